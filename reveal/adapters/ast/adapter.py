@@ -4,7 +4,7 @@ import os
 from reveal.reveal_types import CONTRACT_VERSION
 
 from pathlib import Path
-from typing import Dict, List, Any, Optional
+from typing import Callable, Dict, List, Any, Optional
 
 from .queries import (
     parse_query, format_query,
@@ -12,8 +12,9 @@ from .queries import (
     extract_builtins_param as _extract_builtins_param,
     extract_reveal_type_param as _extract_reveal_type_param,
 )
-from .analysis import collect_structures, PYTHON_BUILTINS
+from .analysis import collect_structures, iter_structures, PYTHON_BUILTINS
 from .filtering import apply_filters, matches_decorator
+from .summary import can_push_down, query_summary
 from .help import get_help as _get_help, get_schema as _get_schema
 from .renderer import AstRenderer
 from ..base import ResourceAdapter, Stability, register_adapter, register_renderer
@@ -29,6 +30,10 @@ from ...utils.results import ResultBuilder
 # Suppress tree-sitter warnings (centralized in core module)
 suppress_treesitter_warnings()
 
+# Auto-cap large unfiltered result sets to prevent accidental token floods.
+# Applies only when no explicit limit was set by the user.
+DEFAULT_RESULT_CAP = 200
+
 
 @register_adapter('ast')
 @register_renderer(AstRenderer)
@@ -126,7 +131,9 @@ class AstAdapter(ResourceAdapter):
         """
         return matches_decorator(decorators, condition)
 
-    def get_structure(self, structures: Optional[List[Dict[str, Any]]] = None, **kwargs) -> Dict[str, Any]:
+    def get_structure(self, structures: Optional[List[Dict[str, Any]]] = None,
+                      on_record: Optional[Callable[[Dict[str, Any]], None]] = None,
+                      **kwargs) -> Dict[str, Any]:
         """Get filtered AST structure based on query.
 
         Args:
@@ -135,6 +142,11 @@ class AstAdapter(ResourceAdapter):
                 caller that already walked and parsed the same files for
                 another purpose (`reveal architecture`, BACK-489) share that
                 work instead of triggering a second full-repo walk.
+            on_record: --format ndjson streaming callback (see
+                routing/uri.py's _ndjson_stream). When given and the query is
+                unsorted, each matching element is passed to it as soon as
+                its file is parsed and 'results' is returned empty; a sorted
+                query needs every match first and ignores it.
 
         Returns:
             Dict containing query results with metadata
@@ -183,6 +195,20 @@ class AstAdapter(ResourceAdapter):
             result['meta'] = meta
             return result
 
+        if on_record is not None and structures is None and not self.result_control.sort_field:
+            return self._stream_query(on_record)
+
+        # Filters and sort on scalar fields only: evaluate them on the
+        # persisted per-file summary rows and build full elements for the
+        # returned rows alone (see summary.py).
+        if structures is None and can_push_down(self.query, self.result_control):
+            total_files, total_filtered, controlled, auto_capped_total = query_summary(
+                self.path, self.query, self.result_control, DEFAULT_RESULT_CAP)
+            for elem in controlled:
+                self._filter_builtin_calls(elem)
+            return self._query_result(total_files, total_filtered, len(controlled),
+                                      controlled, auto_capped_total)
+
         # Collect all structures from path (file or directory), unless the
         # caller already collected them (see `structures` param docstring above)
         if structures is None:
@@ -194,20 +220,62 @@ class AstAdapter(ResourceAdapter):
         # Apply result control (sort, limit, offset)
         controlled = apply_result_control(filtered, self.result_control)
 
-        # Auto-cap large unfiltered result sets to prevent accidental token floods.
-        # Applies only when no explicit limit was set by the user.
-        DEFAULT_RESULT_CAP = 200
-        auto_capped = False
+        auto_capped_total = 0
         if not self.result_control.limit and len(controlled) > DEFAULT_RESULT_CAP:
-            auto_capped = True
             auto_capped_total = len(controlled)
             controlled = controlled[:DEFAULT_RESULT_CAP]
 
+        for elem in controlled:
+            self._filter_builtin_calls(elem)
+
+        return self._query_result(len(structures), len(filtered), len(controlled),
+                                  controlled, auto_capped_total)
+
+    def _stream_query(self, on_record: Callable[[Dict[str, Any]], None]) -> Dict[str, Any]:
+        """Unsorted query for --format ndjson: filter each file's elements as
+        it is parsed and hand the ones inside offset/limit (or the auto-cap)
+        to *on_record*, so only one file's structure is held at a time.
+        Totals keep counting past the cap, as in the collected path."""
+        offset = self.result_control.offset or 0
+        limit = self.result_control.limit
+        cap = limit if limit is not None else DEFAULT_RESULT_CAP
+        total_files = total_filtered = displayed = 0
+        for structure in iter_structures(self.path):
+            total_files += 1
+            for elem in apply_filters([structure], self.query):
+                total_filtered += 1
+                if total_filtered <= offset or displayed >= cap:
+                    continue
+                self._filter_builtin_calls(elem)
+                on_record(elem)
+                displayed += 1
+        auto_capped_total = total_filtered - offset if limit is None and total_filtered - offset > cap else 0
+        return self._query_result(total_files, total_filtered, displayed, [], auto_capped_total)
+
+    def _filter_builtin_calls(self, elem: Dict[str, Any]) -> None:
+        """Filter builtins from calls lists unless ?builtins=true.
+
+        Python-file elements only -- PYTHON_BUILTINS names (map/filter/
+        sorted/...) can collide with real methods in other languages
+        (Scala/Ruby `.map`, `.filter`), same cross-language bug class as
+        BACK-748's calls:// adapter fix; this ast:// copy of the filter was
+        missed there.
+        """
+        if self.include_builtins:
+            return
+        if elem.get('calls') and language_for_extension(
+            os.path.splitext(elem.get('file', ''))[1].lower()
+        ) == 'python':
+            elem['calls'] = [c for c in elem['calls'] if c.split('.')[-1] not in PYTHON_BUILTINS]
+
+    def _query_result(self, total_files: int, total_filtered: int, displayed: int,
+                      results: List[Dict[str, Any]], auto_capped_total: int) -> Dict[str, Any]:
+        """Build the ast_query result envelope and its trust metadata."""
         # Create trust metadata (v1.1)
         # AST adapter uses tree-sitter for parsing
         meta = self.create_meta(
             parse_mode='tree_sitter_full',
-            confidence=1.0 if structures else 0.0,
+            confidence=1.0 if total_files else 0.0,
             warnings=[],
             errors=[]
         )
@@ -217,14 +285,14 @@ class AstAdapter(ResourceAdapter):
 
         # Add truncation metadata if results were limited
         if self.result_control.limit or self.result_control.offset:
-            if len(filtered) > len(controlled):
+            if total_filtered > displayed:
                 meta['warnings'].append({
                     'type': 'truncated',
-                    'message': f'Results truncated: showing {len(controlled)} of {len(filtered)} total matches'
+                    'message': f'Results truncated: showing {displayed} of {total_filtered} total matches'
                 })
 
         # Warn when auto-cap kicked in
-        if auto_capped:
+        if auto_capped_total:
             meta['warnings'].append({
                 'type': 'auto_capped',
                 'message': (
@@ -233,18 +301,6 @@ class AstAdapter(ResourceAdapter):
                 )
             })
 
-        # Filter builtins from calls lists unless ?builtins=true. Python-file
-        # elements only -- PYTHON_BUILTINS names (map/filter/sorted/...) can
-        # collide with real methods in other languages (Scala/Ruby `.map`,
-        # `.filter`), same cross-language bug class as BACK-748's calls://
-        # adapter fix; this ast:// copy of the filter was missed there.
-        if not self.include_builtins:
-            for elem in controlled:
-                if elem.get('calls') and language_for_extension(
-                    os.path.splitext(elem.get('file', ''))[1].lower()
-                ) == 'python':
-                    elem['calls'] = [c for c in elem['calls'] if c.split('.')[-1] not in PYTHON_BUILTINS]
-
         # Build result using ResultBuilder (automatically handles contract_version, source, source_type)
         result = ResultBuilder.create(
             result_type='ast_query',
@@ -254,10 +310,10 @@ class AstAdapter(ResourceAdapter):
                 'path': self.path,
                 'query': format_query(self.query),
                 'show_mode': self.show_mode,
-                'total_files': len(structures),
-                'total_results': len(filtered),
-                'displayed_results': len(controlled),
-                'results': controlled
+                'total_files': total_files,
+                'total_results': total_filtered,
+                'displayed_results': displayed,
+                'results': results
             }
         )
         result['meta'] = meta
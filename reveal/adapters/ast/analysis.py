@@ -5,7 +5,7 @@ import builtins as _builtins_module
 import os
 import sys
 from pathlib import Path
-from typing import Dict, List, Any, Optional
+from typing import Dict, Iterator, List, Any, Optional
 
 from ...utils.path_utils import is_skippable_dir
 from .call_graph import build_symbol_map, resolve_callees
@@ -40,13 +40,30 @@ def collect_structures(path: str) -> List[Dict[str, Any]]:
     Returns:
         List of structure dicts with file metadata
     """
-    structures: List[Dict[str, Any]] = []
+    return list(iter_structures(path))
+
+
+def iter_structures(path: str) -> Iterator[Dict[str, Any]]:
+    """Yield each file's structure as it is analyzed (collect_structures' walk,
+    one file at a time — for callers that stream results instead of holding
+    the whole tree's structures)."""
+    for file_path in iter_code_files(path):
+        structure = analyze_file(file_path)
+        if structure:
+            yield structure
+
+
+def iter_code_files(path: str) -> Iterator[str]:
+    """Yield the files an ast:// scan of *path* analyzes, in scan order.
+
+    A file path is yielded as-is; a directory is walked recursively for code
+    files, pruning well-known non-project dirs.
+    """
     path_obj = Path(path)
 
     if path_obj.is_file():
-        try_add_file_structure(str(path_obj), structures)
+        yield str(path_obj)
     elif path_obj.is_dir():
-        # Recursively find all code files, pruning well-known non-project dirs.
         for root, dirs, files in os.walk(str(path_obj)):
             dirs[:] = [
                 d for d in dirs
@@ -55,9 +72,7 @@ def collect_structures(path: str) -> List[Dict[str, Any]]:
             for name in files:
                 fp = Path(root) / name
                 if is_code_file(fp):
-                    try_add_file_structure(str(fp), structures)
-
-    return structures
+                    yield str(fp)
 
 
 def is_code_file(path: Path) -> bool:
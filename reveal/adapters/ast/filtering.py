@@ -2,11 +2,19 @@
 
 import re
 from fnmatch import fnmatch
-from typing import Dict, List, Any
-from ...utils.query import compare_values
+from typing import Any, Callable, Dict, Iterable, List, Tuple
+from ...utils.query import compare_values, compile_comparison
 
+# compare_values() options for ast:// conditions.
+COMPARE_OPTIONS = {
+    'allow_list_any': False,  # AST doesn't have list fields
+    'case_sensitive': True,   # AST comparisons are case-sensitive
+    'coerce_numeric': True,
+    'none_matches_not_equal': False
+}
 
-def apply_filters(structures: List[Dict[str, Any]], query: Dict[str, Any]) -> List[Dict[str, Any]]:
+
+def apply_filters(structures: Iterable[Dict[str, Any]], query: Dict[str, Any]) -> List[Dict[str, Any]]:
     """Apply query filters to collected structures.
 
     When a name= glob filter is used without an explicit type= filter, import
@@ -27,6 +35,7 @@ def apply_filters(structures: List[Dict[str, Any]], query: Dict[str, Any]) -> Li
         and query['name'].get('op') == 'glob'
         and 'type' not in query
     )
+    matches = compile_query(query)
 
     results = []
 
@@ -34,7 +43,7 @@ def apply_filters(structures: List[Dict[str, Any]], query: Dict[str, Any]) -> Li
         for element in structure.get('elements', []):
             if exclude_imports and element.get('category') == 'imports':
                 continue
-            if matches_filters(element, query):
+            if matches(element):
                 results.append(element)
 
     return results
@@ -43,6 +52,8 @@ def apply_filters(structures: List[Dict[str, Any]], query: Dict[str, Any]) -> Li
 def matches_filters(element: Dict[str, Any], query: Dict[str, Any]) -> bool:
     """Check if element matches all query filters.
 
+    Compiles *query* on every call; loops should use compile_query() once.
+
     Args:
         element: Element dict
         query: Query dict with filter conditions
@@ -50,65 +61,96 @@ def matches_filters(element: Dict[str, Any], query: Dict[str, Any]) -> bool:
     Returns:
         True if element matches all filters
     """
-    for key, condition in query.items():
-        # Handle special key mappings
-        if key == 'type':
-            # Map 'type' to 'category'
-            value = element.get('category', '')
-            # Normalize singular/plural for type filter
-            # Categories are plural (functions, classes) but users may type singular
-            condition = normalize_type_condition(condition)
-        elif key == 'lines':
-            # Map 'lines' to 'line_count'
-            value = element.get('line_count', 0)
-        elif key == 'decorator':
-            # Special handling: check if any decorator matches
-            decorators = element.get('decorators', [])
-            if not matches_decorator(decorators, condition):
-                return False
-            continue  # Already handled, skip normal comparison
-        elif key == 'calls':
-            # calls=<name>: find functions whose calls list contains <name>
-            # Supports bare name match or attribute suffix: "validate_item" matches "self.validate_item"
-            if not _matches_call_list(element.get('calls', []), condition):
-                return False
-            continue
-        elif key == 'callee_of':
-            # callee_of=<name>: find functions whose called_by list contains <name>
-            if not _matches_call_list(element.get('called_by', []), condition):
-                return False
-            continue
-        elif key == 'param_type':
-            # param_type=dict: find functions where any param has this type annotation
-            if not _matches_param_type(element.get('signature', ''), condition):
-                return False
-            continue
-        elif key == 'return_type':
-            # return_type=bool: find functions with this return annotation
-            if not _matches_return_type(element.get('signature', ''), condition):
-                return False
-            continue
-        elif key == 'has_annotations':
-            # has_annotations=false: fully unannotated functions (no param or return hints)
-            # has_annotations=true: at least one annotation present
-            if not compare_value(_has_annotations(element.get('signature', '')), condition):
-                return False
-            continue
-        elif key == 'callers':
-            # callers>N: filter by number of inbound callers (length of called_by list)
-            if not compare_value(len(element.get('called_by', [])), condition):
-                return False
-            continue
-        else:
-            value = element.get(key)
+    return compile_query(query)(element)
+
+
+# Per-element cost of each query key's test, so compile_query() can run the
+# scalar comparisons before decorator globs, signature parsing and call-list
+# scans. Unlisted keys are plain field comparisons (cost 0, or 1 for
+# glob/regex operators).
+_KEY_COST = {
+    'decorator': 2,
+    'callers': 2,
+    'calls': 3,
+    'callee_of': 3,
+    'param_type': 3,
+    'return_type': 3,
+    'has_annotations': 3,
+}
 
-        if value is None:
-            return False
 
-        if not compare_value(value, condition):
-            return False
+def _key_cost(item: Tuple[str, Dict[str, Any]]) -> int:
+    key, condition = item
+    if key in _KEY_COST:
+        return _KEY_COST[key]
+    return 1 if condition.get('op') in ('glob', '~=', '!~') else 0
 
-    return True
+
+def compile_query(query: Dict[str, Any]) -> Callable[[Dict[str, Any]], bool]:
+    """Compile an ast:// query dict into one predicate over elements.
+
+    Same answers as evaluating every key in turn, but each condition's
+    operator dispatch and target coercion happen once, and the conjunction
+    runs cheapest key first.
+    """
+    predicates = [_compile_key(key, condition)
+                  for key, condition in sorted(query.items(), key=_key_cost)]
+
+    def matches(element: Dict[str, Any]) -> bool:
+        for predicate in predicates:
+            if not predicate(element):
+                return False
+        return True
+
+    return matches
+
+
+def _compile_key(key: str, condition: Dict[str, Any]) -> Callable[[Dict[str, Any]], bool]:
+    """Predicate for one query key (see compile_query)."""
+    if key == 'decorator':
+        # Special handling: check if any decorator matches
+        return lambda element: matches_decorator(element.get('decorators', []), condition)
+    if key == 'calls':
+        # calls=<name>: find functions whose calls list contains <name>
+        # Supports bare name match or attribute suffix: "validate_item" matches "self.validate_item"
+        return lambda element: _matches_call_list(element.get('calls', []), condition)
+    if key == 'callee_of':
+        # callee_of=<name>: find functions whose called_by list contains <name>
+        return lambda element: _matches_call_list(element.get('called_by', []), condition)
+    if key == 'param_type':
+        # param_type=dict: find functions where any param has this type annotation
+        return lambda element: _matches_param_type(element.get('signature', ''), condition)
+    if key == 'return_type':
+        # return_type=bool: find functions with this return annotation
+        return lambda element: _matches_return_type(element.get('signature', ''), condition)
+
+    if key == 'has_annotations':
+        # has_annotations=false: fully unannotated functions (no param or return hints)
+        # has_annotations=true: at least one annotation present
+        test = compile_condition(condition)
+        return lambda element: test(_has_annotations(element.get('signature', '')))
+    if key == 'callers':
+        # callers>N: filter by number of inbound callers (length of called_by list)
+        test = compile_condition(condition)
+        return lambda element: test(len(element.get('called_by', [])))
+
+    if key == 'type':
+        # Map 'type' to 'category'. Categories are plural (functions,
+        # classes) but users may type singular.
+        field, default = 'category', ''
+        condition = normalize_type_condition(condition)
+    elif key == 'lines':
+        # Map 'lines' to 'line_count'
+        field, default = 'line_count', 0
+    else:
+        field, default = key, None
+    test = compile_condition(condition)
+
+    def field_matches(element: Dict[str, Any]) -> bool:
+        value = element.get(field, default)
+        return value is not None and test(value)
+
+    return field_matches
 
 
 def matches_decorator(decorators: List[str], condition: Dict[str, Any]) -> bool:
@@ -212,17 +254,23 @@ def compare_value(value: Any, condition: Dict[str, Any]) -> bool:
         return str(value) in [str(t) for t in target]
 
     # All other operators: use unified comparison
-    return compare_values(
-        value,
-        op,
-        target,
-        options={
-            'allow_list_any': False,  # AST doesn't have list fields
-            'case_sensitive': True,   # AST comparisons are case-sensitive
-            'coerce_numeric': True,
-            'none_matches_not_equal': False
-        }
-    )
+    return compare_values(value, op, target, options=COMPARE_OPTIONS)
+
+
+def compile_condition(condition: Dict[str, Any]) -> Callable[[Any], bool]:
+    """compare_value(value, condition) as a one-argument predicate."""
+    op = condition['op']
+    target = condition['value']
+
+    if op == 'glob':
+        patterns = [str(p) for p in target] if isinstance(target, list) else [str(target)]
+        return lambda value: any(fnmatch(str(value), p) for p in patterns)
+
+    if op == 'in':
+        members = frozenset(str(t) for t in target)
+        return lambda value: str(value) in members
+
+    return compile_comparison(op, target, COMPARE_OPTIONS)
 
 
 def _matches_param_type(signature: str, condition: Dict[str, Any]) -> bool:
@@ -0,0 +1,220 @@
+"""Per-file element summary index for ast:// filter pushdown.
+
+`ast://src/?complexity>10&sort=-complexity&limit=20` only ever looks at a few
+scalar fields of each element to decide what to return, yet the collected
+path builds every file's full element dicts (signatures, calls, resolved
+calls, called_by) first and keeps all of them until the query finishes.
+
+The summary table holds just those scalar fields per element (name, kind,
+line span, complexity, depth, decorators, file id). It is persisted in the
+disk cache per scan root, together with each file's (mtime_ns, size), so a
+repeat query re-analyzes only the files that changed. Filters, sort and
+offset/limit (or the auto-cap) run against the rows, with apply_result_control's
+heap top-k selection when sorting, and full element detail is loaded only
+for the rows returned. Those files are re-read through analyze_file(), which is a structure-cache
+hit for any file that was summarized before.
+
+Only queries whose filter keys and sort field the rows answer exactly as
+matches_filters() would on a full element are pushed down
+(`can_push_down`); calls=, signature and other detail filters keep the
+collected path.
+"""
+
+import hashlib
+import os
+from dataclasses import replace
+from typing import Any, Dict, Iterator, List, NamedTuple, Optional, Tuple
+
+from ...core import disk_cache
+from ...utils.query_control import ResultControl, apply_result_control
+from .analysis import analyze_file, iter_code_files
+from .filtering import apply_filters
+
+# One entry per scan root (like depends://'s scan snapshots); each entry is
+# the whole root's table, so a warm query is one cache read plus a stat per file.
+_SUMMARY_NAMESPACE = "ast_summary"
+_SUMMARY_MAX_ENTRIES = 64
+
+# Query keys a summary row answers the same as the full element does.
+SUMMARY_FILTER_KEYS = frozenset({
+    'type', 'category', 'name', 'file', 'line', 'lines', 'line_count',
+    'complexity', 'depth', 'decorator',
+})
+# Element fields a summary row carries, i.e. the sort fields it can rank by.
+SUMMARY_SORT_FIELDS = frozenset({
+    'category', 'name', 'file', 'line', 'line_count', 'complexity', 'depth',
+})
+
+
+class SummaryRow(NamedTuple):
+    """The scalar fields of one analyze_file() element."""
+    file_id: int                 # index into SummaryTable.paths
+    index: int                   # position in the file's element list
+    category: str
+    name: str
+    line: int
+    line_count: int              # line span is line .. line + line_count - 1
+    complexity: Optional[int]    # functions/methods/tests only
+    depth: Optional[int]         # functions/methods/tests only
+    decorators: Tuple[str, ...]
+
+
+class SummaryTable(NamedTuple):
+    """Summary rows of every file under one scan root, in scan order."""
+    paths: List[str]
+    stats: List[Tuple[int, int]]              # (mtime_ns, size) per file
+    rows: List[Optional[List[SummaryRow]]]    # None: analyze_file() declined the file
+
+
+def can_push_down(query: Dict[str, Any], control: ResultControl) -> bool:
+    """True when every filter and the sort field can be evaluated on rows."""
+    if not set(query) <= SUMMARY_FILTER_KEYS:
+        return False
+    return not control.sort_field or control.sort_field in SUMMARY_SORT_FIELDS
+
+
+def _table_key(path: str) -> str:
+    return hashlib.sha256(os.path.abspath(path).encode('utf-8', 'surrogatepass')).hexdigest()
+
+
+def _summarize(structure: Optional[Dict[str, Any]], file_id: int) -> Optional[List[SummaryRow]]:
+    if not structure:
+        return None
+    return [
+        SummaryRow(
+            file_id=file_id,
+            index=i,
+            category=element.get('category', ''),
+            name=element.get('name', ''),
+            line=element.get('line', 0),
+            line_count=element.get('line_count', 0),
+            complexity=element.get('complexity'),
+            depth=element.get('depth'),
+            decorators=tuple(element.get('decorators') or ()),
+        )
+        for i, element in enumerate(structure.get('elements', []))
+    ]
+
+
+def load_table(path: str) -> SummaryTable:
+    """Summary table for *path*, re-analyzing only files whose stat changed.
+
+    Each file is stat'ed before it is analyzed, so an edit racing the scan is
+    recorded under the old stat and picked up by the next query.
+    """
+    key = _table_key(path)
+    previous = disk_cache.get(_SUMMARY_NAMESPACE, key)
+    if not isinstance(previous, SummaryTable):
+        previous = None
+    saved: Dict[str, Tuple[Tuple[int, int], Optional[List[SummaryRow]]]] = {}
+    if previous is not None:
+        saved = {p: (st, rows) for p, st, rows in zip(previous.paths, previous.stats, previous.rows)}
+
+    table = SummaryTable(paths=[], stats=[], rows=[])
+    changed = previous is None
+    for file_path in iter_code_files(path):
+        try:
+            st = os.stat(file_path)
+        except OSError:
+            continue
+        stat = (st.st_mtime_ns, st.st_size)
+        file_id = len(table.paths)
+        entry = saved.get(file_path)
+        if entry is not None and entry[0] == stat:
+            file_rows = entry[1]
+            if file_rows and file_rows[0].file_id != file_id:
+                file_rows = [row._replace(file_id=file_id) for row in file_rows]
+                changed = True
+        else:
+            file_rows = _summarize(analyze_file(file_path), file_id)
+            changed = True
+        table.paths.append(file_path)
+        table.stats.append(stat)
+        table.rows.append(file_rows)
+
+    if previous is not None and len(table.paths) != len(previous.paths):
+        changed = True
+    if changed:
+        disk_cache.put(_SUMMARY_NAMESPACE, key, table, max_entries=_SUMMARY_MAX_ENTRIES)
+    return table
+
+
+def _row_element(row: SummaryRow, file_path: str) -> Dict[str, Any]:
+    """The row as the subset of an element dict that filters and sorts read."""
+    element: Dict[str, Any] = {
+        'file': file_path,
+        'category': row.category,
+        'name': row.name,
+        'line': row.line,
+        'line_count': row.line_count,
+        'decorators': row.decorators,
+        '_row': row,
+    }
+    if row.complexity is not None:
+        element['complexity'] = row.complexity
+    if row.depth is not None:
+        element['depth'] = row.depth
+    return element
+
+
+def _iter_row_structures(table: SummaryTable) -> Iterator[Dict[str, Any]]:
+    for file_path, rows in zip(table.paths, table.rows):
+        if rows:
+            yield {'file': file_path, 'elements': [_row_element(row, file_path) for row in rows]}
+
+
+def select_window(items: List[Dict[str, Any]], control: ResultControl, cap: int) -> List[Dict[str, Any]]:
+    """apply_result_control() plus ast://'s auto-cap.
+
+    The auto-cap is applied as the limit, so a sorted query without one
+    still only heap-selects offset + cap items instead of sorting them all.
+    """
+    if control.limit is None:
+        control = replace(control, limit=cap)
+    return apply_result_control(items, control)
+
+
+def _find_element(elements: List[Dict[str, Any]], row: SummaryRow) -> Optional[Dict[str, Any]]:
+    def same(element: Dict[str, Any]) -> bool:
+        return (element.get('category'), element.get('name'), element.get('line')) == \
+            (row.category, row.name, row.line)
+
+    if row.index < len(elements) and same(elements[row.index]):
+        return elements[row.index]
+    return next((element for element in elements if same(element)), None)
+
+
+def load_elements(table: SummaryTable, rows: List[SummaryRow]) -> List[Dict[str, Any]]:
+    """Full element dicts for *rows*, analyzing each of their files once.
+
+    A row whose element no longer exists (file edited since the table was
+    loaded) is dropped.
+    """
+    structures: Dict[int, List[Dict[str, Any]]] = {}
+    elements = []
+    for row in rows:
+        if row.file_id not in structures:
+            structure = analyze_file(table.paths[row.file_id])
+            structures[row.file_id] = structure.get('elements', []) if structure else []
+        element = _find_element(structures[row.file_id], row)
+        if element is not None:
+            elements.append(element)
+    return elements
+
+
+def query_summary(path: str, query: Dict[str, Any], control: ResultControl,
+                  cap: int) -> Tuple[int, int, List[Dict[str, Any]], int]:
+    """Run a pushed-down ast:// query.
+
+    Returns:
+        (total_files, total_filtered, elements, auto_capped_total) — the same
+        figures AstAdapter.get_structure's collected path reports.
+    """
+    table = load_table(path)
+    total_files = sum(1 for rows in table.rows if rows is not None)
+    matches = apply_filters(_iter_row_structures(table), query)
+    window = select_window(matches, control, cap)
+    elements = load_elements(table, [item['_row'] for item in window])
+    remaining = len(matches) - (control.offset or 0)
+    auto_capped_total = remaining if control.limit is None and remaining > cap else 0
+    return total_files, len(matches), elements, auto_capped_total
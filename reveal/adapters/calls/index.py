@@ -4,18 +4,33 @@ Builds and caches an inverted call graph across all code files in a directory:
 
     callee_name → [(file_path, caller_func_name, line)]
 
+The index is stored as an interned-string, array-backed edge table
+(``CallersIndex``) and only materializes caller-record dicts for the keys a
+query actually reads.
+
 Cache key is a frozenset of (file_path, mtime_ns) tuples so any file change
 invalidates only the entries affected.  In practice the whole index is rebuilt
 per directory when any file changes (simple and correct).
+
+Built indexes are also persisted through ``disk_cache`` in a memory-mapped
+layout (``mapped_index.py``), so a fresh process can answer point lookups
+without re-parsing the tree.
 """
 
+import hashlib
 import os
+from array import array
 from collections import OrderedDict
+from collections.abc import Mapping
 from pathlib import Path
-from typing import Any, Dict, FrozenSet, List, Optional, Set, Tuple
+from typing import Any, Dict, FrozenSet, Iterator, List, Optional, Set, Tuple, Union
 
-from ..ast.analysis import collect_structures, is_code_file, PYTHON_BUILTINS
+from ..ast.analysis import (
+    analyze_file, collect_structures, is_code_file, iter_code_files, PYTHON_BUILTINS,
+)
 from ..ast.call_graph import build_alias_map, build_symbol_map, resolve_callees as _resolve_callees
+from .mapped_index import MappedCallersIndex, serialize_callers_index
+from ...core import disk_cache
 from ...defaults import TEST_FRAMEWORK_CALLEE_NAMES
 from ...registry import language_for_extension
 from ...utils.path_utils import is_unsafe_scan_root
@@ -27,6 +42,15 @@ from ...utils.path_utils import is_unsafe_scan_root
 _INDEX_CACHE: OrderedDict = OrderedDict()
 _INDEX_CACHE_MAX = 8
 
+# On-disk, memory-mapped copies of built indexes (see mapped_index.py), keyed
+# by a (path, mtime_ns, size) fingerprint of every code file under the root.
+# A fresh process — an MCP tool call, an agent's one-off `?target=` — maps the
+# file and answers from the pages it touches instead of re-parsing the tree.
+# One entry per scan root; each can run to tens of MB on a huge repo, so the
+# namespace keeps fewer than the disk_cache default.
+_DISK_INDEX_NAMESPACE = 'calls_index_v1'
+_DISK_INDEX_MAX_ENTRIES = 16
+
 # Decorators that cause the runtime to dispatch the function implicitly —
 # never appear as explicit call expressions in source code.
 _IMPLICIT_DECORATORS: frozenset = frozenset({'property', 'classmethod', 'staticmethod'})
@@ -241,37 +265,146 @@ def _bare_callee_name(callee: str) -> str:
     return bare.strip()
 
 
+class CallersIndex(Mapping):
+    """Callee name → caller records, backed by an interned, columnar edge table.
+
+    Behaves as a read-only ``Dict[str, List[Dict]]`` (``in``, ``get``,
+    ``keys``, ``items``, ``[name]``) so callers of ``build_callers_index`` see
+    the same shape as before, but nothing is stored as per-edge dicts:
+
+    * every file path, caller name and call expression is interned once into
+      ``_strings`` and referred to by integer id;
+    * each call edge is one slot in four parallel ``array('I')`` columns
+      (file id, caller id, line, call-expr id);
+    * each lookup key maps to an ``array('I')`` of edge ids (its postings).
+
+    Record dicts are materialized only for the keys actually read, so a
+    1M-edge repo holds a few flat integer arrays instead of millions of small
+    dicts. ``find_callers``' BFS, ``rank_by_callers`` and ``find_uncalled``
+    work on the edge ids directly (see ``edge_ids``/``file_id``/``caller_id``).
+    """
+
+    __slots__ = ('_strings', '_ids', '_file', '_caller', '_line', '_expr', '_postings')
+
+    def __init__(self) -> None:
+        self._strings: List[str] = []
+        self._ids: Dict[str, int] = {}
+        self._file = array('I')
+        self._caller = array('I')
+        self._line = array('I')
+        self._expr = array('I')
+        self._postings: Dict[str, array] = {}
+
+    # -- construction -------------------------------------------------------
+
+    def intern(self, value: str) -> int:
+        """Return the id for *value*, assigning the next one on first sight."""
+        sid = self._ids.get(value)
+        if sid is None:
+            sid = len(self._strings)
+            self._ids[value] = sid
+            self._strings.append(value)
+        return sid
+
+    def add_edge(self, file_id: int, caller_id: int, line: int, expr_id: int) -> int:
+        """Append one call edge; return its edge id."""
+        self._file.append(file_id)
+        self._caller.append(caller_id)
+        self._line.append(line)
+        self._expr.append(expr_id)
+        return len(self._file) - 1
+
+    def post(self, key: str, edge: int) -> None:
+        """Make *edge* reachable under lookup *key*."""
+        postings = self._postings.get(key)
+        if postings is None:
+            postings = self._postings[key] = array('I')
+        postings.append(edge)
+
+    # -- integer-level access -----------------------------------------------
+
+    def edge_ids(self, key: str) -> array:
+        """Edge ids posted under *key* (empty when absent)."""
+        return self._postings.get(key, _EMPTY_POSTINGS)
+
+    def file_id(self, edge: int) -> int:
+        return self._file[edge]
+
+    def caller_id(self, edge: int) -> int:
+        return self._caller[edge]
+
+    def string(self, sid: int) -> str:
+        return self._strings[sid]
+
+    def record(self, edge: int) -> Dict[str, Any]:
+        """Materialize *edge* as the public ``{file, caller, line, call_expr}`` dict."""
+        strings = self._strings
+        return {
+            'file': strings[self._file[edge]],
+            'caller': strings[self._caller[edge]],
+            'line': self._line[edge],
+            'call_expr': strings[self._expr[edge]],
+        }
+
+    @property
+    def edge_count(self) -> int:
+        return len(self._file)
+
+    # -- Mapping protocol ---------------------------------------------------
+
+    def __getitem__(self, key: str) -> List[Dict[str, Any]]:
+        return [self.record(e) for e in self._postings[key]]
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._postings
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._postings)
+
+    def __len__(self) -> int:
+        return len(self._postings)
+
+
+_EMPTY_POSTINGS = array('I')
+
+
 def _index_callee(
-    index: Dict[str, List[Dict[str, Any]]],
+    index: CallersIndex,
     callee: str,
-    record: Dict[str, Any],
+    edge: int,
     alias_map: Dict[str, str],
 ) -> None:
-    """Add *record* to *index* under the bare name, dotted/arrow form, and canonical alias."""
+    """Post *edge* under the bare name, dotted/arrow form, and canonical alias."""
     bare = _bare_callee_name(callee)
-    index.setdefault(bare, []).append(record)
+    index.post(bare, edge)
     if bare != callee:
-        index.setdefault(callee, []).append(record)
+        index.post(callee, edge)
     canonical = alias_map.get(bare)
     if canonical and canonical != bare:
-        index.setdefault(canonical, []).append(record)
+        index.post(canonical, edge)
 
 
 def _bfs_level(
-    index: Dict[str, List[Dict[str, Any]]],
+    index: Union[CallersIndex, MappedCallersIndex],
     current_targets: Set[str],
-    visited_callers: Set[Tuple[str, str]],
+    visited_callers: Set[Tuple[int, int]],
 ) -> Tuple[List[Dict[str, Any]], Set[str]]:
-    """Run one BFS level: return (level_records, next_targets)."""
+    """Run one BFS level: return (level_records, next_targets).
+
+    Visited-state is kept as (file id, caller id) integer pairs; only the
+    records that survive de-duplication are materialized as dicts.
+    """
     level_records: List[Dict[str, Any]] = []
     next_targets: Set[str] = set()
     for t in sorted(current_targets):
-        for record in index.get(t, []):
-            key = (record['file'], record['caller'])
+        for edge in index.edge_ids(t):
+            key = (index.file_id(edge), index.caller_id(edge))
             if key in visited_callers:
                 continue
             visited_callers.add(key)
-            level_records.append({**record, 'callee': t})
+            record = index.record(edge)
+            record['callee'] = t
+            level_records.append(record)
             next_targets.add(record['caller'])
     return level_records, next_targets
 
@@ -307,10 +440,76 @@ def _dir_cache_key(directory: Path) -> Any:
         return tuple(entries)
 
 
-def build_callers_index(path: str) -> Dict[str, List[Dict[str, Any]]]:
+def _tree_fingerprint(directory: Path, code_files: List[str]) -> Optional[str]:
+    """Hash (path, mtime_ns, size) of *code_files*, the files a build would read.
+
+    The disk-index key. *code_files* is the ``iter_code_files`` walk that
+    ``_build_index`` parses on a miss, so the tree is walked once either way;
+    this only stats. Returns None (→ no disk cache) when there are no code
+    files or a stat fails.
+    """
+    if not code_files:
+        return None
+    entries = []
+    try:
+        for path_str in code_files:
+            st = os.stat(path_str)
+            entries.append((path_str, st.st_mtime_ns, st.st_size))
+    except OSError:
+        return None
+    entries.sort()
+    hasher = hashlib.sha256(str(directory.resolve()).encode('utf-8', 'replace'))
+    for path_str, mtime_ns, size in entries:
+        hasher.update(path_str.encode('utf-8', 'replace'))
+        hasher.update(f"\x02{mtime_ns}\x03{size}\x04".encode('ascii'))
+    return hasher.hexdigest()
+
+
+def _load_disk_index(fingerprint: Optional[str]) -> Optional[MappedCallersIndex]:
+    if not fingerprint:
+        return None
+    cached = disk_cache.get_file(_DISK_INDEX_NAMESPACE, fingerprint)
+    return MappedCallersIndex.open(str(cached)) if cached else None
+
+
+def _build_index(code_files: List[str]) -> CallersIndex:
+    """Parse *code_files* (an ``iter_code_files`` walk) into a fresh ``CallersIndex``."""
+    index = CallersIndex()
+
+    for code_file in code_files:
+        file_struct = analyze_file(code_file)
+        if not file_struct:
+            continue
+        file_path = file_struct.get('file', '')
+        file_id = index.intern(file_path)
+        # Build alias → canonical name map for this file so that calls using
+        # an import alias (e.g. `h` for `from utils import helper as h`) also
+        # index the definition name (`helper`).  This prevents find_uncalled
+        # from falsely reporting `helper` as dead code and lets find_callers
+        # locate callers that use the alias.
+        alias_map = build_alias_map(file_path)
+        for elem in file_struct.get('elements', []):
+            # 'tests' (Zig's TestDecl blocks — the only 'tests'-category
+            # producer today) counts as a caller here for the same reason
+            # JS/TS's describe()/it() callbacks are folded into 'functions'
+            # (BACK-334): a function called only from a test previously
+            # reported zero callers — indistinguishable from dead code,
+            # BACK-660's exact failure mode, just one hop further in.
+            if elem.get('category') not in ('functions', 'methods', 'tests'):
+                continue
+            caller_id = index.intern(elem.get('name', ''))
+            line = elem.get('line') or 0
+            for callee in elem.get('calls', []):
+                edge = index.add_edge(file_id, caller_id, line, index.intern(callee))
+                _index_callee(index, callee, edge, alias_map)
+    return index
+
+
+def build_callers_index(path: str) -> Union[CallersIndex, MappedCallersIndex]:
     """Return project-level callers index for *path* (file or directory).
 
-    The index maps each callee name to a list of caller records::
+    The index maps each callee name to a list of caller records (a read-only
+    mapping over an integer edge table — see ``CallersIndex``)::
 
         {
           "validate_item": [
@@ -323,11 +522,18 @@ def build_callers_index(path: str) -> Dict[str, List[Dict[str, Any]]]:
     Results are cached by directory mtime fingerprint; any file change causes
     a full rebuild (rebuilds are fast — just iterating existing structures).
 
+    Across processes, a built index is also persisted through ``disk_cache``
+    in the memory-mapped layout of ``mapped_index.py``. On an in-process miss
+    the tree is fingerprinted (stat only) and, when an index for exactly those
+    files exists on disk, it is mapped and returned as a
+    ``MappedCallersIndex`` — same integer API and Mapping behaviour, but a
+    point lookup only pages in the key-table and postings it reads.
+
     Args:
         path: File or directory to index.
 
     Returns:
-        Inverted call graph dict (callee → list of caller dicts).
+        Inverted call graph mapping (callee → list of caller dicts).
     """
     path_obj = Path(path)
     directory = path_obj if path_obj.is_dir() else path_obj.parent
@@ -339,34 +545,16 @@ def build_callers_index(path: str) -> Dict[str, List[Dict[str, Any]]]:
         _INDEX_CACHE.move_to_end(dir_str)
         return _INDEX_CACHE[dir_str][1]
 
-    # Build index
-    structures = collect_structures(str(directory))
-    index: Dict[str, List[Dict[str, Any]]] = {}
-
-    for file_struct in structures:
-        file_path = file_struct.get('file', '')
-        # Build alias → canonical name map for this file so that calls using
-        # an import alias (e.g. `h` for `from utils import helper as h`) also
-        # index the definition name (`helper`).  This prevents find_uncalled
-        # from falsely reporting `helper` as dead code and lets find_callers
-        # locate callers that use the alias.
-        alias_map = build_alias_map(file_path)
-        for elem in file_struct.get('elements', []):
-            # 'tests' (Zig's TestDecl blocks — the only 'tests'-category
-            # producer today) counts as a caller here for the same reason
-            # JS/TS's describe()/it() callbacks are folded into 'functions'
-            # (BACK-334): a function called only from a test previously
-            # reported zero callers — indistinguishable from dead code,
-            # BACK-660's exact failure mode, just one hop further in.
-            if elem.get('category') not in ('functions', 'methods', 'tests'):
-                continue
-            record_base = {
-                'file': file_path,
-                'caller': elem.get('name', ''),
-                'line': elem.get('line', 0),
-            }
-            for callee in elem.get('calls', []):
-                _index_callee(index, callee, {**record_base, 'call_expr': callee}, alias_map)
+    code_files = list(iter_code_files(dir_str))
+    fingerprint = _tree_fingerprint(directory, code_files) if disk_cache.is_enabled() else None
+    index: Union[CallersIndex, MappedCallersIndex, None] = _load_disk_index(fingerprint)
+    if index is None:
+        index = _build_index(code_files)
+        if fingerprint:
+            disk_cache.put_bytes(
+                _DISK_INDEX_NAMESPACE, fingerprint, serialize_callers_index(index),
+                max_entries=_DISK_INDEX_MAX_ENTRIES,
+            )
 
     _INDEX_CACHE[dir_str] = (cache_key, index)
     _INDEX_CACHE.move_to_end(dir_str)
@@ -595,7 +783,7 @@ def find_callers(
     index = build_callers_index(path)
 
     # BFS up to *depth* levels
-    visited_callers: Set[Tuple[str, str]] = set()
+    visited_callers: Set[Tuple[int, int]] = set()
     current_targets = {target}
     levels: List[Dict[str, Any]] = []
 
@@ -619,7 +807,7 @@ def find_callers(
         parent = str(Path(path).parent)
         if parent != path and os.path.isdir(parent) and _parent_hint_scan_is_cheap(parent):
             parent_index = build_callers_index(parent)
-            potential = len(parent_index.get(target, []))
+            potential = len(parent_index.edge_ids(target))
             if potential:
                 result['hint'] = (
                     f"0 callers found in '{path}' — "
@@ -812,7 +1000,9 @@ def find_uncalled(
     # NOT dead code).
     file_filter: Optional[str] = str(path_obj.resolve()) if is_file else None
 
-    called_names: Set[str] = set(build_callers_index(path).keys())
+    # Membership-only: test names against the index's key set directly
+    # rather than copying it (or materializing any caller records).
+    called_names = build_callers_index(path)
     file_lines: Dict[str, List[str]] = {}
     structures = collect_structures(str(directory))
     extra_implicit_decorators = _project_entry_point_decorators(directory)
@@ -922,39 +1112,55 @@ def rank_by_callers(
     index = build_callers_index(path)
     top = max(1, min(top, 100))
 
-    entries = []
-    for callee_name, caller_records in index.items():
+    # Python-ness is a per-file property: resolve it once per interned file id
+    # instead of once per edge.
+    python_files: Dict[int, bool] = {}
+
+    def _is_python(file_id: int) -> bool:
+        flag = python_files.get(file_id)
+        if flag is None:
+            flag = python_files[file_id] = _lang_family(index.string(file_id)) == 'python'
+        return flag
+
+    # Count over edge ids; only the entries that make the cut get dicts.
+    ranked: List[Tuple[str, List[int]]] = []
+    for callee_name in index:
+        edges = index.edge_ids(callee_name)
         if not include_builtins and callee_name.split('.')[-1] in PYTHON_BUILTINS:
             # PYTHON_BUILTINS names can collide with real methods in other
             # languages (Scala/Ruby `.map`, `.filter`, ...) — only drop the
             # callers that are actually Python, keep the rest (BACK-748).
-            caller_records = [r for r in caller_records if _lang_family(r['file']) != 'python']
-            if not caller_records:
+            edges = [e for e in edges if not _is_python(index.file_id(e))]
+            if not edges:
                 continue
         if not include_test_framework and callee_name.split('.')[-1] in TEST_FRAMEWORK_CALLEE_NAMES:
             continue
-        # Deduplicate caller records by (file, caller) to count unique callers
-        seen: Set[Tuple[str, str]] = set()
-        unique_records = []
-        for rec in caller_records:
-            key = (rec['file'], rec['caller'])
+        # Deduplicate caller edges by (file, caller) to count unique callers
+        seen: Set[Tuple[int, int]] = set()
+        unique_edges = []
+        for edge in edges:
+            key = (index.file_id(edge), index.caller_id(edge))
             if key not in seen:
                 seen.add(key)
-                unique_records.append(rec)
-        entries.append({
-            'name': callee_name,
-            'caller_count': len(unique_records),
-            'callers': unique_records,
-        })
+                unique_edges.append(edge)
+        ranked.append((callee_name, unique_edges))
 
-    entries.sort(key=lambda e: e['caller_count'], reverse=True)
+    ranked.sort(key=lambda entry: len(entry[1]), reverse=True)
+    entries = [
+        {
+            'name': callee_name,
+            'caller_count': len(unique_edges),
+            'callers': [index.record(e) for e in unique_edges],
+        }
+        for callee_name, unique_edges in ranked[:top]
+    ]
 
     return {
         'query': 'rank_callers',
         'path': path,
         'top': top,
-        'total_unique_callees': len(entries),
-        'entries': entries[:top],
+        'total_unique_callees': len(ranked),
+        'entries': entries,
     }
 
 
@@ -0,0 +1,263 @@
+"""Memory-mapped, on-disk form of the calls:// callers index.
+
+``CallersIndex`` (index.py) answers every query from an in-memory edge table,
+which means a fresh process pays for parsing every file's structure before it
+can answer a single ``?target=`` lookup. This module persists that table as
+one flat file that a later process maps read-only and queries in place — a
+point lookup touches the header, a handful of key-table pages for the binary
+search, and the postings pages for that one callee. Nothing else is read.
+
+File layout (native byte order, every region 8-byte aligned)::
+
+    header        magic, byte-order check, counts, region offsets
+    str_offsets   u64[n_strings + 1]   start of each string in str_blob
+    str_blob      UTF-8 (surrogatepass) bytes of every interned string
+    keys          u32[n_keys * 3]      (key string id, first posting, count),
+                                       in the in-memory index's insertion order
+    key_order     u32[n_keys]          key-table rows sorted by key bytes
+    postings      u32[n_postings * 4]  packed (file id, caller id, line,
+                                       call-expr id) records, grouped by key
+
+Postings are stored *by key*, not as an edge table plus edge-id lists: an edge
+reachable under several keys (bare name, dotted form, alias) is duplicated so
+that each callee's records are one contiguous run. ``edge_ids(key)`` therefore
+returns a ``range`` of posting slots, which ``file_id``/``caller_id``/``record``
+accept exactly as ``CallersIndex`` accepts edge ids — so ``_bfs_level``,
+``rank_by_callers`` and ``find_uncalled`` run unchanged against either form.
+
+Keys keep the in-memory index's insertion order so iteration (and therefore
+tie order in ``rank_by_callers``) is identical whether an index was just built
+or mapped from disk.
+"""
+
+import mmap
+import os
+import struct
+from array import array
+from collections.abc import Mapping
+from typing import Any, Dict, Iterator, List, Optional
+
+_MAGIC = b'RVCALLS1'
+# Written in native order; a file produced on a machine of the other
+# endianness reads back as a different number and is rejected.
+_BYTE_ORDER_CHECK = 0x01020304
+# magic, check, n_strings, n_keys, n_postings, five region offsets, total size.
+_HEADER = struct.Struct('=8sIIII6Q')
+_STR_OFFSET = struct.Struct('=Q')
+_ALIGN = 8
+
+
+def _pad(length: int) -> int:
+    return (-length) % _ALIGN
+
+
+def serialize_callers_index(index: Any) -> bytes:
+    """Encode a ``CallersIndex`` into the mappable on-disk layout.
+
+    Reads the index's columns directly; the index itself is not modified.
+    """
+    strings: List[str] = index._strings
+    postings_by_key: Dict[str, array] = index._postings
+    ids: Dict[str, int] = dict(index._ids)
+    extra_strings: List[str] = []
+
+    def key_sid(key: str) -> int:
+        # Every posted key is normally interned already (it's a bare name or a
+        # call expression); an alias-derived canonical name may not be.
+        sid = ids.get(key)
+        if sid is None:
+            sid = ids[key] = len(strings) + len(extra_strings)
+            extra_strings.append(key)
+        return sid
+
+    all_strings = strings
+    keys = array('I')
+    records = array('I')
+    file_col, caller_col, line_col, expr_col = index._file, index._caller, index._line, index._expr
+    for key, edges in postings_by_key.items():
+        keys.append(key_sid(key))
+        keys.append(len(records) // 4)
+        keys.append(len(edges))
+        for edge in edges:
+            records.append(file_col[edge])
+            records.append(caller_col[edge])
+            records.append(line_col[edge])
+            records.append(expr_col[edge])
+    if extra_strings:
+        all_strings = strings + extra_strings
+
+    encoded = [s.encode('utf-8', 'surrogatepass') for s in all_strings]
+    str_offsets = array('Q', [0])
+    total = 0
+    for chunk in encoded:
+        total += len(chunk)
+        str_offsets.append(total)
+    blob = b''.join(encoded)
+
+    n_keys = len(postings_by_key)
+    key_bytes = [encoded[keys[row * 3]] for row in range(n_keys)]
+    key_order = array('I', sorted(range(n_keys), key=key_bytes.__getitem__))
+
+    parts: List[bytes] = []
+    offsets: List[int] = []
+    cursor = _HEADER.size + _pad(_HEADER.size)
+    for region in (str_offsets.tobytes(), blob, keys.tobytes(), key_order.tobytes(), records.tobytes()):
+        offsets.append(cursor)
+        parts.append(region)
+        parts.append(b'\0' * _pad(len(region)))
+        cursor += len(region) + _pad(len(region))
+    header = _HEADER.pack(
+        _MAGIC, _BYTE_ORDER_CHECK, len(all_strings), n_keys, len(records) // 4,
+        *offsets, cursor,
+    )
+    return b''.join([header, b'\0' * _pad(_HEADER.size)] + parts)
+
+
+class MappedCallersIndex(Mapping):
+    """Read-only ``CallersIndex`` look-alike served from a memory-mapped file.
+
+    Open with ``MappedCallersIndex.open(path)``, which returns None for a file
+    that is missing, truncated, or was written by an incompatible build — the
+    caller then rebuilds. Decoded strings are cached per instance, so repeated
+    lookups of the same file/caller names don't re-decode.
+    """
+
+    def __init__(self, buf: mmap.mmap, header: tuple) -> None:
+        (_, _, n_strings, n_keys, n_postings,
+         str_off_at, blob_at, keys_at, order_at, post_at, _size) = header
+        self._mm = buf
+        view = memoryview(buf)
+        self._str_offsets = view[str_off_at:str_off_at + 8 * (n_strings + 1)].cast('Q')
+        self._blob = view[blob_at:keys_at]
+        self._keys = view[keys_at:keys_at + 12 * n_keys].cast('I')
+        self._order = view[order_at:order_at + 4 * n_keys].cast('I')
+        self._records = view[post_at:post_at + 16 * n_postings].cast('I')
+        self._n_strings = n_strings
+        self._n_keys = n_keys
+        self._decoded: Dict[int, str] = {}
+
+    @classmethod
+    def open(cls, path: str) -> Optional['MappedCallersIndex']:
+        try:
+            with open(path, 'rb') as fh:
+                size = os.fstat(fh.fileno()).st_size
+                if size < _HEADER.size:
+                    return None
+                buf = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError):
+            return None
+        try:
+            header = _HEADER.unpack_from(buf, 0)
+        except struct.error:
+            buf.close()
+            return None
+        if not _header_is_valid(header, buf, size):
+            buf.close()
+            return None
+        return cls(buf, header)
+
+    # -- lookup helpers -----------------------------------------------------
+
+    def _string_bytes(self, sid: int) -> memoryview:
+        offsets = self._str_offsets
+        return self._blob[offsets[sid]:offsets[sid + 1]]
+
+    def _row(self, key: str) -> int:
+        """Key-table row for *key*, or -1. Binary search over ``key_order``."""
+        try:
+            target = key.encode('utf-8', 'surrogatepass')
+        except (AttributeError, UnicodeEncodeError):
+            return -1
+        keys, order = self._keys, self._order
+        lo, hi = 0, self._n_keys
+        while lo < hi:
+            mid = (lo + hi) // 2
+            row = order[mid]
+            probe = self._string_bytes(keys[row * 3]).tobytes()
+            if probe < target:
+                lo = mid + 1
+            elif probe > target:
+                hi = mid
+            else:
+                return row
+        return -1
+
+    # -- integer-level access (mirrors CallersIndex) ------------------------
+
+    def edge_ids(self, key: str) -> range:
+        """Posting slots for *key* (empty when absent)."""
+        row = self._row(key)
+        if row < 0:
+            return range(0)
+        start = self._keys[row * 3 + 1]
+        return range(start, start + self._keys[row * 3 + 2])
+
+    def file_id(self, edge: int) -> int:
+        return self._records[edge * 4]
+
+    def caller_id(self, edge: int) -> int:
+        return self._records[edge * 4 + 1]
+
+    def string(self, sid: int) -> str:
+        value = self._decoded.get(sid)
+        if value is None:
+            value = self._decoded[sid] = str(self._string_bytes(sid), 'utf-8', 'surrogatepass')
+        return value
+
+    def record(self, edge: int) -> Dict[str, Any]:
+        """Materialize posting *edge* as the public ``{file, caller, line, call_expr}`` dict."""
+        base = edge * 4
+        records = self._records
+        return {
+            'file': self.string(records[base]),
+            'caller': self.string(records[base + 1]),
+            'line': records[base + 2],
+            'call_expr': self.string(records[base + 3]),
+        }
+
+    @property
+    def edge_count(self) -> int:
+        return len(self._records) // 4
+
+    # -- Mapping protocol ---------------------------------------------------
+
+    def __getitem__(self, key: str) -> List[Dict[str, Any]]:
+        row = self._row(key)
+        if row < 0:
+            raise KeyError(key)
+        start = self._keys[row * 3 + 1]
+        return [self.record(e) for e in range(start, start + self._keys[row * 3 + 2])]
+
+    def __contains__(self, key: object) -> bool:
+        return isinstance(key, str) and self._row(key) >= 0
+
+    def __iter__(self) -> Iterator[str]:
+        keys = self._keys
+        for row in range(self._n_keys):
+            yield self.string(keys[row * 3])
+
+    def __len__(self) -> int:
+        return self._n_keys
+
+
+def _header_is_valid(header: tuple, buf: mmap.mmap, size: int) -> bool:
+    """Bounds-check every region the header points at against the file size,
+    and the last string offset against the blob it indexes into."""
+    (magic, check, n_strings, n_keys, n_postings,
+     str_off_at, blob_at, keys_at, order_at, post_at, total) = header
+    if magic != _MAGIC or check != _BYTE_ORDER_CHECK or total != size:
+        return False
+    regions = (
+        (str_off_at, 8 * (n_strings + 1)),
+        (blob_at, 0),
+        (keys_at, 12 * n_keys),
+        (order_at, 4 * n_keys),
+        (post_at, 16 * n_postings),
+    )
+    previous = _HEADER.size
+    for start, length in regions:
+        if start % _ALIGN or start < previous or start + length > size:
+            return False
+        previous = start + length
+    (last_offset,) = _STR_OFFSET.unpack_from(buf, str_off_at + 8 * n_strings)
+    return last_offset <= keys_at - blob_at
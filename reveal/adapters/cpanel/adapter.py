@@ -19,11 +19,17 @@ Examples:
     reveal cpanel://USERNAME/acl-check        # nobody ACL on all docroots
 """
 
+import hashlib
 import os
+import queue
 import re
 import socket
 import sys
-from typing import Dict, Any, Optional, List
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, wait
+from datetime import datetime, timezone
+from typing import Callable, Dict, Any, NamedTuple, Optional, List, Tuple
 from reveal.reveal_types import CONTRACT_VERSION
 
 # fcntl/struct/array are Unix-only; used only in _get_local_ips() for IP
@@ -35,7 +41,9 @@ if sys.platform != 'win32':
     import struct
 
 from ..base import ResourceAdapter, register_adapter, register_renderer
+from ...core import disk_cache
 from ...utils.query import parse_query_params
+from ...utils.threadsafe import main_thread_gc
 from ...utils.results import ResultBuilder
 from .renderer import CpanelRenderer
 
@@ -45,6 +53,19 @@ CPANEL_USERDATA_DIR = "/var/cpanel/userdata"
 CPANEL_SSL_DIR = "/var/cpanel/ssl/apache_tls"
 NGINX_USER_CONF_DIR = "/etc/nginx/conf.d/users"
 
+# Per-domain audit fan-out: DNS lookups and TLS probes are network-bound, so
+# the pool is sized by concurrent sockets, not CPUs. An operation still
+# running past its timeout is reported as an error and its result dropped;
+# its daemon thread is left behind and doesn't hold up interpreter exit.
+_AUDIT_MAX_WORKERS = 32
+_DNS_TIMEOUT = 10.0
+_TLS_TIMEOUT = 30.0
+
+# Parsed disk certs, one entry per SSL dir, reused while a cert file's
+# (mtime_ns, size) is unchanged — a repeat audit re-parses only renewed certs.
+_DISK_CERT_NAMESPACE = "cpanel_disk_certs"
+_DISK_CERT_MAX_ENTRIES = 8
+
 # Non-domain files that may appear in the userdata directory (cache, metadata, etc.)
 _USERDATA_ARTIFACT_EXTENSIONS = ('.cache', '.yaml', '.json', '.lock', '.tmp', '.db', '.bak', '.log')
 
@@ -254,9 +275,82 @@ def _list_user_domains(username: str) -> List[Dict[str, str]]:
     return entries
 
 
+class _DiskCert(NamedTuple):
+    """The fields of a parsed disk cert that its status is computed from."""
+    not_after: datetime
+    serial_number: str
+    common_name: str
+
+
+def _parse_disk_cert(cert_path: str) -> _DiskCert:
+    """Parse *cert_path*'s leaf cert. Raises whatever load_certificate_from_file raises."""
+    from ..ssl.certificate import load_certificate_from_file
+    leaf, _ = load_certificate_from_file(cert_path)
+    return _DiskCert(leaf.not_after, leaf.serial_number, leaf.common_name)
+
+
+class _DiskCertCache:
+    """Parsed disk certs under one cPanel SSL dir, persisted in the disk cache.
+
+    A cert is re-parsed only when its (mtime_ns, size) differs from the
+    saved entry; AutoSSL renewals rewrite the file, so they always are.
+    Certs that fail to parse aren't saved and are retried next time.
+    """
+
+    def __init__(self, ssl_dir: str):
+        self.ssl_dir = ssl_dir
+        self._key = hashlib.sha256(ssl_dir.encode('utf-8', 'surrogatepass')).hexdigest()
+        saved = disk_cache.get(_DISK_CERT_NAMESPACE, self._key)
+        self._entries: Dict[str, Tuple[Tuple[int, int], _DiskCert]] = saved if isinstance(saved, dict) else {}
+        self._changed = False
+        self._lock = threading.Lock()
+
+    def load(self, cert_path: str) -> _DiskCert:
+        try:
+            st = os.stat(cert_path)
+        except OSError:
+            with self._lock:
+                if self._entries.pop(cert_path, None) is not None:
+                    self._changed = True
+            return _parse_disk_cert(cert_path)
+        stat = (st.st_mtime_ns, st.st_size)
+        with self._lock:
+            entry = self._entries.get(cert_path)
+        if entry is not None and entry[0] == stat:
+            return entry[1]
+        cert = _parse_disk_cert(cert_path)
+        with self._lock:
+            self._entries[cert_path] = (stat, cert)
+            self._changed = True
+        return cert
+
+    def save(self) -> None:
+        """Persist the entries if any cert was parsed since the last save."""
+        with self._lock:
+            if not self._changed:
+                return
+            entries = dict(self._entries)
+            self._changed = False
+        disk_cache.put(_DISK_CERT_NAMESPACE, self._key, entries, max_entries=_DISK_CERT_MAX_ENTRIES)
+
+
+_disk_certs: Optional[_DiskCertCache] = None
+
+
+def _disk_cert_cache() -> _DiskCertCache:
+    """The process's _DiskCertCache for CPANEL_SSL_DIR, loaded on first use."""
+    global _disk_certs
+    if _disk_certs is None or _disk_certs.ssl_dir != CPANEL_SSL_DIR:
+        _disk_certs = _DiskCertCache(CPANEL_SSL_DIR)
+    return _disk_certs
+
+
 def _get_disk_cert_status(domain: str) -> Dict[str, Any]:
     """Load cPanel disk cert for domain and return status dict.
 
+    The parse is reused from the disk cert cache while the file is unchanged;
+    callers looping over domains call _disk_cert_cache().save() afterwards.
+
     Returns dict with: status ('ok'|'missing'|'expired'|'expiring'|'error'),
     days_until_expiry, not_after (str), serial_number.
     """
@@ -265,9 +359,8 @@ def _get_disk_cert_status(domain: str) -> Dict[str, Any]:
         return {'status': 'missing', 'cert_path': cert_path}
 
     try:
-        from ..ssl.certificate import load_certificate_from_file
-        leaf, _ = load_certificate_from_file(cert_path)
-        days = leaf.days_until_expiry
+        cert = _disk_cert_cache().load(cert_path)
+        days = (cert.not_after - datetime.now(timezone.utc)).days
         if days < 0:
             status = 'expired'
         elif days < 7:
@@ -280,26 +373,32 @@ def _get_disk_cert_status(domain: str) -> Dict[str, Any]:
             'status': status,
             'cert_path': cert_path,
             'days_until_expiry': days,
-            'not_after': leaf.not_after.strftime('%Y-%m-%d'),
-            'serial_number': leaf.serial_number,
-            'common_name': leaf.common_name,
+            'not_after': cert.not_after.strftime('%Y-%m-%d'),
+            'serial_number': cert.serial_number,
+            'common_name': cert.common_name,
         }
     except Exception as exc:
         return {'status': 'error', 'cert_path': cert_path, 'error': str(exc)[:80]}
 
 
-def _get_live_cert_status(domain: str) -> Dict[str, Any]:
+def _probe_tls(domain: str) -> Dict[str, Any]:
+    """check_ssl_health() on port 443 with the audit thresholds (30/7 days)."""
+    from ..ssl.certificate import check_ssl_health
+    return check_ssl_health(domain, 443, warn_days=30, critical_days=7)
+
+
+def _get_live_cert_status(domain: str, probes: Optional['_HostProbes'] = None) -> Dict[str, Any]:
     """Fetch live SSL cert for a domain and return status dict.
 
     Used by --check-live to cross-reference disk cert against what the server
     is actually serving (surfaces CDN/edge renewals where disk cert is stale).
+    *probes* shares the TLS probe with other checks of the same host.
 
     Returns dict with: live_status ('ok'|'expiring'|'critical'|'expired'|'error'),
     live_days_until_expiry, live_not_after, live_serial.
     """
     try:
-        from ..ssl.certificate import check_ssl_health
-        result = check_ssl_health(domain, 443)
+        result = probes.tls(domain) if probes is not None else _probe_tls(domain)
         cert = result.get('certificate', {})
         if not cert:
             return {'live_status': 'error', 'live_error': result.get('error', 'no cert data')[:80]}
@@ -384,6 +483,151 @@ def _get_local_ips() -> set:
     return ips
 
 
+class _HostProbes:
+    """DNS and TLS results for one audit, shared by every check of a host.
+
+    Hostnames repeat within an audit (full-audit's nginx section has a row
+    per ACME location, often several per domain; names differ only in case
+    or a trailing dot); each is resolved and probed once. A second request
+    for a host whose probe is still running waits for it rather than
+    opening another connection.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._results: Dict[Tuple[str, str], Future] = {}
+
+    def _get(self, kind: str, host: str, probe: Callable[[str], Any]) -> Any:
+        key = (kind, host.lower().rstrip('.'))
+        with self._lock:
+            future = self._results.get(key)
+            owner = future is None
+            if owner:
+                future = self._results[key] = Future()
+        if owner:
+            try:
+                future.set_result(probe(host))
+            except Exception as exc:
+                future.set_exception(exc)
+        return future.result()
+
+    def ips(self, host: str) -> List[str]:
+        return self._get('dns', host, _dns_resolve_ips)
+
+    def tls(self, host: str) -> Dict[str, Any]:
+        return self._get('tls', host, _probe_tls)
+
+
+def _enrich_acme_row(row: Dict[str, Any], probes: _HostProbes) -> Dict[str, Any]:
+    """An extract_acme_roots() row plus the live cert status of its domain."""
+    try:
+        ssl_result = probes.tls(row['domain'])
+        leaf = ssl_result.get('leaf', {})
+        return {**row,
+                'ssl_status': ssl_result.get('status', 'unknown'),
+                'ssl_days': leaf.get('days_until_expiry'),
+                'ssl_not_after': leaf.get('not_after', '')}
+    except Exception as exc:
+        return {**row, 'ssl_status': 'error', 'ssl_days': None,
+                'ssl_not_after': str(exc)[:60]}
+
+
+def _audit_workers(n_tasks: int) -> int:
+    """Threads for the per-domain fan-out; REVEAL_MAX_WORKERS overrides."""
+    override = os.environ.get('REVEAL_MAX_WORKERS')
+    if override:
+        try:
+            return max(1, min(int(override), n_tasks))
+        except ValueError:
+            pass
+    return max(1, min(_AUDIT_MAX_WORKERS, n_tasks))
+
+
+def _daemon_worker(jobs: 'queue.Queue') -> None:
+    """Run (future, call) jobs until a None sentinel arrives."""
+    while True:
+        job = jobs.get()
+        if job is None:
+            return
+        future, call = job
+        if not future.set_running_or_notify_cancel():
+            continue
+        try:
+            future.set_result(call())
+        except BaseException as exc:
+            future.set_exception(exc)
+
+
+def _run_fanout(calls: Dict[Any, Callable[[], Any]], timeout: Optional[float],
+                on_timeout: Callable[[Any], Any]) -> Dict[Any, Any]:
+    """Run independent per-domain *calls* on a bounded pool of daemon threads.
+
+    A call that has been running for longer than *timeout* seconds gets
+    ``on_timeout(key)`` as its result. getaddrinfo() and a TLS handshake
+    can't be interrupted, so its thread keeps running, but the threads are
+    daemons: unlike ThreadPoolExecutor workers, which are joined at
+    interpreter exit, a hung lookup doesn't keep the CLI alive. Each
+    abandoned call's thread is replaced by a fresh worker, so calls still
+    queued behind hung ones start (and are timed) without waiting. With one
+    worker (or REVEAL_MAX_WORKERS=1) the calls run serially in this thread,
+    without timeouts.
+
+    Returns:
+        {key: result} for every key in *calls*.
+    """
+    workers = _audit_workers(len(calls))
+    if workers <= 1:
+        return {key: call() for key, call in calls.items()}
+
+    started: Dict[Any, float] = {}
+
+    def timed(key: Any) -> Any:
+        started[key] = time.monotonic()
+        return calls[key]()
+
+    results: Dict[Any, Any] = {}
+    jobs: 'queue.Queue' = queue.Queue()
+    futures: Dict[Future, Any] = {}
+    for key in calls:
+        future: Future = Future()
+        futures[future] = key
+        jobs.put((future, lambda key=key: timed(key)))
+
+    def start_worker() -> None:
+        threading.Thread(target=_daemon_worker, args=(jobs,), daemon=True,
+                         name='reveal-cpanel-audit').start()
+
+    for _ in range(workers):
+        start_worker()
+    spawned = workers
+    pending = set(futures)
+    try:
+        with main_thread_gc():
+            while pending:
+                wake = None
+                if timeout is not None:
+                    running = [started[futures[f]] for f in pending if futures[f] in started]
+                    wake = max(0.05, min(running) + timeout - time.monotonic()) if running else timeout
+                done, pending = wait(pending, timeout=wake, return_when=FIRST_COMPLETED)
+                for future in done:
+                    results[futures[future]] = future.result()
+                if timeout is not None:
+                    now = time.monotonic()
+                    for future in [f for f in pending
+                                   if futures[f] in started and now - started[futures[f]] > timeout]:
+                        pending.discard(future)
+                        results[futures[future]] = on_timeout(futures[future])
+                        if any(futures[f] not in started for f in pending):
+                            start_worker()
+                            spawned += 1
+    finally:
+        for future in pending:
+            future.cancel()
+        for _ in range(spawned):
+            jobs.put(None)
+    return results
+
+
 _SCHEMA_ELEMENTS = {
     '(none)': 'Overview: domain count, SSL summary, nginx config path',
     'domains': 'All addon/subdomain domains with docroots and type',
@@ -448,6 +692,7 @@ _SCHEMA_OUTPUT_TYPES = [
                 'days_until_expiry': {'type': ['number', 'null']},
                 'dns_resolves': {'type': 'boolean', 'description': 'Only present when dns_verified=true; false = NXDOMAIN'},
                 'dns_points_here': {'type': ['boolean', 'null'], 'description': 'Only present when dns_verified=true and domain resolves; false = points to different server'},
+                'dns_error': {'type': 'string', 'description': 'Only present when the DNS lookup timed out (domain then counts as not resolving)'},
             }}},
             'next_steps': {'type': 'array', 'items': {'type': 'string'}},
         }},
@@ -642,6 +887,7 @@ class CpanelAdapter(ResourceAdapter):
         for d in domains:
             status = _get_disk_cert_status(d['domain'])['status']
             ssl_summary[status] = ssl_summary.get(status, 0) + 1
+        _disk_cert_cache().save()
 
         nginx_conf = os.path.join(NGINX_USER_CONF_DIR, f'{self.username}.conf')
         nginx_present = os.path.exists(nginx_conf)
@@ -695,29 +941,49 @@ class CpanelAdapter(ResourceAdapter):
     def _get_ssl_structure(self, dns_verified: bool = False,
                            only_failures: bool = False,
                            domain_type_filter: Optional[str] = None,
-                           check_live: bool = False) -> Dict[str, Any]:
-        """Disk cert health per domain."""
+                           check_live: bool = False,
+                           probes: Optional[_HostProbes] = None) -> Dict[str, Any]:
+        """Disk cert health per domain.
+
+        Disk certs are read through the disk cert cache; DNS lookups and
+        --check-live probes fan out over a thread pool (_run_fanout), sharing
+        *probes* with the rest of a full audit.
+        """
         domains = self._get_domains()
         local_ips = _get_local_ips() if dns_verified else set()
-        certs = []
+        probes = probes if probes is not None else _HostProbes()
+        certs: List[Dict[str, Any]] = []
         for d in domains:
             status = _get_disk_cert_status(d['domain'])
-            entry: Dict[str, Any] = {
+            certs.append({
                 'domain': d['domain'],
                 'domain_type': d.get('type', 'unknown'),
                 **status,
-            }
-            if dns_verified:
-                resolved_ips = _dns_resolve_ips(d['domain'])
+            })
+        _disk_cert_cache().save()
+
+        if dns_verified:
+            resolved = _run_fanout(
+                {i: (lambda domain=entry['domain']: probes.ips(domain)) for i, entry in enumerate(certs)},
+                _DNS_TIMEOUT, lambda i: None)
+            for i, entry in enumerate(certs):
+                resolved_ips = resolved[i]
+                if resolved_ips is None:
+                    entry['dns_error'] = f'lookup timed out after {_DNS_TIMEOUT:g}s'
+                    resolved_ips = []
                 entry['dns_resolves'] = bool(resolved_ips)
                 if resolved_ips and local_ips:
                     entry['dns_points_here'] = bool(set(resolved_ips) & local_ips)
                 elif resolved_ips:
                     entry['dns_points_here'] = None  # resolved but couldn't determine local IPs
-            if check_live and entry['status'] != 'ok':
-                live = _get_live_cert_status(d['domain'])
-                entry.update(live)
-            certs.append(entry)
+        if check_live:
+            live = _run_fanout(
+                {i: (lambda domain=entry['domain']: _get_live_cert_status(domain, probes))
+                 for i, entry in enumerate(certs) if entry['status'] != 'ok'},
+                _TLS_TIMEOUT,
+                lambda i: {'live_status': 'error', 'live_error': f'timed out after {_TLS_TIMEOUT:g}s'})
+            for i, result in live.items():
+                certs[i].update(result)
 
         # Apply domain_type filter (from URI query param ?domain_type=...)
         if domain_type_filter:
@@ -776,13 +1042,17 @@ class CpanelAdapter(ResourceAdapter):
         )
 
     def _get_acl_structure(self, only_failures: bool = False) -> Dict[str, Any]:
-        """nobody ACL health per domain docroot."""
+        """nobody ACL health per domain docroot (checked concurrently; getfacl is a subprocess)."""
         domains = self._get_domains()
+        acls = _run_fanout(
+            {docroot: (lambda docroot=docroot: _check_docroot_acl(docroot))
+             for docroot in {d['docroot'] for d in domains if d['docroot']}},
+            None, lambda docroot: None)
         acl_results = []
         for d in domains:
             docroot = d['docroot']
             if docroot:
-                acl = _check_docroot_acl(docroot)
+                acl = acls[docroot]
                 acl_results.append({
                     'domain': d['domain'],
                     'docroot': docroot,
@@ -826,9 +1096,15 @@ class CpanelAdapter(ResourceAdapter):
 
     def _get_full_audit_structure(self, dns_verified: bool = False,
                                   only_failures: bool = False) -> Dict[str, Any]:
-        """Composite audit: ssl + acl-check + nginx ACME in one pass."""
+        """Composite audit: ssl + acl-check + nginx ACME in one pass.
+
+        All sections share one _HostProbes, so each host is resolved and
+        TLS-probed at most once per audit.
+        """
+        probes = _HostProbes()
         ssl_data = self._get_ssl_structure(dns_verified=dns_verified,
-                                            only_failures=only_failures)
+                                            only_failures=only_failures,
+                                            probes=probes)
         acl_data = self._get_acl_structure(only_failures=only_failures)
 
         # nginx ACME audit — optional (only if conf file exists)
@@ -837,23 +1113,17 @@ class CpanelAdapter(ResourceAdapter):
         if os.path.exists(nginx_conf):
             try:
                 from ...analyzers.nginx import NginxAnalyzer
-                from ...adapters.ssl.certificate import check_ssl_health
                 analyzer = NginxAnalyzer(nginx_conf)
                 rows = analyzer.extract_acme_roots()
                 if rows:
+                    enriched_rows = _run_fanout(
+                        {i: (lambda row=row: _enrich_acme_row(row, probes)) for i, row in enumerate(rows)},
+                        _TLS_TIMEOUT,
+                        lambda i: {**rows[i], 'ssl_status': 'error', 'ssl_days': None,
+                                   'ssl_not_after': f'timed out after {_TLS_TIMEOUT:g}s'})
                     results = []
-                    for row in rows:
-                        try:
-                            ssl_result = check_ssl_health(row['domain'], warn_days=30,
-                                                          critical_days=7)
-                            leaf = ssl_result.get('leaf', {})
-                            enriched = {**row,
-                                        'ssl_status': ssl_result.get('status', 'unknown'),
-                                        'ssl_days': leaf.get('days_until_expiry'),
-                                        'ssl_not_after': leaf.get('not_after', '')}
-                        except Exception as exc:
-                            enriched = {**row, 'ssl_status': 'error', 'ssl_days': None,
-                                        'ssl_not_after': str(exc)[:60]}
+                    for i in range(len(rows)):
+                        enriched = enriched_rows[i]
                         acl_fail = enriched['acl_status'] == 'denied'
                         ssl_fail = enriched['ssl_status'] in ('expired', 'error')
                         enriched['has_failure'] = acl_fail or ssl_fail
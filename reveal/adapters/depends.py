@@ -9,6 +9,7 @@ Usage:
     reveal 'depends://src?format=dot'      # GraphViz output
 """
 
+import hashlib
 import os
 import sys
 from pathlib import Path
@@ -16,6 +17,7 @@ from typing import Dict, Any, List, NamedTuple, Optional, Set, Tuple
 from reveal.reveal_types import CONTRACT_VERSION
 
 from .base import ResourceAdapter, register_adapter, register_renderer
+from ..core import disk_cache
 from ..utils import print_json_result
 from ..analyzers.imports import ImportGraph, ImportStatement
 from ..analyzers.imports.base import get_extractor, get_all_extensions, get_supported_languages
@@ -68,6 +70,116 @@ class _ResolutionIndices(NamedTuple):
     load_path_roots: List[Path]         # BACK-669: extra gemspec-registered lib/ search roots
 
 
+# Disk-cache namespace for depends:// scan snapshots. One entry per scan scope
+# (root, parse extensions, file cap) holding what the last build of that scope
+# parsed and resolved, so asking "who imports X" for several files of one tree
+# re-assembles the graph instead of re-parsing and re-resolving every file,
+# and an edit re-parses and re-resolves only the files whose stat changed.
+_SNAPSHOT_NAMESPACE = "depends_snapshot"
+_SNAPSHOT_MAX_ENTRIES = 64
+
+
+class _FileFacts(NamedTuple):
+    """Everything the resolution-index pass parses out of one file — the
+    per-file delta a snapshot carries. Path-derived facts (Zeitwerk constant
+    path, SwiftPM module) are cheap and recomputed instead."""
+    imports: List[ImportStatement]
+    declared: List[str]                  # declared packages/namespaces
+    member_keys: List[Tuple[str, str]]   # member_index keys, in insertion order
+    constant_refs: Optional[List[Tuple[int, str]]]  # Zeitwerk references; None until needed
+
+
+class _FileEdges(NamedTuple):
+    """One importer's resolved statements, recorded instead of written
+    straight into the graph so a snapshot can replay them for a file whose
+    facts and resolution context are both unchanged."""
+    targets: Set[Path]
+    resolved_paths: Dict[str, Path]
+    edge_stmts: Dict[Tuple[Path, Path], ImportStatement]
+    unresolved: List[ImportStatement]   # intra-project statements with no edge
+
+
+class _ScanSnapshot(NamedTuple):
+    """A persisted `_build_graph` result for one scan scope."""
+    stats: Dict[str, Tuple[int, int]]    # every discovered file → (mtime_ns, size)
+    constants: Tuple[Dict[str, Tuple[str, str]], Set[str]]
+    constants_sig: Tuple                 # stats of the define()-eligible files
+    manifests: Tuple[List[Tuple[Path, str]], Set[str], List[Path]]
+    facts: Dict[Path, _FileFacts]
+    context: str                         # `_resolution_context` digest
+    edges: Dict[Path, _FileEdges]
+
+
+def _scope_key(scan_root: Path, supported_exts: frozenset, file_cap: int) -> str:
+    raw = '\0'.join((str(scan_root), ','.join(sorted(supported_exts)), str(file_cap)))
+    return hashlib.sha256(raw.encode('utf-8', 'surrogatepass')).hexdigest()
+
+
+def _scan_stats(
+    files: List[Path], file_index: Dict[str, List[Path]],
+) -> Dict[str, Tuple[int, int]]:
+    """(mtime_ns, size) for every discovered file — the tree fingerprint.
+
+    Covers the whole basename index, not just the parse corpus: resolution
+    also reads non-source files (package manifests, ``.inc`` include
+    targets), so editing one of those must invalidate resolved edges too.
+    An unstat-able entry (broken symlink) is recorded as (-1, -1) so its
+    presence still counts.
+    """
+    stats: Dict[str, Tuple[int, int]] = {}
+    for paths in [files, *file_index.values()]:
+        for fp in paths:
+            try:
+                st = fp.stat()
+                stats[str(fp)] = (st.st_mtime_ns, st.st_size)
+            except OSError:
+                stats[str(fp)] = (-1, -1)
+    return stats
+
+
+def _constants_signature(files: List[Path], stats: Dict[str, Tuple[int, int]]) -> Tuple:
+    """Stats of the files `_build_constant_index` may scan (BACK-565)."""
+    sig = []
+    for fp in files:
+        spec = getattr(get_extractor(fp), 'spec', None)
+        if getattr(spec, 'constant_define_call_names', None):
+            sig.append((str(fp), stats.get(str(fp))))
+    return tuple(sig)
+
+
+def _resolution_context(
+    stats: Dict[str, Tuple[int, int]], files: List[Path],
+    indices: '_ResolutionIndices', scan_root: Path,
+) -> str:
+    """Digest of everything statement resolution reads besides the statement.
+
+    That is the set of files that exist (resolvers probe the filesystem), the
+    contents of every non-corpus file (manifests a resolver may read), and
+    the cross-file indices. A corpus file's own stat is left out: editing a
+    file body changes only that file's statements unless the edit also
+    changes what it declares, which the index part of the digest catches.
+    Files outside ``scan_root`` (or in skipped directories) aren't covered.
+    """
+    def items(index: Dict[Any, List[Path]]) -> List[Tuple[str, List[str]]]:
+        return sorted((repr(k), sorted(str(p) for p in v)) for k, v in index.items())
+
+    corpus = {str(f) for f in files}
+    hasher = hashlib.sha256(str(scan_root).encode('utf-8', 'surrogatepass'))
+    for path_str in sorted(stats):
+        hasher.update(path_str.encode('utf-8', 'surrogatepass'))
+        if path_str not in corpus:
+            hasher.update(repr(stats[path_str]).encode('ascii'))
+        hasher.update(b'\0')
+    hasher.update(repr((
+        items(indices.namespace_index),
+        items(indices.member_index),
+        items(indices.module_index),
+        sorted(indices.project_namespaces),
+        [str(p) for p in indices.load_path_roots],
+    )).encode('utf-8', 'surrogatepass'))
+    return hasher.hexdigest()
+
+
 def _has_project_marker(directory: Path) -> bool:
     """True if *directory* holds a depends:// project-root marker (package or
     VCS, union of both tiers). A missing marker is a hang, not a cosmetic gap
@@ -440,6 +552,12 @@ class DependsAdapter(ResourceAdapter):
         # therefore excluded from resolution.
         self._constants_indexed = 0
         self._constants_ambiguous = 0
+        # Per-scan parse/resolution results, persisted as a `_ScanSnapshot`
+        # by _build_graph so the next build of the same scope can reuse them.
+        self._file_facts: Dict[Path, _FileFacts] = {}
+        self._file_edges: Dict[Path, _FileEdges] = {}
+        self._scan_constants: Optional[tuple] = None
+        self._scan_manifests: Optional[tuple] = None
 
     def get_structure(self, **kwargs) -> Dict[str, Any]:
         """Build import graph and return reverse-dependency view.
@@ -610,6 +728,14 @@ class DependsAdapter(ResourceAdapter):
         file-count cap's non-determinism for single-language targets
         (``None`` — directory targets, which may span languages — stays
         unscoped across every supported extension, the pre-BACK-525 shape).
+
+        Snapshots: each build is saved per scan scope (``_SNAPSHOT_NAMESPACE``)
+        with every file's parse facts and resolved edges. The next build of
+        the scope re-parses only files whose (mtime_ns, size) changed, and
+        replays the saved edges of every other file as long as the resolution
+        context (file set, non-corpus files, cross-file indices) is the same;
+        otherwise every file is re-resolved from its facts, still without a
+        re-parse. A repeat query on an unchanged tree parses nothing.
         """
         supported_exts = scan_extensions if scan_extensions is not None else frozenset(get_all_extensions())
         self._scan_root = scan_root
@@ -626,10 +752,36 @@ class DependsAdapter(ResourceAdapter):
         # indices; (3) resolve each import to graph edges; (4) add the
         # convention-only Zeitwerk edges.
         files, file_index = self._discover_files(scan_root, supported_exts)
-        indices = self._build_resolution_indices(files, scan_root)
+        stats = _scan_stats(files, file_index)
+        scope = _scope_key(scan_root, supported_exts, self._SCAN_FILE_CAP)
+        previous = disk_cache.get(_SNAPSHOT_NAMESPACE, scope)
+        if not isinstance(previous, _ScanSnapshot):
+            previous = None
+        indices = self._build_resolution_indices(files, scan_root, stats=stats, previous=previous)
         self._graph = ImportGraph.from_imports(indices.all_imports)
-        self._resolve_edges(scan_root, file_index, indices)
+        context = _resolution_context(stats, files, indices, scan_root)
+        reusable_edges = None
+        if previous is not None and previous.context == context:
+            reusable_edges = {
+                fp: edges for fp, edges in previous.edges.items()
+                if self._file_facts.get(fp) is previous.facts.get(fp)
+            }
+        self._resolve_edges(scan_root, file_index, indices, reusable_edges=reusable_edges)
         self._build_zeitwerk_edges(files, indices.zeitwerk_index)
+        if previous is None or previous.stats != stats or previous.facts != self._file_facts:
+            disk_cache.put(
+                _SNAPSHOT_NAMESPACE, scope,
+                _ScanSnapshot(
+                    stats=stats,
+                    constants=self._scan_constants[:2],
+                    constants_sig=self._scan_constants[2],
+                    manifests=self._scan_manifests,
+                    facts=self._file_facts,
+                    context=context,
+                    edges=self._file_edges,
+                ),
+                max_entries=_SNAPSHOT_MAX_ENTRIES,
+            )
 
     def _discover_files(
         self, scan_root: Path, supported_exts: frozenset,
@@ -677,7 +829,11 @@ class DependsAdapter(ResourceAdapter):
                     break
         return files, file_index
 
-    def _build_resolution_indices(self, files: List[Path], scan_root: Path) -> '_ResolutionIndices':
+    def _build_resolution_indices(
+        self, files: List[Path], scan_root: Path,
+        stats: Optional[Dict[str, Tuple[int, int]]] = None,
+        previous: Optional['_ScanSnapshot'] = None,
+    ) -> '_ResolutionIndices':
         """Parse every file in `files` once into the resolution indices.
 
         One pass over the parse corpus that produces everything edge
@@ -685,6 +841,13 @@ class DependsAdapter(ResourceAdapter):
         package/namespace declaration sets, and the namespace / member /
         Zeitwerk indices. Also updates the autoload-coverage and
         PHP-constant counters as a side effect.
+
+        With a ``previous`` snapshot of the same scope and the current
+        ``stats``, a file whose stat is unchanged keeps its saved facts
+        instead of being parsed again (a spec-driven file also needs the
+        same constant index, which its imports were extracted against), and
+        the constant index and manifest tables are reused when their inputs
+        are unchanged. The facts used end up in ``self._file_facts``.
         """
         all_imports: List[ImportStatement] = []
         # BACK-547/544/549: the set of packages/namespaces the tree declares,
@@ -749,14 +912,23 @@ class DependsAdapter(ResourceAdapter):
         # defined later in the walk than a file that references it needs a
         # second pass to resolve — capped at a small iteration count since
         # real chains are only 2-3 levels deep, never unbounded.
-        constant_index, constant_ambiguous = self._build_constant_index(files)
+        constants_sig = _constants_signature(files, stats) if stats is not None else ()
+        if previous is not None and stats is not None and previous.constants_sig == constants_sig:
+            constant_index, constant_ambiguous = previous.constants
+        else:
+            constant_index, constant_ambiguous = self._build_constant_index(files)
+        self._scan_constants = (constant_index, constant_ambiguous, constants_sig)
         self._constants_indexed = len(constant_index)
         self._constants_ambiguous = len(constant_ambiguous)
         # BACK-567: explicit-`path:` target dirs from every Package.swift, built
         # once before the per-file loop so each Swift file's module lookup can
         # prefer an authoritative manifest mapping over the directory
         # convention (see _swift_module_for).
-        manifest_dirs = self._build_manifest_module_dirs(files)
+        unchanged_tree = previous is not None and previous.stats == stats
+        if unchanged_tree:
+            manifest_dirs, manifest_targets, load_path_roots = previous.manifests
+        else:
+            manifest_dirs = self._build_manifest_module_dirs(files)
         # BACK-669 (swift-collections second corpus): a broader, position-
         # independent set of target NAMES declared anywhere in the manifest,
         # unioned into project_namespaces below (not module_index) so a
@@ -764,13 +936,17 @@ class DependsAdapter(ResourceAdapter):
         # literal `path:` for _build_manifest_module_dirs to resolve) is
         # still known as real and in-tree for honest-decline purposes, even
         # when it can't be fanned out to real files.
-        project_namespaces.update(self._build_manifest_target_names(files))
+        if not unchanged_tree:
+            manifest_targets = self._build_manifest_target_names(files)
+        project_namespaces.update(manifest_targets)
         # BACK-669: extra bare-import search roots for a multi-package monorepo
         # (RubyGems' *.gemspec + lib/, spec.load_path_manifest_glob). Built once
         # per scan, gated on the language actually being present (files may span
         # languages for a directory target), so this is a no-op glob for every
         # other tree.
-        load_path_roots = self._build_load_path_roots(files, scan_root)
+        if not unchanged_tree:
+            load_path_roots = self._build_load_path_roots(files, scan_root)
+        self._scan_manifests = (manifest_dirs, manifest_targets, load_path_roots)
         # Built empty and mutated in place by _index_one_file below — every
         # field is a mutable List/Set/Dict, so there is no reassignment
         # risk, and it lets the per-file helper take the same one-bundle
@@ -785,25 +961,36 @@ class DependsAdapter(ResourceAdapter):
             module_index=module_index,
             load_path_roots=load_path_roots,
         )
+        self._file_facts = {}
+        constants_unchanged = previous is not None and previous.constants[0] == constant_index
         for file_path in files:
             extractor = get_extractor(file_path)
             if not extractor:
                 continue
-            self._index_one_file(file_path, extractor, constant_index, manifest_dirs, indices)
+            facts = None
+            if previous is not None and stats is not None:
+                path_str = str(file_path)
+                prior = previous.facts.get(file_path)
+                if (prior is not None and stats.get(path_str) == previous.stats.get(path_str)
+                        and (constants_unchanged or getattr(extractor, 'spec', None) is None)):
+                    facts = prior
+            self._index_one_file(file_path, extractor, constant_index, manifest_dirs, indices, facts=facts)
 
         return indices
 
     def _index_one_file(
         self, file_path: Path, extractor, constant_index: Dict[str, Tuple[str, str]],
         manifest_dirs: List[Tuple[Path, str]], indices: '_ResolutionIndices',
+        facts: Optional['_FileFacts'] = None,
     ) -> None:
         """One file's contribution to every `_build_resolution_indices` index
         (BACK-919 phase-split of the former single per-file loop body).
-        Mutates `indices`' fields in place."""
-        if getattr(extractor, 'spec', None) is not None:
-            file_imports = extractor.extract_imports(file_path, constant_index=constant_index)
-        else:
-            file_imports = extractor.extract_imports(file_path)
+        Mutates `indices`' fields in place. `facts` are the file's saved
+        parse results when still valid; otherwise the file is parsed."""
+        if facts is None:
+            facts = self._extract_file_facts(file_path, extractor, constant_index)
+        self._file_facts[file_path] = facts
+        file_imports = facts.imports
         indices.all_imports.extend(file_imports)
         spec = getattr(extractor, 'spec', None)
         # BACK-557: require-statement coverage for the convention-autoloaded
@@ -835,16 +1022,33 @@ class DependsAdapter(ResourceAdapter):
             if module_name:
                 indices.module_index.setdefault(module_name, []).append(file_path)
                 indices.project_namespaces.add(module_name)
-        if getattr(spec, 'resolve_namespaces', False) or getattr(spec, 'package_node_types', None):
-            declared = extractor.extract_namespaces(file_path)
-            indices.project_namespaces.update(declared)
+        if facts.declared:
+            indices.project_namespaces.update(facts.declared)
             if getattr(spec, 'resolve_namespaces', False):
-                for ns in declared:
+                for ns in facts.declared:
                     indices.namespace_index.setdefault(ns, []).append(file_path)
+        for key in facts.member_keys:
+            indices.member_index.setdefault(key, []).append(file_path)
+
+    @staticmethod
+    def _extract_file_facts(
+        file_path: Path, extractor, constant_index: Dict[str, Tuple[str, str]],
+    ) -> '_FileFacts':
+        """Parse one file for `_index_one_file`: its imports, declared
+        packages/namespaces, and the member-index keys it contributes."""
+        spec = getattr(extractor, 'spec', None)
+        if spec is not None:
+            file_imports = extractor.extract_imports(file_path, constant_index=constant_index)
+        else:
+            file_imports = extractor.extract_imports(file_path)
+        declared: List[str] = []
+        member_keys: List[Tuple[str, str]] = []
+        if getattr(spec, 'resolve_namespaces', False) or getattr(spec, 'package_node_types', None):
+            declared = list(extractor.extract_namespaces(file_path))
             if getattr(spec, 'member_symbol_fallback', False) and declared:
                 for symbol in extractor.extract_top_level_members(file_path):
                     for ns in declared:
-                        indices.member_index.setdefault((ns, symbol), []).append(file_path)
+                        member_keys.append((ns, symbol))
             if getattr(spec, 'container_member_fallback', False) and declared:
                 # BACK-557 Scala measurement loop: `import a.b.container.member`
                 # where `container` is a lowerCamelCase top-level object (e.g.
@@ -858,8 +1062,7 @@ class DependsAdapter(ResourceAdapter):
                 sep = spec.module_separator or ''
                 for container_name, symbol in extractor.extract_container_members(file_path):
                     for ns in declared:
-                        key = (f'{ns}{sep}{container_name}', symbol)
-                        indices.member_index.setdefault(key, []).append(file_path)
+                        member_keys.append((f'{ns}{sep}{container_name}', symbol))
             if getattr(spec, 'namespaced_type_fallback', False) and declared:
                 # BACK-669 C# recall loop: `using static Foo.Bar.Type;` /
                 # `using Alias = Foo.Bar.Type;` name a specific TYPE, one
@@ -875,7 +1078,8 @@ class DependsAdapter(ResourceAdapter):
                 # member_symbol_fallback populates above.
                 for typename in extractor.extract_namespaced_type_names(file_path):
                     for ns in declared:
-                        indices.member_index.setdefault((ns, typename), []).append(file_path)
+                        member_keys.append((ns, typename))
+        return _FileFacts(file_imports, declared, member_keys, None)
 
     @staticmethod
     def _build_load_path_roots(files: List[Path], scan_root: Path) -> List[Path]:
@@ -991,73 +1195,103 @@ class DependsAdapter(ResourceAdapter):
     def _resolve_edges(
         self, scan_root: Path, file_index: Dict[str, List[Path]],
         indices: '_ResolutionIndices',
+        reusable_edges: Optional[Dict[Path, '_FileEdges']] = None,
     ) -> None:
         """Resolve every extracted import into dependency (and reverse_deps)
-        edges, one file at a time."""
+        edges, one file at a time. A file in ``reusable_edges`` (saved by the
+        previous snapshot, still valid) is replayed instead of re-resolved."""
+        self._file_edges = {}
         for file_path, imports in self._graph.files.items():
-            extractor = get_extractor(file_path)
-            if not extractor:
+            edges = reusable_edges.get(file_path) if reusable_edges else None
+            if edges is None:
+                edges = self._resolve_file_edges(file_path, imports, scan_root, file_index, indices)
+            if edges is None:
                 continue
+            self._file_edges[file_path] = edges
+            self._apply_file_edges(file_path, edges)
+
+    def _apply_file_edges(self, file_path: Path, edges: '_FileEdges') -> None:
+        """Write one importer's resolved edges into the graph and counters."""
+        for target in edges.targets:
+            self._graph.add_dependency(file_path, target)
+        self._graph.resolved_paths.update(edges.resolved_paths)
+        self._edge_stmts.update(edges.edge_stmts)
+        for stmt in edges.unresolved:
+            self._unresolved_intra += 1
+            if len(self._unresolved_examples) < 5:
+                self._unresolved_examples.append((file_path, stmt))
 
-            base_path = file_path.parent
-            # BACK-621 GDScript: the `!= base_path` skip was a harmless dedup
-            # for every resolver that also tries base_path itself first (the
-            # `_resolve_path_target` roots list is `[base_path] + search_paths`)
-            # — until `project_relative_prefix` (GDScript `res://`), the one
-            # resolver that deliberately never falls back to base_path at all
-            # (project-root-relative, not file-relative). For an importer
-            # sitting directly in scan_root (a project's own root-level
-            # `game.gd`/`main.gd`/`test.gd`), that made extra_paths empty and
-            # every `res://` import in that file silently unresolvable — found
-            # via the godot-demo-projects oracle loop (3 of 3 sampled
-            # root-level preload/load edges missed). Always including
-            # scan_root costs nothing for the other resolvers (base_path is
-            # already tried first, so this is just a harmless duplicate root).
-            extra_paths = [scan_root] if scan_root.is_dir() else []
-            # BACK-669: a multi-gem monorepo registers each gem's own lib/ on
-            # $LOAD_PATH too (spec.load_path_manifest_glob) — a bare `require`
-            # can target another gem's lib/ tree, not just the project root.
-            spec = getattr(extractor, 'spec', None)
-            if getattr(spec, 'load_path_manifest_glob', None) and indices.load_path_roots:
-                extra_paths = extra_paths + indices.load_path_roots
-            # Mirrors ImportsAdapter._build_graph's gating (BACK-491): only
-            # generic (spec-based) extractors accept file_index.
-            uses_file_index = spec is not None
-            for stmt in imports:
-                if stmt.is_type_checking:
-                    continue
-                self._resolve_statement_edges(
-                    stmt, file_path, extractor, base_path, extra_paths,
-                    uses_file_index, file_index, indices)
+    def _resolve_file_edges(
+        self, file_path: Path, imports: List[ImportStatement], scan_root: Path,
+        file_index: Dict[str, List[Path]], indices: '_ResolutionIndices',
+    ) -> Optional['_FileEdges']:
+        """Resolve one importer's statements (None if it has no extractor)."""
+        extractor = get_extractor(file_path)
+        if not extractor:
+            return None
+        edges = _FileEdges(targets=set(), resolved_paths={}, edge_stmts={}, unresolved=[])
+
+        base_path = file_path.parent
+        # BACK-621 GDScript: the `!= base_path` skip was a harmless dedup
+        # for every resolver that also tries base_path itself first (the
+        # `_resolve_path_target` roots list is `[base_path] + search_paths`)
+        # — until `project_relative_prefix` (GDScript `res://`), the one
+        # resolver that deliberately never falls back to base_path at all
+        # (project-root-relative, not file-relative). For an importer
+        # sitting directly in scan_root (a project's own root-level
+        # `game.gd`/`main.gd`/`test.gd`), that made extra_paths empty and
+        # every `res://` import in that file silently unresolvable — found
+        # via the godot-demo-projects oracle loop (3 of 3 sampled
+        # root-level preload/load edges missed). Always including
+        # scan_root costs nothing for the other resolvers (base_path is
+        # already tried first, so this is just a harmless duplicate root).
+        extra_paths = [scan_root] if scan_root.is_dir() else []
+        # BACK-669: a multi-gem monorepo registers each gem's own lib/ on
+        # $LOAD_PATH too (spec.load_path_manifest_glob) — a bare `require`
+        # can target another gem's lib/ tree, not just the project root.
+        spec = getattr(extractor, 'spec', None)
+        if getattr(spec, 'load_path_manifest_glob', None) and indices.load_path_roots:
+            extra_paths = extra_paths + indices.load_path_roots
+        # Mirrors ImportsAdapter._build_graph's gating (BACK-491): only
+        # generic (spec-based) extractors accept file_index.
+        uses_file_index = spec is not None
+        for stmt in imports:
+            if stmt.is_type_checking:
+                continue
+            self._resolve_statement_edges(
+                stmt, file_path, extractor, base_path, extra_paths,
+                uses_file_index, file_index, indices, edges)
+        return edges
 
     def _resolve_statement_edges(
         self, stmt: 'ImportStatement', file_path: Path, extractor,
         base_path: Path, extra_paths: List[Path], uses_file_index: bool,
         file_index: Dict[str, List[Path]], indices: '_ResolutionIndices',
+        edges: '_FileEdges',
     ) -> None:
-        """Resolve a single import statement, walking the fallback cascade:
+        """Resolve a single import statement into `edges`, walking the fallback cascade:
         direct resolution → namespace index (BACK-554) → member index
         (BACK-547/557) → honest-decline classification (BACK-547)."""
         added = self._add_direct_edges(
-            stmt, file_path, extractor, base_path, extra_paths, uses_file_index, file_index)
+            stmt, file_path, extractor, base_path, extra_paths, uses_file_index, file_index, edges)
         spec = getattr(extractor, 'spec', None)
         if not added and indices.namespace_index and getattr(spec, 'resolve_namespaces', False):
-            added = self._add_namespace_edges(stmt, file_path, extractor, indices) or added
+            added = self._add_namespace_edges(stmt, file_path, extractor, indices, edges) or added
         if not added and indices.member_index and (
                 getattr(spec, 'member_symbol_fallback', False)
                 or getattr(spec, 'container_member_fallback', False)
                 or getattr(spec, 'namespaced_type_fallback', False)):
-            added = self._add_member_edges(stmt, file_path, extractor, indices) or added
+            added = self._add_member_edges(stmt, file_path, extractor, indices, edges) or added
         if indices.module_index and getattr(spec, 'module_dir_convention', None):
             # Deliberately NOT gated on `not added` — see _add_module_edges.
-            added = self._add_module_edges(stmt, file_path, extractor, indices) or added
+            added = self._add_module_edges(stmt, file_path, extractor, indices, edges) or added
         if not added:
-            self._record_unresolved_if_intra(stmt, file_path, extractor, base_path, extra_paths, indices)
+            self._record_unresolved_if_intra(stmt, extractor, base_path, extra_paths, indices, edges)
 
     def _add_direct_edges(
         self, stmt: 'ImportStatement', file_path: Path, extractor,
         base_path: Path, extra_paths: List[Path], uses_file_index: bool,
-        file_index: Dict[str, List[Path]],
+        file_index: Dict[str, List[Path]], edges: '_FileEdges',
     ) -> bool:
         """Stage 1: direct dotted-name resolution."""
         if uses_file_index:
@@ -1077,14 +1311,15 @@ class DependsAdapter(ResourceAdapter):
         added = False
         for resolved in targets:
             if resolved and resolved != file_path:
-                self._graph.add_dependency(file_path, resolved)
-                self._graph.resolved_paths[stmt.module_name] = resolved
-                self._edge_stmts[(file_path, resolved)] = stmt
+                edges.targets.add(resolved)
+                edges.resolved_paths[stmt.module_name] = resolved
+                edges.edge_stmts[(file_path, resolved)] = stmt
                 added = True
         return added
 
     def _add_namespace_edges(
         self, stmt: 'ImportStatement', file_path: Path, extractor, indices: '_ResolutionIndices',
+        edges: '_FileEdges',
     ) -> bool:
         """Stage 2 (BACK-554): the single-file dotted match above only
         catches a namespace that coincidentally names one matching file —
@@ -1095,13 +1330,14 @@ class DependsAdapter(ResourceAdapter):
         added = False
         for resolved in extractor.resolve_namespace_targets(stmt, indices.namespace_index):
             if resolved != file_path:
-                self._graph.add_dependency(file_path, resolved)
-                self._edge_stmts[(file_path, resolved)] = stmt
+                edges.targets.add(resolved)
+                edges.edge_stmts[(file_path, resolved)] = stmt
                 added = True
         return added
 
     def _add_member_edges(
         self, stmt: 'ImportStatement', file_path: Path, extractor, indices: '_ResolutionIndices',
+        edges: '_FileEdges',
     ) -> bool:
         """Stage 3: BACK-547 Kotlin measurement loop: `import a.b.foo` for a
         top-level fun/val/var — the direct dotted match above looked for
@@ -1117,13 +1353,14 @@ class DependsAdapter(ResourceAdapter):
         added = False
         for resolved in extractor.resolve_member_targets(stmt, indices.member_index):
             if resolved != file_path:
-                self._graph.add_dependency(file_path, resolved)
-                self._edge_stmts[(file_path, resolved)] = stmt
+                edges.targets.add(resolved)
+                edges.edge_stmts[(file_path, resolved)] = stmt
                 added = True
         return added
 
     def _add_module_edges(
         self, stmt: 'ImportStatement', file_path: Path, extractor, indices: '_ResolutionIndices',
+        edges: '_FileEdges',
     ) -> bool:
         """Stage 4 (BACK-567 Swift): `import Foo` names a whole SwiftPM
         target, not a file. Fan out to every file in module Foo via the
@@ -1139,14 +1376,15 @@ class DependsAdapter(ResourceAdapter):
         added = False
         for resolved in extractor.resolve_module_targets(stmt, indices.module_index):
             if resolved != file_path:
-                self._graph.add_dependency(file_path, resolved)
-                self._edge_stmts.setdefault((file_path, resolved), stmt)
+                edges.targets.add(resolved)
+                edges.edge_stmts.setdefault((file_path, resolved), stmt)
                 added = True
         return added
 
     def _record_unresolved_if_intra(
-        self, stmt: 'ImportStatement', file_path: Path, extractor,
+        self, stmt: 'ImportStatement', extractor,
         base_path: Path, extra_paths: List[Path], indices: '_ResolutionIndices',
+        edges: '_FileEdges',
     ) -> None:
         """Stage 5 (BACK-547 honest-decline): an extracted import that
         produced no edge is only a false-negative risk if it points
@@ -1157,9 +1395,7 @@ class DependsAdapter(ResourceAdapter):
             stmt, base_path, search_paths=extra_paths,
             project_namespaces=indices.project_namespaces)
         if verdict is True:
-            self._unresolved_intra += 1
-            if len(self._unresolved_examples) < 5:
-                self._unresolved_examples.append((file_path, stmt))
+            edges.unresolved.append(stmt)
 
     def _build_zeitwerk_edges(
         self, files: List[Path], zeitwerk_index: Dict[str, Path],
@@ -1173,7 +1409,8 @@ class DependsAdapter(ResourceAdapter):
         (built from the tree's own file layout): a reference that
         doesn't land on a real in-tree file's conventional constant name
         is simply not added, never guessed at — the same honest-skip
-        contract every other resolver in this module holds to.
+        contract every other resolver in this module holds to. References
+        are kept in the file's facts, so a snapshot replays them unparsed.
         """
         if not zeitwerk_index:
             return
@@ -1184,7 +1421,13 @@ class DependsAdapter(ResourceAdapter):
             spec = getattr(extractor, 'spec', None)
             if not getattr(spec, 'zeitwerk_convention', False):
                 continue
-            for line_no, const_path in extractor.extract_constant_references(file_path):
+            facts = self._file_facts.get(file_path)
+            refs = facts.constant_refs if facts is not None else None
+            if refs is None:
+                refs = list(extractor.extract_constant_references(file_path))
+                if facts is not None:
+                    self._file_facts[file_path] = facts._replace(constant_refs=refs)
+            for line_no, const_path in refs:
                 target = zeitwerk_index.get(const_path)
                 if target is None or target == file_path:
                     continue
@@ -4,7 +4,7 @@ from typing import Dict, Any, Optional, Tuple, cast
 from reveal.reveal_types import CONTRACT_VERSION
 
 from .parsing import parse_diff_uris
-from .resolution import resolve_uri, extract_metadata, find_element
+from .resolution import resolve_uri, resolve_uri_pair, extract_metadata, find_element
 from .help import get_schema as _get_schema, get_help as _get_help
 from ..base import ResourceAdapter, register_adapter, register_renderer
 from .renderer import DiffRenderer
@@ -136,9 +136,9 @@ class DiffAdapter(ResourceAdapter):
         """
         from ...diff import compute_structure_diff
 
-        # Resolve both URIs using existing adapter infrastructure
-        left_struct = resolve_uri(self.left_uri, **kwargs)
-        right_struct = resolve_uri(self.right_uri, **kwargs)
+        # Resolve both URIs using existing adapter infrastructure (two git
+        # directories are resolved together, skipping identical subtrees)
+        left_struct, right_struct = resolve_uri_pair(self.left_uri, self.right_uri, **kwargs)
 
         # Compute semantic diff
         diff_result = compute_structure_diff(left_struct, right_struct)
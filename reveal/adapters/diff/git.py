@@ -3,13 +3,19 @@
 import logging
 import os
 import tempfile
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Dict, Any, cast
+from typing import Dict, Any, List, Optional, Set, Tuple, cast
 
 from ...registry import get_analyzer
 
 logger = logging.getLogger(__name__)
 
+# Changed blobs in a paired directory diff are analyzed in worker processes;
+# below _PARALLEL_MIN_BLOBS the pool's startup cost outweighs the win.
+_PARALLEL_MIN_BLOBS = 16
+_PARALLEL_MAX_WORKERS = 16
+
 
 def _open_repo():
     """Open the pygit2 repository containing the current working directory.
@@ -315,3 +321,238 @@ def resolve_git_directory(git_ref: str, dir_path: str) -> Dict[str, Any]:
         'classes': all_classes,
         'imports': all_imports
     }
+
+
+# ── Paired directory diff: tree-OID short-circuit ───────────────────────────
+#
+# resolve_git_directory analyzes every file under a ref, so diffing two refs
+# of one repository analyzes both trees in full even when they share almost
+# every subtree. When both sides of a diff are git directories,
+# resolve_git_directory_pair walks the two trees together instead: a subtree
+# or blob whose OID is the same on both sides contributes identical
+# functions/classes to both structures, so compute_structure_diff (keyed by
+# (file, name)) finds nothing there and it is skipped unread. Only the
+# differing blobs are analyzed, in parallel.
+#
+# Imports are the exception: diff_imports compares import *text* across the
+# whole directory, so an import added to a changed file is not "added" if an
+# unchanged file already had it. Unchanged blobs are therefore consulted only
+# for the import texts that differ between the changed files, and only blobs
+# that contain one of those texts verbatim are analyzed (tree-sitter import
+# content is the node's source text, so the substring test can't miss one).
+
+
+def _scoped_tree(repo, commit, git_ref: str, dir_path: str):
+    """Tree object for dir_path at commit (the root tree for '' / '.')."""
+    if dir_path in ('', '.'):
+        return commit.tree
+    try:
+        entry = commit.tree[dir_path.rstrip('/')]
+    except KeyError:
+        raise ValueError(f"Directory not found in {git_ref}: {dir_path}")
+    if entry.type_str != 'tree':
+        raise ValueError(f"Path is not a directory: {dir_path}")
+    return repo[entry.id]
+
+
+def _walk_blobs(repo, tree, prefix: str, out: List[Tuple[str, Any]]) -> None:
+    """Append (relpath, blob oid) for every blob under tree, in tree order."""
+    for item in tree:
+        if item.type_str == 'blob':
+            out.append((prefix + item.name, item.id))
+        elif item.type_str == 'tree':
+            _walk_blobs(repo, repo[item.id], prefix + item.name + '/', out)
+
+
+def _changed_blobs(repo, tree, other, prefix: str,
+                   changed: List[Tuple[str, Any]],
+                   unchanged: Optional[List[Tuple[str, Any, bool]]] = None) -> None:
+    """Collect blobs under tree whose OID differs from other's at the same path.
+
+    Subtrees with equal OIDs are not descended. When unchanged is given, the
+    skipped subtrees and blobs are recorded as (relpath, oid, is_tree).
+    """
+    twins = {item.name: item for item in other} if other is not None else {}
+    for item in tree:
+        rel = prefix + item.name
+        twin = twins.get(item.name)
+        same_kind = twin is not None and twin.type_str == item.type_str
+        if item.type_str == 'tree':
+            if same_kind and twin.id == item.id:
+                if unchanged is not None:
+                    unchanged.append((rel + '/', item.id, True))
+                continue
+            _changed_blobs(repo, repo[item.id], repo[twin.id] if same_kind else None,
+                           rel + '/', changed, unchanged)
+        elif item.type_str == 'blob':
+            if same_kind and twin.id == item.id:
+                if unchanged is not None:
+                    unchanged.append((rel, item.id, False))
+                continue
+            changed.append((rel, item.id))
+
+
+def _analyze_blob_text(args: Tuple[str, str]) -> Dict[str, Any]:
+    """Analyze one file's text (written to a temp file) — structure dict or {}.
+
+    Module-level so ProcessPoolExecutor can pickle it.
+    """
+    rel_path, content = args
+    with tempfile.NamedTemporaryFile(mode='w', suffix=Path(rel_path).suffix, delete=False) as f:
+        f.write(content)
+        temp_path = f.name
+    try:
+        analyzer_class = get_analyzer(temp_path, allow_fallback=False)
+        if not analyzer_class:
+            return {}
+        structure = analyzer_class(temp_path).get_structure()
+        return cast(Dict[str, Any], structure.get('structure', structure))
+    except Exception as e:
+        logger.warning(f"Skipping {rel_path} in directory diff: {e}")
+        return {}
+    finally:
+        os.unlink(temp_path)
+
+
+def _diff_worker_count(n_blobs: int) -> int:
+    """Workers for analyzing `n_blobs` changed blobs. 1 = run serially (no pool).
+
+    `REVEAL_MAX_WORKERS` overrides everything (set to 1 to force the serial
+    path); otherwise parallelize only above `_PARALLEL_MIN_BLOBS`, capped at
+    `_PARALLEL_MAX_WORKERS` and the CPU count.
+    """
+    override = os.environ.get('REVEAL_MAX_WORKERS')
+    if override:
+        try:
+            return max(1, int(override))
+        except ValueError:
+            pass
+    if n_blobs < _PARALLEL_MIN_BLOBS:
+        return 1
+    return max(1, min(os.cpu_count() or 1, _PARALLEL_MAX_WORKERS))
+
+
+def _analyze_texts(tasks: List[Tuple[str, str]]) -> List[Dict[str, Any]]:
+    workers = _diff_worker_count(len(tasks))
+    if workers > 1:
+        with ProcessPoolExecutor(max_workers=min(workers, len(tasks))) as pool:
+            return list(pool.map(_analyze_blob_text, tasks, chunksize=4))
+    return [_analyze_blob_text(task) for task in tasks]
+
+
+def _repo_path(dir_path: str, rel: str) -> str:
+    return rel if dir_path in ('', '.') else f"{dir_path.rstrip('/')}/{rel}"
+
+
+def _read_analyzable(repo, dir_path: str, blobs: List[Tuple[str, Any]]) -> List[Tuple[str, str]]:
+    """(relpath, text) for the blobs an analyzer exists for, in order."""
+    tasks = []
+    for rel, oid in blobs:
+        if get_analyzer(_repo_path(dir_path, rel), allow_fallback=False):
+            tasks.append((rel, repo[oid].data.decode('utf-8', errors='replace')))
+    return tasks
+
+
+def _aggregate(git_ref: str, dir_path: str, file_count: int,
+               structs: List[Tuple[str, Dict[str, Any]]],
+               shared_imports: List[Dict[str, Any]]) -> Dict[str, Any]:
+    all_functions: list = []
+    all_classes: list = []
+    all_imports: list = []
+    for rel_path, struct in structs:
+        all_functions.extend(_tag_items_with_file(struct, rel_path, 'functions'))
+        all_classes.extend(_tag_items_with_file(struct, rel_path, 'classes'))
+        all_imports.extend(_tag_items_with_file(struct, rel_path, 'imports'))
+    return {
+        'type': 'git_directory',
+        'ref': git_ref,
+        'path': dir_path,
+        'file_count': file_count,
+        'functions': all_functions,
+        'classes': all_classes,
+        'imports': shared_imports + all_imports,
+    }
+
+
+def _shared_import_items(repo, dir_path: str, unchanged: List[Tuple[str, Any, bool]],
+                         wanted: Set[str]) -> List[Dict[str, Any]]:
+    """Import items of unchanged blobs whose text is one of `wanted`."""
+    from ...treesitter import TreeSitterAnalyzer
+
+    blobs: List[Tuple[str, Any]] = []
+    for rel, oid, is_tree in unchanged:
+        if is_tree:
+            _walk_blobs(repo, repo[oid], rel, blobs)
+        else:
+            blobs.append((rel, oid))
+
+    tasks = []
+    for rel, text in _read_analyzable(repo, dir_path, blobs):
+        analyzer_class = get_analyzer(_repo_path(dir_path, rel), allow_fallback=False)
+        exact_text = isinstance(analyzer_class, type) and issubclass(analyzer_class, TreeSitterAnalyzer)
+        if exact_text and not any(w in text for w in wanted):
+            continue
+        tasks.append((rel, text))
+
+    items = []
+    for (rel, _), struct in zip(tasks, _analyze_texts(tasks)):
+        for imp in _tag_items_with_file(struct, rel, 'imports'):
+            if imp.get('content', '') in wanted:
+                items.append(imp)
+    return items
+
+
+def resolve_git_directory_pair(left: Tuple[str, str],
+                               right: Tuple[str, str]) -> Optional[Tuple[Dict[str, Any], Dict[str, Any]]]:
+    """Structures for two git directories, analyzing only blobs that differ.
+
+    Args:
+        left: (git_ref, dir_path) of the left side
+        right: (git_ref, dir_path) of the right side
+
+    Returns:
+        (left_structure, right_structure) — diff-equivalent to resolving each
+        side with resolve_git_directory, though holding only the changed files
+        (file_count counts those) — or None when either side is not a
+        resolvable directory (the caller then resolves each side on its own,
+        which raises the usual errors).
+    """
+    try:
+        repo = _open_repo()
+        (left_ref, left_dir), (right_ref, right_dir) = left, right
+        left_commit = _resolve_commit(repo, left_ref)
+        right_commit = _resolve_commit(repo, right_ref)
+        if not (_tree_entry_is_directory(left_commit, left_ref, left_dir)
+                and _tree_entry_is_directory(right_commit, right_ref, right_dir)):
+            return None
+        left_tree = _scoped_tree(repo, left_commit, left_ref, left_dir)
+        right_tree = _scoped_tree(repo, right_commit, right_ref, right_dir)
+    except (ImportError, ValueError):
+        return None
+
+    left_changed: List[Tuple[str, Any]] = []
+    right_changed: List[Tuple[str, Any]] = []
+    unchanged: List[Tuple[str, Any, bool]] = []
+    if left_tree.id != right_tree.id:
+        _changed_blobs(repo, left_tree, right_tree, '', left_changed, unchanged)
+        _changed_blobs(repo, right_tree, left_tree, '', right_changed)
+    else:
+        unchanged.append(('', left_tree.id, True))
+
+    left_tasks = _read_analyzable(repo, left_dir, left_changed)
+    right_tasks = _read_analyzable(repo, right_dir, right_changed)
+    results = _analyze_texts(left_tasks + right_tasks)
+    left_structs = [(rel, s) for (rel, _), s in zip(left_tasks, results[:len(left_tasks)]) if s]
+    right_structs = [(rel, s) for (rel, _), s in zip(right_tasks, results[len(left_tasks):]) if s]
+
+    def import_texts(structs):
+        return {imp.get('content', '') for _, s in structs for imp in s.get('imports', [])}
+
+    wanted = import_texts(left_structs) ^ import_texts(right_structs)
+    shared = _shared_import_items(repo, left_dir, unchanged, wanted) if wanted and unchanged else []
+
+    return (
+        _aggregate(left_ref, left_dir, len(left_structs), left_structs, shared),
+        _aggregate(right_ref, right_dir, len(right_structs), right_structs,
+                   [dict(imp) for imp in shared]),
+    )
@@ -3,9 +3,9 @@
 import inspect
 import os
 from pathlib import Path
-from typing import Dict, Any, Optional, Iterator, cast
+from typing import Dict, Any, Optional, Iterator, Tuple, cast
 
-from .git import resolve_git_ref, resolve_git_adapter
+from .git import resolve_git_ref, resolve_git_adapter, resolve_git_directory_pair
 from ..base import get_adapter_class
 from ...registry import get_analyzer
 from ...utils.path_utils import is_skippable_dir
@@ -84,6 +84,35 @@ def resolve_uri(uri: str, **kwargs) -> Dict[str, Any]:
     return cast(Dict[str, Any], adapter.get_structure(**kwargs))
 
 
+def _legacy_git_target(uri: str) -> Optional[Tuple[str, str]]:
+    """(ref, path) for a legacy git://REF/path URI, else None."""
+    if not uri.startswith('git://'):
+        return None
+    resource = uri[len('git://'):]
+    if '@' in resource or ':' in resource or '/' not in resource:
+        return None
+    git_ref, path = resource.split('/', 1)
+    return git_ref, path
+
+
+def resolve_uri_pair(left_uri: str, right_uri: str,
+                     **kwargs) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    """Resolve both sides of a diff, jointly when that lets work be skipped.
+
+    Two legacy git:// directories (git://REF/dir) are compared tree against
+    tree, analyzing only the blobs whose OIDs differ (see
+    resolve_git_directory_pair). Everything else resolves each side on its
+    own through resolve_uri.
+    """
+    left_git = _legacy_git_target(left_uri)
+    right_git = _legacy_git_target(right_uri)
+    if left_git and right_git:
+        pair = resolve_git_directory_pair(left_git, right_git)
+        if pair is not None:
+            return pair
+    return resolve_uri(left_uri, **kwargs), resolve_uri(right_uri, **kwargs)
+
+
 def resolve_directory(dir_path: str) -> Dict[str, Any]:
     """Resolve a directory to aggregated structure.
 
@@ -23,6 +23,7 @@ from . import refs, commits, files, queries
 _SCHEMA_QUERY_PARAMS = {
     'type': {'type': 'string', 'description': 'Query type for file operations', 'values': ['history', 'blame', 'diff', 'ownership'], 'examples': ['?type=history', '?type=blame', '?type=ownership']},
     'merges': {'type': 'string', 'description': 'For ownership: "1" includes merge commits (excluded by default)', 'examples': ['?type=ownership&merges=1']},
+    'basis': {'type': 'string', 'description': 'For ownership: "lines" aggregates surviving-line ownership from (cached) per-file blame instead of commit-share', 'values': ['commits', 'lines'], 'examples': ['?type=ownership&basis=lines']},
     'detail': {'type': 'string', 'description': 'Detail level for blame', 'values': ['full', 'summary'], 'examples': ['?type=blame&detail=full']},
     'element': {'type': 'string', 'description': 'Semantic element for blame (function/class name)', 'examples': ['?type=blame&element=load_config']},
     'context': {'type': 'integer', 'description': 'For diff: number of context lines around each hunk (default: 3)', 'examples': ['?type=diff&context=10']},
@@ -84,6 +85,8 @@ _SCHEMA_OUTPUT_TYPES = [
         'source_type': {'type': 'string', 'enum': ['file', 'directory', 'repository']},
         'path': {'type': 'string'}, 'ref': {'type': 'string'},
         'total_commits': {'type': 'integer'}, 'contributor_count': {'type': 'integer'},
+        'basis': {'type': 'string', 'enum': ['lines']},
+        'total_lines': {'type': 'integer'}, 'file_count': {'type': 'integer'},
         'primary_author': {'type': ['object', 'null']}, 'last_touch': {'type': ['string', 'null']},
         'authors': {'type': 'array'}
     }),
@@ -100,6 +103,7 @@ _SCHEMA_EXAMPLE_QUERIES = [
     {'uri': 'git://src/app.py?type=blame&element=load_config', 'description': 'Semantic blame (who wrote this function)', 'query_param': '?type=blame&element=load_config', 'output_type': 'git_file_blame'},
     {'uri': 'git://src/app.py?type=ownership', 'description': 'Commit-share ownership of a file (primary author, contributors, last touch)', 'query_param': '?type=ownership', 'output_type': 'git_ownership'},
     {'uri': 'git://src/?type=ownership', 'description': 'Commit-share ownership of a directory', 'query_param': '?type=ownership', 'output_type': 'git_ownership'},
+    {'uri': 'git://src/?type=ownership&basis=lines', 'description': 'Surviving-line ownership of a directory (aggregated per-file blame)', 'query_param': '?type=ownership&basis=lines', 'output_type': 'git_ownership'},
     {'uri': 'git://src/app.py?type=history&bucket=month', 'description': 'Monthly commit/author counts for a file', 'query_param': '?type=history&bucket=month', 'output_type': 'git_timeline'},
     {'uri': 'git://src/?type=history&bucket=week', 'description': 'Weekly commit/author counts for a directory', 'query_param': '?type=history&bucket=week', 'output_type': 'git_timeline'},
     {'uri': 'git://.?type=history&bucket=month', 'description': 'Monthly commit/author counts for the whole repo', 'query_param': '?type=history&bucket=month', 'output_type': 'git_timeline'},
@@ -241,7 +245,7 @@ class GitAdapter(ResourceAdapter):
                 result_control_parts.append(f"{k}={v}")
             # Operational parameters (exclude from both)
             elif k in ['type', 'detail', 'element', 'ignore', 'raw', 'context',
-                       'no_merges', 'content', 'content~', 'bucket']:
+                       'no_merges', 'content', 'content~', 'bucket', 'basis']:
                 continue
             # ?ref= overrides the starting ref (alias for @ref in the URI)
             elif k == 'ref':
@@ -340,6 +344,7 @@ class GitAdapter(ResourceAdapter):
     # accepted (they're in the schema) but silently inert on any other view.
     _VIEW_SCOPED_PARAMS = {
         'merges': 'ownership',
+        'basis': 'ownership',
         'detail': 'blame',
         'element': 'blame',
         'context': 'diff',
@@ -514,6 +519,8 @@ class GitAdapter(ResourceAdapter):
         query_type = self.query.get('type', None)
         no_merges = self.query.get('no_merges') in ('1', 'true', 'yes')
         content_pattern = self.query.get('content~') or self.query.get('content') or None
+        # Compiled once; every history walk below tests it against each commit.
+        commit_matches = queries.compile_commit_filters(self.query_filters)
 
         # Ownership works on a file, a directory, or the whole repo, so it is
         # routed before the subpath/ref branching below.
@@ -542,7 +549,7 @@ class GitAdapter(ResourceAdapter):
                     return files.get_file_timeline(
                         repo, self.ref, git_subpath, self.query,
                         commits.format_commit,
-                        lambda cd: queries.matches_all_filters(cd, self.query_filters),
+                        commit_matches,
                         touch_func,
                         commits.bucket_commits,
                     )
@@ -551,7 +558,7 @@ class GitAdapter(ResourceAdapter):
                     repo, self.ref, git_subpath, self.query,
                     self.result_control, self.query_filters,
                     commits.format_commit,
-                    lambda cd: queries.matches_all_filters(cd, self.query_filters),
+                    commit_matches,
                     touch_func
                 )
                 if element_name:
@@ -578,7 +585,7 @@ class GitAdapter(ResourceAdapter):
                     commits.get_commit_timeline(
                         repo, start_commit, _b, _lim,
                         commits.format_commit,
-                        lambda cd: queries.matches_all_filters(cd, self.query_filters),
+                        commit_matches,
                         no_merges=_nm,
                     )
             )
@@ -587,12 +594,12 @@ class GitAdapter(ResourceAdapter):
                 repo, self.ref, self.query, self.query_filters,
                 self.result_control,
                 commits.format_commit,
-                lambda cd: queries.matches_all_filters(cd, self.query_filters),
+                commit_matches,
                 lambda repo, start_commit, limit, _nm=no_merges, _cp=content_pattern: \
                     commits.get_commit_history(
                         repo, start_commit, limit,
                         commits.format_commit,
-                        lambda cd: queries.matches_all_filters(cd, self.query_filters),
+                        commit_matches,
                         self.result_control,
                         self.query_filters,
                         no_merges=_nm,
@@ -609,7 +616,7 @@ class GitAdapter(ResourceAdapter):
                     commits.get_recent_commits(
                         repo, limit,
                         commits.format_commit,
-                        lambda cd: queries.matches_all_filters(cd, self.query_filters),
+                        commit_matches,
                         self.result_control,
                         self.query_filters,
                         no_merges=_nm,
@@ -19,6 +19,19 @@ logger = logging.getLogger(__name__)
 # structure cache, so the default 64-entry prune cap is correct as-is.
 _CHURN_CACHE_NAMESPACE = "churn"
 
+# Blame is cached per file, so the cap is structure-cache sized rather than
+# the 64-entry default. "blame" holds exact (path, commit, blob) results;
+# "blame_head" holds one forward-only pointer per path — the newest blame
+# computed — which is what an advanced HEAD blames incrementally from.
+_BLAME_CACHE_NAMESPACE = "blame"
+_BLAME_HEAD_NAMESPACE = "blame_head"
+_BLAME_CACHE_MAX_ENTRIES = 4096
+
+# ?type=ownership&basis=lines blames every file under the path; below this
+# many files a thread pool costs more than it saves.
+_OWNERSHIP_PARALLEL_MIN_FILES = 8
+_OWNERSHIP_MAX_WORKERS = 8
+
 _LINE_RANGE_RE = re.compile(r'^[Ll](\d+)-[Ll]?(\d+)$')
 
 _BLAME_NOISE_RE = re.compile(
@@ -515,31 +528,200 @@ def _read_blob_lines(repo: 'pygit2.Repository', commit: 'pygit2.Commit', subpath
     return blob.data.decode('utf-8', errors='replace').splitlines()
 
 
+def _format_blame_hunk(repo: 'pygit2.Repository', hunk: Any) -> Optional[Dict[str, Any]]:
+    """Convert one pygit2 blame hunk to a serializable dict (None if uncommitted)."""
+    committer = hunk.final_committer
+    if not committer:
+        return None
+    commit_obj = cast('pygit2.Commit', repo[hunk.final_commit_id])
+    return {
+        'lines': {
+            'start': hunk.final_start_line_number,
+            'count': hunk.lines_in_hunk,
+        },
+        'commit': {
+            'hash': str(hunk.final_commit_id)[:7],
+            'author': committer.name,
+            'email': committer.email,
+            'date': datetime.fromtimestamp(committer.time).strftime('%Y-%m-%d %H:%M:%S'),
+            'message': commit_obj.message.split('\n')[0],
+        },
+    }
+
+
 def _format_blame_hunks(repo: 'pygit2.Repository', blame: Any) -> List[Dict[str, Any]]:
     """Convert pygit2 blame hunks to serializable dicts."""
-    import pygit2
     hunks: List[Dict[str, Any]] = []
     for hunk in blame:
-        commit_obj = cast('pygit2.Commit', repo[hunk.final_commit_id])
-        committer = hunk.final_committer
-        if not committer:
+        formatted = _format_blame_hunk(repo, hunk)
+        if formatted is not None:
+            hunks.append(formatted)
+    return hunks
+
+
+def _blame_cache_key(repo_id: str, *parts: Any) -> str:
+    hasher = hashlib.sha256(repo_id.encode("utf-8", "replace"))
+    for part in parts:
+        hasher.update(b"\x00")
+        hasher.update(str(part).encode("utf-8", "replace"))
+    return hasher.hexdigest()
+
+
+def _repo_cache_identity(repo: 'pygit2.Repository') -> Optional[str]:
+    """Stable per-repository cache-key component, or None to skip caching."""
+    try:
+        return str(repo.workdir or repo.path)
+    except Exception:
+        # Intentional: same contract as _churn_fingerprint — no identity
+        # means "run uncached", never an error.
+        return None
+
+
+def _merge_blame_onto_base(
+    repo: 'pygit2.Repository',
+    blame: Any,
+    base_commit: str,
+    subpath: str,
+    base_hunks: List[Dict[str, Any]],
+) -> Optional[List[Dict[str, Any]]]:
+    """Resolve a bounded blame's boundary hunks against a cached full blame.
+
+    ``blame`` was run with ``oldest_commit=base_commit``, so every line that
+    survived unchanged since the base comes back as a boundary hunk
+    attributed to the base, carrying its line number in the base's version
+    of the file (``orig_start_line_number``). The base's cached hunks know
+    who really wrote those lines; everything newer is taken from ``blame``
+    as-is. Returns None when a boundary hunk can't be mapped (the file was
+    renamed across the range) — the caller then blames from scratch.
+    """
+    owner: Dict[int, int] = {}
+    for idx, h in enumerate(base_hunks):
+        start = h['lines']['start']
+        for line in range(start, start + h['lines']['count']):
+            owner[line] = idx
+
+    merged: List[Dict[str, Any]] = []
+    # (base hunk index, last base line) of merged[-1] when it came from the
+    # base — a run only continues while both numberings stay contiguous.
+    tail: Optional[tuple] = None
+    for hunk in blame:
+        boundary = getattr(hunk, 'boundary', False) or str(hunk.final_commit_id) == base_commit
+        if not boundary:
+            formatted = _format_blame_hunk(repo, hunk)
+            if formatted is not None:
+                merged.append(formatted)
+            tail = None
             continue
-        hunks.append({
-            'lines': {
-                'start': hunk.final_start_line_number,
-                'count': hunk.lines_in_hunk,
-            },
-            'commit': {
-                'hash': str(hunk.final_commit_id)[:7],
-                'author': committer.name,
-                'email': committer.email,
-                'date': datetime.fromtimestamp(committer.time).strftime('%Y-%m-%d %H:%M:%S'),
-                'message': commit_obj.message.split('\n')[0],
-            },
-        })
+        orig_path = getattr(hunk, 'orig_path', None)
+        if orig_path and orig_path != subpath:
+            return None
+        for offset in range(hunk.lines_in_hunk):
+            base_line = hunk.orig_start_line_number + offset
+            final_line = hunk.final_start_line_number + offset
+            idx = owner.get(base_line)
+            if idx is None:
+                # The base blame skipped this line too (no committer).
+                tail = None
+                continue
+            last = merged[-1] if merged else None
+            if (tail is not None and last is not None and tail == (idx, base_line - 1)
+                    and last['lines']['start'] + last['lines']['count'] == final_line):
+                last['lines']['count'] += 1
+            else:
+                merged.append({
+                    'lines': {'start': final_line, 'count': 1},
+                    'commit': base_hunks[idx]['commit'],
+                })
+            tail = (idx, base_line)
+    return merged
+
+
+def _incremental_blame(
+    repo: 'pygit2.Repository',
+    commit: 'pygit2.Commit',
+    subpath: str,
+    prior: Dict[str, Any],
+) -> Optional[List[Dict[str, Any]]]:
+    """Bring a cached blame at an ancestor commit forward to *commit*.
+
+    Only the history between the two commits is walked; None means the
+    cached commit isn't an ancestor or the bounded blame failed.
+    """
+    base = prior['commit']
+    try:
+        if not repo.descendant_of(commit.id, base):
+            return None
+        blame = repo.blame(subpath, newest_commit=commit.id, oldest_commit=base)
+        return _merge_blame_onto_base(repo, blame, base, subpath, prior['hunks'])
+    except Exception:
+        # Intentional: any failure here (base commit gc'd, shallow boundary,
+        # rename) falls back to a full blame, which surfaces real errors.
+        return None
+
+
+def _blame_file_hunks(
+    repo: 'pygit2.Repository',
+    commit: 'pygit2.Commit',
+    subpath: str,
+    writes: Optional[List[tuple]] = None,
+) -> List[Dict[str, Any]]:
+    """Formatted blame hunks for *subpath* at *commit*, served from the disk cache.
+
+    Exact hits are keyed on (repo, path, commit oid, blob oid). A per-path
+    pointer remembers the newest commit blamed so far; when HEAD advances
+    past it, ``_incremental_blame`` re-blames only the new history and
+    reuses the cached attribution for every untouched line. The pointer only
+    moves forward, so blaming an old tag doesn't discard it.
+
+    With *writes*, new entries are appended to it as (namespace, key, entry)
+    instead of written, so a caller blaming many files can flush them with
+    ``_flush_blame_writes`` and prune each namespace once.
+    """
+    blob_id = commit.tree[subpath].id
+    repo_id = _repo_cache_identity(repo)
+    if repo_id is None:
+        return _format_blame_hunks(repo, repo.blame(subpath, newest_commit=commit.id))
+
+    exact_key = _blame_cache_key(repo_id, subpath, commit.id, blob_id)
+    cached = disk_cache.get(_BLAME_CACHE_NAMESPACE, exact_key)
+    if cached is not None:
+        return cached['hunks']
+
+    head_key = _blame_cache_key(repo_id, subpath)
+    prior = disk_cache.get(_BLAME_HEAD_NAMESPACE, head_key)
+    hunks = _incremental_blame(repo, commit, subpath, prior) if prior is not None else None
+    if hunks is None:
+        hunks = _format_blame_hunks(repo, repo.blame(subpath, newest_commit=commit.id))
+
+    entry = {'commit': str(commit.id), 'hunks': hunks}
+    pending = [(_BLAME_CACHE_NAMESPACE, exact_key, entry)]
+    if prior is None or _advances(repo, commit, prior['commit']):
+        pending.append((_BLAME_HEAD_NAMESPACE, head_key, entry))
+    if writes is None:
+        _flush_blame_writes(pending)
+    else:
+        writes.extend(pending)
     return hunks
 
 
+def _flush_blame_writes(writes: List[tuple]) -> None:
+    """Write deferred (namespace, key, entry) blame entries, one put_many per namespace."""
+    by_namespace: Dict[str, List[tuple]] = {}
+    for namespace, key, entry in writes:
+        by_namespace.setdefault(namespace, []).append((key, entry))
+    for namespace, items in by_namespace.items():
+        disk_cache.put_many(namespace, items, max_entries=_BLAME_CACHE_MAX_ENTRIES)
+
+
+def _advances(repo: 'pygit2.Repository', commit: 'pygit2.Commit', prior_commit: str) -> bool:
+    """True if *commit* is strictly newer than *prior_commit* on its history."""
+    try:
+        return bool(repo.descendant_of(commit.id, prior_commit))
+    except Exception:
+        # Intentional: unknown ancestry keeps the existing pointer.
+        return False
+
+
 def _read_blame_ignore_revs(workdir: Optional[str]) -> List[str]:
     """Read short SHAs from .git-blame-ignore-revs if present in workdir."""
     if not workdir:
@@ -586,9 +768,8 @@ def get_file_blame(
 
     try:
         commit = _resolve_blame_commit(repo, ref)
-        blame = repo.blame(subpath, newest_commit=commit.id)
         lines = _read_blob_lines(repo, commit, subpath)
-        hunks = _format_blame_hunks(repo, blame)
+        hunks = _blame_file_hunks(repo, commit, subpath)
 
         element_name = query.get('element')
         element_info = None
@@ -703,6 +884,163 @@ def _aggregate_commit_authors(
     return author_list, total
 
 
+def _tree_blob_paths(repo: 'pygit2.Repository', tree: Any, prefix: str) -> List[str]:
+    """Repo-relative paths of every non-binary blob beneath *tree*."""
+    paths: List[str] = []
+    stack = [(tree, prefix)]
+    while stack:
+        current, base = stack.pop()
+        for entry in current:
+            path = f"{base}{entry.name}"
+            if entry.type_str == 'tree':
+                stack.append((repo[entry.id], f"{path}/"))
+            elif entry.type_str == 'blob' and not repo[entry.id].is_binary:
+                paths.append(path)
+    return sorted(paths)
+
+
+def _ownership_worker_count(n_files: int) -> int:
+    """Blame threads for line ownership; REVEAL_MAX_WORKERS overrides."""
+    override = os.environ.get('REVEAL_MAX_WORKERS')
+    if override:
+        try:
+            return max(1, int(override))
+        except ValueError:
+            pass
+    if n_files < _OWNERSHIP_PARALLEL_MIN_FILES:
+        return 1
+    return max(1, min(os.cpu_count() or 1, _OWNERSHIP_MAX_WORKERS))
+
+
+def _blame_files(
+    repo: 'pygit2.Repository',
+    commit: 'pygit2.Commit',
+    paths: List[str],
+    open_repo=None,
+) -> List[List[Dict[str, Any]]]:
+    """Blame hunks for each of *paths* at *commit*, in order.
+
+    Warm files are disk-cache reads; cold ones are blamed on a thread pool.
+    libgit2 objects must not be shared across threads, so each worker opens
+    its own Repository (*open_repo*, default ``pygit2.Repository(repo.path)``)
+    and looks the commit up there. New cache entries are written once all
+    files are blamed, so each namespace is pruned once rather than per file.
+    """
+    writes: List[tuple] = []
+    workers = _ownership_worker_count(len(paths))
+    if workers == 1:
+        results = [_blame_file_hunks(repo, commit, p, writes) for p in paths]
+        _flush_blame_writes(writes)
+        return results
+
+    import threading
+    from concurrent.futures import ThreadPoolExecutor
+
+    if open_repo is None:
+        import pygit2
+        repo_path = repo.path
+
+        def open_repo():
+            return pygit2.Repository(repo_path)
+
+    local = threading.local()
+    commit_id = commit.id
+
+    def blame_one(path: str) -> List[Dict[str, Any]]:
+        if not hasattr(local, 'repo'):
+            local.repo = open_repo()
+            local.commit = local.repo[commit_id]
+        return _blame_file_hunks(local.repo, local.commit, path, writes)
+
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        results = list(pool.map(blame_one, paths))
+    _flush_blame_writes(writes)
+    return results
+
+
+def _aggregate_line_owners(
+    paths: List[str],
+    hunks_per_file: List[List[Dict[str, Any]]],
+) -> tuple:
+    """Sum surviving lines per author across files.
+
+    Returns (author_list, total_lines) — author_list sorted by lines
+    descending; each entry carries name, email, lines, files, share,
+    last_touch.
+    """
+    authors: Dict[tuple, Dict[str, Any]] = {}
+    total = 0
+    for path, hunks in zip(paths, hunks_per_file):
+        for h in hunks:
+            info = h['commit']
+            count = h['lines']['count']
+            total += count
+            key = (info['author'], info['email'])
+            rec = authors.get(key)
+            if rec is None:
+                rec = authors[key] = {
+                    'name': info['author'],
+                    'email': info['email'],
+                    'lines': 0,
+                    '_files': set(),
+                    '_date': info['date'],
+                }
+            rec['lines'] += count
+            rec['_files'].add(path)
+            if info['date'] > rec['_date']:
+                rec['_date'] = info['date']
+
+    author_list = sorted(authors.values(), key=lambda a: a['lines'], reverse=True)
+    for a in author_list:
+        a['files'] = len(a.pop('_files'))
+        a['share'] = round(a['lines'] / total, 4) if total else 0.0
+        a['last_touch'] = a.pop('_date')[:10]
+    return author_list, total
+
+
+def _get_line_ownership(
+    repo: 'pygit2.Repository',
+    commit: 'pygit2.Commit',
+    ref: str,
+    git_subpath: Optional[str],
+    source_type: str,
+) -> Dict[str, Any]:
+    """?type=ownership&basis=lines — surviving-line ownership from cached blame."""
+    if source_type == 'file':
+        paths = [cast(str, git_subpath)]
+    else:
+        tree = commit.tree if git_subpath is None else repo[commit.tree[git_subpath].id]
+        prefix = f"{git_subpath.rstrip('/')}/" if git_subpath else ''
+        paths = _tree_blob_paths(repo, tree, prefix)
+
+    author_list, total = _aggregate_line_owners(paths, _blame_files(repo, commit, paths))
+
+    return ResultBuilder.create(
+        result_type='git_ownership',
+        source=f"{git_subpath or '.'}@{ref}",
+        source_type=source_type,
+        contract_version=CONTRACT_VERSION,
+        path=git_subpath or '.',
+        ref=ref,
+        basis='lines',
+        total_lines=total,
+        file_count=len(paths),
+        contributor_count=len(author_list),
+        primary_author=author_list[0] if author_list else None,
+        last_touch=max((a['last_touch'] for a in author_list), default=None),
+        authors=author_list,
+        _meta={
+            'analysis_kind': 'line-ownership',
+            'confidence': 'high',
+            'known_limits': [
+                'surviving lines at this ref, attributed by git blame — a reformat commit owns every line it touched',
+                'binary files are skipped',
+                'author identity is name+email — aliases / multiple emails count as distinct contributors',
+            ],
+        },
+    )
+
+
 def get_ownership(
     repo: 'pygit2.Repository',
     ref: str,
@@ -715,8 +1053,9 @@ def get_ownership(
     Returns commit-share ownership: primary author, per-author commit share,
     contributor count, and last-touch date. This is straight commit-log
     aggregation (commit-share, NOT line-ownership — use ?type=blame for
-    surviving-line attribution). The consumer applies the bus-factor /
-    key-person judgment over this data.
+    surviving-line attribution, or ?basis=lines, which aggregates cached
+    per-file blame into line ownership). The consumer applies the
+    bus-factor / key-person judgment over this data.
 
     git_subpath is repo-root-relative; None means the whole repository.
     """
@@ -739,6 +1078,15 @@ def get_ownership(
             ) from e
         source_type = 'directory' if isinstance(repo[entry.id], pygit2.Tree) else 'file'
 
+    if query.get('basis') == 'lines':
+        try:
+            result = _get_line_ownership(repo, commit, ref, git_subpath, source_type)
+        except (KeyError, pygit2.GitError) as e:
+            raise ValueError(f"Failed to blame for ownership: {git_subpath or '.'}") from e
+        if getattr(repo, 'is_shallow', False):
+            result['shallow_clone'] = True
+        return result
+
     include_merges = query.get('merges') in ('1', 'true', 'yes')
     limit = getattr(result_control, 'limit', None) if result_control else None
 
@@ -1,8 +1,16 @@
 """Git query filtering and comparison logic."""
 
-from typing import Any, Union, Dict
+from typing import Any, Callable, Union, Dict
 
-from ...utils.query import compare_values
+from ...utils.query import compare_values, compile_filters
+
+# compare_values() options for git:// commit filters.
+COMPARE_OPTIONS = {
+    'allow_list_any': False,  # Git commits don't have list fields
+    'case_sensitive': False,  # Author/email/message searches case-insensitive
+    'coerce_numeric': True,   # For timestamp comparisons
+    'none_matches_not_equal': True
+}
 
 
 def compare(field_value: Any, operator: str, target_value: Union[bool, int, float, str]) -> bool:
@@ -18,17 +26,7 @@ def compare(field_value: Any, operator: str, target_value: Union[bool, int, floa
     Returns:
         True if comparison passes, False otherwise
     """
-    return compare_values(
-        field_value,
-        operator,
-        target_value,
-        options={
-            'allow_list_any': False,  # Git commits don't have list fields
-            'case_sensitive': False,  # Author/email/message searches case-insensitive
-            'coerce_numeric': True,   # For timestamp comparisons
-            'none_matches_not_equal': True
-        }
-    )
+    return compare_values(field_value, operator, target_value, options=COMPARE_OPTIONS)
 
 
 def matches_all_filters(commit_dict: Dict[str, Any], query_filters: list) -> bool:
@@ -51,3 +49,9 @@ def matches_all_filters(commit_dict: Dict[str, Any], query_filters: list) -> boo
             return False
 
     return True
+
+
+def compile_commit_filters(query_filters: list) -> Callable[[Dict[str, Any]], bool]:
+    """matches_all_filters(commit_dict, query_filters) compiled once, for
+    walks that test the same filters against every commit."""
+    return compile_filters(query_filters, COMPARE_OPTIONS, existence_ops=False)
@@ -230,6 +230,10 @@ class GitRenderer:
             print("  Run `git fetch --unshallow` for complete bus-factor / key-person data.")
             print()
 
+        if result.get('basis') == 'lines':
+            GitRenderer._render_line_ownership(result)
+            return
+
         label = result['source_type'].capitalize()
         print(f"Ownership ({label}): {result['path']} @ {result['ref']}")
         print(f"Commits: {result['total_commits']}  ·  Contributors: {result['contributor_count']}  ·  Last touch: {result['last_touch'] or '—'}")
@@ -250,6 +254,28 @@ class GitRenderer:
         print()
         print("ℹ Commit-share (not surviving-line ownership) — use ?type=blame for line-level attribution.")
 
+    @staticmethod
+    def _render_line_ownership(result: dict) -> None:
+        """Render ?basis=lines ownership (surviving lines per author)."""
+        label = result['source_type'].capitalize()
+        print(f"Line ownership ({label}): {result['path']} @ {result['ref']}")
+        print(f"Lines: {result['total_lines']}  ·  Files: {result['file_count']}  ·  Contributors: {result['contributor_count']}  ·  Last touch: {result['last_touch'] or '—'}")
+        print()
+
+        authors = result['authors']
+        if not authors:
+            print("  (no blamed lines under this path)")
+            print()
+            return
+
+        print("Authors (by surviving lines):")
+        for a in authors[:10]:
+            pct = a['share'] * 100
+            print(f"  {a['name'][:28]:28} {a['lines']:7} lines ({pct:5.1f}%)  {a['files']:4} files  Last: {a['last_touch']}")
+        if len(authors) > 10:
+            print(f"  ... and {len(authors) - 10} more contributors")
+        print()
+
     @staticmethod
     def _render_file_structure(result: dict) -> None:
         """Render structural view of a file at a historical ref."""
@@ -23,6 +23,7 @@ from reveal.reveal_types import CONTRACT_VERSION
 from .base import ResourceAdapter, register_adapter, register_renderer
 from .help_data import load_help_data
 from ..core import disk_cache
+from ..utils.packed import pack_record, PackedRecord
 from ..utils import print_json_result
 from ..analyzers.imports import ImportGraph, ImportStatement
 from ..analyzers.imports.layers import load_layer_config
@@ -776,6 +777,21 @@ def _extract_one_file(fp_str: str, want_structure: bool):
     return fp_str, imports, symbols, structure, failed
 
 
+def _extract_one_file_packed(fp_str: str, want_structure: bool):
+    """Pool entry point: `_extract_one_file` as `(fp_str, pack_record payload)`.
+
+    Header: `(failed, has_extractor)`. Segments: imports, symbols, structure —
+    each pickled separately so the parent unpickles only what its reduce step
+    reads (`_extract_files` skips imports/symbols for files with no extractor
+    and the structure segment unless structures were requested).
+    """
+    fp_str, imports, symbols, structure, failed = _extract_one_file(fp_str, want_structure)
+    return fp_str, pack_record(
+        (failed, imports is not None),
+        (imports, symbols, structure),
+    )
+
+
 @register_adapter('imports')
 @register_renderer(ImportsRenderer)
 class ImportsAdapter(ResourceAdapter):
@@ -969,10 +985,15 @@ class ImportsAdapter(ResourceAdapter):
         chunksize = max(1, n // (workers * 8))
         paths = [str(fp) for fp in candidates]
         with ProcessPoolExecutor(max_workers=workers) as executor:
-            for fp_str, imports, symbols, structure, failed in executor.map(
-                _extract_one_file, paths, repeat(want_structure), chunksize=chunksize
+            for fp_str, payload in executor.map(
+                _extract_one_file_packed, paths, repeat(want_structure), chunksize=chunksize
             ):
-                yield Path(fp_str), imports, symbols, structure, failed
+                record = PackedRecord(payload)
+                failed, has_extractor = record.scalars
+                imports = record.segment(0) if has_extractor else None
+                symbols = record.segment(1) if has_extractor else None
+                structure = record.segment(2) if want_structure else None
+                yield Path(fp_str), imports, symbols, structure, bool(failed)
 
     @staticmethod
     def _discover_candidate_files(
@@ -17,7 +17,6 @@ from .help import get_help, get_schema
 from .parsing import parse_path, load_json
 from .queries import (
     get_field_value,
-    compare,
     filter_array,
     apply_result_control,
     navigate_to_path
@@ -295,7 +294,7 @@ class JsonAdapter(ResourceAdapter):
 
         # Apply filters
         if self.query_filters:
-            value = filter_array(value, self.query_filters, get_field_value, compare)
+            value = filter_array(value, self.query_filters, get_field_value)
 
         # Apply result control (sort, limit, offset)
         if has_result_control:
@@ -1,8 +1,17 @@
 """Query and filtering functions for JSON adapter."""
 
-from typing import Any, List, Dict
+import heapq
+from typing import Any, Callable, List, Dict, Optional
 
-from ...utils.query import compare_values, ResultControl
+from ...utils.query import compare_values, compile_filters, ResultControl
+
+# compare_values() options for json:// filters.
+COMPARE_OPTIONS = {
+    'allow_list_any': True,
+    'case_sensitive': False,
+    'coerce_numeric': True,
+    'none_matches_not_equal': True
+}
 
 
 def get_field_value(obj: Any, field: str) -> Any:
@@ -44,17 +53,7 @@ def compare(field_value: Any, operator: str, target_value: Any) -> bool:
     Returns:
         True if comparison passes, False otherwise
     """
-    return compare_values(
-        field_value,
-        operator,
-        target_value,
-        options={
-            'allow_list_any': True,
-            'case_sensitive': False,
-            'coerce_numeric': True,
-            'none_matches_not_equal': True
-        }
-    )
+    return compare_values(field_value, operator, target_value, options=COMPARE_OPTIONS)
 
 
 def matches_all_filters(obj: Any, query_filters: list, get_field_value_func, compare_func) -> bool:
@@ -80,14 +79,17 @@ def matches_all_filters(obj: Any, query_filters: list, get_field_value_func, com
     return True
 
 
-def filter_array(arr: List[Any], query_filters: list, get_field_value_func, compare_func) -> List[Any]:
+def filter_array(arr: List[Any], query_filters: list, get_field_value_func,
+                 compare_func: Optional[Callable[[Any, str, Any], bool]] = None) -> List[Any]:
     """Filter array elements based on query filters.
 
     Args:
         arr: Array to filter
         query_filters: List of query filter objects
         get_field_value_func: Function to extract field values
-        compare_func: Function to compare values
+        compare_func: Function to compare values. When omitted, the filters
+            are compiled once with compare()'s options instead of being
+            re-dispatched for every element.
 
     Returns:
         Filtered array
@@ -95,6 +97,11 @@ def filter_array(arr: List[Any], query_filters: list, get_field_value_func, comp
     if not query_filters:
         return arr
 
+    if compare_func is None:
+        matches = compile_filters(query_filters, COMPARE_OPTIONS, get_value=get_field_value_func,
+                                  existence_ops=False)
+        return [item for item in arr if matches(item)]
+
     return [
         item for item in arr
         if matches_all_filters(item, query_filters, get_field_value_func, compare_func)
@@ -134,7 +141,14 @@ def apply_result_control(
                     return (1, '') if not reverse else (0, '')
                 return (0, value)
 
-            controlled = sorted(controlled, key=sort_key, reverse=reverse)
+            if result_control.limit is not None and result_control.limit >= 0:
+                # Only the first offset + limit survive: heap-select those
+                # (same order, ties included, as the full sort).
+                wanted = max(result_control.offset or 0, 0) + result_control.limit
+                select = heapq.nlargest if reverse else heapq.nsmallest
+                controlled = select(wanted, controlled, key=sort_key)
+            else:
+                controlled = sorted(controlled, key=sort_key, reverse=reverse)
         except Exception:
             # If sorting fails, continue without sorting
             pass
@@ -10,92 +10,202 @@ Usage:
 """
 
 import glob
-import re
+import hashlib
+import logging
+import os
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 from reveal.reveal_types import CONTRACT_VERSION
 
 from ..base import ResourceAdapter, register_adapter, register_renderer
 from ..help_data import load_help_data
+from ..nginx.config_index import load_index
+from ...core import disk_cache
 from ...utils.query import parse_query_params
 from ...utils.results import ResultBuilder
 from .renderer import LetsEncryptRenderer
 
+logger = logging.getLogger(__name__)
+
 _LIVE_DIR = '/etc/letsencrypt/live'
 
+# Parsed cert summaries, one snapshot per live dir, reused while a cert's
+# (inode, mtime_ns, size) is unchanged. live/<name>/cert.pem is a symlink that
+# certbot repoints at a new archive file on renewal, so the stat (which
+# follows it) changes exactly when the cert does.
+_INVENTORY_NAMESPACE = "letsencrypt_inventory"
+_INVENTORY_MAX_ENTRIES = 16
+
+# Certs parsed on a cold (or mostly renewed) inventory are parsed in worker
+# processes; below _PARSE_PARALLEL_MIN_CERTS the pool's startup cost outweighs
+# the win.
+_PARSE_PARALLEL_MIN_CERTS = 64
+_PARSE_MAX_WORKERS = 16
+
 # Standard nginx config directories for orphan detection
 _NGINX_CONFIG_DIRS = [
     '/etc/nginx/sites-enabled',
     '/etc/nginx/conf.d',
 ]
 
-# Regex to extract ssl_certificate paths from nginx config lines
-_SSL_CERT_RE = re.compile(r'^\s*ssl_certificate\s+([^;]+);')
 
+def _san_hash(san: List[str]) -> str:
+    """Short digest of the sorted SAN set; certs with equal hashes are duplicates."""
+    return hashlib.sha256('\n'.join(sorted(set(san))).encode('utf-8')).hexdigest()[:16]
 
-def _load_cert_info(cert_path: Path) -> Optional[Dict[str, Any]]:
-    """Load and parse a single cert.pem, returning a summary dict or None on error."""
+
+def _parse_cert_file(cert_path: str) -> Tuple[Dict[str, Any], bool]:
+    """Parse one cert.pem into its time-independent fields.
+
+    Module-level (not a closure) so cold parses can run in a
+    ProcessPoolExecutor.
+
+    Returns:
+        (fields, cacheable): fields are common_name, san, san_hash, not_after
+        (datetime) and issuer, or just 'error'. Read errors (OSError) aren't
+        cacheable; a file that doesn't parse is, until it changes.
+    """
     try:
         from ..ssl.certificate import load_certificate_from_file
-        leaf, _ = load_certificate_from_file(str(cert_path))
+        leaf, _ = load_certificate_from_file(cert_path)
+        san = sorted(leaf.san)
         return {
-            'name': cert_path.parent.name,
-            'cert_path': str(cert_path),
             'common_name': leaf.common_name,
-            'san': sorted(leaf.san),
-            'days_until_expiry': leaf.days_until_expiry,
-            'not_after': leaf.not_after.isoformat(),
-            'is_expired': leaf.is_expired,
+            'san': san,
+            'san_hash': _san_hash(san),
+            'not_after': leaf.not_after,
             'issuer': leaf.issuer_name,
-        }
+        }, True
     except Exception as exc:
-        return {
-            'name': cert_path.parent.name,
-            'cert_path': str(cert_path),
-            'error': str(exc),
-        }
+        return {'error': str(exc)}, not isinstance(exc, OSError)
+
+
+def _cert_summary(cert_path: Path, fields: Dict[str, Any]) -> Dict[str, Any]:
+    """The inventory entry for a cert: its parsed fields plus expiry as of now."""
+    if 'error' in fields:
+        return {'name': cert_path.parent.name, 'cert_path': str(cert_path), 'error': fields['error']}
+    days = (fields['not_after'] - datetime.now(timezone.utc)).days
+    return {
+        'name': cert_path.parent.name,
+        'cert_path': str(cert_path),
+        'common_name': fields['common_name'],
+        'san': fields['san'],
+        'days_until_expiry': days,
+        'not_after': fields['not_after'].isoformat(),
+        'is_expired': days < 0,
+        'issuer': fields['issuer'],
+        'san_hash': fields['san_hash'],
+    }
+
+
+def _load_cert_info(cert_path: Path) -> Optional[Dict[str, Any]]:
+    """Load and parse a single cert.pem, returning a summary dict (with 'error' on failure)."""
+    return _cert_summary(cert_path, _parse_cert_file(str(cert_path))[0])
+
+
+def _parse_worker_count(n_certs: int) -> int:
+    """Workers for parsing `n_certs` certs. 1 = run serially (no pool).
+
+    `REVEAL_MAX_WORKERS` overrides everything (set to 1 to force the serial
+    path); otherwise parallelize only above `_PARSE_PARALLEL_MIN_CERTS`,
+    capped at `_PARSE_MAX_WORKERS` and the CPU count.
+    """
+    override = os.environ.get('REVEAL_MAX_WORKERS')
+    if override:
+        try:
+            return max(1, int(override))
+        except ValueError:
+            pass
+    if n_certs < _PARSE_PARALLEL_MIN_CERTS:
+        return 1
+    return max(1, min(os.cpu_count() or 1, _PARSE_MAX_WORKERS))
+
+
+def _parse_cert_files(paths: List[str]) -> List[Tuple[Dict[str, Any], bool]]:
+    """_parse_cert_file() for each path, in order, in a process pool when there are many."""
+    workers = _parse_worker_count(len(paths))
+    if workers > 1 and len(paths) > 1:
+        try:
+            with ProcessPoolExecutor(max_workers=min(workers, len(paths))) as pool:
+                return list(pool.map(_parse_cert_file, paths, chunksize=16))
+        except Exception as e:
+            # Degrade to serial on any pool failure (restricted/forbidden-fork
+            # environments) rather than losing the inventory.
+            logger.debug("letsencrypt: parallel cert parsing failed (%s); running serially", e)
+    return [_parse_cert_file(path) for path in paths]
+
+
+def _inventory_key(live_dir: str) -> str:
+    return hashlib.sha256(os.path.abspath(live_dir).encode('utf-8', 'surrogatepass')).hexdigest()
 
 
 def _walk_live_dir(live_dir: str) -> List[Dict[str, Any]]:
-    """Walk /etc/letsencrypt/live/*/cert.pem and return cert summaries."""
+    """Walk /etc/letsencrypt/live/*/cert.pem and return cert summaries.
+
+    Parsed fields come from the inventory cache for certs whose stat is
+    unchanged; the rest are parsed (in parallel when there are many) and
+    the cache updated.
+    """
     base = Path(live_dir)
     if not base.exists():
         return []
-    certs = []
+    cert_files = []
     for subdir in sorted(base.iterdir()):
         if not subdir.is_dir():
             continue
         cert_file = subdir / 'cert.pem'
         if cert_file.exists():
-            info = _load_cert_info(cert_file)
-            if info:
-                certs.append(info)
-    return certs
+            cert_files.append(cert_file)
+
+    key = _inventory_key(live_dir)
+    saved = disk_cache.get(_INVENTORY_NAMESPACE, key)
+    if not isinstance(saved, dict):
+        saved = {}
+    entries: Dict[str, Tuple[Tuple[int, int, int], Dict[str, Any]]] = {}
+    fields_by_path: Dict[str, Dict[str, Any]] = {}
+    cold: List[Tuple[str, Optional[Tuple[int, int, int]]]] = []
+    for cert_file in cert_files:
+        path = str(cert_file)
+        try:
+            st = os.stat(path)
+            stamp: Optional[Tuple[int, int, int]] = (st.st_ino, st.st_mtime_ns, st.st_size)
+        except OSError:
+            stamp = None
+        entry = saved.get(path)
+        if stamp is not None and entry is not None and entry[0] == stamp:
+            entries[path] = entry
+            fields_by_path[path] = entry[1]
+        else:
+            cold.append((path, stamp))
+
+    parsed = _parse_cert_files([path for path, _ in cold])
+    for (path, stamp), (fields, cacheable) in zip(cold, parsed):
+        fields_by_path[path] = fields
+        if stamp is not None and cacheable:
+            entries[path] = (stamp, fields)
+
+    if entries != saved:
+        disk_cache.put(_INVENTORY_NAMESPACE, key, entries, max_entries=_INVENTORY_MAX_ENTRIES)
+    return [_cert_summary(cert_file, fields_by_path[str(cert_file)]) for cert_file in cert_files]
 
 
 def _collect_nginx_cert_paths(nginx_dirs: List[str]) -> List[str]:
-    """Scan standard nginx config dirs and return all ssl_certificate path values."""
-    paths: List[str] = []
-    for dir_str in nginx_dirs:
-        d = Path(dir_str)
-        if not d.exists():
-            continue
-        for conf_file in d.iterdir():
-            if not conf_file.is_file():
-                continue
-            try:
-                for line in conf_file.read_text(errors='replace').splitlines():
-                    m = _SSL_CERT_RE.match(line)
-                    if m:
-                        paths.append(m.group(1).strip().strip('"\''))
-            except OSError:
-                continue
-    return paths
+    """Return all ssl_certificate path values from the enabled nginx configs in
+    nginx_dirs, including snippet files pulled in by their include directives."""
+    return load_index(nginx_dirs).cert_paths()
 
 
 def _find_orphans(certs: List[Dict], nginx_cert_paths: List[str]) -> List[Dict]:
     """Return certs whose cert_path is not referenced by any nginx ssl_certificate directive."""
     referenced = set(nginx_cert_paths)
+    # Every directory some referenced path lies under, so each cert is one
+    # set lookup instead of a prefix test against every referenced path.
+    referenced_dirs = set()
+    for p in referenced:
+        parts = p.split('/')
+        referenced_dirs.update('/'.join(parts[:i]) for i in range(1, len(parts)))
     orphans = []
     for cert in certs:
         if 'error' in cert:
@@ -106,25 +216,21 @@ def _find_orphans(certs: List[Dict], nginx_cert_paths: List[str]) -> List[Dict]:
         # We also check the parent directory name appearing in any referenced path,
         # since certbot often uses fullchain.pem rather than cert.pem.
         cert_dir = cert_path.rsplit('/', 1)[0]  # POSIX split — cert_path is always a server path
-        in_use = any(
-            p == cert_path or p.startswith(cert_dir + '/')
-            for p in referenced
-        )
+        in_use = cert_path in referenced or cert_dir in referenced_dirs
         if not in_use:
             orphans.append(cert)
     return orphans
 
 
 def _find_duplicates(certs: List[Dict]) -> List[List[Dict]]:
-    """Return groups of certs sharing identical SAN sets."""
+    """Return groups of certs sharing identical SAN sets, grouped by san_hash."""
     from collections import defaultdict
-    groups: Dict[Any, List[Dict]] = defaultdict(list)
+    groups: Dict[str, List[Dict]] = defaultdict(list)
     for cert in certs:
-        if 'error' in cert:
+        if 'error' in cert or not cert.get('san'):
             continue
-        key = frozenset(cert.get('san', []))
-        if key:
-            groups[key].append(cert)
+        key = cert.get('san_hash') or _san_hash(cert['san'])
+        groups[key].append(cert)
     return [group for group in groups.values() if len(group) > 1]
 
 
@@ -314,6 +420,7 @@ class LetsEncryptAdapter(ResourceAdapter):
                                         'days_until_expiry': {'type': 'integer'},
                                         'not_after': {'type': 'string'},
                                         'is_expired': {'type': 'boolean'},
+                                        'san_hash': {'type': 'string', 'description': 'Digest of the sorted SAN set; equal values = duplicate certs'},
                                     },
                                 },
                             },
@@ -339,7 +446,8 @@ class LetsEncryptAdapter(ResourceAdapter):
             ],
             'notes': [
                 'Reads /etc/letsencrypt/live/*/cert.pem — requires read access',
-                '--check-orphans scans /etc/nginx/sites-enabled/ and /etc/nginx/conf.d/',
+                'Parsed certs are cached (~/.reveal/cache/) by inode + mtime; repeat listings re-parse only renewed certs',
+                '--check-orphans scans enabled configs in /etc/nginx/sites-enabled/ and /etc/nginx/conf.d/, plus the files they include',
                 'certbot renew --dry-run is out of scope — no command execution',
             ],
         }
@@ -2,9 +2,10 @@
 
 import fnmatch
 from pathlib import Path
-from typing import Dict, Any, Optional, List, Tuple
+from typing import Callable, Dict, Any, Optional, List, Tuple
 
 from . import query as query_module
+from ...utils.query import compile_filters
 
 
 def matches_body_contains(path: Path, terms: List[str]) -> bool:
@@ -149,3 +150,24 @@ def matches_all_filters(frontmatter: Optional[Dict[str, Any]],
                 return False
 
     return True
+
+
+def compile_frontmatter_filters(filters: List[Tuple[str, str, str]],
+                                query_filters: List[Any]) -> Callable[[Optional[Dict[str, Any]]], bool]:
+    """matches_all_filters(frontmatter, filters, query_filters) with the
+    query filters compiled once, for scans that test every file's frontmatter."""
+    query_matches = compile_filters(
+        query_filters, query_module.COMPARE_OPTIONS, existence_ops=False
+    ) if query_filters else None
+
+    def matches(frontmatter: Optional[Dict[str, Any]]) -> bool:
+        if filters and not all(
+            matches_filter(frontmatter, field, op, value)
+            for field, op, value in filters
+        ):
+            return False
+        if query_matches is not None:
+            return frontmatter is not None and query_matches(frontmatter)
+        return True
+
+    return matches
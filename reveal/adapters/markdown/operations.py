@@ -51,11 +51,12 @@ def get_structure(
     candidates = grep_files(all_files, body_contains) if body_contains else all_files
 
     matched_results = []
+    frontmatter_matches = filtering.compile_frontmatter_filters(filters, query_filters)
 
     # Build results for matching files
     for path in candidates:
         frontmatter = files.extract_frontmatter(path)
-        if not filtering.matches_all_filters(frontmatter, filters, query_filters):
+        if not frontmatter_matches(frontmatter):
             continue
         if body_contains and not filtering.matches_body_contains(path, body_contains):
             continue
@@ -137,10 +138,11 @@ def aggregate_field_values(
     counts: Counter = Counter()
     matched = 0
     missing = 0
+    frontmatter_matches = filtering.compile_frontmatter_filters(filters, query_filters)
 
     for path in candidates:
         frontmatter = files.extract_frontmatter(path)
-        if not filtering.matches_all_filters(frontmatter, filters, query_filters):
+        if not frontmatter_matches(frontmatter):
             continue
         if body_contains and not filtering.matches_body_contains(path, body_contains):
             continue
@@ -4,6 +4,14 @@ from typing import Any, List, Tuple
 
 from ...utils.query import compare_values
 
+# compare_values() options for markdown:// frontmatter filters.
+COMPARE_OPTIONS = {
+    'allow_list_any': True,
+    'case_sensitive': False,
+    'coerce_numeric': True,
+    'none_matches_not_equal': True
+}
+
 
 def parse_query(query: str) -> List[Tuple[str, str, str]]:
     """Parse query string into filter tuples.
@@ -57,14 +65,4 @@ def compare(field_value: Any, operator: str, target_value: bool | int | float |
     Returns:
         True if comparison matches
     """
-    return compare_values(
-        field_value,
-        operator,
-        target_value,
-        options={
-            'allow_list_any': True,
-            'case_sensitive': False,
-            'coerce_numeric': True,
-            'none_matches_not_equal': True
-        }
-    )
+    return compare_values(field_value, operator, target_value, options=COMPARE_OPTIONS)
@@ -10,6 +10,8 @@ from .performance import PerformanceAnalyzer
 from .replication import ReplicationMonitor
 from .storage import StorageAnalyzer
 from .renderer import MySQLRenderer
+from .snapshot import ServerSnapshot, parse_sample_interval
+from ...utils.query import parse_query_params
 from ...utils.results import ResultBuilder
 from reveal.reveal_types import CONTRACT_VERSION
 
@@ -26,6 +28,23 @@ class HealthCheckThresholds:
     operator: str = '<'
 
 
+# Variables shown by the /variables element.
+_KEY_VARIABLES = (
+    'innodb_buffer_pool_size', 'max_connections', 'max_heap_table_size',
+    'query_cache_size', 'tmp_table_size',
+)
+
+_SCHEMA_QUERY_PARAMS = {
+    'sample': {
+        'type': 'string',
+        'description': (
+            'Sample interval (e.g. 5s, 500ms, 1m; max 300s): read status twice '
+            'this far apart and report per-second rates over the interval '
+            '(overview, /performance, /innodb)'
+        ),
+    },
+}
+
 _SCHEMA_OUTPUT_TYPES = [
     {
         'type': 'mysql_health',
@@ -135,13 +154,18 @@ _SCHEMA_EXAMPLE_QUERIES = [
     {'uri': 'mysql://localhost/variables',
      'description': 'Server configuration variables',
      'element': 'variables', 'output_type': 'mysql_variables'},
+    {'uri': 'mysql://localhost?sample=5s',
+     'description': 'Current load: QPS, row operations and buffer pool reads per second over 5 seconds',
+     'output_type': 'mysql_health'},
 ]
 
 _SCHEMA_NOTES = [
     'Requires pymysql package (pip install pymysql)',
     'Credentials can be provided in URI or via environment variables',
     'Read-only operations for safety',
-    'Health checks include connection utilization, InnoDB buffer pool, and resource limits'
+    'Health checks include connection utilization, InnoDB buffer pool, and resource limits',
+    'Status, variables and the processlist are read once per invocation and shared by every section',
+    'Rates without ?sample= are lifetime averages (counter / uptime); ?sample= measures the current interval',
 ]
 
 
@@ -173,7 +197,7 @@ class MySQLAdapter(ResourceAdapter):
             'adapter': 'mysql',
             'description': 'MySQL database inspection with health monitoring, performance analysis, and replication status',
             'uri_syntax': 'mysql://[user:pass@]host[:port][/element]',
-            'query_params': {},  # No query parameters
+            'query_params': _SCHEMA_QUERY_PARAMS,
             'elements': {
                 'connections': 'Connection pool and thread details',
                 'innodb': 'InnoDB buffer pool and engine status',
@@ -216,12 +240,25 @@ class MySQLAdapter(ResourceAdapter):
             resource: [user:pass@]host[:port][/element], with or without
                 the mysql:// prefix — MySQLConnection._parse_connection_string
                 normalizes both forms (see its docstring)
-            query: Unused — mysql:// supports no query parameters
+            query: Optional query string — ?sample=5s reads server status
+                twice that far apart and reports per-second rates
 
         Raises:
             ImportError: If pymysql is not installed
+            ValueError: If ?sample= isn't a valid interval
         """
         connection_string = resource
+        # Query string may arrive embedded (direct construction) or separately (router)
+        if '?' in connection_string:
+            connection_string, embedded_query = connection_string.split('?', 1)
+            query = query or embedded_query
+        self.query_params = parse_query_params(query or '')
+        self._warn_unknown_query_params(self.query_params)
+        self._sample_seconds: Optional[float] = None
+        if 'sample' in self.query_params:
+            self._sample_seconds = parse_sample_interval(self.query_params['sample'])
+        self._sample_result: Optional[Dict[str, Any]] = None
+
         # Create connection manager
         self.conn = MySQLConnection(connection_string)
         self.element = self.conn.element
@@ -282,29 +319,56 @@ class MySQLAdapter(ResourceAdapter):
         """Delegate to connection module."""
         return self.conn.convert_decimals(obj)
 
-    def _get_server_uptime_info(self, status_vars):
+    def _get_server_uptime_info(self, status_vars, server_time=None):
         """Delegate to health module."""
-        return self.health.get_server_uptime_info(status_vars)
+        return self.health.get_server_uptime_info(status_vars, server_time)
 
-    def _calculate_connection_health(self, status_vars):
+    def _calculate_connection_health(self, status_vars, variables=None):
         """Delegate to health module."""
-        return self.health.calculate_connection_health(status_vars)
+        return self.health.calculate_connection_health(status_vars, variables)
 
     def _calculate_innodb_health(self, status_vars):
         """Delegate to health module."""
         return self.health.calculate_innodb_health(status_vars)
 
-    def _calculate_resource_limits(self, status_vars):
+    def _calculate_resource_limits(self, status_vars, variables=None):
         """Delegate to health module."""
-        return self.health.calculate_resource_limits(status_vars)
+        return self.health.calculate_resource_limits(status_vars, variables)
+
+    def _snapshot(self) -> ServerSnapshot:
+        """The server snapshot every section of this invocation reads."""
+        return self.conn.snapshot(self._execute_query, self._execute_single)
+
+    def _sample(self) -> Optional[Dict[str, Any]]:
+        """Per-second rates over the ?sample= interval, or None without ?sample=.
+
+        Taken once, before anything else reads the snapshot, so the rest of
+        the result describes the end of the interval.
+        """
+        if self._sample_seconds is None:
+            return None
+        if self._sample_result is None:
+            self._snapshot()  # created through this adapter's delegates
+            self._sample_result = self.conn.sample(self._sample_seconds)
+        return self._sample_result
 
     def _get_performance(self) -> Dict[str, Any]:
-        """Delegate to performance module."""
-        return self.performance.get_performance()
+        """Delegate to performance module, with interval rates under ?sample=."""
+        sample = self._sample()
+        result = self.performance.get_performance(self._snapshot().status)
+        if sample:
+            result['queries_per_second'] = sample['per_second'].get(
+                'queries', result['queries_per_second'])
+            result['sample'] = sample
+        return result
 
     def _get_innodb(self) -> Dict[str, Any]:
-        """Delegate to performance module."""
-        return self.performance.get_innodb()
+        """Delegate to performance module, with interval rates under ?sample=."""
+        sample = self._sample()
+        result = self.performance.get_innodb(self._snapshot().status)
+        if sample:
+            result['sample'] = sample
+        return result
 
     def _get_replication(self) -> Dict[str, Any]:
         """Delegate to replication module."""
@@ -339,26 +403,29 @@ class MySQLAdapter(ResourceAdapter):
                 return result
             # Fall through to overview if element not recognized
 
+        # ?sample= first: everything below then reads the end-of-interval snapshot
+        sample = self._sample()
+        snap = self._snapshot()
+
         # Get timing context for snapshot
         timing = self.conn.get_snapshot_context()
 
-        # Get server version and status
-        version_info = self._execute_single("SELECT VERSION() as version")
-        status_vars = {row['Variable_name']: row['Value']
-                      for row in self._execute_query("SHOW GLOBAL STATUS")}
+        # Server version and status, from the shared snapshot
+        status_vars = snap.status
+        variables = snap.variables
 
         # Calculate uptime and health metrics (for detailed display)
         uptime_days, uptime_hours, uptime_mins, server_start_time = (
-            self._get_server_uptime_info(status_vars)
+            self._get_server_uptime_info(status_vars, snap.server_time)
         )
         uptime_seconds = int(status_vars.get('Uptime', 0))
 
-        conn_health = self._calculate_connection_health(status_vars)
+        conn_health = self._calculate_connection_health(status_vars, variables)
         innodb_health = self._calculate_innodb_health(status_vars)
-        resource_limits = self._calculate_resource_limits(status_vars)
+        resource_limits = self._calculate_resource_limits(status_vars, variables)
 
         # Build subsystem info using extracted helpers
-        performance_metrics = self._build_performance_metrics(status_vars, uptime_seconds)
+        performance_metrics = self._build_performance_metrics(status_vars, uptime_seconds, sample)
         replication_info = self._build_replication_info()
         storage_info = self._build_storage_info()
         health_status, health_issues = self._build_health_assessment(
@@ -370,57 +437,63 @@ class MySQLAdapter(ResourceAdapter):
         # Extract just hostname for next_steps (without port for cleaner URIs)
         host_display = server_display.split(':')[0]
 
+        data: Dict[str, Any] = {
+            'snapshot_time': timing['snapshot_time'],
+            'server': server_display,
+            'version': variables.get('version', 'unknown'),
+            'uptime': f"{uptime_days}d {uptime_hours}h {uptime_mins}m",
+            'server_start_time': server_start_time.isoformat(),
+            'connection_health': {
+                **conn_health,
+                'percentage': f"{conn_health['percentage']:.1f}%",
+                'max_used_pct': f"{conn_health['max_used_pct']:.1f}%",
+                'note': 'If max_used_pct was 100%, connections were rejected (since server start)'
+            },
+            'performance': performance_metrics,
+            'innodb_health': {
+                'buffer_pool_hit_rate': f"{innodb_health['buffer_hit_rate']:.2f}% (since server start)",
+                'status': innodb_health['status'],
+                'row_lock_waits': f"{innodb_health['row_lock_waits']} (since server start)",
+                'deadlocks': f"{innodb_health['deadlocks']} (since server start)",
+            },
+            'replication': replication_info,
+            'storage': storage_info,
+            'resource_limits': {
+                'open_files': {
+                    **resource_limits['open_files'],
+                    'percentage': f"{resource_limits['open_files']['percentage']:.1f}%",
+                    'note': 'Approaching limit (>75%) can cause "too many open files" errors'
+                }
+            },
+            'health_status': health_status,
+            'health_issues': health_issues,
+            'next_steps': [
+                f"reveal mysql://{host_display}/connections       # Connection details",
+                f"reveal mysql://{host_display}/performance       # Query performance",
+                f"reveal mysql://{host_display}/innodb            # InnoDB details",
+                f"reveal mysql://{host_display} --check           # Run health checks",
+            ]
+        }
+        if sample:
+            data['sample'] = sample
+
         return ResultBuilder.create(
             result_type='mysql_server',
             source=server_display,
             source_type='database',
             contract_version=CONTRACT_VERSION,
-            data={
-                'snapshot_time': timing['snapshot_time'],
-                'server': server_display,
-                'version': version_info['version'],
-                'uptime': f"{uptime_days}d {uptime_hours}h {uptime_mins}m",
-                'server_start_time': server_start_time.isoformat(),
-                'connection_health': {
-                    **conn_health,
-                    'percentage': f"{conn_health['percentage']:.1f}%",
-                    'max_used_pct': f"{conn_health['max_used_pct']:.1f}%",
-                    'note': 'If max_used_pct was 100%, connections were rejected (since server start)'
-                },
-                'performance': performance_metrics,
-                'innodb_health': {
-                    'buffer_pool_hit_rate': f"{innodb_health['buffer_hit_rate']:.2f}% (since server start)",
-                    'status': innodb_health['status'],
-                    'row_lock_waits': f"{innodb_health['row_lock_waits']} (since server start)",
-                    'deadlocks': f"{innodb_health['deadlocks']} (since server start)",
-                },
-                'replication': replication_info,
-                'storage': storage_info,
-                'resource_limits': {
-                    'open_files': {
-                        **resource_limits['open_files'],
-                        'percentage': f"{resource_limits['open_files']['percentage']:.1f}%",
-                        'note': 'Approaching limit (>75%) can cause "too many open files" errors'
-                    }
-                },
-                'health_status': health_status,
-                'health_issues': health_issues,
-                'next_steps': [
-                    f"reveal mysql://{host_display}/connections       # Connection details",
-                    f"reveal mysql://{host_display}/performance       # Query performance",
-                    f"reveal mysql://{host_display}/innodb            # InnoDB details",
-                    f"reveal mysql://{host_display} --check           # Run health checks",
-                ]
-            }
+            data=data,
         )
 
     def _build_performance_metrics(self, status_vars: Dict[str, str],
-                                   uptime_seconds: int) -> Dict[str, Any]:
+                                   uptime_seconds: int,
+                                   sample: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """Build performance metrics from status variables.
 
         Args:
             status_vars: SHOW GLOBAL STATUS results
             uptime_seconds: Server uptime in seconds
+            sample: ?sample= rates; QPS is taken from the interval when given
 
         Returns:
             Dict with performance metrics
@@ -428,6 +501,8 @@ class MySQLAdapter(ResourceAdapter):
         questions = int(status_vars.get('Questions', 0))
         slow_queries = int(status_vars.get('Slow_queries', 0))
         qps = questions / uptime_seconds if uptime_seconds else 0
+        if sample and 'queries' in sample['per_second']:
+            qps = sample['per_second']['queries']
         slow_pct = (slow_queries / questions * 100) if questions else 0
         threads_running = int(status_vars.get('Threads_running', 0))
 
@@ -645,7 +720,7 @@ class MySQLAdapter(ResourceAdapter):
         interpret long_running_queries time values.
         """
         timing = self.conn.get_snapshot_context()
-        processlist = self._execute_query("SHOW FULL PROCESSLIST")
+        processlist = self._snapshot().processlist
 
         # Group by state
         by_state: Dict[str, int] = {}
@@ -679,8 +754,7 @@ class MySQLAdapter(ResourceAdapter):
     def _get_errors(self) -> Dict[str, Any]:
         """Get error indicators."""
         timing = self.conn.get_snapshot_context()
-        status_vars = {row['Variable_name']: row['Value']
-                      for row in self._execute_query("SHOW GLOBAL STATUS")}
+        status_vars = self._snapshot().status
 
         return {
             'type': 'errors',
@@ -694,17 +768,12 @@ class MySQLAdapter(ResourceAdapter):
     def _get_variables(self) -> Dict[str, Any]:
         """Get key server variables with snapshot timing context."""
         timing = self.conn.get_snapshot_context()
-        variables = self._execute_query("""
-            SHOW VARIABLES WHERE Variable_name IN (
-                'max_connections', 'innodb_buffer_pool_size',
-                'query_cache_size', 'tmp_table_size', 'max_heap_table_size'
-            )
-        """)
+        variables = self._snapshot().variables
 
         return {
             'type': 'variables',
             **timing,
-            'variables': {row['Variable_name']: row['Value'] for row in variables},
+            'variables': {name: variables[name] for name in _KEY_VARIABLES if name in variables},
         }
 
     def _get_health(self) -> Dict[str, Any]:
@@ -979,11 +1048,10 @@ class MySQLAdapter(ResourceAdapter):
         performance = self._get_performance()
         tuning_ratios = performance.get('tuning_ratios', {})
 
-        # Get status and configuration variables
-        status_vars = {row['Variable_name']: row['Value']
-                      for row in self._execute_query("SHOW GLOBAL STATUS")}
-        vars_result = self._execute_query("SHOW VARIABLES")
-        variables = {row['Variable_name']: row['Value'] for row in vars_result}
+        # Status and configuration variables, shared with _get_performance()
+        snap = self._snapshot()
+        status_vars = snap.status
+        variables = snap.variables
 
         # Parse ratio metrics
         table_scan_ratio = self._parse_percentage(tuning_ratios.get('table_scan_ratio', '0%'))
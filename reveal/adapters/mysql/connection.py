@@ -1,10 +1,13 @@
 """MySQL connection management and credential resolution."""
 
 import os
+import time
 from datetime import datetime, timezone
-from typing import Dict, Any, Optional, cast
+from typing import Callable, Dict, Any, Optional, cast
 from urllib.parse import urlparse, unquote
 
+from .snapshot import ServerSnapshot, sample_rates
+
 try:
     import pymysql
     import pymysql.cursors
@@ -47,6 +50,7 @@ class MySQLConnection:
         self._parse_connection_string(connection_string)
         self._resolve_credentials()
         self._connection = None
+        self._snapshot: Optional[ServerSnapshot] = None
 
     def _parse_connection_string(self, uri: str):
         """Parse mysql:// URI into components.
@@ -209,11 +213,50 @@ class MySQLConnection:
         results = self.execute_query(query, params)
         return results[0] if results else None
 
+    def snapshot(self, execute_query: Optional[Callable] = None,
+                 execute_single: Optional[Callable] = None) -> ServerSnapshot:
+        """Get the server snapshot shared by everything in this invocation.
+
+        Created on first use; later calls return the same snapshot, so
+        status, variables and the processlist are each queried once.
+
+        Args:
+            execute_query: Query function for a snapshot created by this call
+                (default: this connection's). MySQLAdapter passes its own
+                delegates so tests that mock MySQLAdapter._execute_query
+                also see the snapshot queries.
+            execute_single: Single-row counterpart of execute_query
+        """
+        if self._snapshot is None:
+            self._snapshot = ServerSnapshot(execute_query or self.execute_query,
+                                            execute_single or self.execute_single)
+        return self._snapshot
+
+    def sample(self, seconds: float) -> Dict[str, Any]:
+        """Take a second snapshot *seconds* after the first and compare them.
+
+        The second snapshot replaces the shared one, so everything read
+        afterwards reflects the end of the interval.
+
+        Returns:
+            sample_rates() of the two snapshots
+        """
+        before = self.snapshot()
+        # the interval starts at the first status read, whenever that was
+        remaining = seconds - (time.monotonic() - before.read_status())
+        if remaining > 0:
+            time.sleep(remaining)
+        after = before.refreshed()
+        after.read_status()
+        self._snapshot = after
+        return sample_rates(before, after)
+
     def get_snapshot_context(self) -> Dict[str, Any]:
         """Get standardized timing context for all metrics.
 
         Returns timing information using MySQL's clock for accuracy.
-        All timestamps in UTC ISO 8601 format.
+        All timestamps in UTC ISO 8601 format. Read from the shared
+        snapshot, so every section of one invocation reports the same time.
 
         Returns:
             Dict with:
@@ -222,17 +265,14 @@ class MySQLConnection:
             - uptime_seconds: Server uptime in seconds
             - measurement_window: Human-readable uptime (e.g., "23d 23h (since server start)")
         """
+        snap = self.snapshot()
 
         # Get MySQL's current timestamp (not local machine time)
-        mysql_time = self.execute_single("SELECT UNIX_TIMESTAMP() as timestamp")
-        assert mysql_time is not None, "Failed to get MySQL timestamp"
-        snapshot_timestamp = int(mysql_time['timestamp'])
+        snapshot_timestamp = snap.server_time
         snapshot_time = datetime.fromtimestamp(snapshot_timestamp, timezone.utc)
 
         # Get server uptime
-        status_vars = {row['Variable_name']: row['Value']
-                      for row in self.execute_query("SHOW GLOBAL STATUS WHERE Variable_name = 'Uptime'")}
-        uptime_seconds = int(status_vars.get('Uptime', 0))
+        uptime_seconds = int(snap.status.get('Uptime', 0))
 
         # Calculate server start time
         server_start_timestamp = snapshot_timestamp - uptime_seconds
@@ -1,6 +1,6 @@
 """MySQL health metrics calculation."""
 
-from typing import Dict, Tuple
+from typing import Dict, Optional, Tuple
 from datetime import datetime, timezone
 
 
@@ -20,12 +20,14 @@ class HealthMetrics:
         self.conn = connection
 
     def get_server_uptime_info(
-        self, status_vars: Dict[str, str]
+        self, status_vars: Dict[str, str], server_time: Optional[int] = None
     ) -> Tuple[int, int, int, datetime]:
         """Calculate server uptime and start time.
 
         Args:
             status_vars: Dict from SHOW GLOBAL STATUS
+            server_time: MySQL's UNIX_TIMESTAMP() if already known
+                (queried when None)
 
         Returns:
             Tuple of (uptime_days, uptime_hours, uptime_mins, server_start_time)
@@ -36,29 +38,39 @@ class HealthMetrics:
         uptime_mins = (uptime_seconds % 3600) // 60
 
         # Calculate server start time using MySQL's clock
-        mysql_time = self.conn.execute_single(
-            "SELECT UNIX_TIMESTAMP() as timestamp"
-        )
-        mysql_timestamp = int(mysql_time['timestamp'])
-        server_start_timestamp = mysql_timestamp - uptime_seconds
+        if server_time is None:
+            mysql_time = self.conn.execute_single(
+                "SELECT UNIX_TIMESTAMP() as timestamp"
+            )
+            server_time = int(mysql_time['timestamp'])
+        server_start_timestamp = server_time - uptime_seconds
         server_start_time = datetime.fromtimestamp(
             server_start_timestamp, timezone.utc
         )
 
         return uptime_days, uptime_hours, uptime_mins, server_start_time
 
-    def calculate_connection_health(self, status_vars: Dict[str, str]) -> Dict:
+    def _variable(self, variables: Optional[Dict[str, str]], name: str) -> int:
+        """Integer server variable, from *variables* or queried on its own."""
+        if variables is not None and name in variables:
+            return int(variables[name])
+        return int(self.conn.execute_single(
+            "SHOW VARIABLES LIKE %s", (name,)
+        )['Value'])
+
+    def calculate_connection_health(self, status_vars: Dict[str, str],
+                                    variables: Optional[Dict[str, str]] = None) -> Dict:
         """Calculate connection health metrics.
 
         Args:
             status_vars: Dict from SHOW GLOBAL STATUS
+            variables: Dict from SHOW GLOBAL VARIABLES, if already fetched
+                (max_connections is queried on its own otherwise)
 
         Returns:
             Dict with current/max connections, percentages, and status indicators
         """
-        max_connections = int(self.conn.execute_single(
-            "SHOW VARIABLES LIKE 'max_connections'"
-        )['Value'])
+        max_connections = self._variable(variables, 'max_connections')
         current_connections = int(status_vars.get('Threads_connected', 0))
         max_used_connections = int(status_vars.get('Max_used_connections', 0))
 
@@ -126,19 +138,20 @@ class HealthMetrics:
             'deadlocks': deadlocks,
         }
 
-    def calculate_resource_limits(self, status_vars: Dict[str, str]) -> Dict:
+    def calculate_resource_limits(self, status_vars: Dict[str, str],
+                                  variables: Optional[Dict[str, str]] = None) -> Dict:
         """Calculate resource limit metrics.
 
         Args:
             status_vars: Dict from SHOW GLOBAL STATUS
+            variables: Dict from SHOW GLOBAL VARIABLES, if already fetched
+                (open_files_limit is queried on its own otherwise)
 
         Returns:
             Dict with open files current/limit, percentage, and status
         """
         open_files = int(status_vars.get('Open_files', 0))
-        open_files_limit = int(self.conn.execute_single(
-            "SHOW VARIABLES LIKE 'open_files_limit'"
-        )['Value'])
+        open_files_limit = self._variable(variables, 'open_files_limit')
         open_files_pct = ((open_files / open_files_limit * 100)
                          if open_files_limit > 0 else 0)
 
@@ -1,6 +1,6 @@
 """MySQL performance metrics and InnoDB engine status."""
 
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 
 
 class PerformanceAnalyzer:
@@ -90,15 +90,24 @@ class PerformanceAnalyzer:
             'note': 'Ratio >25% suggests increasing tmp_table_size or max_heap_table_size'
         }
 
-    def get_performance(self) -> Dict[str, Any]:
+    def _status_vars(self, status_vars: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        """*status_vars* if given, else a fresh SHOW GLOBAL STATUS."""
+        if status_vars is not None:
+            return status_vars
+        return {row['Variable_name']: row['Value']
+                for row in self.conn.execute_query("SHOW GLOBAL STATUS")}
+
+    def get_performance(self, status_vars: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """Get query performance metrics.
 
+        Args:
+            status_vars: SHOW GLOBAL STATUS as a dict, if already fetched
+
         Returns:
             Dict with QPS, slow queries, table scans, thread cache, temp tables
         """
         timing = self.conn.get_snapshot_context()
-        status_vars = {row['Variable_name']: row['Value']
-                      for row in self.conn.execute_query("SHOW GLOBAL STATUS")}
+        status_vars = self._status_vars(status_vars)
 
         uptime_seconds = timing['uptime_seconds']
         questions = float(status_vars.get('Questions', 0))
@@ -118,17 +127,24 @@ class PerformanceAnalyzer:
             'thread_cache_efficiency': thread_metrics,
             'temp_tables': tmp_metrics,
             'sort_merge_passes': f"{status_vars.get('Sort_merge_passes', 0)} (since server start)",
+            'tuning_ratios': {
+                'table_scan_ratio': scan_metrics['select_scan_ratio'],
+                'thread_cache_miss_rate': thread_metrics['miss_rate'],
+                'temp_tables_to_disk_ratio': tmp_metrics['disk_ratio'],
+            },
         }
 
-    def get_innodb(self) -> Dict[str, Any]:
+    def get_innodb(self, status_vars: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """Get InnoDB engine status.
 
+        Args:
+            status_vars: SHOW GLOBAL STATUS as a dict, if already fetched
+
         Returns:
             Dict with buffer pool hit rate, locks, deadlocks
         """
         timing = self.conn.get_snapshot_context()
-        status_vars = {row['Variable_name']: row['Value']
-                      for row in self.conn.execute_query("SHOW GLOBAL STATUS")}
+        status_vars = self._status_vars(status_vars)
 
         buffer_reads = int(status_vars.get('Innodb_buffer_pool_reads', 0))
         buffer_requests = int(
@@ -30,6 +30,7 @@ class MySQLRenderer(TypeDispatchRenderer):
         print(f"  Slow Queries: {perf['slow_queries']}")
         print(f"  Threads Running: {perf['threads_running']}")
         print()
+        MySQLRenderer._print_sample(result)
 
         innodb = result['innodb_health']
         print(f"InnoDB Health: {innodb['status']}")
@@ -86,6 +87,19 @@ class MySQLRenderer(TypeDispatchRenderer):
             print(f"Measurement window: {window}")
             print()
 
+    @staticmethod
+    def _print_sample(result: dict) -> None:
+        """Print ?sample= interval rates, if the result carries them."""
+        sample = result.get('sample')
+        if not sample:
+            return
+        print(f"Sampled over {sample['interval_seconds']}s (per second):")
+        for name, rate in sample['per_second'].items():
+            print(f"  {name.replace('_', ' ').capitalize()}: {rate}")
+        if sample.get('buffer_pool_hit_rate'):
+            print(f"  Buffer pool hit rate (interval): {sample['buffer_pool_hit_rate']}")
+        print()
+
     @staticmethod
     def _render_connections(result: dict) -> None:
         """Render connections/processlist element."""
@@ -227,6 +241,10 @@ class MySQLRenderer(TypeDispatchRenderer):
         print(f"Temp Tables: {tmp['status']} {tmp['disk_ratio']} on disk")
         print(f"  {tmp['note']}")
 
+        if result.get('sample'):
+            print()
+            MySQLRenderer._print_sample(result)
+
     @staticmethod
     def _render_innodb(result: dict) -> None:
         """Render InnoDB engine-status element."""
@@ -240,6 +258,10 @@ class MySQLRenderer(TypeDispatchRenderer):
         print(f"Row Lock Time (avg): {result['row_lock_time_avg']}")
         print(f"Deadlocks: {result['deadlocks']}")
 
+        if result.get('sample'):
+            print()
+            MySQLRenderer._print_sample(result)
+
     @staticmethod
     def _render_replication(result: dict) -> None:
         """Render replication-status element."""
@@ -0,0 +1,175 @@
+"""Per-invocation MySQL server snapshot and interval sampling.
+
+The overview, check() and the element handlers all read the same few
+server-wide result sets. Each used to issue its own SHOW GLOBAL STATUS (plus
+a SHOW VARIABLES LIKE ... per variable and a UNIX_TIMESTAMP() per timing
+block), so a single ``reveal mysql://host`` ran the status query several
+times and its sections saw slightly different counters. ServerSnapshot
+fetches each result set once, on first use, and every consumer reads it.
+
+Lifetime counters divided by uptime describe the server's whole life, not
+its current load. sample_rates() compares two snapshots taken an interval
+apart and reports per-second rates for just that interval (``?sample=5s``).
+"""
+
+import re
+import time
+from typing import Any, Callable, Dict, List, Optional, cast
+
+QueryFn = Callable[[str], List[Dict[str, Any]]]
+SingleFn = Callable[[str], Optional[Dict[str, Any]]]
+
+# Status counters reported per second in ?sample= mode, by output name.
+_RATE_COUNTERS = {
+    'queries': 'Questions',
+    'selects': 'Com_select',
+    'inserts': 'Com_insert',
+    'updates': 'Com_update',
+    'deletes': 'Com_delete',
+    'slow_queries': 'Slow_queries',
+    'rows_read': 'Innodb_rows_read',
+    'rows_inserted': 'Innodb_rows_inserted',
+    'rows_updated': 'Innodb_rows_updated',
+    'rows_deleted': 'Innodb_rows_deleted',
+    'buffer_pool_read_requests': 'Innodb_buffer_pool_read_requests',
+    'buffer_pool_reads': 'Innodb_buffer_pool_reads',
+    'buffer_pool_pages_flushed': 'Innodb_buffer_pool_pages_flushed',
+    'connections': 'Connections',
+    'select_scans': 'Select_scan',
+    'tmp_disk_tables': 'Created_tmp_disk_tables',
+    'bytes_received': 'Bytes_received',
+    'bytes_sent': 'Bytes_sent',
+}
+
+MAX_SAMPLE_SECONDS = 300
+_INTERVAL_RE = re.compile(r'^(\d+(?:\.\d+)?)(ms|s|m)?$')
+_INTERVAL_UNITS = {'ms': 0.001, 's': 1.0, 'm': 60.0}
+
+
+def parse_sample_interval(value: Any) -> float:
+    """Parse a ?sample= value ('5s', '500ms', '1m', bare seconds) into seconds.
+
+    Raises:
+        ValueError: if the value isn't a duration or is outside
+            (0, MAX_SAMPLE_SECONDS].
+    """
+    match = _INTERVAL_RE.match(str(value).strip().lower())
+    if not match:
+        raise ValueError(f"Invalid sample interval: {value!r} (expected e.g. 5s, 500ms, 1m)")
+    seconds = float(match.group(1)) * _INTERVAL_UNITS[match.group(2) or 's']
+    if not 0 < seconds <= MAX_SAMPLE_SECONDS:
+        raise ValueError(
+            f"Sample interval must be between 0 and {MAX_SAMPLE_SECONDS}s, got {value!r}"
+        )
+    return seconds
+
+
+def _name_value(rows: List[Dict[str, Any]]) -> Dict[str, Any]:
+    return {row['Variable_name']: row['Value'] for row in rows}
+
+
+class ServerSnapshot:
+    """Server status, variables, processlist and clock, each read once.
+
+    Sections are fetched lazily, so an element that only needs the
+    processlist never pays for SHOW GLOBAL STATUS.
+    """
+
+    def __init__(self, execute_query: QueryFn, execute_single: SingleFn):
+        """Initialize with the query functions sections are fetched through.
+
+        Args:
+            execute_query: Runs a query, returns all rows as dicts
+            execute_single: Runs a query, returns the first row or None
+        """
+        self._query = execute_query
+        self._single = execute_single
+        self._status: Optional[Dict[str, Any]] = None
+        self._variables: Optional[Dict[str, Any]] = None
+        self._processlist: Optional[List[Dict[str, Any]]] = None
+        self._server_time: Optional[int] = None
+        self._status_time: Optional[float] = None
+
+    def read_status(self) -> float:
+        """Read SHOW GLOBAL STATUS unless already read.
+
+        Returns:
+            time.monotonic() at which status was read
+        """
+        if self._status_time is None:
+            started = time.monotonic()
+            self._status = _name_value(self._query("SHOW GLOBAL STATUS"))
+            self._status_time = started
+        return self._status_time
+
+    @property
+    def status(self) -> Dict[str, Any]:
+        """SHOW GLOBAL STATUS as {name: value}."""
+        self.read_status()
+        return cast(Dict[str, Any], self._status)
+
+    @property
+    def variables(self) -> Dict[str, Any]:
+        """SHOW GLOBAL VARIABLES as {name: value}."""
+        if self._variables is None:
+            self._variables = _name_value(self._query("SHOW GLOBAL VARIABLES"))
+        return self._variables
+
+    @property
+    def processlist(self) -> List[Dict[str, Any]]:
+        """SHOW FULL PROCESSLIST rows."""
+        if self._processlist is None:
+            self._processlist = self._query("SHOW FULL PROCESSLIST")
+        return self._processlist
+
+    @property
+    def server_time(self) -> int:
+        """MySQL's clock (UNIX_TIMESTAMP()), not the local machine's."""
+        if self._server_time is None:
+            row = self._single("SELECT UNIX_TIMESTAMP() as timestamp")
+            assert row is not None, "Failed to get MySQL timestamp"
+            self._server_time = int(row['timestamp'])
+        return self._server_time
+
+    def refreshed(self) -> 'ServerSnapshot':
+        """A new snapshot that re-reads status, processlist and clock.
+
+        Variables are configuration, not counters, so they're carried over
+        rather than fetched again.
+        """
+        fresh = ServerSnapshot(self._query, self._single)
+        fresh._variables = self._variables
+        return fresh
+
+
+def sample_rates(before: ServerSnapshot, after: ServerSnapshot) -> Dict[str, Any]:
+    """Per-second counter rates between two snapshots.
+
+    Returns:
+        Dict with interval_seconds, per_second ({name: rate} for each
+        _RATE_COUNTERS counter the server reports) and the buffer pool hit
+        rate over the interval (None when there were no read requests).
+    """
+    elapsed = max(after.read_status() - before.read_status(), 1e-6)
+
+    def delta(counter: str) -> int:
+        # FLUSH STATUS between the two reads can move a counter backwards
+        return max(int(after.status[counter]) - int(before.status[counter]), 0)
+
+    per_second = {
+        name: round(delta(counter) / elapsed, 2)
+        for name, counter in _RATE_COUNTERS.items()
+        if counter in before.status and counter in after.status
+    }
+
+    hit_rate = None
+    if 'buffer_pool_read_requests' in per_second and 'buffer_pool_reads' in per_second:
+        requests = delta('Innodb_buffer_pool_read_requests')
+        if requests:
+            hit_rate = f"{100 * (1 - delta('Innodb_buffer_pool_reads') / requests):.2f}%"
+
+    return {
+        'interval_seconds': round(elapsed, 3),
+        'per_second': per_second,
+        'buffer_pool_hit_rate': hit_rate,
+    }
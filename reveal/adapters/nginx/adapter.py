@@ -24,6 +24,14 @@ from reveal.reveal_types import CONTRACT_VERSION
 from ..base import AdapterFlag, ResourceAdapter, register_adapter, register_renderer
 from ..ssl.probe import probe_http_redirect
 from ...utils.results import ResultBuilder
+from .config_index import _BACKUP_SUFFIXES, _FLEET_CHECK_DEFS, load_index
+# Canonical location is adapters/nginx/config_index.py
+from .config_index import (  # noqa: F401 — re-exported for backward compat
+    _audit_site_content,
+    _extract_domains_from_content,
+    _extract_includes,
+    _iter_nginx_configs,
+)
 from .renderer import NginxUriRenderer
 
 
@@ -41,9 +49,7 @@ _NGINX_MAIN_CONFIGS = [
     '/usr/local/etc/nginx/nginx.conf',
 ]
 
-# Nginx includes all files in sites-enabled/, but only *.conf in conf.d/.
-# Skip backup/temp files regardless.
-_BACKUP_SUFFIXES = ('.bak', '.backup', '.old', '.disabled', '.orig', '~')
+# Backup/temp files nginx skips (see config_index._iter_nginx_configs)
 _ARTIFACT_SUFFIXES = _BACKUP_SUFFIXES + ('.tmp',)
 
 
@@ -221,41 +227,6 @@ _SCHEMA_NOTES = [
 ]
 
 
-def _iter_nginx_configs(search_dir: str):
-    """Yield config file paths from a nginx config directory.
-
-    Mirrors nginx's own include logic:
-    - sites-enabled: all files (no extension filter)
-    - conf.d and others: *.conf only (including one level of subdirectories,
-      e.g. conf.d/users/ on cPanel/WHM servers)
-
-    Skips backup/temp files in both cases.
-    """
-    is_sites_enabled = 'sites-enabled' in search_dir
-    pattern = os.path.join(search_dir, '*')
-    for path in sorted(glob.glob(pattern)):
-        if os.path.isdir(path):
-            # Recurse one level into subdirectories (e.g. conf.d/users/)
-            for subpath in sorted(glob.glob(os.path.join(path, '*.conf'))):
-                if not os.path.isfile(subpath):
-                    continue
-                name = os.path.basename(subpath)
-                if any(name.endswith(s) or ('.backup' in name) for s in _BACKUP_SUFFIXES):
-                    continue
-                yield subpath
-            continue
-        if not os.path.isfile(path):
-            continue
-        name = os.path.basename(path)
-        # Skip backup/temp files
-        if any(name.endswith(s) or ('.backup' in name) for s in _BACKUP_SUFFIXES):
-            continue
-        # conf.d and other dirs: only .conf files
-        if not is_sites_enabled and not name.endswith('.conf'):
-            continue
-        yield path
-
-
 def _find_artifact_files(search_dir: str) -> List[str]:
     """Return paths of backup/temp files in a nginx config directory.
 
@@ -279,40 +250,14 @@ def _find_artifact_files(search_dir: str) -> List[str]:
     return found
 
 
-def _config_file_has_domain(conf_file: str, domain: str) -> bool:
-    """Return True if the config file has a server_name directive for domain."""
-    try:
-        content = Path(conf_file).read_text(errors='replace')
-    except OSError:
-        return False
-    return any(
-        domain in m.group(1).split()
-        for m in re.finditer(r'server_name\s+([^;]+);', content)
-    )
-
-
 def _find_config_for_domain(domain: str) -> Optional[str]:
-    """Scan nginx config directories for the file that handles domain.
+    """Return the first enabled config file whose server_name lists domain.
 
-    Returns the path to the config file, or None if not found.
+    Looked up in the parsed config index (config_index.load_index), which
+    re-reads only the files that changed since the last lookup.
     """
-    for search_dir in _NGINX_SEARCH_DIRS:
-        if not os.path.isdir(search_dir):
-            continue
-        for conf_file in _iter_nginx_configs(search_dir):
-            if _config_file_has_domain(conf_file, domain):
-                return conf_file
-    return None
-
-
-def _extract_domains_from_content(content: str) -> List[str]:
-    """Extract unique domain names from nginx server_name directives in content."""
-    domains: List[str] = []
-    for m in re.finditer(r'server_name\s+([^;]+);', content):
-        for name in m.group(1).split():
-            if name not in ('_', 'localhost') and '.' in name and name not in domains:
-                domains.append(name)
-    return domains
+    site = load_index(_NGINX_SEARCH_DIRS).site_for_domain(domain)
+    return site.path if site else None
 
 
 def _resolve_symlink_info(path: str) -> Dict[str, Any]:
@@ -591,31 +536,6 @@ def _detect_warnings(
     return warnings
 
 
-# Fleet audit check definitions
-# (id, label, severity, per_site_pattern, consolidation_eligible, deprecated, action_template)
-# consolidation_eligible: True if directive belongs in nginx.conf http{} and can be moved there
-# deprecated: True if having this directive is the problem (inverted check, e.g. X-XSS-Protection)
-_FLEET_CHECK_DEFS = [
-    ('server_tokens', 'server_tokens off',         'MEDIUM',
-     r'\bserver_tokens\s+off\b',     True,  False, 'Move to nginx.conf http{}'),
-    ('hsts',          'Strict-Transport-Security', 'HIGH',
-     r'\badd_header\s+Strict-Transport-Security\b', True, False, 'Move to nginx.conf http{}'),
-    ('xcto',          'X-Content-Type-Options',    'MEDIUM',
-     r'\badd_header\s+X-Content-Type-Options\b',  True,  False, 'Move to nginx.conf http{}'),
-    ('xfo',           'X-Frame-Options',           'MEDIUM',
-     r'\badd_header\s+X-Frame-Options\b',         True,  False, 'Move to nginx.conf http{}'),
-    ('http2',         'http2 on 443 listener',     'LOW',
-     r'\blisten\b[^;]*443\b[^;]*\bhttp2\b',       False, False,
-     'Add per-site (certbot strips http2 on renewal)'),
-    ('limit_req',     'limit_req applied',         'LOW',
-     r'\blimit_req\s',                             False, False,
-     'Add zones to nginx.conf, then limit_req per sensitive location'),
-    ('xss_prot',      'X-XSS-Protection (depr.)', 'LOW',
-     r'\badd_header\s+X-XSS-Protection\b',        False, True,
-     'Remove — deprecated since 2019, ignored by Chrome'),
-]
-
-
 def _find_nginx_conf(main_configs: List[str]) -> Optional[str]:
     """Return the first readable nginx.conf path from the search list."""
     for path in main_configs:
@@ -624,22 +544,6 @@ def _find_nginx_conf(main_configs: List[str]) -> Optional[str]:
     return None
 
 
-def _audit_site_content(content: str) -> Dict[str, bool]:
-    """Check which fleet directives are present in a single site config's raw content."""
-    return {
-        check_id: bool(re.search(pattern, content, re.IGNORECASE))
-        for check_id, _label, _sev, pattern, _consol, _depr, _action in _FLEET_CHECK_DEFS
-    }
-
-
-def _extract_includes(content: str) -> List[str]:
-    """Return include directive paths from nginx config content."""
-    return [
-        m.group(1).strip()
-        for m in re.finditer(r'\binclude\s+([^;]+);', content)
-    ]
-
-
 def _normalize_include(path: str) -> str:
     """Normalize an include path to a 2-component display key."""
     parts = path.replace('\\', '/').split('/')
@@ -685,23 +589,16 @@ def _build_snippet_consistency(site_records: List[Dict], site_count: int) -> Lis
 
 
 def _collect_site_records(search_dirs: List[str]) -> List[Dict]:
-    """Read every enabled nginx site config under search_dirs into a record."""
-    site_records: List[Dict] = []
-    for search_dir in search_dirs:
-        if not os.path.isdir(search_dir):
-            continue
-        for conf_file in _iter_nginx_configs(search_dir):
-            try:
-                content = Path(conf_file).read_text(errors='replace')
-            except OSError:
-                continue
-            site_records.append({
-                'file': conf_file,
-                'domains': _extract_domains_from_content(content),
-                'checks': _audit_site_content(content),
-                'includes': _extract_includes(content),
-            })
-    return site_records
+    """One record per enabled nginx site config under search_dirs."""
+    return [
+        {
+            'file': site.path,
+            'domains': list(site.domains),
+            'checks': site.checks,
+            'includes': list(site.includes),
+        }
+        for site in load_index(search_dirs).sites
+    ]
 
 
 def _read_global_directives(main_configs: List[str]) -> Tuple[Optional[str], Dict[str, bool]]:
@@ -931,9 +828,14 @@ class NginxUriAdapter(ResourceAdapter):
         Returns (config_path, content, server_block_content).
         """
         assert self.domain is not None
-        config_path = _find_config_for_domain(self.domain)
-        if not config_path:
+        index = load_index(_NGINX_SEARCH_DIRS)
+        site = index.site_for_domain(self.domain)
+        if site is None:
             return None, None, None
+        config_path = site.path
+        if not any(s.path == site.path for s, _block in index.server_blocks(self.domain)):
+            # server_name found outside any parseable server block
+            return config_path, None, None
 
         try:
             content = Path(config_path).read_text(errors='replace')
@@ -979,25 +881,18 @@ class NginxUriAdapter(ResourceAdapter):
     def _get_overview(self) -> Dict[str, Any]:
         """List all enabled nginx sites."""
         sites = []
+        for site in load_index(_NGINX_SEARCH_DIRS).sites:
+            symlink_info = _resolve_symlink_info(site.path)
+            sites.append({
+                'file': site.path,
+                'domains': list(site.domains),
+                'is_symlink': symlink_info['is_symlink'],
+                'enabled': symlink_info['exists'],
+            })
         artifact_files: List[str] = []
         for search_dir in _NGINX_SEARCH_DIRS:
-            if not os.path.isdir(search_dir):
-                continue
-            for conf_file in _iter_nginx_configs(search_dir):
-                try:
-                    content = Path(conf_file).read_text(errors='replace')
-                except OSError:
-                    continue
-
-                domains = _extract_domains_from_content(content)
-                symlink_info = _resolve_symlink_info(conf_file)
-                sites.append({
-                    'file': conf_file,
-                    'domains': domains,
-                    'is_symlink': symlink_info['is_symlink'],
-                    'enabled': symlink_info['exists'],
-                })
-            artifact_files.extend(_find_artifact_files(search_dir))
+            if os.path.isdir(search_dir):
+                artifact_files.extend(_find_artifact_files(search_dir))
 
         next_steps = [
             "Inspect a specific domain: reveal nginx://<domain>",
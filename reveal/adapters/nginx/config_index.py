@@ -0,0 +1,320 @@
+"""Parse-once nginx configuration model shared by nginx://, letsencrypt:// and cpanel://.
+
+Every per-domain nginx:// lookup used to re-read each enabled site file and
+regex-scan its server_name directives; the fleet audit and overview read them
+all again, and letsencrypt://'s orphan check walked the same directories a
+third time for ssl_certificate lines. On a host with thousands of vhosts that
+makes each query a full read of /etc/nginx.
+
+`load_index(search_dirs)` reads and parses each enabled site file once into a
+`ConfigFile` record (server_name tokens, server blocks, includes,
+ssl_certificate paths, fleet-audit directive flags), follows `include`
+directives into the files they pull in, and derives domain → site and
+domain → server block indexes from the records. The parsed records are
+persisted in the disk cache per set of search dirs together with each file's
+(mtime_ns, size), so the next load re-parses only the files whose stat changed.
+"""
+
+import glob
+import hashlib
+import os
+import re
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+from ...core import disk_cache
+
+# One entry per set of search dirs; each entry holds every parsed file.
+_INDEX_NAMESPACE = "nginx_config_index"
+_INDEX_MAX_ENTRIES = 16
+
+# Nginx includes all files in sites-enabled/, but only *.conf in conf.d/.
+# Skip backup/temp files regardless.
+_BACKUP_SUFFIXES = ('.bak', '.backup', '.old', '.disabled', '.orig', '~')
+
+_SERVER_NAME_RE = re.compile(r'server_name\s+([^;]+);')
+_INCLUDE_RE = re.compile(r'\binclude\s+([^;]+);')
+# Line-anchored so ssl_certificate_key and commented-out directives don't match
+_SSL_CERT_RE = re.compile(r'^\s*ssl_certificate\s+([^;]+);', re.MULTILINE)
+# Server blocks with up to 3 levels of brace nesting (server → location →
+# nested location), same as nginx://'s per-domain block extraction.
+_SERVER_BLOCK_RE = re.compile(
+    r'(server\s*\{(?:[^{}]|\{(?:[^{}]|\{[^{}]*\})*\})*\})',
+    re.MULTILINE | re.DOTALL
+)
+
+# Fleet audit check definitions
+# (id, label, severity, per_site_pattern, consolidation_eligible, deprecated, action_template)
+# consolidation_eligible: True if directive belongs in nginx.conf http{} and can be moved there
+# deprecated: True if having this directive is the problem (inverted check, e.g. X-XSS-Protection)
+_FLEET_CHECK_DEFS = [
+    ('server_tokens', 'server_tokens off',         'MEDIUM',
+     r'\bserver_tokens\s+off\b',     True,  False, 'Move to nginx.conf http{}'),
+    ('hsts',          'Strict-Transport-Security', 'HIGH',
+     r'\badd_header\s+Strict-Transport-Security\b', True, False, 'Move to nginx.conf http{}'),
+    ('xcto',          'X-Content-Type-Options',    'MEDIUM',
+     r'\badd_header\s+X-Content-Type-Options\b',  True,  False, 'Move to nginx.conf http{}'),
+    ('xfo',           'X-Frame-Options',           'MEDIUM',
+     r'\badd_header\s+X-Frame-Options\b',         True,  False, 'Move to nginx.conf http{}'),
+    ('http2',         'http2 on 443 listener',     'LOW',
+     r'\blisten\b[^;]*443\b[^;]*\bhttp2\b',       False, False,
+     'Add per-site (certbot strips http2 on renewal)'),
+    ('limit_req',     'limit_req applied',         'LOW',
+     r'\blimit_req\s',                             False, False,
+     'Add zones to nginx.conf, then limit_req per sensitive location'),
+    ('xss_prot',      'X-XSS-Protection (depr.)', 'LOW',
+     r'\badd_header\s+X-XSS-Protection\b',        False, True,
+     'Remove — deprecated since 2019, ignored by Chrome'),
+]
+
+
+class ServerBlock(NamedTuple):
+    """One `server { ... }` block of a config file."""
+    line: int                    # 1-based line of the `server` keyword
+    names: Tuple[str, ...]       # its server_name tokens
+    cert_paths: Tuple[str, ...]  # its ssl_certificate values
+
+
+class ConfigFile(NamedTuple):
+    """Everything the nginx-aware adapters read from one config file."""
+    path: str
+    stat: Tuple[int, int]             # (mtime_ns, size) when parsed
+    server_names: Tuple[str, ...]     # every server_name token, in file order
+    domains: Tuple[str, ...]          # server_names that look like real domains, deduplicated
+    servers: Tuple[ServerBlock, ...]
+    includes: Tuple[str, ...]         # raw include arguments
+    cert_paths: Tuple[str, ...]       # every ssl_certificate value, quotes stripped
+    checks: Dict[str, bool]           # fleet-audit directive presence
+
+
+class _Snapshot(NamedTuple):
+    """What is persisted: enabled sites in scan order plus every parsed file."""
+    sites: List[str]
+    files: Dict[str, ConfigFile]      # sites and the files their includes reach
+    include_graph: Dict[str, Tuple[str, ...]]
+
+
+def _iter_nginx_configs(search_dir: str):
+    """Yield config file paths from a nginx config directory.
+
+    Mirrors nginx's own include logic:
+    - sites-enabled: all files (no extension filter)
+    - conf.d and others: *.conf only (including one level of subdirectories,
+      e.g. conf.d/users/ on cPanel/WHM servers)
+
+    Skips backup/temp files in both cases.
+    """
+    is_sites_enabled = 'sites-enabled' in search_dir
+    pattern = os.path.join(search_dir, '*')
+    for path in sorted(glob.glob(pattern)):
+        if os.path.isdir(path):
+            # Recurse one level into subdirectories (e.g. conf.d/users/)
+            for subpath in sorted(glob.glob(os.path.join(path, '*.conf'))):
+                if not os.path.isfile(subpath):
+                    continue
+                name = os.path.basename(subpath)
+                if any(name.endswith(s) or ('.backup' in name) for s in _BACKUP_SUFFIXES):
+                    continue
+                yield subpath
+            continue
+        if not os.path.isfile(path):
+            continue
+        name = os.path.basename(path)
+        # Skip backup/temp files
+        if any(name.endswith(s) or ('.backup' in name) for s in _BACKUP_SUFFIXES):
+            continue
+        # conf.d and other dirs: only .conf files
+        if not is_sites_enabled and not name.endswith('.conf'):
+            continue
+        yield path
+
+
+def _extract_domains_from_content(content: str) -> List[str]:
+    """Extract unique domain names from nginx server_name directives in content."""
+    return _filter_domains(
+        name for m in _SERVER_NAME_RE.finditer(content) for name in m.group(1).split()
+    )
+
+
+def _filter_domains(names) -> List[str]:
+    domains: List[str] = []
+    for name in names:
+        if name not in ('_', 'localhost') and '.' in name and name not in domains:
+            domains.append(name)
+    return domains
+
+
+def _extract_includes(content: str) -> List[str]:
+    """Return include directive paths from nginx config content."""
+    return [m.group(1).strip() for m in _INCLUDE_RE.finditer(content)]
+
+
+def _audit_site_content(content: str) -> Dict[str, bool]:
+    """Check which fleet directives are present in a single site config's raw content."""
+    return {
+        check_id: bool(re.search(pattern, content, re.IGNORECASE))
+        for check_id, _label, _sev, pattern, _consol, _depr, _action in _FLEET_CHECK_DEFS
+    }
+
+
+def _cert_paths(text: str) -> Tuple[str, ...]:
+    return tuple(m.group(1).strip().strip('"\'') for m in _SSL_CERT_RE.finditer(text))
+
+
+def parse_config_file(path: str, stat: Tuple[int, int], content: str) -> ConfigFile:
+    """Parse one config file's text into its ConfigFile record."""
+    server_names = tuple(
+        name for m in _SERVER_NAME_RE.finditer(content) for name in m.group(1).split()
+    )
+    servers = []
+    for m in _SERVER_BLOCK_RE.finditer(content):
+        block = m.group(1)
+        sn_match = _SERVER_NAME_RE.search(block)
+        servers.append(ServerBlock(
+            line=content.count('\n', 0, m.start(1)) + 1,
+            names=tuple(sn_match.group(1).split()) if sn_match else (),
+            cert_paths=_cert_paths(block),
+        ))
+    return ConfigFile(
+        path=path,
+        stat=stat,
+        server_names=server_names,
+        domains=tuple(_filter_domains(server_names)),
+        servers=tuple(servers),
+        includes=tuple(_extract_includes(content)),
+        cert_paths=_cert_paths(content),
+        checks=_audit_site_content(content),
+    )
+
+
+def _resolve_include(pattern: str, prefix: str) -> List[str]:
+    """Files an include argument pulls in; relative paths resolve against the
+    nginx prefix, as nginx does. Includes built from variables are skipped."""
+    pattern = pattern.strip().strip('"\'')
+    if not pattern or '$' in pattern:
+        return []
+    if not os.path.isabs(pattern):
+        pattern = os.path.join(prefix, pattern)
+    return sorted(p for p in glob.glob(pattern) if os.path.isfile(p))
+
+
+def _stat_key(path: str) -> Optional[Tuple[int, int]]:
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return (st.st_mtime_ns, st.st_size)
+
+
+def _index_key(search_dirs: List[str]) -> str:
+    joined = '\0'.join(os.path.abspath(d) for d in search_dirs)
+    return hashlib.sha256(joined.encode('utf-8', 'surrogatepass')).hexdigest()
+
+
+class ConfigIndex:
+    """The parsed files of one set of search dirs and the lookups over them."""
+
+    def __init__(self, snapshot: _Snapshot):
+        self._snapshot = snapshot
+        self.sites: List[ConfigFile] = [snapshot.files[p] for p in snapshot.sites]
+        self.include_graph = snapshot.include_graph
+        self.by_domain: Dict[str, ConfigFile] = {}
+        self.blocks_by_domain: Dict[str, List[Tuple[ConfigFile, ServerBlock]]] = {}
+        for site in self.sites:
+            for name in site.server_names:
+                self.by_domain.setdefault(name, site)
+            for block in site.servers:
+                for name in dict.fromkeys(block.names):
+                    self.blocks_by_domain.setdefault(name, []).append((site, block))
+
+    def file(self, path: str) -> Optional[ConfigFile]:
+        return self._snapshot.files.get(path)
+
+    def site_for_domain(self, domain: str) -> Optional[ConfigFile]:
+        """First enabled site, in search order, with *domain* in a server_name."""
+        return self.by_domain.get(domain)
+
+    def server_blocks(self, domain: str) -> List[Tuple[ConfigFile, ServerBlock]]:
+        """Every (site, server block) whose server_name lists *domain*."""
+        return self.blocks_by_domain.get(domain, [])
+
+    def cert_paths(self) -> List[str]:
+        """ssl_certificate values of every enabled site, then of the files
+        their includes reach, each file counted once."""
+        paths: List[str] = []
+        for path in self._snapshot.sites:
+            paths.extend(self._snapshot.files[path].cert_paths)
+        sites = set(self._snapshot.sites)
+        for path, record in self._snapshot.files.items():
+            if path not in sites:
+                paths.extend(record.cert_paths)
+        return paths
+
+
+def _load_file(path: str, saved: Dict[str, ConfigFile]) -> Tuple[Optional[ConfigFile], bool]:
+    """(record, reparsed) for *path*, reusing the saved record if its stat matches."""
+    stat = _stat_key(path)
+    if stat is None:
+        return None, False
+    previous = saved.get(path)
+    if previous is not None and previous.stat == stat:
+        return previous, False
+    try:
+        with open(path, 'r', encoding='utf-8', errors='replace') as fh:
+            content = fh.read()
+    except OSError:
+        return None, False
+    return parse_config_file(path, stat, content), True
+
+
+def load_index(search_dirs: List[str]) -> ConfigIndex:
+    """ConfigIndex of the enabled sites under *search_dirs*.
+
+    Re-parses only the files whose (mtime_ns, size) changed since the saved
+    snapshot; the snapshot is rewritten only when something changed.
+    """
+    key = _index_key(search_dirs)
+    previous = disk_cache.get(_INDEX_NAMESPACE, key)
+    saved = previous.files if isinstance(previous, _Snapshot) else {}
+
+    snapshot = _Snapshot(sites=[], files={}, include_graph={})
+    changed = not isinstance(previous, _Snapshot)
+    pending: List[Tuple[str, str]] = []  # (path, nginx prefix its includes resolve against)
+    for search_dir in search_dirs:
+        if not os.path.isdir(search_dir):
+            continue
+        prefix = os.path.dirname(os.path.abspath(search_dir))
+        for conf_file in _iter_nginx_configs(search_dir):
+            record, reparsed = _load_file(conf_file, saved)
+            if record is None:
+                continue
+            changed = changed or reparsed
+            snapshot.sites.append(conf_file)
+            snapshot.files[conf_file] = record
+            pending.append((conf_file, prefix))
+
+    while pending:
+        path, prefix = pending.pop()
+        targets: List[str] = []
+        for include in snapshot.files[path].includes:
+            for target in _resolve_include(include, prefix):
+                if target in targets:
+                    continue
+                targets.append(target)
+                if target in snapshot.files:
+                    continue
+                record, reparsed = _load_file(target, saved)
+                if record is None:
+                    continue
+                changed = changed or reparsed
+                snapshot.files[target] = record
+                pending.append((target, prefix))
+        if targets:
+            snapshot.include_graph[path] = tuple(targets)
+
+    if not changed and (previous.sites != snapshot.sites
+                        or previous.include_graph != snapshot.include_graph
+                        or set(previous.files) != set(snapshot.files)):
+        changed = True
+    if changed:
+        disk_cache.put(_INDEX_NAMESPACE, key, snapshot, max_entries=_INDEX_MAX_ENTRIES)
+    return ConfigIndex(snapshot)
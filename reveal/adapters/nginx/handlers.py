@@ -390,8 +390,8 @@ def _render_diagnose_table(hits: list, resolved_path: str) -> bool:
     return has_failures
 
 
-def _handle_diagnose(analyzer, log_path: Optional[str] = None) -> None:
-    """Diagnose ACME / SSL failures from the nginx error log."""
+def _handle_diagnose(analyzer, log_path: Optional[str] = None, since: Optional[str] = None) -> None:
+    """Diagnose ACME / SSL failures from the nginx error log (last 5,000 lines, or --since DATE)."""
     if not hasattr(analyzer, 'diagnose_acme_errors'):
         print(f"Error: --diagnose not supported for {type(analyzer).__name__}", file=sys.stderr)
         print("This option is available for nginx config files.", file=sys.stderr)
@@ -405,9 +405,14 @@ def _handle_diagnose(analyzer, log_path: Optional[str] = None) -> None:
         print("   Use --log-path /path/to/error.log to specify the log file.", file=sys.stderr)
         sys.exit(1)
 
-    hits = analyzer.diagnose_acme_errors(resolved_path)
+    try:
+        hits = analyzer.diagnose_acme_errors(resolved_path, since=since)
+    except ValueError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        sys.exit(1)
     if not hits:
-        print(f"✅ No ACME/SSL errors found in {resolved_path} (last 5,000 lines).")
+        window = f"since {since}" if since else "last 5,000 lines"
+        print(f"✅ No ACME/SSL errors found in {resolved_path} ({window}).")
         return
 
     has_failures = _render_diagnose_table(hits, resolved_path)
@@ -11,6 +11,7 @@ from cli/commands/pack.py, so the MCP tool is untouched by this refactor.
 import io
 import subprocess
 import sys
+from array import array
 from pathlib import Path
 from typing import Any, Dict, Generator, List, Optional, Set, Tuple
 
@@ -18,6 +19,7 @@ from reveal.reveal_types import CONTRACT_VERSION
 from reveal.registry import get_code_extensions
 
 from .base import ResourceAdapter, register_adapter, register_renderer
+from ..core import disk_cache
 from ..utils import print_json_result
 from ..utils.path_utils import is_skippable_dir, to_posix
 from ..utils.query import parse_query_params
@@ -128,6 +130,148 @@ def _fetch_fan_in(path: Path) -> Dict[str, int]:
     return {str(f): len(graph.reverse_deps.get(f, set())) for f in all_files}
 
 
+# Disk-cache namespace for the --focus relevance graph (CSR form). Keyed on
+# the same candidate-set fingerprint as imports://'s own graph cache
+# (_ADAPTER_IMPORT_GRAPH_NAMESPACE, BACK-834), so any edit/add/delete under
+# the tree misses both together. Caches only what PageRank needs — sorted
+# file list + undirected adjacency as two flat int arrays — so a warm
+# --focus never unpickles the full ImportGraph or rebuilds Path-keyed sets.
+_PACK_RELEVANCE_GRAPH_NAMESPACE = "pack_relevance_csr_v1"
+
+_PAGERANK_DAMPING = 0.85
+_PAGERANK_MAX_ITER = 30
+# Early stop once no seed column moves by more than this (L1) in one round.
+# Scores are max-normalized afterwards, so this is far below anything that
+# could reorder a ranking.
+_PAGERANK_TOL = 1e-9
+
+
+def _csr_from_import_graph(graph: Any, scanned_files: Set[Path]) -> Tuple[List[str], 'array', 'array']:
+    """Flatten an ImportGraph into ``(files, indptr, indices)`` CSR arrays.
+
+    Undirected: an import edge signals relevance in either direction, not
+    just "depends on" — so every edge is recorded on both endpoints. This
+    makes the matrix symmetric, which is what lets the PageRank step *pull*
+    along a row (row j lists exactly the files that push into j).
+    """
+    all_files = scanned_files | set(graph.files.keys()) | set(graph.reverse_deps.keys())
+    files = sorted(str(f) for f in all_files)
+    index = {f: i for i, f in enumerate(files)}
+    neighbors: List[Set[int]] = [set() for _ in files]
+    for edges in (graph.dependencies, graph.reverse_deps):
+        for src, targets in edges.items():
+            i = index.get(str(src))
+            if i is None:
+                continue
+            for dst in targets:
+                j = index.get(str(dst))
+                if j is not None:
+                    neighbors[i].add(j)
+                    neighbors[j].add(i)
+    indptr = array('q', [0])
+    indices = array('i')
+    for nbrs in neighbors:
+        indices.extend(sorted(nbrs))
+        indptr.append(len(indices))
+    return files, indptr, indices
+
+
+def _load_pack_relevance_graph(path: Path) -> Optional[Tuple[List[str], 'array', 'array']]:
+    """Return the CSR relevance graph for *path*, from disk cache when warm.
+
+    The fingerprint costs one cheap walk + stat per candidate (no parse). On
+    a miss the graph is built through ``_build_pack_import_graph`` — itself
+    disk-cached — then flattened and stored. None on any failure (callers
+    treat a missing graph as "no relevance signal").
+    """
+    fingerprint = None
+    try:
+        from reveal.adapters.imports import ImportsAdapter, _candidate_set_fingerprint  # noqa: I006
+        from reveal.analyzers.imports.base import get_all_extensions  # noqa: I006
+        target = ImportsAdapter(resource=str(path))._target_path
+        candidates, _ = ImportsAdapter._discover_candidate_files(
+            target, frozenset(get_all_extensions()), get_code_extensions())
+        fingerprint = _candidate_set_fingerprint(candidates)
+    except Exception:
+        # Fingerprinting is an optimization only: fall through and build.
+        pass
+    if fingerprint is not None:
+        cached = disk_cache.get(_PACK_RELEVANCE_GRAPH_NAMESPACE, fingerprint)
+        if cached is not None:
+            return cached
+
+    graph, scanned_files = _build_pack_import_graph(path)
+    if graph is None:
+        return None
+    csr = _csr_from_import_graph(graph, scanned_files)
+    if fingerprint is not None:
+        disk_cache.put(_PACK_RELEVANCE_GRAPH_NAMESPACE, fingerprint, csr)
+    return csr
+
+
+def _personalized_pagerank(indptr: 'array', indices: 'array', seeds: List[int]) -> List[float]:
+    """Random-walk-with-restart scores from *seeds* over a CSR graph.
+
+    Each round: ``x' = (1-d)·p + d·A·(x / deg)`` over the symmetric CSR
+    adjacency ``A``, with a file's mass split evenly across its neighbors
+    and an isolated file's mass dropped (same walk the dict version ran).
+    Stops after ``_PAGERANK_MAX_ITER`` rounds or once the scores have
+    converged to ``_PAGERANK_TOL``. Uses NumPy when installed, else a
+    pure-Python loop over the same flat arrays.
+    """
+    try:
+        import numpy as np  # noqa: I006 — optional accelerator, see pyproject [pack] extra
+    except ImportError:
+        return _pagerank_python(indptr, indices, seeds)
+
+    n = len(indptr) - 1
+    ptr = np.asarray(indptr, dtype=np.int64)
+    idx = np.asarray(indices, dtype=np.intp)
+    deg = np.diff(ptr)
+    restart = np.zeros(n)
+    restart[seeds] = 1.0 / len(seeds)
+    spread = np.divide(_PAGERANK_DAMPING, deg, out=np.zeros(n), where=deg > 0)
+    base = (1 - _PAGERANK_DAMPING) * restart
+
+    scores = restart
+    running = np.zeros(len(idx) + 1)
+    for _ in range(_PAGERANK_MAX_ITER):
+        # Row-segment sums of share[idx] via a running total: new[j] is the
+        # sum over j's neighbors i of share[i] (A is symmetric).
+        np.cumsum((scores * spread)[idx], out=running[1:])
+        new_scores = base + running[ptr[1:]] - running[ptr[:-1]]
+        converged = np.abs(new_scores - scores).sum() < _PAGERANK_TOL
+        scores = new_scores
+        if converged:
+            break
+    return scores.tolist()
+
+
+def _pagerank_python(indptr: 'array', indices: 'array', seeds: List[int]) -> List[float]:
+    """Pure-Python fallback for ``_personalized_pagerank``."""
+    n = len(indptr) - 1
+    restart = [0.0] * n
+    for s in seeds:
+        restart[s] = 1.0 / len(seeds)
+    base = [(1 - _PAGERANK_DAMPING) * r for r in restart]
+    spread = [
+        _PAGERANK_DAMPING / (indptr[i + 1] - indptr[i]) if indptr[i + 1] > indptr[i] else 0.0
+        for i in range(n)
+    ]
+    scores = restart
+    for _ in range(_PAGERANK_MAX_ITER):
+        share = [x * w for x, w in zip(scores, spread)]
+        new_scores = [
+            b + sum(share[j] for j in indices[indptr[i]:indptr[i + 1]])
+            for i, b in enumerate(base)
+        ]
+        delta = sum(abs(a - b) for a, b in zip(new_scores, scores))
+        scores = new_scores
+        if delta < _PAGERANK_TOL:
+            break
+    return scores
+
+
 def _compute_graph_relevance(path: Path, focus: Optional[str]) -> Dict[str, float]:
     """Personalized-PageRank relevance score per file, seeded from --focus (BACK-833).
 
@@ -141,52 +285,29 @@ def _compute_graph_relevance(path: Path, focus: Optional[str]) -> Dict[str, floa
     an unrelated file. Closes the gap the plain focus-substring match leaves:
     that match only ever rewards a literal name hit.
 
+    The graph is read as a cached CSR matrix and scored by
+    ``_personalized_pagerank`` (vectorized when NumPy is installed).
+
     Returns {abs_path: score in [0, 1]}; empty on no focus, no matching seed
     files, or any graph-construction failure — callers treat missing entries
     as 0 (pure relevance signal, additive on top of the existing heuristic).
     """
     if not focus:
         return {}
-    graph, scanned_files = _build_pack_import_graph(path)
-    if graph is None:
+    csr = _load_pack_relevance_graph(path)
+    if csr is None:
         return {}
-
-    all_files = scanned_files | set(graph.files.keys()) | set(graph.reverse_deps.keys())
-    if not all_files:
-        return {}
-
+    files, indptr, indices = csr
     focus_lower = focus.lower()
-    seeds = [f for f in all_files if focus_lower in str(f).lower()]
+    seeds = [i for i, f in enumerate(files) if focus_lower in f.lower()]
     if not seeds:
         return {}
 
-    # Undirected adjacency: an import edge signals relevance in either
-    # direction, not just "depends on."
-    adjacency = {
-        f: set(graph.dependencies.get(f, set())) | set(graph.reverse_deps.get(f, set()))
-        for f in all_files
-    }
-
-    seed_weight = 1.0 / len(seeds)
-    personalization = {f: (seed_weight if f in seeds else 0.0) for f in all_files}
-    scores = dict(personalization)
-
-    damping = 0.85
-    for _ in range(30):
-        new_scores = {f: (1 - damping) * personalization[f] for f in all_files}
-        for f in all_files:
-            neighbors = adjacency[f]
-            if not neighbors:
-                continue
-            share = damping * scores[f] / len(neighbors)
-            for nb in neighbors:
-                new_scores[nb] += share
-        scores = new_scores
-
-    max_score = max(scores.values()) if scores else 0.0
+    scores = _personalized_pagerank(indptr, indices, seeds)
+    max_score = max(scores)
     if max_score <= 0:
         return {}
-    return {str(f): v / max_score for f, v in scores.items()}
+    return {f: v / max_score for f, v in zip(files, scores)}
 
 
 def _get_file_raw_content(file_path: str, max_lines: int = 500) -> str:
@@ -2,13 +2,61 @@
 
 import os
 import sqlite3
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, Any, List, Optional
 from ..base import ResourceAdapter, register_adapter, register_renderer
 from ..help_data import load_help_data
+from ...utils.query import parse_query_params
 from ...utils.results import ResultBuilder
 from .renderer import SqliteRenderer
 from reveal.reveal_types import CONTRACT_VERSION
 
+# Row-count strategy for the database overview (?counts=). `SELECT COUNT(*)`
+# is a full table scan in SQLite (no maintained row counter), so on a
+# multi-GB database the overview used to scan every table. `auto` keeps exact
+# counts for ordinary-sized files and switches to estimates (sqlite_stat1, else
+# max(rowid)) above _EXACT_COUNT_MAX_BYTES; `exact`/`approx` force either.
+_COUNT_MODES = ('auto', 'exact', 'approx')
+_EXACT_COUNT_MAX_BYTES = 256 * 1024 * 1024
+
+# Memory-map up to this many bytes of the database file on read-only
+# connections: catalog and index reads then come straight from the page cache
+# instead of through read() syscalls.
+_MMAP_SIZE = 256 * 1024 * 1024
+
+# Upper bound for ?workers= (parallel exact COUNT(*) connections).
+_MAX_COUNT_WORKERS = 16
+
+# One round-trip for every table's column/index/foreign-key counts, via the
+# table-valued pragma functions (SQLite >= 3.16) instead of three queries per
+# table. origin = 'c' keeps only CREATE INDEX indexes — the same set the
+# per-table path selects by excluding sqlite_autoindex_* names.
+_CATALOG_QUERY = """
+    SELECT m.name AS name, m.type AS type,
+           (SELECT COUNT(*) FROM pragma_table_info(m.name)) AS columns,
+           (SELECT COUNT(*) FROM pragma_index_list(m.name) WHERE origin = 'c') AS indexes,
+           (SELECT COUNT(*) FROM pragma_foreign_key_list(m.name)) AS foreign_keys
+    FROM sqlite_master m
+    WHERE m.type IN ('table', 'view')
+    AND m.name NOT LIKE 'sqlite_%'
+    ORDER BY m.type, m.name
+"""
+
+_SCHEMA_QUERY_PARAMS = {
+    'counts': {
+        'type': 'string',
+        'description': (
+            'Row-count mode for the overview: auto (default — exact below 256 MB, '
+            'estimated above), exact (SELECT COUNT(*) per table), or approx '
+            '(sqlite_stat1 / max(rowid) estimates, no table scans)'
+        ),
+    },
+    'workers': {
+        'type': 'integer',
+        'description': 'Parallel read-only connections for exact row counts (default 1, max 16)',
+    },
+}
+
 _SCHEMA_OUTPUT_TYPES = [
     {
         'type': 'sqlite_database',
@@ -96,6 +144,16 @@ _SCHEMA_EXAMPLE_QUERIES = [
         'uri': 'sqlite://./relative/path/data.db',
         'description': 'Relative path to database',
         'output_type': 'sqlite_database'
+    },
+    {
+        'uri': 'sqlite:///path/to/warehouse.db?counts=approx',
+        'description': 'Fast overview of a large database using estimated row counts',
+        'output_type': 'sqlite_database'
+    },
+    {
+        'uri': 'sqlite:///path/to/warehouse.db?counts=exact&workers=8',
+        'description': 'Exact row counts computed over 8 parallel read-only connections',
+        'output_type': 'sqlite_database'
     }
 ]
 
@@ -103,7 +161,8 @@ _SCHEMA_NOTES = [
     'Opens databases in read-only mode for safety',
     'Supports both absolute (///) and relative (//) paths',
     'Health checks include integrity verification',
-    'Built-in SQLite module, no external dependencies'
+    'Built-in SQLite module, no external dependencies',
+    'Databases over 256 MB report estimated row counts by default (rows_estimated: true); use ?counts=exact for exact counts',
 ]
 
 
@@ -133,7 +192,7 @@ class SQLiteAdapter(ResourceAdapter):
             'adapter': 'sqlite',
             'description': 'SQLite database inspection with schema exploration and health checks',
             'uri_syntax': 'sqlite:///path/to/db.db[/table]',
-            'query_params': {},
+            'query_params': _SCHEMA_QUERY_PARAMS,
             'elements': {},
             'cli_flags': ['--check'],
             'cli_only_flags': {
@@ -164,7 +223,9 @@ class SQLiteAdapter(ResourceAdapter):
                 strips it if present, so both direct construction
                 (SQLiteAdapter("sqlite:///x.db")) and router construction
                 (bare "/x.db") work unchanged.
-            query: Unused — sqlite:// supports no query parameters
+            query: Optional query string — ?counts=auto|exact|approx selects
+                the overview's row-count mode, ?workers=N parallelizes exact
+                counts across N read-only connections
 
         Raises:
             ValueError: When no path is given or the format is invalid
@@ -178,11 +239,18 @@ class SQLiteAdapter(ResourceAdapter):
                 "Use SQLiteAdapter('sqlite:///path/to/db.db')"
             )
 
+        # Query string may arrive embedded (direct construction) or separately (router)
+        if '?' in connection_string:
+            connection_string, embedded_query = connection_string.split('?', 1)
+            query = query or embedded_query
+
         self.connection_string = connection_string
         self.db_path: Optional[str] = None
         self.table: Optional[str] = None
         self._connection: Optional[sqlite3.Connection] = None
         self._parse_connection_string(connection_string)
+        self.query_params = parse_query_params(query or '')
+        self._warn_unknown_query_params(self.query_params)
 
     def _parse_connection_string(self, uri: str):
         """Parse sqlite:// URI into components.
@@ -248,11 +316,8 @@ class SQLiteAdapter(ResourceAdapter):
             if not os.access(self.db_path, os.R_OK):
                 raise PermissionError(f"Database file is not readable: {self.db_path}")
 
-            # Open in read-only mode for safety
-            uri = f"file:{self.db_path}?mode=ro"
             try:
-                self._connection = sqlite3.connect(uri, uri=True)
-                self._connection.row_factory = sqlite3.Row
+                self._connection = self._open_readonly()
                 # Verify the file is actually a valid SQLite database
                 self._connection.execute("SELECT sqlite_version()")
             except sqlite3.DatabaseError as e:
@@ -265,6 +330,17 @@ class SQLiteAdapter(ResourceAdapter):
 
         return self._connection
 
+    def _open_readonly(self) -> sqlite3.Connection:
+        """Open a new read-only, memory-mapped connection to ``db_path``."""
+        # Open in read-only mode for safety
+        conn = sqlite3.connect(f"file:{self.db_path}?mode=ro", uri=True, check_same_thread=False)
+        conn.row_factory = sqlite3.Row
+        try:
+            conn.execute(f"PRAGMA mmap_size = {_MMAP_SIZE}")
+        except sqlite3.DatabaseError:
+            pass  # mmap is an optimization only; a build without it still reads fine
+        return conn
+
     def _execute_query(self, query: str, params: tuple = ()) -> List[Dict[str, Any]]:
         """Execute a query and return results as list of dicts.
 
@@ -366,24 +442,21 @@ class SQLiteAdapter(ResourceAdapter):
         }
 
     def _get_table_stats(self, tables: list) -> list:
-        """Get statistics for all tables and views.
+        """Get statistics for all tables and views (per-table queries).
+
+        Fallback for SQLite builds without table-valued pragma functions;
+        ``_get_catalog`` answers the same thing in one query.
 
         Args:
             tables: List of table/view dicts with 'name' and 'type'
 
         Returns:
-            List of table statistics
+            List of table statistics (without row counts — see _row_counts)
         """
         table_stats = []
         for table in tables:
             quoted_name = self._quote_identifier(table['name'])
             if table['type'] == 'table':
-                # Get row count
-                count_result = self._execute_single(
-                    f'SELECT COUNT(*) as count FROM "{quoted_name}"'
-                )
-                row_count = count_result['count'] if count_result else 0
-
                 # Get column count
                 columns = self._execute_query(f'PRAGMA table_info("{quoted_name}")')
                 col_count = len(columns)
@@ -397,12 +470,14 @@ class SQLiteAdapter(ResourceAdapter):
                 )
                 idx_count = indexes[0]['count'] if indexes else 0
 
+                fks = self._execute_query(f'PRAGMA foreign_key_list("{quoted_name}")')
+
                 table_stats.append({
                     'name': table['name'],
                     'type': 'table',
-                    'rows': row_count,
                     'columns': col_count,
-                    'indexes': idx_count
+                    'indexes': idx_count,
+                    'foreign_keys': len(fks),
                 })
             else:  # view
                 columns = self._execute_query(f'PRAGMA table_info("{quoted_name}")')
@@ -413,22 +488,125 @@ class SQLiteAdapter(ResourceAdapter):
                 })
         return table_stats
 
-    def _count_foreign_keys(self, tables: list) -> int:
-        """Count foreign keys across all tables.
+    def _get_catalog(self) -> list:
+        """Column/index/foreign-key counts for every table and view.
 
-        Args:
-            tables: List of table dicts
+        Runs ``_CATALOG_QUERY`` (one statement for the whole schema) and falls
+        back to the per-table ``_get_table_stats`` path when the pragma
+        table-valued functions are unavailable.
 
         Returns:
-            Total count of foreign keys
+            List of table statistics (without row counts — see _row_counts)
         """
-        fk_count = 0
-        for table in tables:
-            if table['type'] == 'table':
-                quoted_name = self._quote_identifier(table['name'])
-                fks = self._execute_query(f'PRAGMA foreign_key_list("{quoted_name}")')
-                fk_count += len(fks)
-        return fk_count
+        try:
+            rows = [dict(r) for r in self._get_connection().execute(_CATALOG_QUERY)]
+        except sqlite3.OperationalError:
+            tables = self._execute_query(
+                "SELECT name, type FROM sqlite_master "
+                "WHERE type IN ('table', 'view') AND name NOT LIKE 'sqlite_%' "
+                "ORDER BY type, name"
+            )
+            return self._get_table_stats(tables)
+        table_stats = []
+        for row in rows:
+            if row['type'] == 'table':
+                table_stats.append({
+                    'name': row['name'],
+                    'type': 'table',
+                    'columns': row['columns'],
+                    'indexes': row['indexes'],
+                    'foreign_keys': row['foreign_keys'],
+                })
+            else:
+                table_stats.append({'name': row['name'], 'type': 'view', 'columns': row['columns']})
+        return table_stats
+
+    def _count_mode(self, db_size: int) -> str:
+        """Resolve ?counts= into 'exact' or 'approx' for a file of ``db_size`` bytes."""
+        mode = str(self.query_params.get('counts', 'auto')).lower()
+        if mode not in _COUNT_MODES:
+            raise ValueError(f"Invalid counts mode: {mode!r} (expected one of: {', '.join(_COUNT_MODES)})")
+        if mode == 'auto':
+            return 'approx' if db_size > _EXACT_COUNT_MAX_BYTES else 'exact'
+        return mode
+
+    def _count_workers(self) -> int:
+        """?workers= clamped to [1, _MAX_COUNT_WORKERS]; 1 on a bad value."""
+        try:
+            workers = int(self.query_params.get('workers', 1))
+        except (TypeError, ValueError):
+            return 1
+        return max(1, min(workers, _MAX_COUNT_WORKERS))
+
+    def _exact_row_count(self, conn: sqlite3.Connection, table_name: str) -> int:
+        """``SELECT COUNT(*)`` for one table on ``conn``."""
+        quoted_name = self._quote_identifier(table_name)
+        try:
+            row = conn.execute(f'SELECT COUNT(*) FROM "{quoted_name}"').fetchone()
+        except sqlite3.DatabaseError as e:
+            raise IOError(f"Database error during query: {e}") from e
+        return row[0] if row else 0
+
+    def _exact_row_counts(self, table_names: List[str], workers: int = 1) -> Dict[str, int]:
+        """Exact row counts, optionally spread across parallel connections.
+
+        SQLite releases the GIL while stepping a statement, so independent
+        read-only connections scanning different tables run concurrently.
+        Each worker thread gets its own connection (connections are never
+        shared across threads).
+        """
+        if workers <= 1 or len(table_names) <= 1:
+            conn = self._get_connection()
+            return {name: self._exact_row_count(conn, name) for name in table_names}
+
+        def _count(name: str) -> int:
+            conn = self._open_readonly()
+            try:
+                return self._exact_row_count(conn, name)
+            finally:
+                conn.close()
+
+        with ThreadPoolExecutor(max_workers=min(workers, len(table_names))) as pool:
+            counts = list(pool.map(_count, table_names))
+        return dict(zip(table_names, counts))
+
+    def _approximate_row_counts(self, table_names: List[str]) -> Dict[str, Optional[int]]:
+        """Estimated row counts without scanning any table.
+
+        Prefers ``sqlite_stat1`` (written by ANALYZE). Its ``idx IS NULL`` row,
+        when present, holds the table's row count; otherwise the largest
+        leading integer among the index rows is used, since a partial index
+        counts only the rows it covers. Tables it
+        doesn't cover fall back to ``max(rowid)`` — a single b-tree descent,
+        exact for append-only rowid tables and an upper bound otherwise.
+        ``WITHOUT ROWID`` tables with no statistics get ``None``.
+        """
+        counts: Dict[str, Optional[int]] = {}
+        has_stat1 = self._execute_query(
+            "SELECT 1 FROM sqlite_master WHERE type='table' AND name='sqlite_stat1'"
+        )
+        if has_stat1:
+            table_rows: Dict[str, int] = {}
+            for row in self._execute_query("SELECT tbl, idx, stat FROM sqlite_stat1"):
+                head = str(row['stat'] or '').split(' ', 1)[0]
+                if not head.isdigit():
+                    continue
+                if row['idx'] is None:
+                    table_rows[row['tbl']] = int(head)
+                else:
+                    counts[row['tbl']] = max(counts.get(row['tbl'], 0), int(head))
+            counts.update(table_rows)
+        for name in table_names:
+            if name in counts:
+                continue
+            quoted_name = self._quote_identifier(name)
+            try:
+                row = self._get_connection().execute(f'SELECT max(rowid) FROM "{quoted_name}"').fetchone()
+            except sqlite3.OperationalError:
+                counts[name] = None  # WITHOUT ROWID table
+                continue
+            counts[name] = (row[0] or 0) if row else 0
+        return {name: counts.get(name) for name in table_names}
 
     def get_structure(self, **kwargs) -> Dict[str, Any]:
         """Get SQLite database overview.
@@ -462,21 +640,24 @@ class SQLiteAdapter(ResourceAdapter):
         # Get PRAGMA information
         pragma_info = self._get_pragma_info()
 
-        # Get all tables
-        tables_query = """
-            SELECT name, type
-            FROM sqlite_master
-            WHERE type IN ('table', 'view')
-            AND name NOT LIKE 'sqlite_%'
-            ORDER BY type, name
-        """
-        tables = self._execute_query(tables_query)
-
-        # Get table statistics
-        table_stats = self._get_table_stats(tables)
+        # Columns/indexes/foreign keys for every table in one catalog query
+        table_stats = self._get_catalog()
+        fk_count = sum(t.pop('foreign_keys', 0) for t in table_stats)
 
-        # Count foreign keys
-        fk_count = self._count_foreign_keys(tables)
+        # Row counts: exact scans, or estimates that never touch table pages
+        count_mode = self._count_mode(db_size)
+        table_names = [t['name'] for t in table_stats if t['type'] == 'table']
+        if count_mode == 'exact':
+            row_counts: Dict[str, Optional[int]] = dict(
+                self._exact_row_counts(table_names, self._count_workers())
+            )
+        else:
+            row_counts = self._approximate_row_counts(table_names)
+        for t in table_stats:
+            if t['type'] == 'table':
+                t['rows'] = row_counts.get(t['name'])
+                if count_mode == 'approx':
+                    t['rows_estimated'] = True
 
         return ResultBuilder.create(
             result_type='sqlite_database',
@@ -498,14 +679,17 @@ class SQLiteAdapter(ResourceAdapter):
                 'statistics': {
                     'tables': sum(1 for t in table_stats if t['type'] == 'table'),
                     'views': sum(1 for t in table_stats if t['type'] == 'view'),
-                    'total_rows': sum(t.get('rows', 0) for t in table_stats),
+                    'total_rows': sum(t.get('rows') or 0 for t in table_stats),
+                    'row_counts': 'estimated' if count_mode == 'approx' else 'exact',
                     'foreign_keys': fk_count
                 },
                 'tables': table_stats,
                 'next_steps': [
                     f"reveal sqlite://{self.db_path}/<table>     # Inspect specific table",
                     f"reveal sqlite://{self.db_path} --check     # Run integrity check",
-                ]
+                ] + ([
+                    f"reveal 'sqlite://{self.db_path}?counts=exact'     # Exact row counts (full scans)",
+                ] if count_mode == 'approx' else [])
             }
         )
 
@@ -579,9 +763,8 @@ class SQLiteAdapter(ResourceAdapter):
                 'on_delete': fk['on_delete']
             })
 
-        # Get row count
-        count_result = self._execute_single(f'SELECT COUNT(*) as count FROM "{quoted_name}"')
-        row_count = count_result['count'] if count_result else 0
+        # Get row count (exact: a single table is the on-demand path)
+        row_count = self._exact_row_count(self._get_connection(), element_name)
 
         # Get CREATE TABLE statement
         create_sql = self._execute_single(
@@ -32,14 +32,21 @@ class SqliteRenderer(TypeDispatchRenderer):
         print("Statistics:")
         print(f"  Tables: {stats['tables']}")
         print(f"  Views: {stats['views']}")
-        print(f"  Total Rows: {stats['total_rows']:,}")
+        estimated = stats.get('row_counts') == 'estimated'
+        print(f"  Total Rows: {'~' if estimated else ''}{stats['total_rows']:,}"
+              f"{' (estimated)' if estimated else ''}")
         print(f"  Foreign Keys: {stats['foreign_keys']}")
         print()
 
         print("Tables:")
         for table in result['tables']:
             if table['type'] == 'table':
-                print(f"  📋 {table['name']} ({table['rows']:,} rows, {table['columns']} columns, {table['indexes']} indexes)")
+                rows = table.get('rows')
+                if rows is None:
+                    rows_text = "? rows"
+                else:
+                    rows_text = f"{'~' if table.get('rows_estimated') else ''}{rows:,} rows"
+                print(f"  📋 {table['name']} ({rows_text}, {table['columns']} columns, {table['indexes']} indexes)")
             else:  # view
                 print(f"  👁️  {table['name']} (view, {table['columns']} columns)")
         print()
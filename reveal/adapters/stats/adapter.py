@@ -2,7 +2,7 @@
 
 import os
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Callable, Dict, Any, Iterator, Optional
 from reveal.reveal_types import CONTRACT_VERSION
 
 from ..base import ResourceAdapter, register_adapter, register_renderer
@@ -13,13 +13,17 @@ from ...utils.query import (
     parse_result_control,
 )
 from ...utils.validation import require_path_exists
+from ...utils.packed import pack_record, PackedRecord
 
 # Import modular functions
 from .renderer import StatsRenderer
 from .analysis import find_analyzable_files, analyze_file, get_file_display_path
 from .metrics import calculate_file_stats
-from .queries import get_quality_config, field_value, compare, matches_filters
-from .aggregation import aggregate_stats, identify_hotspots
+from .queries import (
+    get_quality_config, field_value, compare, compile_query_filters, matches_filters,
+    legacy_scalars, within_legacy_bounds,
+)
+from .aggregation import aggregate_stats, identify_hotspots, StatsTotals
 
 
 def _analyze_file_worker(args: tuple):
@@ -42,6 +46,19 @@ def _analyze_file_worker(args: tuple):
     )
 
 
+def _analyze_file_worker_packed(args: tuple) -> Optional[bytes]:
+    """Pool entry point: `_analyze_file_worker`'s stats as a `pack_record` payload.
+
+    The header carries the three scalars the legacy ?min_/?max_ filters read
+    (lines.total, complexity.average, elements.functions), so the parent can
+    reject a file on those without unpickling its stats dict at all.
+    """
+    stats = _analyze_file_worker(args)
+    if not stats:
+        return None
+    return pack_record(legacy_scalars(stats), (stats,))
+
+
 def _i002_preload(directory: Path, files: Optional[list] = None) -> dict:
     """Build the I002 import graph once in the main process before spawning workers.
 
@@ -263,6 +280,13 @@ class StatsAdapter(ResourceAdapter):
     def _collect_filtered_stats(self, code_only, min_lines, max_lines,
                                 min_complexity, max_complexity, min_functions) -> list:
         """Collect file stats that match the specified filters."""
+        return list(self._iter_filtered_stats(
+            code_only, min_lines, max_lines, min_complexity, max_complexity, min_functions))
+
+    def _iter_filtered_stats(self, code_only, min_lines, max_lines,
+                             min_complexity, max_complexity, min_functions) -> Iterator[Dict[str, Any]]:
+        """Yield file stats that match the specified filters, in walk order,
+        as the worker pool produces them."""
         from concurrent.futures import ProcessPoolExecutor
 
         # BACK-1042: ?exclude=pat1,pat2 / ?respect_gitignore=false, composed
@@ -277,7 +301,7 @@ class StatsAdapter(ResourceAdapter):
             respect_gitignore=respect_gitignore, exclude_patterns=exclude_patterns,
         ))
         if not files:
-            return []
+            return
 
         quality_config = self._quality_config
         base_path_str = str(self.path)
@@ -297,6 +321,15 @@ class StatsAdapter(ResourceAdapter):
                 workers = min(8, max(1, len(files) // 10))
         else:
             workers = min(8, max(1, len(files) // 10))
+
+        query_matches = compile_query_filters(self.query_filters)
+
+        def passes(s) -> bool:
+            return bool(s) and matches_filters(
+                s, min_lines, max_lines, min_complexity, max_complexity, min_functions,
+                [], field_value, compare
+            ) and query_matches(s)
+
         if workers > 1:
             graph_cache = _i002_preload(self.path, files)
             with ProcessPoolExecutor(
@@ -304,17 +337,22 @@ class StatsAdapter(ResourceAdapter):
                 initializer=_i002_init_worker,
                 initargs=(graph_cache,),
             ) as executor:
-                all_stats = list(executor.map(_analyze_file_worker, args))
+                # Records are decoded lazily: a file the legacy bounds reject
+                # never has its stats dict unpickled in this process.
+                bounds = (min_lines, max_lines, min_complexity, max_complexity, min_functions)
+                for payload in executor.map(_analyze_file_worker_packed, args):
+                    if payload is None:
+                        continue
+                    record = PackedRecord(payload)
+                    if within_legacy_bounds(record.scalars, *bounds):
+                        s = record.segment(0)
+                        if passes(s):
+                            yield s
         else:
-            all_stats = [_analyze_file_worker(a) for a in args]
-
-        return [
-            s for s in all_stats
-            if s and matches_filters(
-                s, min_lines, max_lines, min_complexity, max_complexity, min_functions,
-                self.query_filters, field_value, compare
-            )
-        ]
+            for a in args:
+                s = _analyze_file_worker(a)
+                if passes(s):
+                    yield s
 
     def _apply_sorting(self, file_stats: list) -> list:
         """Apply sorting to file stats if sort field is specified."""
@@ -421,6 +459,7 @@ class StatsAdapter(ResourceAdapter):
                      max_complexity: Optional[float] = None,
                      min_functions: Optional[int] = None,
                      summary_only: bool = False,
+                     on_record: Optional[Callable[[Dict[str, Any]], None]] = None,
                      **kwargs) -> Dict[str, Any]:
         """Get statistics for file or directory.
 
@@ -440,6 +479,11 @@ class StatsAdapter(ResourceAdapter):
                 an 18K-file repo) and is impractical to consume directly in
                 an LLM context. The full per-file walk still runs (needed for
                 the aggregate and for hotspots) — this only trims the output.
+            on_record: --format ndjson streaming callback (see routing/uri.py's
+                _ndjson_stream). For a directory without sort, limit/offset,
+                hotspots or summary_only, each file's stats are passed to it
+                as they are computed and only running totals are kept; the
+                returned result then has an empty 'files' list.
 
         Returns:
             Dict containing statistics and optionally hotspots
@@ -469,6 +513,24 @@ class StatsAdapter(ResourceAdapter):
                 result.pop('files', None)
             return result
 
+        if on_record is not None and not (
+            hotspots or summary_only or self.result_control.sort_field
+            or self.result_control.offset or self.result_control.limit
+        ):
+            totals = StatsTotals()
+            for file_stats in self._iter_filtered_stats(
+                code_only, min_lines, max_lines, min_complexity, max_complexity, min_functions
+            ):
+                totals.add(file_stats)
+                on_record(file_stats)
+            result = totals.result(self.path, [])
+            result.update(
+                contract_version=CONTRACT_VERSION,
+                source=str(self.path),
+                source_type='directory',
+            )
+            return result
+
         # Collect filtered directory statistics
         dir_file_stats = self._collect_filtered_stats(
             code_only, min_lines, max_lines, min_complexity, max_complexity, min_functions
@@ -25,54 +25,71 @@ def aggregate_stats(file_stats: List[Dict[str, Any]], source_path: Path) -> Dict
     Returns:
         Dict with aggregated statistics
     """
-    if not file_stats:
+    totals = StatsTotals()
+    for s in file_stats:
+        totals.add(s)
+    return totals.result(source_path, file_stats)
+
+
+class StatsTotals:
+    """aggregate_stats' running sums, fed one file at a time.
+
+    Lets a streaming caller (stats:// under --format ndjson) emit each file's
+    stats and drop it, keeping only these counters for the summary.
+    """
+
+    def __init__(self) -> None:
+        self.files = 0
+        self.lines = 0
+        self.code_lines = 0
+        self.functions = 0
+        self.classes = 0
+        self.complexity_sum = 0.0
+        self.quality_sum = 0.0
+
+    def add(self, s: Dict[str, Any]) -> None:
+        self.files += 1
+        self.lines += s['lines']['total']
+        self.code_lines += s['lines']['code']
+        self.functions += s['elements']['functions']
+        self.classes += s['elements']['classes']
+        # Weighted average complexity (by number of functions)
+        self.complexity_sum += s['complexity']['average'] * s['elements']['functions']
+        self.quality_sum += s['quality']['score']
+
+    def result(self, source_path: Path, files: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """The stats_summary result, with *files* as its per-file list."""
+        if not self.files:
+            summary: Dict[str, Any] = {
+                'total_files': 0,
+                'total_lines': 0,
+                'total_code_lines': 0,
+                'total_functions': 0,
+                'total_classes': 0,
+                'avg_complexity': 0,
+                'avg_quality_score': 0,
+            }
+        else:
+            avg_complexity = self.complexity_sum / self.functions if self.functions > 0 else 0
+            summary = {
+                'total_files': self.files,
+                'total_lines': self.lines,
+                'total_code_lines': self.code_lines,
+                'total_functions': self.functions,
+                'total_classes': self.classes,
+                'avg_complexity': round(avg_complexity, 2),
+                'avg_quality_score': round(self.quality_sum / self.files, 1),
+            }
         return ResultBuilder.create(
             result_type='stats_summary',
             source=source_path,
             contract_version=CONTRACT_VERSION,
             data={
-                'summary': {
-                    'total_files': 0,
-                    'total_lines': 0,
-                    'total_code_lines': 0,
-                    'total_functions': 0,
-                    'total_classes': 0,
-                    'avg_complexity': 0,
-                    'avg_quality_score': 0,
-                },
-                'files': []
+                'summary': summary,
+                'files': files
             }
         )
 
-    total_lines = sum(s['lines']['total'] for s in file_stats)
-    total_code = sum(s['lines']['code'] for s in file_stats)
-    total_functions = sum(s['elements']['functions'] for s in file_stats)
-    total_classes = sum(s['elements']['classes'] for s in file_stats)
-
-    # Weighted average complexity (by number of functions)
-    complexity_sum = sum(s['complexity']['average'] * s['elements']['functions'] for s in file_stats)
-    avg_complexity = complexity_sum / total_functions if total_functions > 0 else 0
-
-    avg_quality = sum(s['quality']['score'] for s in file_stats) / len(file_stats)
-
-    return ResultBuilder.create(
-        result_type='stats_summary',
-        source=source_path,
-        contract_version=CONTRACT_VERSION,
-        data={
-            'summary': {
-                'total_files': len(file_stats),
-                'total_lines': total_lines,
-                'total_code_lines': total_code,
-                'total_functions': total_functions,
-                'total_classes': total_classes,
-                'avg_complexity': round(avg_complexity, 2),
-                'avg_quality_score': round(avg_quality, 1),
-            },
-            'files': file_stats
-        }
-    )
-
 
 def identify_hotspots(
     file_stats: List[Dict[str, Any]],
@@ -2,9 +2,17 @@
 
 import copy
 from pathlib import Path
-from typing import Dict, Any, Optional, cast
+from typing import Any, Callable, Dict, Optional, Tuple, cast
 
-from ...utils.query import compare_values
+from ...utils.query import compare_values, compile_filters
+
+# compare_values() options for stats:// filters.
+COMPARE_OPTIONS = {
+    'allow_list_any': False,  # Stats doesn't have list fields
+    'case_sensitive': False,
+    'coerce_numeric': True,
+    'none_matches_not_equal': False  # Stats: None doesn't match anything
+}
 
 
 # Quality scoring defaults - configurable via .reveal/stats-quality.yaml
@@ -151,17 +159,48 @@ def compare(value: Any, op: str, target: Any) -> bool:
     Returns:
         True if comparison passes
     """
-    return compare_values(
-        value,
-        op,
-        target,
-        options={
-            'allow_list_any': False,  # Stats doesn't have list fields
-            'case_sensitive': False,
-            'coerce_numeric': True,
-            'none_matches_not_equal': False  # Stats: None doesn't match anything
-        }
-    )
+    return compare_values(value, op, target, options=COMPARE_OPTIONS)
+
+
+def compile_query_filters(query_filters: list) -> Callable[[Dict[str, Any]], bool]:
+    """The query-filter half of matches_filters() compiled once, for scans
+    that test the same filters against every file's stats."""
+    return compile_filters(query_filters, COMPARE_OPTIONS, get_value=field_value,
+                           existence_ops=False)
+
+
+def legacy_scalars(stats: Dict[str, Any]) -> Tuple[int, float, int]:
+    """The (lines.total, complexity.average, elements.functions) the legacy
+    ?min_/?max_ parameters test."""
+    return (stats['lines']['total'], stats['complexity']['average'],
+            stats['elements']['functions'])
+
+
+def within_legacy_bounds(
+    scalars: Tuple[int, float, int],
+    min_lines: Optional[int],
+    max_lines: Optional[int],
+    min_complexity: Optional[float],
+    max_complexity: Optional[float],
+    min_functions: Optional[int],
+) -> bool:
+    """Check ``legacy_scalars`` against the legacy filter parameters.
+
+    Takes the scalars rather than the stats dict so a directory scan can
+    reject a file from its packed record header alone.
+    """
+    lines, complexity, functions = scalars
+    if min_lines is not None and lines < min_lines:
+        return False
+    if max_lines is not None and lines > max_lines:
+        return False
+    if min_complexity is not None and complexity < min_complexity:
+        return False
+    if max_complexity is not None and complexity > max_complexity:
+        return False
+    if min_functions is not None and functions < min_functions:
+        return False
+    return True
 
 
 def matches_filters(
@@ -195,15 +234,8 @@ def matches_filters(
         True if matches all filters
     """
     # Check legacy parameters (backward compatibility)
-    if min_lines is not None and stats['lines']['total'] < min_lines:
-        return False
-    if max_lines is not None and stats['lines']['total'] > max_lines:
-        return False
-    if min_complexity is not None and stats['complexity']['average'] < min_complexity:
-        return False
-    if max_complexity is not None and stats['complexity']['average'] > max_complexity:
-        return False
-    if min_functions is not None and stats['elements']['functions'] < min_functions:
+    if not within_legacy_bounds(legacy_scalars(stats), min_lines, max_lines,
+                                min_complexity, max_complexity, min_functions):
         return False
 
     # Check new query filters (unified syntax)
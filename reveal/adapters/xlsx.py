@@ -445,6 +445,9 @@ _SCHEMA_QUERY_PARAMS = {
     'connections': {'type': 'string', 'description': 'List external data connections (list or omit value)', 'examples': ['connections=list', 'connections']},
 }
 
+# Rows returned for ?sheet= when neither ?range= nor ?limit= is given (text/json).
+_DEFAULT_SHEET_ROWS = 20
+
 _SCHEMA_OUTPUT_TYPES = [
     {
         'type': 'xlsx_workbook',
@@ -495,8 +498,9 @@ _SCHEMA_OUTPUT_TYPES = [
 _SCHEMA_NOTES = [
     'Pure stdlib implementation — no extra dependencies required',
     'Sheet can be specified by name or 0-based integer index (sheet=0 for first sheet)',
-    '?range=A1:C10 uses standard A1 notation; omit to get the entire sheet',
-    '?search=term is case-insensitive and searches all sheets simultaneously',
+    '?range=A1:C10 uses standard A1 notation; without ?range or ?limit the first 20 rows are shown (?format=csv exports the whole sheet)',
+    'Worksheets are streamed: ?range/?limit stop parsing early, so very large sheets (hundreds of MB) stay queryable',
+    '?search=term is case-insensitive and searches all sheets simultaneously; large workbooks search sheets in parallel worker processes, and ?limit=N stops the search once N rows match',
     '?formulas=true shows raw formulas instead of computed cell values',
     '?format=csv exports the sheet as CSV — pipe to other tools or save to file',
     '?powerpivot=schema shows Power Pivot tables and columns (Excel 2010/2013 XMLA format)',
@@ -824,6 +828,9 @@ class XlsxAdapter(ResourceAdapter):
     def _get_sheet_data(self, sheet_identifier: str) -> Dict[str, Any]:
         """Extract data from specific sheet.
 
+        ?range= and ?limit= are pushed down into the analyzer's streaming
+        reader, which stops parsing the worksheet once they are satisfied.
+
         Args:
             sheet_identifier: Sheet name or index (0-based)
 
@@ -835,46 +842,47 @@ class XlsxAdapter(ResourceAdapter):
         if not sheet_name:
             raise ValueError(f"Sheet not found: {sheet_identifier}")
 
-        # Extract sheet using analyzer
         if self.analyzer is None:
             raise ValueError("Analyzer not initialized")
-        sheet_result = self.analyzer.extract_element('sheet', sheet_name)
-        if not sheet_result:
-            raise ValueError(f"Failed to extract sheet: {sheet_name}")
-
-        # Parse the sheet data
-        source_text = sheet_result.get('source', '')
-        lines = source_text.split('\n') if source_text else []
-        rows_data = self._parse_sheet_lines(lines)
-
-        # Apply cell range if specified
-        range_param = self.query_params.get('range')
-        if range_param:
-            rows_data = self._apply_cell_range(rows_data, range_param)
+        sheet_path = dict(self.analyzer.sheet_entries())[sheet_name]
 
-        # Apply row limit if specified
+        range_param = self.query_params.get('range') or None
+        limit: Optional[int] = None
         limit_param = self.query_params.get('limit')
         if limit_param:
             try:
                 limit = int(limit_param)
-                rows_data = rows_data[:limit]
             except ValueError:
                 pass  # Ignore invalid limit
+        format_param = self.query_params.get('format')
+        if limit is None and not range_param and format_param != 'csv':
+            limit = _DEFAULT_SHEET_ROWS  # preview; ?format=csv exports the whole sheet
 
-        # Get sheet metadata
-        sheet_info = self._get_sheet_info(sheet_name)
+        try:
+            sheet = self.analyzer.read_sheet_rows(sheet_path, cell_range=range_param, limit=limit)
+        except Exception as e:
+            raise ValueError(f"Failed to extract sheet: {sheet_name} ({e})") from e
+        rows_data = sheet['rows']
+        dimension = sheet['dimension']
+
+        # Exact row count when the reader saw the whole sheet; otherwise the
+        # <dimension> span, so pushdown never forces a full scan for metadata.
+        if sheet['exhausted']:
+            rows_count = sheet['rows_scanned']
+        else:
+            rows_count = XlsxAnalyzer._rows_from_dim_ref(dimension) or sheet['rows_scanned']
+        cols_count = XlsxAnalyzer._cols_from_dim_ref(dimension) or max((len(r) for r in rows_data), default=0)
 
         # Build result data
         result_data = {
             'sheet_name': sheet_name,
             'rows': rows_data,
-            'dimension': sheet_info.get('dimension', ''),
-            'rows_count': sheet_info.get('rows', len(rows_data)),
-            'cols_count': sheet_info.get('cols', len(rows_data[0]) if rows_data else 0)
+            'dimension': dimension,
+            'rows_count': rows_count,
+            'cols_count': cols_count,
         }
 
         # Add preferred format if specified in query params
-        format_param = self.query_params.get('format')
         if format_param:
             result_data['preferred_format'] = format_param
 
@@ -888,6 +896,8 @@ class XlsxAdapter(ResourceAdapter):
     def _resolve_sheet_name(self, identifier: str) -> Optional[str]:
         """Resolve sheet identifier to sheet name.
 
+        Reads sheet names from workbook.xml only — no worksheet is parsed.
+
         Args:
             identifier: Sheet name or index (e.g., "Sales" or "0")
 
@@ -896,132 +906,24 @@ class XlsxAdapter(ResourceAdapter):
         """
         if self.analyzer is None:
             return None
-        structure = self.analyzer.get_structure()
-        sheets = structure.get('sheets', [])
+        names = [name for name, _ in self.analyzer.sheet_entries()]
 
         # Try as index first
         try:
             index = int(identifier)
-            if 0 <= index < len(sheets):
-                name = sheets[index].get('name', '')
-                # Extract just the sheet name (before dimension)
-                match = re.match(r'([^(]+)', name)
-                return match.group(1).strip() if match else name
+            if 0 <= index < len(names):
+                return names[index]
         except ValueError:
             pass
 
         # Try as name - case insensitive search
         identifier_lower = identifier.lower()
-        for sheet in sheets:
-            name = sheet.get('name', '')
-            match = re.match(r'([^(]+)', name)
-            if match:
-                sheet_name = match.group(1).strip()
-                if sheet_name.lower() == identifier_lower or identifier_lower in sheet_name.lower():
-                    return sheet_name
+        for sheet_name in names:
+            if sheet_name.lower() == identifier_lower or identifier_lower in sheet_name.lower():
+                return sheet_name
 
         return None
 
-    def _get_sheet_info(self, sheet_name: str) -> Dict[str, Any]:
-        """Get metadata for a specific sheet.
-
-        Args:
-            sheet_name: Sheet name
-
-        Returns:
-            Dict with sheet metadata
-        """
-        if self.analyzer is None:
-            return {'name': sheet_name}
-        structure = self.analyzer.get_structure()
-        sheets = structure.get('sheets', [])
-
-        for sheet in sheets:
-            name = sheet.get('name', '')
-            if sheet_name in name:
-                match = re.match(r'([^(]+?)(?:\s*\(([^)]+)\))?\s*-\s*(\d+)\s*rows,\s*(\d+)\s*cols', name)
-                if match:
-                    return {
-                        'name': match.group(1).strip(),
-                        'dimension': match.group(2) or '',
-                        'rows': int(match.group(3)),
-                        'cols': int(match.group(4))
-                    }
-
-        return {'name': sheet_name}
-
-    def _parse_sheet_lines(self, lines: List[str]) -> List[List[Any]]:
-        """Parse sheet lines into row data.
-
-        Args:
-            lines: List of text lines from sheet extraction
-
-        Returns:
-            List of rows (each row is a list of cell values)
-        """
-        rows = []
-        for line in lines:
-            # Skip header lines and empty lines
-            line = line.strip()
-            if not line or line.startswith('Sheet:') or line.startswith('Rows:'):
-                continue
-
-            # Remove line number prefix if present (e.g., "  1  data|data|data")
-            line = re.sub(r'^\s*\d+\s+', '', line)
-
-            # Split by pipe delimiter
-            cells = [cell.strip() for cell in line.split('|')]
-            rows.append(cells)
-
-        return rows
-
-    def _apply_cell_range(self, rows: List[List[Any]], cell_range: str) -> List[List[Any]]:
-        """Apply cell range filter to rows.
-
-        Args:
-            rows: Full sheet data
-            cell_range: A1 notation range (e.g., "A1:C10", "B5:D20")
-
-        Returns:
-            Filtered rows
-        """
-        # Parse A1 notation
-        match = re.match(r'([A-Z]+)(\d+):([A-Z]+)(\d+)', cell_range, re.IGNORECASE)
-        if not match:
-            return rows  # Invalid range, return all rows
-
-        start_col, start_row, end_col, end_row = match.groups()
-
-        # Convert column letters to indices (A=0, B=1, etc.)
-        start_col_idx = self._col_letter_to_index(start_col)
-        end_col_idx = self._col_letter_to_index(end_col)
-        start_row_idx = int(start_row) - 1  # 1-based to 0-based
-        end_row_idx = int(end_row) - 1
-
-        # Filter rows and columns
-        filtered = []
-        for i in range(start_row_idx, min(end_row_idx + 1, len(rows))):
-            if i < len(rows):
-                row = rows[i]
-                filtered_row = row[start_col_idx:end_col_idx + 1]
-                filtered.append(filtered_row)
-
-        return filtered
-
-    def _col_letter_to_index(self, col: str) -> int:
-        """Convert column letter to 0-based index.
-
-        Args:
-            col: Column letter (e.g., "A", "B", "AA")
-
-        Returns:
-            0-based column index
-        """
-        index = 0
-        for char in col.upper():
-            index = index * 26 + (ord(char) - ord('A') + 1)
-        return index - 1
-
     def _search_sheets(self, pattern: str) -> Dict[str, Any]:
         """Search for pattern across all sheets (case-insensitive).
 
@@ -1034,16 +936,17 @@ class XlsxAdapter(ResourceAdapter):
         if self.analyzer is None:
             raise ValueError("Analyzer not initialized")
 
-        matches = self.analyzer.search_all_sheets(pattern)
-
-        # Apply limit if specified
+        # ?limit= is pushed into the search so it stops once satisfied
+        limit: Optional[int] = None
         limit_param = self.query_params.get('limit')
         if limit_param:
             try:
-                matches = matches[:int(limit_param)]
+                limit = int(limit_param)
             except ValueError:
                 pass
 
+        matches = self.analyzer.search_all_sheets(pattern, limit=limit)
+
         # Group by sheet
         sheets_seen: Dict[str, List[Dict[str, Any]]] = {}
         for m in matches:
@@ -18,7 +18,7 @@ from pathlib import Path
 from typing import Callable, List, Set, ClassVar, Optional, Tuple, Type, Dict
 
 from .types import ImportStatement, restamp_file_path
-from ...core import disk_cache
+from ...core import content_keys, disk_cache
 from ...registry import get_analyzer
 
 logger = logging.getLogger(__name__)
@@ -70,6 +70,16 @@ class ImportsDiskCache:
         except OSError:
             return None
         hasher = hashlib.sha256()
+        # A materialized git blob is keyed on (OID, extension) (see
+        # core.content_keys): one namespace can serve several extractors, and
+        # the extension is what picks the grammar the blob is parsed with.
+        content_key = content_keys.lookup(path_str)
+        if content_key is not None:
+            hasher.update(b"blob\x00")
+            hasher.update(content_key.encode("utf-8", "replace"))
+            hasher.update(b"\x00")
+            hasher.update(os.path.splitext(path_str)[1].lower().encode("utf-8", "replace"))
+            return hasher.hexdigest()
         hasher.update(path_str.encode("utf-8", "replace"))
         hasher.update(b"\x00")
         hasher.update(str(mtime_ns).encode("ascii"))
@@ -17,7 +17,7 @@ import logging
 import os
 from pathlib import Path
 from typing import List, Set, Optional, Dict, Tuple
-from ...core import disk_cache, node_children as _children, node_prev_sibling as _prev_sibling
+from ...core import content_keys, disk_cache, node_children as _children, node_prev_sibling as _prev_sibling
 from ...core.treesitter_compat import _zero_arg
 
 logger = logging.getLogger(__name__)
@@ -65,6 +65,15 @@ def _imports_fingerprint(path_str: str, mtime_ns: int) -> Optional[str]:
     except OSError:
         return None
     hasher = hashlib.sha256()
+    # A materialized git blob is keyed on (OID, extension), as in
+    # ImportsDiskCache.fingerprint (see core.content_keys).
+    content_key = content_keys.lookup(path_str)
+    if content_key is not None:
+        hasher.update(b"blob\x00")
+        hasher.update(content_key.encode("utf-8", "replace"))
+        hasher.update(b"\x00")
+        hasher.update(os.path.splitext(path_str)[1].lower().encode("utf-8", "replace"))
+        return hasher.hexdigest()
     hasher.update(path_str.encode("utf-8", "replace"))
     hasher.update(b"\x00")
     hasher.update(str(mtime_ns).encode("ascii"))
@@ -1,13 +1,17 @@
 """Nginx configuration file analyzer."""
 
+import bisect
+import hashlib
 import os
 import re
 import shutil
 import subprocess
 from pathlib import Path
-from typing import Dict, List, Any, Optional, Tuple
+from typing import Dict, List, Any, NamedTuple, Optional, Tuple
 from ..base import FileAnalyzer
+from ..core import disk_cache
 from ..registry import register
+from ..utils.log_tail import read_tail
 from ..utils.results import ResultBuilder
 from reveal.reveal_types import CONTRACT_VERSION
 
@@ -15,6 +19,70 @@ from reveal.reveal_types import CONTRACT_VERSION
 # Pattern matching ACME challenge location paths
 _ACME_PATH_RE = re.compile(r'^\.well-known[/\\]acme-challenge/?$')
 
+# --diagnose error-log patterns: (pattern_key, compiled_regex)
+_ACME_LOG_PATTERNS = [
+    ('permission_denied', re.compile(
+        r'open\(\)\s+"[^"]*\.well-known[^"]*"\s+failed.*Permission denied',
+        re.IGNORECASE,
+    )),
+    ('not_found', re.compile(
+        r'open\(\)\s+"[^"]*\.well-known[^"]*"\s+failed.*No such file',
+        re.IGNORECASE,
+    )),
+    ('ssl_error', re.compile(
+        r'(SSL_CTX_use_certificate|SSL handshake|ssl_handshake|'
+        r'no "ssl_certificate"|cannot load certificate)',
+        re.IGNORECASE,
+    )),
+]
+# Nearly every error-log line matches none of the patterns. Every pattern
+# needs one of these literals (lowercased), so a substring test rejects most
+# lines before any regex runs, and one alternation of all the patterns
+# rejects most of the rest; only lines it matches try each pattern, since
+# one line can count under several.
+_ACME_LOG_LITERALS = ('well-known', 'ssl', 'certificate')
+_ACME_LOG_ANY_RE = re.compile(
+    '|'.join(f'(?:{regex.pattern})' for _, regex in _ACME_LOG_PATTERNS), re.IGNORECASE)
+_LOG_SERVER_RE = re.compile(r'server:\s+([^\s,]+)')
+_LOG_TIMESTAMP_RE = re.compile(r'^(\d{4}/\d{2}/\d{2}\s+\d{2}:\d{2}:\d{2})')
+_SINCE_RE = re.compile(r'^(\d{4})-(\d{2})-(\d{2})(?:[ T](\d{2}:\d{2}(?::\d{2})?))?$')
+
+# --diagnose checkpoints: how far into the log the last run scanned, and the
+# hits in its window, so a repeat run reads only what nginx appended since.
+_ACME_LOG_NAMESPACE = "nginx_acme_log"
+_ACME_LOG_MAX_ENTRIES = 32
+# Bytes just before the checkpoint offset, compared on reuse: a log that was
+# truncated in place and regrew past the offset keeps its inode and size
+# ordering, but not these bytes.
+_ANCHOR_BYTES = 64
+
+# (line index in window, domain, pattern_key, timestamp, sample)
+_LogMatch = Tuple[int, str, str, str, str]
+
+
+class _LogCheckpoint(NamedTuple):
+    """State of the last --diagnose scan of one log (for one config and window)."""
+    inode: int
+    offset: int                # scanned up to here (end of the last complete line)
+    anchor: bytes              # the _ANCHOR_BYTES bytes before offset
+    line_count: int            # lines in the window ending at offset (<= tail_lines)
+    matches: List[_LogMatch]
+
+
+def _read_anchor(log_path: str, offset: int) -> bytes:
+    with open(log_path, 'rb') as fh:
+        fh.seek(max(0, offset - _ANCHOR_BYTES))
+        return fh.read(min(offset, _ANCHOR_BYTES))
+
+
+def _since_cutoff(since: str) -> str:
+    """--since value as an nginx error-log timestamp prefix (YYYY/MM/DD[ HH:MM[:SS]])."""
+    m = _SINCE_RE.match(since.strip())
+    if not m:
+        raise ValueError(f"Invalid --since value {since!r}: expected YYYY-MM-DD or 'YYYY-MM-DD HH:MM'")
+    year, month, day, clock = m.groups()
+    return f"{year}/{month}/{day}" + (f" {clock}" if clock else '')
+
 
 def _check_nobody_access(path: str) -> Dict[str, Any]:
     """Check if the nobody user can read files at path.
@@ -650,28 +718,30 @@ class NginxAnalyzer(FileAnalyzer):
                 break
         return None
 
+    def _server_starts(self) -> Tuple[List[int], List[Dict]]:
+        """Start lines of every server block, in file order, with their parsed
+        info. Built once per analyzer; location lookups bisect into it."""
+        cached = getattr(self, '_server_start_index', None)
+        if cached is None:
+            starts: List[int] = []
+            infos: List[Dict] = []
+            for i, line in enumerate(self.lines, 1):
+                if self._is_server_block_start(line.strip()):
+                    starts.append(i)
+                    infos.append(self._process_server_block([], i)[0])
+            cached = self._server_start_index = (starts, infos)
+        return cached
+
     def _find_server_start_for_location(self, location_line: int) -> Tuple[int, Dict]:
-        """Find the server block that contains the given location line number."""
-        best_start = 0
-        best_info: Dict = {}
-        depth = 0
-        in_server = False
-        current_start = 0
-        current_info: Dict = {}
+        """Find the server block that contains the given location line number.
 
-        for i, line in enumerate(self.lines, 1):
-            stripped = line.strip()
-            depth += stripped.count('{') - stripped.count('}')
-            if self._is_server_block_start(stripped):
-                current_start = i
-                current_info, _ = self._process_server_block([], i)
-                in_server = True
-            if in_server and i <= location_line:
-                best_start = current_start
-                best_info = current_info
-            if in_server and depth == 0:
-                in_server = False
-        return best_start, best_info
+        That is the last server block starting at or before the location's line.
+        """
+        starts, infos = self._server_starts()
+        pos = bisect.bisect_right(starts, location_line)
+        if not pos:
+            return 0, {}
+        return starts[pos - 1], infos[pos - 1]
 
     def extract_acme_roots(self) -> List[Dict[str, Any]]:
         """Find ACME challenge location blocks and check nobody ACL on each root.
@@ -987,36 +1057,89 @@ class NginxAnalyzer(FileAnalyzer):
             hits[key]['last_seen'] = timestamp
 
     @staticmethod
-    def _scan_log_for_patterns(
-        recent_lines: list, domains: set, patterns: list
-    ) -> Dict[tuple, Dict]:
-        """Scan log lines for ACME/SSL error patterns, grouped by (domain, pattern)."""
-        hits: Dict[tuple, Dict] = {}
-        for raw_line in recent_lines:
+    def _scan_log_for_patterns(recent_lines: List[str], domains: set) -> List[_LogMatch]:
+        """Find ACME/SSL error patterns in log lines, one match per (line, domain, pattern)."""
+        matches: List[_LogMatch] = []
+        for i, raw_line in enumerate(recent_lines):
+            lowered = raw_line.lower()
+            if not any(literal in lowered for literal in _ACME_LOG_LITERALS):
+                continue
             line = raw_line.rstrip()
-            server_match = re.search(r'server:\s+([^\s,]+)', line)
+            if not _ACME_LOG_ANY_RE.search(line):
+                continue
+            server_match = _LOG_SERVER_RE.search(line)
             line_domain = server_match.group(1).lower() if server_match else None
 
-            for pattern_key, regex in patterns:
+            for pattern_key, regex in _ACME_LOG_PATTERNS:
                 if not regex.search(line):
                     continue
                 matched_domains = NginxAnalyzer._find_matched_domains(line_domain, domains, line)
                 if not matched_domains:
                     continue
-                ts_match = re.match(r'^(\d{4}/\d{2}/\d{2}\s+\d{2}:\d{2}:\d{2})', line)
+                ts_match = _LOG_TIMESTAMP_RE.match(line)
                 timestamp = ts_match.group(1) if ts_match else ''
                 for d in matched_domains:
-                    NginxAnalyzer._record_hit(hits, d, pattern_key, timestamp, line)
-        return hits
+                    matches.append((i, d, pattern_key, timestamp, line[:120]))
+        return matches
+
+    @staticmethod
+    def _checkpoint_key(log_path: str, domains: set, tail_lines: int) -> str:
+        ident = '\0'.join([os.path.abspath(log_path), str(tail_lines)] + sorted(domains))
+        return hashlib.sha256(ident.encode('utf-8', 'surrogatepass')).hexdigest()
+
+    @staticmethod
+    def _scan_log_window(log_path: str, domains: set, tail_lines: int) -> List[_LogMatch]:
+        """Matches in the last *tail_lines* lines of the log, via its checkpoint.
+
+        When the checkpoint still describes this file (same inode, not
+        shrunk, same bytes before the offset) only the bytes appended since
+        are read; their matches are added to the saved ones and the window
+        is trimmed back to *tail_lines*. Otherwise the tail is read from
+        scratch. A final line still being written is reported but left
+        past the checkpoint, so the next run reads it whole.
+        """
+        st = os.stat(log_path)
+        cap = tail_lines if tail_lines > 0 else None
+        key = NginxAnalyzer._checkpoint_key(log_path, domains, tail_lines)
+        saved = disk_cache.get(_ACME_LOG_NAMESPACE, key)
+        if not (isinstance(saved, _LogCheckpoint) and saved.inode == st.st_ino
+                and saved.offset <= st.st_size
+                and _read_anchor(log_path, saved.offset) == saved.anchor):
+            saved = _LogCheckpoint(st.st_ino, 0, b'', 0, [])
+        if saved.offset == st.st_size:
+            return saved.matches
+
+        tail = read_tail(log_path, max_lines=cap, start=saved.offset, end=st.st_size)
+        total = saved.line_count + len(tail.lines)
+        drop = total - cap if cap is not None and total > cap else 0
+        matches = [(m[0] - drop,) + m[1:] for m in saved.matches if m[0] >= drop]
+        matches += [(saved.line_count + m[0] - drop,) + m[1:]
+                    for m in NginxAnalyzer._scan_log_for_patterns(tail.lines, domains)]
+
+        line_count = total - drop
+        kept = matches
+        if tail.complete_end < st.st_size:  # partial final line: leave it for next time
+            line_count -= 1
+            kept = [m for m in matches if m[0] < line_count]
+        disk_cache.put(_ACME_LOG_NAMESPACE, key,
+                       _LogCheckpoint(st.st_ino, tail.complete_end,
+                                      _read_anchor(log_path, tail.complete_end), line_count, kept),
+                       max_entries=_ACME_LOG_MAX_ENTRIES)
+        return matches
 
     def diagnose_acme_errors(
-        self, log_path: str, tail_lines: int = 5000
+        self, log_path: str, tail_lines: int = 5000, since: Optional[str] = None
     ) -> List[Dict[str, Any]]:
         """Scan an nginx error log for ACME / SSL failure patterns per domain.
 
-        Reads the last *tail_lines* lines of *log_path* and groups error events
-        by domain and pattern type.  Only SSL domains present in this config
-        file are considered.
+        Reads the last *tail_lines* lines of *log_path* — or, with *since*,
+        every line logged from that date (YYYY-MM-DD or 'YYYY-MM-DD HH:MM')
+        on — and groups error events by domain and pattern type.  Only SSL
+        domains present in this config file are considered.
+
+        The log is read backwards a block at a time, so memory doesn't grow
+        with its size. In last-N-lines mode a byte-offset checkpoint is kept
+        in the disk cache, and a repeat run reads only lines appended since.
 
         Pattern types detected:
             permission_denied   – open() on /.well-known/ path returned 13
@@ -1030,40 +1153,29 @@ class NginxAnalyzer(FileAnalyzer):
                 count       – number of matching log lines
                 last_seen   – raw timestamp string of most recent match
                 sample      – one representative log line (first 120 chars)
-        """
-        import os
 
+        Raises:
+            ValueError: if *since* isn't a recognised date.
+        """
+        cutoff = _since_cutoff(since) if since else None
         domains = set(self.extract_ssl_domains())
         if not domains:
             return []
 
-        # Patterns: (pattern_key, compiled_regex)
-        PATTERNS = [
-            ('permission_denied', re.compile(
-                r'open\(\)\s+"[^"]*\.well-known[^"]*"\s+failed.*Permission denied',
-                re.IGNORECASE,
-            )),
-            ('not_found', re.compile(
-                r'open\(\)\s+"[^"]*\.well-known[^"]*"\s+failed.*No such file',
-                re.IGNORECASE,
-            )),
-            ('ssl_error', re.compile(
-                r'(SSL_CTX_use_certificate|SSL handshake|ssl_handshake|'
-                r'no "ssl_certificate"|cannot load certificate)',
-                re.IGNORECASE,
-            )),
-        ]
-
-        # Read last tail_lines lines from the log
         try:
-            with open(log_path, 'r', encoding='utf-8', errors='replace') as fh:
-                all_lines = fh.readlines()
+            if cutoff:
+                def before_cutoff(line: str) -> bool:
+                    return bool(_LOG_TIMESTAMP_RE.match(line)) and line[:len(cutoff)] < cutoff
+                tail = read_tail(log_path, stop=before_cutoff)
+                matches = self._scan_log_for_patterns(tail.lines, domains)
+            else:
+                matches = self._scan_log_window(log_path, domains, tail_lines)
         except OSError:
             return []
 
-        recent_lines = all_lines[-tail_lines:]
-
-        hits = self._scan_log_for_patterns(recent_lines, domains, PATTERNS)
+        hits: Dict[tuple, Dict] = {}
+        for _, domain, pattern_key, timestamp, sample in matches:
+            self._record_hit(hits, domain, pattern_key, timestamp, sample)
         return sorted(hits.values(), key=lambda r: (r['domain'], r['pattern']))
 
     # ------------------------------------------------------------------
@@ -13,7 +13,7 @@ import zipfile
 import xml.etree.ElementTree as ET
 import logging
 from pathlib import Path
-from typing import Dict, Any, List, Optional
+from typing import IO, Dict, Any, List, Optional
 from ...base import FileAnalyzer
 from ...utils import format_size
 from ...utils.results import ResultBuilder
@@ -60,6 +60,15 @@ class ZipXMLAnalyzer(FileAnalyzer):
 
         self._open_archive()
 
+    @staticmethod
+    def _check_compression_ratio(part_path: str, info: zipfile.ZipInfo) -> None:
+        """Reject parts whose declared inflation ratio looks like a zip bomb."""
+        if info.compress_size > 0 and info.file_size / info.compress_size > MAX_COMPRESSION_RATIO:
+            raise ValueError(
+                f"Part {part_path} has suspicious compression ratio "
+                f"({info.file_size}/{info.compress_size}), possible zip bomb"
+            )
+
     def _safe_read(self, part_path: str) -> bytes:
         """Read a part from the archive with decompressed-size guard."""
         info = self.archive.getinfo(part_path)  # type: ignore[union-attr]
@@ -67,13 +76,23 @@ class ZipXMLAnalyzer(FileAnalyzer):
             raise ValueError(
                 f"Part {part_path} too large: {info.file_size} bytes (limit {MAX_XML_PART_SIZE})"
             )
-        if info.compress_size > 0 and info.file_size / info.compress_size > MAX_COMPRESSION_RATIO:
-            raise ValueError(
-                f"Part {part_path} has suspicious compression ratio "
-                f"({info.file_size}/{info.compress_size}), possible zip bomb"
-            )
+        self._check_compression_ratio(part_path, info)
         return self.archive.read(part_path)  # type: ignore[union-attr]
 
+    def _open_stream(self, part_path: str) -> Optional[IO[bytes]]:
+        """Open a part for incremental (streaming) reads.
+
+        Unlike _safe_read there is no MAX_XML_PART_SIZE ceiling: callers
+        consume the part in chunks (ET.iterparse) and never hold it whole,
+        so a 500 MB worksheet costs bounded memory. The compression-ratio
+        guard still applies.
+        """
+        if not self.archive or part_path not in self.parts:
+            return None
+        info = self.archive.getinfo(part_path)
+        self._check_compression_ratio(part_path, info)
+        return self.archive.open(info)
+
     def _open_archive(self) -> None:
         """Open ZIP archive and parse structure."""
         try:
@@ -8,8 +8,14 @@ Supports:
 All are ZIP archives containing XML files following the ECMA-376 standard.
 """
 
+import logging
+import os
+import re
+import threading
 import xml.etree.ElementTree as ET
-from typing import Dict, Any, List, Optional
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from typing import AbstractSet, Dict, Any, Iterator, List, Optional, Tuple
 from ...registry import register
 from ...utils import format_size
 from ...utils.results import ResultBuilder
@@ -226,6 +232,46 @@ class DocxAnalyzer(ZipXMLAnalyzer):
         return None
 
 
+# Cross-sheet search fans out to worker processes (each reopens the workbook
+# and inflates/scans its sheet's zip member independently) only when there is
+# enough worksheet XML to amortize pool startup; small workbooks stay serial.
+_SEARCH_PARALLEL_MIN_BYTES = 16 * 1024 * 1024
+_SEARCH_MAX_WORKERS = 8
+
+
+def _search_worker_count(n_sheets: int, total_bytes: int) -> int:
+    """Workers for a search over `n_sheets` sheets totalling `total_bytes`.
+
+    `REVEAL_MAX_WORKERS` overrides everything (set to 1 to force the serial
+    path); otherwise parallelize only above `_SEARCH_PARALLEL_MIN_BYTES`,
+    capped at `_SEARCH_MAX_WORKERS`, the CPU count and the sheet count.
+    """
+    if n_sheets < 2:
+        return 1
+    override = os.environ.get('REVEAL_MAX_WORKERS')
+    if override:
+        try:
+            return max(1, min(int(override), n_sheets))
+        except ValueError:
+            pass
+    if total_bytes < _SEARCH_PARALLEL_MIN_BYTES:
+        return 1
+    return max(1, min(os.cpu_count() or 1, _SEARCH_MAX_WORKERS, n_sheets))
+
+
+def _search_sheet_worker(args: tuple) -> List[Dict[str, Any]]:
+    """Search one sheet in a worker process.
+
+    Module-level so ProcessPoolExecutor can pickle it. Opens its own
+    XlsxAnalyzer (zip handles don't cross processes); shared strings resolve
+    lazily there, so a worker only decodes the table as far as its matched
+    rows need.
+    """
+    path, sheet_name, sheet_path, pattern_lower, ss_matches, limit = args
+    analyzer = XlsxAnalyzer(path)
+    return analyzer._search_sheet(sheet_name, sheet_path, pattern_lower, ss_matches, limit)
+
+
 @register('.xlsx', name='Excel Spreadsheet', icon='📊', category='doc')
 class XlsxAnalyzer(ZipXMLAnalyzer):
     """Analyzer for Microsoft Excel spreadsheets (.xlsx)."""
@@ -233,24 +279,72 @@ class XlsxAnalyzer(ZipXMLAnalyzer):
     CONTENT_PATH = 'xl/workbook.xml'
     NAMESPACES = OPENXML_NS
 
+    # A1-notation range, e.g. "B5:D20"
+    _CELL_RANGE_RE = re.compile(r'([A-Z]+)(\d+):([A-Z]+)(\d+)', re.IGNORECASE)
+
     def __init__(self, path: str):
         super().__init__(path)
-        self.shared_strings: List[str] = []
-        self._load_shared_strings()
+        # Shared strings resolve lazily: sharedStrings.xml is streamed only as
+        # far as the highest index a caller has asked for (see _shared_string),
+        # so reading the first rows of a sheet doesn't decode a 100 MB table.
+        self._ss_values: List[str] = []
+        self._ss_iter: Optional[Iterator[str]] = None
+        self._ss_done = False
+        self._ss_lock = threading.Lock()
+
+    @property
+    def shared_strings(self) -> List[str]:
+        """The full shared strings table (drains the lazy reader)."""
+        with self._ss_lock:
+            while self._pull_shared_string():
+                pass
+        return self._ss_values
 
-    def _load_shared_strings(self) -> None:
-        """Load shared strings table."""
-        ss_tree = self._read_xml('xl/sharedStrings.xml')
-        if ss_tree is None:
-            return
+    def _shared_string(self, idx: int) -> Optional[str]:
+        """Shared string ``idx``, streaming sharedStrings.xml up to it on demand."""
+        if idx < 0:
+            return None
+        with self._ss_lock:
+            while len(self._ss_values) <= idx and self._pull_shared_string():
+                pass
+        return self._ss_values[idx] if idx < len(self._ss_values) else None
 
+    def _pull_shared_string(self) -> bool:
+        """Decode one more <si> entry into _ss_values; False once exhausted.
+
+        Caller holds _ss_lock.
+        """
+        if self._ss_done:
+            return False
+        if self._ss_iter is None:
+            self._ss_iter = self._iter_shared_strings()
+        try:
+            self._ss_values.append(next(self._ss_iter))
+            return True
+        except StopIteration:
+            pass
+        except Exception as e:  # noqa: BLE001 — a damaged table degrades to raw indices
+            logging.warning(f"Failed to read shared strings in {self.path}: {e}")
+        self._ss_done = True
+        return False
+
+    def _iter_shared_strings(self) -> Iterator[str]:
+        """Stream the text of each <si> entry of xl/sharedStrings.xml."""
+        stream = self._open_stream('xl/sharedStrings.xml')
+        if stream is None:
+            return
         xl = self.NAMESPACES['xl']
-        for si in ss_tree.iter(f'{{{xl}}}si'):
-            text_parts = []
-            for t in si.iter(f'{{{xl}}}t'):
-                if t.text:
-                    text_parts.append(t.text)
-            self.shared_strings.append(''.join(text_parts))
+        si_tag = f'{{{xl}}}si'
+        t_tag = f'{{{xl}}}t'
+        with stream:
+            root = None
+            for event, elem in ET.iterparse(stream, events=('start', 'end')):
+                if root is None:
+                    root = elem
+                if event == 'end' and elem.tag == si_tag:
+                    yield ''.join(t.text for t in elem.iter(t_tag) if t.text)
+                    elem.clear()
+                    root.remove(elem)  # keep the parsed tree O(1) in table size
 
     def get_structure(self, head: Optional[int] = None, tail: Optional[int] = None,
                       range: Optional[tuple] = None, **kwargs) -> Dict[str, Any]:
@@ -286,12 +380,9 @@ class XlsxAnalyzer(ZipXMLAnalyzer):
             # Format sheets with details in name
             formatted_sheets = []
             for s in sheets:
-                if s.get('too_large'):
-                    label = f"{s['name']} - too large to parse ({s['size_mb']} MB)"
-                else:
-                    dim = f" ({s['dimension']})" if s.get('dimension') else ''
-                    formulas = f", {s['formulas']} formulas" if s.get('formulas') else ''
-                    label = f"{s['name']}{dim} - {s['rows']} rows, {s['cols']} cols{formulas}"
+                dim = f" ({s['dimension']})" if s.get('dimension') else ''
+                formulas = f", {s['formulas']} formulas" if s.get('formulas') else ''
+                label = f"{s['name']}{dim} - {s['rows']} rows, {s['cols']} cols{formulas}"
                 formatted_sheets.append({
                     'name': label,
                     'line_start': s['line_start'],
@@ -330,50 +421,217 @@ class XlsxAnalyzer(ZipXMLAnalyzer):
             pass
         return 0
 
-    def _analyze_sheet(self, sheet_path: str, sheet_name: str) -> Dict[str, Any]:
-        """Analyze a single worksheet."""
-        # Check size before parsing — large sheets silently fail _read_xml
-        if self.archive and sheet_path in self.parts:
-            from .base import MAX_XML_PART_SIZE
-            info = self.archive.getinfo(sheet_path)
-            if info.file_size > MAX_XML_PART_SIZE:
-                size_mb = info.file_size / (1024 * 1024)
-                return {
-                    'name': sheet_name,
-                    'rows': 0,
-                    'cols': 0,
-                    'too_large': True,
-                    'size_mb': round(size_mb, 1),
-                }
+    @staticmethod
+    def _rows_from_dim_ref(dim_ref: str) -> int:
+        """Parse dimension ref like 'A1:P11' and return its row span (11)."""
+        match = re.match(r'[A-Za-z]+(\d+):[A-Za-z]+(\d+)$', dim_ref or '')
+        if not match:
+            return 0
+        return int(match.group(2)) - int(match.group(1)) + 1
 
-        sheet_tree = self._read_xml(sheet_path)
-        if sheet_tree is None:
-            return {'name': sheet_name, 'rows': 0, 'cols': 0}
+    def _parse_cell_range(self, cell_range: str) -> Optional[Tuple[int, int, int, int]]:
+        """Parse A1 notation into 1-based (min_col, min_row, max_col, max_row)."""
+        match = self._CELL_RANGE_RE.match(cell_range or '')
+        if not match:
+            return None
+        start_col, start_row, end_col, end_row = match.groups()
+        return (self._col_letter_to_index(start_col), int(start_row),
+                self._col_letter_to_index(end_col), int(end_row))
+
+    def _iter_row_elements(self, sheet_path: str,
+                           meta: Optional[Dict[str, Any]] = None) -> Iterator[Tuple[int, ET.Element]]:
+        """Stream ``(row_number, <row> element)`` pairs from a worksheet part.
+
+        Uses ET.iterparse over the zip member, so memory stays bounded by one
+        row no matter how large the sheet is: each row is cleared and detached
+        from <sheetData> once the consumer moves past it. The <row> element is
+        only valid until the next iteration. A consumer that stops early simply
+        closes the generator — the rest of the member is never inflated.
+
+        Args:
+            sheet_path: Worksheet part, e.g. 'xl/worksheets/sheet1.xml'
+            meta: Optional dict; receives 'dimension' (the <dimension ref>,
+                '' when absent) before the first row is yielded
+
+        Raises:
+            ET.ParseError, ValueError: Malformed XML or a zip-bomb ratio
+        """
+        stream = self._open_stream(sheet_path)
+        if stream is None:
+            return
+        xl = self.NAMESPACES['xl']
+        row_tag = f'{{{xl}}}row'
+        dim_tag = f'{{{xl}}}dimension'
+        sheet_data_tag = f'{{{xl}}}sheetData'
+        if meta is not None:
+            meta.setdefault('dimension', '')
+        with stream:
+            sheet_data = None
+            last_row = 0
+            for event, elem in ET.iterparse(stream, events=('start', 'end')):
+                if event == 'start':
+                    if elem.tag == sheet_data_tag:
+                        sheet_data = elem
+                    elif elem.tag == dim_tag and meta is not None:
+                        meta['dimension'] = elem.get('ref', '')
+                    continue
+                if elem.tag != row_tag:
+                    continue
+                ref = elem.get('r', '')
+                last_row = int(ref) if ref.isdigit() else last_row + 1  # r is optional
+                yield last_row, elem
+                elem.clear()
+                if sheet_data is not None:
+                    sheet_data.remove(elem)
+
+    def _row_cells(self, row: ET.Element, min_col: int = 1,
+                   max_col: Optional[int] = None) -> List[str]:
+        """Cell values of ``row`` within columns [min_col, max_col], by reference.
+
+        Cells are placed by their ``r`` column (gaps padded with ''), so
+        column C always lands at index 2 relative to column A even when B is
+        absent from the XML. Trailing empty columns are not padded.
+        """
+        xl = self.NAMESPACES['xl']
+        cells: List[str] = []
+        col = 0
+        for cell in row.iter(f'{{{xl}}}c'):
+            ref = cell.get('r', '')
+            letters = ref.rstrip('0123456789')
+            col = self._col_letter_to_index(letters) if letters else col + 1
+            if col < min_col:
+                continue
+            if max_col is not None and col > max_col:
+                break
+            while len(cells) < col - min_col:
+                cells.append('')
+            cells.append(self._get_cell_value(cell))
+        return cells
+
+    def read_sheet_rows(self, sheet_path: str, cell_range: Optional[str] = None,
+                        limit: Optional[int] = None) -> Dict[str, Any]:
+        """Stream a worksheet's rows with range/limit pushdown.
+
+        Parsing stops as soon as the range's last row is passed or ``limit``
+        rows are collected, so ``?range=A1:C10`` on a 500 MB sheet inflates
+        only its first few KB.
+
+        Args:
+            sheet_path: Worksheet part, e.g. 'xl/worksheets/sheet1.xml'
+            cell_range: A1 notation (e.g. 'A1:C10'); invalid ranges are ignored.
+                Within a range, missing rows come back as [] so output row i
+                is sheet row start+i. Without one, empty rows are skipped.
+            limit: Maximum number of rows to return
+
+        Returns:
+            Dict with 'rows' (list of cell lists), 'dimension' (<dimension ref>),
+            'rows_scanned' (<row> elements read) and 'exhausted' (True if the
+            whole sheet was read, so rows_scanned is its exact row count).
+        """
+        bounds = self._parse_cell_range(cell_range) if cell_range else None
+        min_col, min_row, max_col, max_row = bounds or (1, 1, None, None)
+        meta: Dict[str, Any] = {}
+        rows: List[List[str]] = []
+        scanned = 0
+        exhausted = True
+        next_row = min_row
+
+        if limit is not None and limit <= 0:
+            return {'rows': rows, 'dimension': '', 'rows_scanned': 0, 'exhausted': False}
+
+        row_iter = self._iter_row_elements(sheet_path, meta)
+        try:
+            for row_num, row in row_iter:
+                scanned += 1
+                if row_num < min_row:
+                    continue
+                if max_row is not None and row_num > max_row:
+                    exhausted = False
+                    break
+                cells = self._row_cells(row, min_col, max_col)
+                if bounds:
+                    while next_row < row_num and (limit is None or len(rows) < limit):
+                        rows.append([])
+                        next_row += 1
+                elif not cells:
+                    continue
+                if limit is not None and len(rows) >= limit:
+                    exhausted = False
+                    break
+                rows.append(cells)
+                next_row = row_num + 1
+                if limit is not None and len(rows) >= limit:
+                    exhausted = False
+                    break
+        finally:
+            row_iter.close()
 
+        return {
+            'rows': rows,
+            'dimension': meta.get('dimension', ''),
+            'rows_scanned': scanned,
+            'exhausted': exhausted,
+        }
+
+    def _analyze_sheet(self, sheet_path: str, sheet_name: str) -> Dict[str, Any]:
+        """Analyze a single worksheet.
+
+        Streams the part (see _iter_row_elements) counting rows and formulas,
+        so sheets of any size are measured in bounded memory rather than
+        rejected above MAX_XML_PART_SIZE.
+        """
         xl = self.NAMESPACES['xl']
+        f_tag = f'{{{xl}}}f'
+        c_tag = f'{{{xl}}}c'
+        meta: Dict[str, Any] = {}
+        row_count = 0
+        formula_count = 0
+        first_row_cells = 0
+        try:
+            for _, row in self._iter_row_elements(sheet_path, meta):
+                if row_count == 0:
+                    first_row_cells = sum(1 for _ in row.iter(c_tag))
+                row_count += 1
+                formula_count += sum(1 for _ in row.iter(f_tag))
+        except Exception as e:  # noqa: BLE001 — one damaged sheet shouldn't sink the overview
+            logging.warning(f"Failed to read/parse XML part {sheet_path}: {e}")
+            return {'name': sheet_name, 'rows': 0, 'cols': 0}
 
-        # Get dimension
-        dimension = sheet_tree.find(f'{{{xl}}}dimension')
-        dim_ref = dimension.get('ref', '') if dimension is not None else ''
+        if not meta and row_count == 0:
+            return {'name': sheet_name, 'rows': 0, 'cols': 0}  # part missing
 
-        # Count rows and formulas
-        rows = list(sheet_tree.iter(f'{{{xl}}}row'))
-        formula_count = len(list(sheet_tree.iter(f'{{{xl}}}f')))
+        dim_ref = meta.get('dimension', '')
 
         # Derive column count from dimension ref (handles sparse rows / dynamic arrays)
         # Fall back to counting cells in first row only when no dimension ref
         col_count = self._cols_from_dim_ref(dim_ref)
-        if col_count == 0 and rows:
-            col_count = len(list(rows[0].iter(f'{{{xl}}}c')))
+        if col_count == 0:
+            col_count = first_row_cells
 
         return {
             'name': sheet_name,
             'dimension': dim_ref,
-            'rows': len(rows),
+            'rows': row_count,
             'cols': col_count,
             'formulas': formula_count,
         }
 
+    def sheet_entries(self) -> List[Tuple[str, str]]:
+        """``(sheet_name, part_path)`` for each sheet, in workbook order.
+
+        Reads workbook.xml only — no worksheet is opened.
+        """
+        if self.content_tree is None:
+            return []
+        xl = self.NAMESPACES['xl']
+        sheets_elem = self.content_tree.find(f'{{{xl}}}sheets')
+        if sheets_elem is None:
+            return []
+        return [
+            (sheet.get('name', f'Sheet{idx + 1}'), f'xl/worksheets/sheet{idx + 1}.xml')
+            for idx, sheet in enumerate(sheets_elem.findall(f'{{{xl}}}sheet'))
+        ]
+
     def extract_element(self, element_type: str, name: str) -> Optional[Dict[str, Any]]:
         """Extract a sheet by name."""
         if self.content_tree is None:
@@ -417,24 +675,13 @@ class XlsxAnalyzer(ZipXMLAnalyzer):
         return None
 
     def _get_sheet_preview(self, sheet_path: str, max_rows: int = 10) -> List[List[str]]:
-        """Get preview of sheet data."""
-        sheet_tree = self._read_xml(sheet_path)
-        if sheet_tree is None:
+        """Get preview of sheet data (first ``max_rows`` non-empty rows)."""
+        try:
+            return self.read_sheet_rows(sheet_path, limit=max_rows)['rows']
+        except Exception as e:  # noqa: BLE001 — preview is best-effort
+            logging.warning(f"Failed to read/parse XML part {sheet_path}: {e}")
             return []
 
-        xl = self.NAMESPACES['xl']
-        preview = []
-
-        for row in list(sheet_tree.iter(f'{{{xl}}}row'))[:max_rows]:
-            row_data = []
-            for cell in row.iter(f'{{{xl}}}c'):
-                value = self._get_cell_value(cell)
-                row_data.append(value)
-            if row_data:
-                preview.append(row_data)
-
-        return preview
-
     def _get_cell_value(self, cell: ET.Element) -> str:
         """Get cell value, handling shared strings, inline strings, and numbers."""
         xl = self.NAMESPACES['xl']
@@ -456,54 +703,133 @@ class XlsxAnalyzer(ZipXMLAnalyzer):
 
         if cell_type == 's':  # Shared string index
             try:
-                idx = int(value_elem.text)
-                if 0 <= idx < len(self.shared_strings):
-                    return self.shared_strings[idx]
+                shared = self._shared_string(int(value_elem.text))
+                if shared is not None:
+                    return shared
             except ValueError:
                 pass
         return value_elem.text
 
-    def search_all_sheets(self, pattern: str) -> List[Dict[str, Any]]:
+    def _row_matches(self, row: ET.Element, pattern_lower: str,
+                     ss_matches: AbstractSet[int]) -> bool:
+        """True if any cell of ``row`` contains ``pattern_lower``.
+
+        Shared-string cells are tested by index against the pre-matched
+        ``ss_matches`` set — no string is resolved or lowercased per cell.
+        """
+        xl = self.NAMESPACES['xl']
+        v_tag = f'{{{xl}}}v'
+        for cell in row.iter(f'{{{xl}}}c'):
+            if cell.get('t') == 's':
+                value = cell.findtext(v_tag) or ''
+                if value.isdigit() and int(value) in ss_matches:
+                    return True
+            elif pattern_lower in self._get_cell_value(cell).lower():
+                return True
+        return False
+
+    def _search_sheet(self, sheet_name: str, sheet_path: str, pattern_lower: str,
+                      ss_matches: AbstractSet[int],
+                      limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Matching rows of one sheet (at most ``limit``), streaming the part."""
+        matches: List[Dict[str, Any]] = []
+        row_iter = self._iter_row_elements(sheet_path)
+        try:
+            for row_num, row_elem in row_iter:
+                if not self._row_matches(row_elem, pattern_lower, ss_matches):
+                    continue
+                matches.append({
+                    'sheet_name': sheet_name,
+                    'row_num': row_num,
+                    'cells': self._row_cells(row_elem),
+                })
+                if limit is not None and len(matches) >= limit:
+                    break
+        except Exception as e:  # noqa: BLE001 — skip unreadable sheets, keep searching
+            logging.warning(f"Failed to read/parse XML part {sheet_path}: {e}")
+        finally:
+            row_iter.close()
+        return matches
+
+    def search_all_sheets(self, pattern: str, limit: Optional[int] = None) -> List[Dict[str, Any]]:
         """Search for a pattern across all sheets, returning matching rows.
 
-        Reads all rows in every sheet (no preview cap). Case-insensitive.
+        Reads all rows in every sheet (no preview cap), streaming each
+        worksheet. Case-insensitive.
+
+        The shared strings table is matched once up front; rows are then
+        tested by shared-string index. Sheets are searched independently —
+        across worker processes when the workbook is large enough (see
+        _search_worker_count) — and consumed in sheet order. With ``limit``,
+        the search returns as soon as enough matches are in hand: queued
+        sheets are cancelled and sheets already running aren't waited for.
 
         Args:
             pattern: Substring to search for (case-insensitive)
+            limit: Stop after this many matches (None = all)
 
         Returns:
             List of dicts: {sheet_name, row_num, cells: List[str]}
             in sheet-then-row order.
         """
         results: List[Dict[str, Any]] = []
-        if self.content_tree is None:
-            return results
-
-        xl = self.NAMESPACES['xl']
-        sheets_elem = self.content_tree.find(f'{{{xl}}}sheets')
-        if sheets_elem is None:
+        entries = [(name, path) for name, path in self.sheet_entries() if path in self.parts]
+        if not entries or (limit is not None and limit <= 0):
             return results
 
         pattern_lower = pattern.lower()
+        ss_matches = frozenset(
+            idx for idx, text in enumerate(self.shared_strings) if pattern_lower in text.lower()
+        )
 
-        for idx, sheet_elem in enumerate(sheets_elem.findall(f'{{{xl}}}sheet')):
-            sheet_name = sheet_elem.get('name', f'Sheet{idx + 1}')
-            sheet_path = f'xl/worksheets/sheet{idx + 1}.xml'
-            sheet_tree = self._read_xml(sheet_path)
-            if sheet_tree is None:
-                continue
+        total_bytes = sum(self.archive.getinfo(path).file_size  # type: ignore[union-attr]
+                          for _, path in entries)
+        workers = _search_worker_count(len(entries), total_bytes)
 
-            for row_elem in sheet_tree.iter(f'{{{xl}}}row'):
-                row_num = int(row_elem.get('r', 0))
-                cells = [self._get_cell_value(c) for c in row_elem.iter(f'{{{xl}}}c')]
-                if any(pattern_lower in cell.lower() for cell in cells):
-                    results.append({
-                        'sheet_name': sheet_name,
-                        'row_num': row_num,
-                        'cells': cells,
-                    })
+        def remaining() -> Optional[int]:
+            return None if limit is None else limit - len(results)
+
+        if workers <= 1:
+            for sheet_name, sheet_path in entries:
+                results.extend(self._search_sheet(sheet_name, sheet_path, pattern_lower,
+                                                  ss_matches, remaining()))
+                if limit is not None and len(results) >= limit:
+                    break
+            return results
+
+        # Sliding window: keep `workers` sheets in flight, consume in sheet
+        # order, stop submitting once the limit is met.
+        pending_entries = iter(entries)
+        in_flight: deque = deque()
+        pool = ProcessPoolExecutor(max_workers=workers)
+        limit_reached = False
+
+        def submit_next() -> None:
+            entry = next(pending_entries, None)
+            if entry is not None:
+                in_flight.append(pool.submit(
+                    _search_sheet_worker,
+                    (str(self.path), entry[0], entry[1], pattern_lower, ss_matches, limit),
+                ))
+
+        try:
+            for _ in range(workers):
+                submit_next()
+            while in_flight:
+                future = in_flight.popleft()
+                try:
+                    results.extend(future.result())
+                except Exception as e:  # noqa: BLE001 — a crashed worker loses one sheet, not the search
+                    logging.warning(f"Sheet search failed in {self.path}: {e}")
+                if limit is not None and len(results) >= limit:
+                    limit_reached = True
+                    break
+                submit_next()
+        finally:
+            # Once the limit is met, don't wait for sheets still being searched.
+            pool.shutdown(wait=not limit_reached, cancel_futures=True)
 
-        return results
+        return results if limit is None else results[:limit]
 
 
 @register('.pptx', name='PowerPoint Presentation', icon='📽️', category='doc')
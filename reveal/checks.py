@@ -172,7 +172,8 @@ def run_pattern_detection(
     # Run rules
     rule_errors: List[dict] = []
     detections = RuleRegistry.check_file(
-        path, structure, content, select=select, ignore=ignore, errors=rule_errors
+        path, structure, content, select=select, ignore=ignore, errors=rule_errors,
+        analyzer=analyzer,
     )
     # BACK-1083: a tree-sitter recovery parse (structure['_has_errors'], set by
     # BACK-1084) means rules ran against fabricated/partial structure — surface
@@ -266,7 +267,7 @@ def run_schema_validation(
 
         # Run rules (F003, F004, F005 will use the schema context)
         detections = RuleRegistry.check_file(
-            path, structure, content, select=select, ignore=ignore
+            path, structure, content, select=select, ignore=ignore, analyzer=analyzer,
         )
 
         # Format and output results
@@ -120,6 +120,13 @@ def add_arguments(parser: argparse.ArgumentParser) -> None:
              '(BACK-540): which rule(s) dominate check\'s cost on this tree. Runs serially, '
              'one real pass — use this instead of a manual --ignore RULE A/B or cProfile.',
     )
+    parser.add_argument(
+        '--watch', action='store_true',
+        help='Check the directory, then keep running: re-check only the files that change '
+             '(plus cross-file rules such as duplicate or circular-import detection) and '
+             'print the issues added and resolved. inotify on Linux, polling elsewhere '
+             '(REVEAL_WATCH_POLL=1 forces polling). Ctrl-C to stop.',
+    )
     parser.add_argument(
         '--rules', action='store_true',
         help='List all available quality rules',
@@ -194,9 +201,16 @@ def run_check(args: Namespace) -> None:
         print(f"Error: {path_str}: no such file or directory", file=sys.stderr)
         sys.exit(1)
 
+    if getattr(args, 'watch', False) and not path.is_dir():
+        print("Error: --watch needs a directory (e.g. reveal check src/ --watch)", file=sys.stderr)
+        sys.exit(1)
+
     if path.is_dir():
         args.recursive = True
-        if getattr(args, 'profile_rules', False):
+        if getattr(args, 'watch', False):
+            from reveal.cli.watch import run_check_watch
+            run_check_watch(path, args)
+        elif getattr(args, 'profile_rules', False):
             from reveal.cli.file_checker import handle_profile_rules
             handle_profile_rules(path, args)
         else:
@@ -12,10 +12,11 @@ import logging
 import time
 from collections import defaultdict
 from concurrent.futures import ProcessPoolExecutor
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields as dataclass_fields
 from pathlib import Path
-from typing import Optional, List, Dict, TYPE_CHECKING
+from typing import Optional, Iterator, List, Dict, TYPE_CHECKING
 
+from ..utils.packed import pack_record, PackedRecord
 from ..utils.path_utils import (
     ScopeCensus,
     _language_for_path,
@@ -36,23 +37,50 @@ _PARALLEL_THRESHOLD = 4
 from reveal.checks import _GROUP_THRESHOLD, _is_generated_file  # noqa: E402
 # Single source of truth for severity icons, shared with Detection.__str__ so
 # the single-file and directory renderers cannot drift apart (BACK-857).
-from reveal.rules.base import SEVERITY_MARKERS  # noqa: E402
+from reveal.rules.base import SEVERITY_MARKERS, Detection  # noqa: E402
+
+# Detection attributes shipped column-wise from workers (see _parallel_worker).
+_DETECTION_FIELDS = tuple(f.name for f in dataclass_fields(Detection))
 
 
 def _parallel_worker(packed_args: tuple) -> tuple:
     """Check one file and return results without printing.
 
-    Module-level so it is picklable by multiprocessing.
+    Module-level so it is picklable by multiprocessing. Detections travel
+    column-wise inside a single ``pack_record`` payload (one list per
+    Detection field) rather than as a list of dataclass instances, so the
+    pipe carries one ``bytes`` object per file and repeated rule codes,
+    severities and file paths pickle once per column instead of once per
+    detection. ``_unpack_worker_result`` restores the public tuple shape.
 
     Args:
         packed_args: (file_path, directory, select, ignore)
 
     Returns:
-        (file_path, issue_count, detections, status)
+        (file_path, payload) — decode with ``_unpack_worker_result``
     """
     file_path, directory, select, ignore = packed_args
     issue_count, detections, status = check_and_collect_file(file_path, directory, select, ignore)
-    return file_path, issue_count, detections, status
+    columns = tuple([getattr(d, name) for d in detections] for name in _DETECTION_FIELDS)
+    return file_path, pack_record((issue_count,), (status, columns))
+
+
+def _unpack_worker_result(result: tuple) -> tuple:
+    """Decode a ``_parallel_worker`` result into (file_path, issue_count, detections, status).
+
+    The detection columns are only unpickled when the file actually has
+    issues — the common clean-file case decodes just the status segment.
+    """
+    file_path, payload = result
+    record = PackedRecord(payload)
+    issue_count = int(record.scalars[0])
+    detections: list = []
+    if issue_count:
+        columns = record.segment(1)
+        detections = [
+            Detection(**dict(zip(_DETECTION_FIELDS, values))) for values in zip(*columns)
+        ]
+    return file_path, issue_count, detections, record.segment(0)
 
 
 def _i002_will_run(select, ignore) -> bool:
@@ -148,7 +176,7 @@ def _run_parallel(files: List[Path], directory: Path, select, ignore) -> list:
         initializer=_i002_init_worker,
         initargs=(graph_cache,),
     ) as pool:
-        return list(pool.map(_parallel_worker, args_iter))
+        return [_unpack_worker_result(r) for r in pool.map(_parallel_worker, args_iter)]
 
 
 def _run_parallel_streaming(files: List[Path], directory: Path, select, ignore):
@@ -182,7 +210,7 @@ def _run_parallel_streaming(files: List[Path], directory: Path, select, ignore):
         futures = {pool.submit(_parallel_worker, args): args[0] for args in args_list}
         for future in as_completed(futures):
             try:
-                yield future.result()
+                yield _unpack_worker_result(future.result())
             except Exception as e:
                 file_path = futures[future]
                 logging.warning("check: skipped %s — %s: %s", file_path, type(e).__name__, e)
@@ -311,6 +339,29 @@ def should_skip_file(relative_path: Path, gitignore_patterns: List[str]) -> bool
     return False
 
 
+def prune_dirs(
+    root_path: Path, dirs: List[str], directory: Path, skip_patterns: List[str],
+) -> List[str]:
+    """Subdirectories of *root_path* that a check walk descends into.
+
+    Drops skippable directories (vendored, build output, hidden), ``*.egg-info``
+    build artifacts, and directories matched by *skip_patterns* (gitignore plus
+    --exclude, relative to *directory*). Shared by collect_files_to_check and
+    the ``--watch`` watchers, so both see the same tree.
+    """
+    kept_dirs = []
+    for d in dirs:
+        if is_skippable_dir(root_path, d) or d.endswith('.egg-info'):
+            continue
+        if skip_patterns:
+            rel_dir = (root_path / d).relative_to(directory)
+            # Append a dummy filename so should_skip_file sees parts correctly
+            if should_skip_file(rel_dir / '_', skip_patterns):
+                continue
+        kept_dirs.append(d)
+    return kept_dirs
+
+
 @dataclass
 class FileCollectionResult:
     """Result of collect_files_to_check(): survivors plus *why* everything
@@ -396,20 +447,9 @@ def collect_files_to_check(
     skip_patterns = list(gitignore_patterns) + list(exclude_patterns or [])
 
     for root, dirs, files in os.walk(directory):
-        # Filter out excluded directories and *.egg-info build artifacts
         root_path = Path(root)
-        kept_dirs = []
-        for d in dirs:
-            if is_skippable_dir(root_path, d) or d.endswith('.egg-info'):
-                skipped_dirs += 1
-                continue
-            if skip_patterns:
-                rel_dir = (root_path / d).relative_to(directory)
-                # Append a dummy filename so should_skip_file sees parts correctly
-                if should_skip_file(rel_dir / '_', skip_patterns):
-                    skipped_dirs += 1
-                    continue
-            kept_dirs.append(d)
+        kept_dirs = prune_dirs(root_path, dirs, directory, skip_patterns)
+        skipped_dirs += len(dirs) - len(kept_dirs)
         dirs[:] = kept_dirs
 
         for filename in files:
@@ -486,7 +526,8 @@ def check_and_report_file(
             return 0
 
         detections = RuleRegistry.check_file(
-            str(file_path), structure, content, select=select, ignore=ignore
+            str(file_path), structure, content, select=select, ignore=ignore,
+            analyzer=analyzer,
         )
 
         if not detections:
@@ -558,7 +599,7 @@ def check_and_collect_file(
         rule_errors: list = []
         detections = RuleRegistry.check_file(
             str(file_path), structure, content, select=select, ignore=ignore,
-            profile=profile, errors=rule_errors,
+            profile=profile, errors=rule_errors, analyzer=analyzer,
         )
 
         status: dict = {"status": "ok"}
@@ -606,7 +647,7 @@ def _handle_no_files_found(directory: Path, output_format: str) -> None:
     """
     import json
     from reveal.utils.results import add_cli_contract_fields
-    from reveal.utils.json_utils import attach_provenance
+    from reveal.utils.json_utils import attach_provenance, ndjson_enabled, print_ndjson_result
 
     if output_format == 'json':
         result = {
@@ -618,10 +659,12 @@ def _handle_no_files_found(directory: Path, output_format: str) -> None:
                 "exit_code": 0
             }
         }
-        print(json.dumps(
-            attach_provenance(add_cli_contract_fields(result, result_type='check', source=directory, source_type='directory')),
-            indent=2,
-        ))
+        result = attach_provenance(
+            add_cli_contract_fields(result, result_type='check', source=directory, source_type='directory'))
+        if ndjson_enabled():
+            print_ndjson_result(result, 'files')
+        else:
+            print(json.dumps(result, indent=2))
     else:
         print(f"No supported files found in {directory}")
 
@@ -640,6 +683,48 @@ def _apply_severity_filter(detections: list, severity: Optional[str]) -> list:
     return [d for d in detections if _SEVERITY_ORDER.index(d.severity.value.lower()) >= min_idx]
 
 
+def check_files_collected(
+    sorted_files: List[Path], directory: Path, select: Optional[List[str]], ignore: Optional[List[str]],
+) -> list:
+    """Check *sorted_files*, in parallel above _PARALLEL_THRESHOLD.
+
+    Returns:
+        List of (file_path, issue_count, detections, status) in input order.
+    """
+    if len(sorted_files) >= _PARALLEL_THRESHOLD:
+        try:
+            return _run_parallel(sorted_files, directory, select, ignore)
+        except Exception:
+            # Parallel execution itself failed (e.g. pool startup) — fall back to
+            # serial, still checking every file in sorted_files, not a smaller set.
+            pass
+    return [(f, *check_and_collect_file(f, directory, select, ignore)) for f in sorted_files]
+
+
+def iter_checked_files(
+    sorted_files: List[Path], directory: Path, select: Optional[List[str]], ignore: Optional[List[str]],
+) -> Iterator[tuple]:
+    """Streaming counterpart of check_files_collected.
+
+    Above _PARALLEL_THRESHOLD results come off _run_parallel_streaming in
+    completion order, so memory doesn't grow with the result set.
+
+    Yields:
+        (file_path, issue_count, detections, status) per checked file.
+    """
+    if len(sorted_files) >= _PARALLEL_THRESHOLD:
+        try:
+            return _run_parallel_streaming(sorted_files, directory, select, ignore)
+        except Exception:
+            # Parallel execution itself failed (e.g. pool startup) — fall back to
+            # serial, still checking every file in sorted_files, not a smaller set.
+            pass
+    return (
+        (f, *check_and_collect_file(f, directory, select, ignore))
+        for f in sorted_files
+    )
+
+
 def _check_files_json(
     files: List[Path], directory: Path, select: Optional[List[str]], ignore: Optional[List[str]],
     severity: Optional[str] = None,
@@ -665,15 +750,7 @@ def _check_files_json(
     file_results = []
     sorted_files = sorted(files)
 
-    if len(sorted_files) >= _PARALLEL_THRESHOLD:
-        try:
-            results = _run_parallel(sorted_files, directory, select, ignore)
-        except Exception:
-            # Parallel execution itself failed (e.g. pool startup) — fall back to
-            # serial, still checking every file in sorted_files, not a smaller set.
-            results = [(f, *check_and_collect_file(f, directory, select, ignore)) for f in sorted_files]
-    else:
-        results = [(f, *check_and_collect_file(f, directory, select, ignore)) for f in sorted_files]
+    results = check_files_collected(sorted_files, directory, select, ignore)
 
     cwd = Path.cwd()
     for file_path, issue_count, detections, status in results:
@@ -686,37 +763,87 @@ def _check_files_json(
             total_issues += issue_count
             files_with_issues += 1
         if issue_count > 0 or st != "ok":
-            try:
-                rel_path = file_path.relative_to(cwd)
-            except ValueError:
-                rel_path = file_path.relative_to(directory)
-            entry = {
-                "file": to_posix(rel_path),
-                "issues": issue_count,
-                "detections": [
-                    {
-                        "line": d.line,
-                        "column": d.column,
-                        "rule_code": d.rule_code,
-                        "message": d.message,
-                        "severity": d.severity.value,
-                        "suggestion": d.suggestion,
-                        "context": d.context
-                    }
-                    for d in detections
-                ]
-            }
-            if st != "ok":
-                entry["status"] = st
-                if status.get("detail"):
-                    entry["detail"] = status["detail"]
-            if status.get("rule_errors"):
-                entry["rule_errors"] = status["rule_errors"]
-            file_results.append(entry)
+            file_results.append(_file_result_entry(file_path, detections, status, directory, cwd))
 
     return total_issues, files_with_issues, file_results, files_errored
 
 
+def _file_result_entry(file_path: Path, detections: list, status: dict, directory: Path, cwd: Path) -> dict:
+    """One ``files[]`` entry of the JSON report (also the ndjson ``file`` record)."""
+    try:
+        rel_path = file_path.relative_to(cwd)
+    except ValueError:
+        rel_path = file_path.relative_to(directory)
+    entry = {
+        "file": to_posix(rel_path),
+        "issues": len(detections),
+        "detections": [
+            {
+                "line": d.line,
+                "column": d.column,
+                "rule_code": d.rule_code,
+                "message": d.message,
+                "severity": d.severity.value,
+                "suggestion": d.suggestion,
+                "context": d.context
+            }
+            for d in detections
+        ]
+    }
+    st = status.get("status", "ok")
+    if st != "ok":
+        entry["status"] = st
+        if status.get("detail"):
+            entry["detail"] = status["detail"]
+    if status.get("rule_errors"):
+        entry["rule_errors"] = status["rule_errors"]
+    return entry
+
+
+def _check_files_ndjson(
+    files: List[Path], directory: Path, select: Optional[List[str]], ignore: Optional[List[str]],
+    severity: Optional[str] = None,
+) -> tuple:
+    """Check files, printing each ``file`` record as soon as it is checked.
+
+    The --format ndjson counterpart of _check_files_json: results come off the
+    same streaming pool text mode uses (completion order — every record names
+    its file), and only the counters are kept, so memory does not grow with
+    the number of findings.
+
+    Returns:
+        Tuple of (total_issues, files_with_issues, files_errored, files_degraded,
+        records_printed).
+    """
+    from ..utils.json_utils import print_ndjson_record
+
+    total_issues = 0
+    files_with_issues = 0
+    files_errored = 0
+    files_degraded = 0
+    records = 0
+    sorted_files = sorted(files)
+
+    result_iter = iter_checked_files(sorted_files, directory, select, ignore)
+
+    cwd = Path.cwd()
+    for file_path, _issue_count, detections, status in result_iter:
+        detections = _apply_severity_filter(detections, severity)
+        st = status.get("status", "ok")
+        if st == "error":
+            files_errored += 1
+        elif st == "warning":
+            files_degraded += 1
+        if detections:
+            total_issues += len(detections)
+            files_with_issues += 1
+        if detections or st != "ok":
+            print_ndjson_record("file", _file_result_entry(file_path, detections, status, directory, cwd))
+            records += 1
+
+    return total_issues, files_with_issues, files_errored, files_degraded, records
+
+
 def _check_files_text(
     files: List[Path],
     directory: Path,
@@ -755,21 +882,7 @@ def _check_files_text(
     # Use streaming parallel execution so results are processed as they complete
     # rather than buffering the full result set in memory first.  Non-deterministic
     # output order is acceptable for text mode (matches ruff/flake8 parallel behaviour).
-    if len(sorted_files) >= _PARALLEL_THRESHOLD:
-        try:
-            result_iter = _run_parallel_streaming(sorted_files, directory, select, ignore)
-        except Exception:
-            # Parallel execution itself failed (e.g. pool startup) — fall back to
-            # serial, still checking every file in sorted_files, not a smaller set.
-            result_iter = (
-                (f, *check_and_collect_file(f, directory, select, ignore))
-                for f in sorted_files
-            )
-    else:
-        result_iter = (
-            (f, *check_and_collect_file(f, directory, select, ignore))
-            for f in sorted_files
-        )
+    result_iter = iter_checked_files(sorted_files, directory, select, ignore)
 
     cwd = Path.cwd()
     # BACK-1039: shared run-wide (not per-file) so a rule's full guidance
@@ -848,10 +961,32 @@ def _print_json_output(
             individual reasons are on each file_results entry's "detail".
     """
     import json
-    from reveal.utils.results import add_cli_contract_fields
     from reveal.utils.json_utils import attach_provenance
 
     files_degraded = sum(1 for fr in file_results if fr.get("status") == "warning")
+    result = _build_check_result(
+        file_results, files_checked, files_with_issues, total_issues, source,
+        scope=scope, select=select, ignore=ignore,
+        files_errored=files_errored, files_degraded=files_degraded,
+    )
+    print(json.dumps(attach_provenance(result), indent=2))
+
+
+def _build_check_result(
+    file_results: List[dict],
+    files_checked: int,
+    files_with_issues: int,
+    total_issues: int,
+    source: Path,
+    scope: Optional[ScopeCensus] = None,
+    select: Optional[List[str]] = None,
+    ignore: Optional[List[str]] = None,
+    files_errored: int = 0,
+    files_degraded: int = 0,
+) -> dict:
+    """The check report envelope (see _print_json_output for the fields)."""
+    from reveal.utils.results import add_cli_contract_fields
+
     result = {
         "files": file_results,
         "summary": {
@@ -879,10 +1014,7 @@ def _print_json_output(
             gap["language"] = display_name_for_extension(ext) or gap["language"]
         scope_dict["unscoped_categories"] = gaps
         result["scope"] = scope_dict
-    print(json.dumps(
-        attach_provenance(add_cli_contract_fields(result, result_type='check', source=source, source_type='directory')),
-        indent=2,
-    ))
+    return add_cli_contract_fields(result, result_type='check', source=source, source_type='directory')
 
 
 def _print_grep_output(file_results: List[dict]) -> None:
@@ -977,6 +1109,12 @@ def handle_recursive_check(directory: Path, args: 'Namespace') -> None:
     limit = getattr(args, 'limit', 50)
 
     # Check files based on output format
+    from reveal.utils.json_utils import ndjson_enabled
+    if output_format == 'json' and ndjson_enabled():
+        _run_check_ndjson(
+            files_to_check, directory, select, ignore, severity, collection.to_scope_census(),
+        )
+        return
     if output_format == 'json':
         total_issues, files_with_issues, file_results, files_errored = _check_files_json(
             files_to_check, directory, select, ignore, severity=severity
@@ -1020,6 +1158,27 @@ def handle_recursive_check(directory: Path, args: 'Namespace') -> None:
     sys.exit(1 if total_issues > 0 else 0)
 
 
+def _run_check_ndjson(
+    files: List[Path], directory: Path, select: Optional[List[str]], ignore: Optional[List[str]],
+    severity: Optional[str], scope: ScopeCensus,
+) -> None:
+    """``reveal check <dir> --format ndjson``: one ``file`` record per file
+    with issues (or a non-ok status) as it is checked, then a ``summary``
+    record carrying the same envelope the JSON report has, minus ``files``."""
+    from reveal.utils.json_utils import attach_provenance, print_ndjson_result
+
+    total_issues, files_with_issues, files_errored, files_degraded, records = _check_files_ndjson(
+        files, directory, select, ignore, severity=severity
+    )
+    result = _build_check_result(
+        [], len(files), files_with_issues, total_issues, directory,
+        scope=scope, select=select, ignore=ignore,
+        files_errored=files_errored, files_degraded=files_degraded,
+    )
+    print_ndjson_result(attach_provenance(result), 'files', streamed=records)
+    sys.exit(1 if total_issues > 0 else 0)
+
+
 def handle_profile_rules(directory: Path, args: 'Namespace') -> None:
     """Handle `reveal check <dir> --profile-rules`: a per-rule wall-time
     breakdown of `check`, instead of the normal issue report (BACK-540).
@@ -208,8 +208,10 @@ def _add_global_options(target) -> None:
     Called by both _build_global_options_parser() (for subcommand inheritance)
     and create_argument_parser() (for the main parser's named group).
     """
-    target.add_argument('--format', choices=['text', 'json', 'typed', 'grep'], default='text',
-                        help='Output format (text, json, typed [typed JSON with types/relationships], grep)')
+    target.add_argument('--format', choices=['text', 'json', 'ndjson', 'typed', 'grep'], default='text',
+                        help='Output format (text, json, ndjson [one JSON record per line, streamed '
+                             'as produced, then a summary record], typed [typed JSON with '
+                             'types/relationships], grep)')
     target.add_argument('--copy', '-c', action='store_true',
                         help='Copy output to clipboard (also prints normally)')
     target.add_argument('--verbose', '-v', action='store_true',
@@ -375,6 +377,10 @@ def _add_display_options(parser: argparse.ArgumentParser) -> None:
     parser.add_argument('--files', action='store_true',
                         help='Flat file list with timestamps sorted by mtime — replaces find|sort. '
                              'Combine with --ext to filter by type, --sort name/size/mtime, --desc.')
+    parser.add_argument('--watch', action='store_true',
+                        help='Re-render the directory view whenever files under it change '
+                             '(with --check: re-check only the changed files and print the issues '
+                             'added/resolved). Ctrl-C to stop.')
     parser.add_argument('--hotspots', action='store_true',
                         help='Identify quality hotspots (requires stats:// adapter, shows worst 10 files by quality)')
     parser.add_argument('--code-only', action='store_true',
@@ -450,7 +456,8 @@ def _add_navigation_options(parser: argparse.ArgumentParser) -> None:
                              'with --rules/--adapters/--discover, also include reveal-internal '
                              'self-check entries hidden by default')
     parser.add_argument('--since', type=str, metavar='DATE',
-                        help='Filter results since date (YYYY-MM-DD, e.g., reveal claude:// --since 2026-02-27)')
+                        help='Filter results since date (YYYY-MM-DD, e.g., reveal claude:// --since 2026-02-27); '
+                             'with --diagnose, scan nginx error-log lines from that date on instead of the last 5,000')
     parser.add_argument('--until', type=str, metavar='DATE',
                         help='Filter results until date (YYYY-MM-DD, e.g., reveal claude:// --until 2026-06-18)')
     parser.add_argument('--with-stats', dest='with_stats', action='store_true',
@@ -245,6 +245,12 @@ def _handle_directory_path(path: Path, args: 'Namespace') -> None:
     from ...tree_view import (
         show_directory_tree, show_file_list, show_directory_tree_json, show_file_list_json,
     )
+    if getattr(args, 'watch', False):
+        # Clear the flag so the re-render below takes the normal route.
+        from ...cli.watch import watch_structure
+        args.watch = False
+        watch_structure(path, args, lambda: _handle_directory_path(path, args))
+        return
     if getattr(args, 'meta', False):
         _show_directory_meta(path, args)
         return
@@ -632,6 +632,54 @@ def _apply_budget_constraints(result: dict, args: 'Namespace', adapter=None) ->
     return result
 
 
+class _NdjsonStream:
+    """``on_record`` callback handed to a streaming adapter under --format
+    ndjson: prints each list item as a record the moment it is produced."""
+
+    def __init__(self, list_field: str) -> None:
+        from reveal.utils.json_utils import record_kind
+        self.list_field = list_field
+        self.kind = record_kind(list_field)
+        self.count = 0
+
+    def __call__(self, item: dict) -> None:
+        from reveal.utils.json_utils import print_ndjson_record
+        print_ndjson_record(self.kind, item)
+        self.count += 1
+
+
+def _ndjson_stream(adapter, args: 'Namespace') -> Optional[_NdjsonStream]:
+    """An _NdjsonStream when this adapter can stream its list field, else None.
+
+    Streaming adapters opt in by accepting an ``on_record`` keyword in
+    get_structure(): when it is passed they call it once per item of their
+    BUDGET_LIST_FIELD as each is produced (when they can — a sorted query
+    still has to see everything first) and leave those items out of the
+    returned result. Post-processing that needs the whole list (--fields,
+    --max-items, --max-snippet-chars, an adapter post_process hook) keeps the
+    collect-then-split path.
+    """
+    import inspect
+    from reveal.utils.json_utils import ndjson_enabled
+    if not ndjson_enabled() or adapter is None:
+        return None
+    list_field = getattr(adapter, 'BUDGET_LIST_FIELD', None)
+    if not list_field:
+        return None
+    try:
+        params = inspect.signature(adapter.get_structure).parameters
+    except (TypeError, ValueError):
+        return None
+    if 'on_record' not in params:
+        return None
+    if any(getattr(args, name, None) for name in ('fields', 'max_items', 'max_snippet_chars')):
+        return None
+    from ...adapters.base import ResourceAdapter
+    if getattr(type(adapter), 'post_process', ResourceAdapter.post_process) is not ResourceAdapter.post_process:
+        return None
+    return _NdjsonStream(list_field)
+
+
 def _render_structure(adapter, renderer_class: type[Any], args: 'Namespace',
                       scheme: Optional[str] = None, resource: Optional[str] = None) -> None:
     """Render full structure from adapter.
@@ -645,6 +693,9 @@ def _render_structure(adapter, renderer_class: type[Any], args: 'Namespace',
     """
     # Build adapter kwargs
     structure_kwargs = _build_adapter_kwargs(adapter, args, scheme, resource)
+    stream = _ndjson_stream(adapter, args)
+    if stream is not None:
+        structure_kwargs['on_record'] = stream
 
     # Get structure from adapter
     try:
@@ -658,6 +709,11 @@ def _render_structure(adapter, renderer_class: type[Any], args: 'Namespace',
             print(f"Error{scheme_hint}: {error_msg}", file=sys.stderr)
         sys.exit(1)
 
+    if stream is not None:
+        from reveal.utils.json_utils import attach_provenance, print_ndjson_result
+        print_ndjson_result(attach_provenance(result), stream.list_field, streamed=stream.count)
+        return
+
     # Apply post-processing
     result = _apply_field_selection(result, args)
     result = _apply_budget_constraints(result, args, adapter)
@@ -0,0 +1,578 @@
+"""Watch mode: ``reveal check <dir> --watch`` and ``reveal <dir> --watch``.
+
+Editor hooks that run ``reveal check src/`` on every save pay for a full
+directory walk, a fresh worker pool and a re-check of every file, every time.
+Watch mode keeps one process alive instead:
+
+* a watcher reports changed paths — inotify on Linux, with watches on every
+  directory the check walk would enter (the same skip-dir, .gitignore and
+  --exclude pruning as ``collect_files_to_check``), or a polling fallback
+  that compares (mtime_ns, size) snapshots of that same tree;
+* a burst of events (an editor's write-then-rename, a ``git checkout``) is
+  debounced into one batch;
+* ``CheckWatchSession`` re-checks only the changed files with every rule,
+  re-runs rules that declare ``cross_file = True`` on the other files when a
+  changed file is one they apply to, and reports the delta — issues added
+  and resolved — instead of the whole report.
+
+``REVEAL_WATCH_POLL=1`` forces the polling watcher (network filesystems and
+bind mounts, where inotify events don't arrive).
+"""
+
+import ctypes
+import ctypes.util
+import errno
+import json
+import os
+import select
+import struct
+import sys
+import time
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Dict, Iterator, List, Optional, Set, Tuple, TYPE_CHECKING
+
+from . import file_checker
+from .file_checker import load_gitignore_patterns, prune_dirs, should_skip_file
+from ..utils.path_utils import to_posix
+
+if TYPE_CHECKING:
+    from argparse import Namespace
+
+# A batch closes after this long without a new event, or after _MAX_BATCH_S
+# of continuous events (a long checkout still gets reported while it runs).
+_DEBOUNCE_S = 0.2
+_MAX_BATCH_S = 2.0
+_POLL_INTERVAL_S = 0.5
+
+# inotify(7) event bits.
+_IN_MODIFY = 0x00000002
+_IN_CLOSE_WRITE = 0x00000008
+_IN_MOVED_FROM = 0x00000040
+_IN_MOVED_TO = 0x00000080
+_IN_CREATE = 0x00000100
+_IN_DELETE = 0x00000200
+_IN_DELETE_SELF = 0x00000400
+_IN_Q_OVERFLOW = 0x00004000
+_IN_IGNORED = 0x00008000
+_IN_ISDIR = 0x40000000
+_WATCH_MASK = (_IN_MODIFY | _IN_CLOSE_WRITE | _IN_MOVED_FROM | _IN_MOVED_TO
+               | _IN_CREATE | _IN_DELETE | _IN_DELETE_SELF)
+_EVENT = struct.Struct('iIII')  # wd, mask, cookie, name length
+_READ_SIZE = 64 * 1024
+
+_TRUTHY = ('1', 'true', 'yes', 'on')
+
+
+def _walk_watched(
+    top: Path, directory: Path, skip_patterns: List[str],
+) -> Iterator[Tuple[Path, List[str]]]:
+    """(dir, filenames) for *top* and every directory below it that a check
+    walk rooted at *directory* enters."""
+    for root, dirs, files in os.walk(top):
+        root_path = Path(root)
+        dirs[:] = prune_dirs(root_path, dirs, directory, skip_patterns)
+        yield root_path, files
+
+
+class Watcher(ABC):
+    """Reports debounced batches of changed paths under one directory."""
+
+    kind = 'base'
+
+    def __init__(self, directory: Path, skip_patterns: List[str]) -> None:
+        self.directory = directory
+        self.skip_patterns = skip_patterns
+
+    def wait(self, timeout: Optional[float] = None) -> Set[Path]:
+        """Block until something changes (or *timeout* passes); return the
+        batch of changed paths — files, removed directories, or the watched
+        directory itself when the watcher lost track and everything must be
+        re-read."""
+        batch = self._poll(timeout)
+        if not batch:
+            return set()
+        deadline = time.monotonic() + _MAX_BATCH_S
+        while time.monotonic() < deadline:
+            more = self._poll(_DEBOUNCE_S)
+            if not more:
+                break
+            batch |= more
+        return {p for p in batch if self._included(p)}
+
+    def _included(self, path: Path) -> bool:
+        if path == self.directory:
+            return True
+        try:
+            relative = path.relative_to(self.directory)
+        except ValueError:
+            return False
+        return not should_skip_file(relative, self.skip_patterns)
+
+    @abstractmethod
+    def _poll(self, timeout: Optional[float]) -> Set[Path]:
+        """Changed paths seen within *timeout* seconds (empty if none)."""
+
+    def close(self) -> None:
+        """Release OS resources (a no-op for the polling watcher)."""
+
+
+class PollingWatcher(Watcher):
+    """Portable fallback: re-stat the watched tree every _POLL_INTERVAL_S."""
+
+    kind = 'polling'
+
+    def __init__(self, directory: Path, skip_patterns: List[str],
+                 interval: float = _POLL_INTERVAL_S) -> None:
+        super().__init__(directory, skip_patterns)
+        self.interval = interval
+        self._snapshot = self._scan()
+
+    def _scan(self) -> Dict[Path, Tuple[int, int]]:
+        snapshot: Dict[Path, Tuple[int, int]] = {}
+        for root_path, files in _walk_watched(self.directory, self.directory, self.skip_patterns):
+            for name in files:
+                file_path = root_path / name
+                try:
+                    st = file_path.stat()
+                except OSError:
+                    continue
+                snapshot[file_path] = (st.st_mtime_ns, st.st_size)
+        return snapshot
+
+    def _poll(self, timeout: Optional[float]) -> Set[Path]:
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            current = self._scan()
+            previous = self._snapshot
+            self._snapshot = current
+            changed = {p for p in current.keys() | previous.keys() if current.get(p) != previous.get(p)}
+            if changed:
+                return changed
+            if deadline is None:
+                time.sleep(self.interval)
+                continue
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return set()
+            time.sleep(min(self.interval, remaining))
+
+
+def _libc():
+    return ctypes.CDLL(ctypes.util.find_library('c') or 'libc.so.6', use_errno=True)
+
+
+class InotifyWatcher(Watcher):
+    """Linux inotify, one watch per directory the check walk enters.
+
+    New directories are watched as they appear (their files are reported as
+    changed, which also covers files written before the watch was added).
+    Raises OSError when inotify is unavailable or the per-user watch limit
+    (``fs.inotify.max_user_watches``) is too low for the tree — the caller
+    then falls back to polling.
+    """
+
+    kind = 'inotify'
+
+    def __init__(self, directory: Path, skip_patterns: List[str]) -> None:
+        super().__init__(directory, skip_patterns)
+        self._lib = _libc()
+        self._fd = self._lib.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if self._fd < 0:
+            raise OSError(ctypes.get_errno(), 'inotify_init1 failed')
+        self._dirs: Dict[int, Path] = {}
+        try:
+            self._add_tree(directory)
+        except OSError:
+            self.close()
+            raise
+
+    def _add_tree(self, top: Path) -> Set[Path]:
+        """Watch *top* and the directories below it; return the files found."""
+        found: Set[Path] = set()
+        for root_path, files in _walk_watched(top, self.directory, self.skip_patterns):
+            wd = self._lib.inotify_add_watch(self._fd, os.fsencode(str(root_path)), _WATCH_MASK)
+            if wd < 0:
+                err = ctypes.get_errno()
+                if err == errno.ENOSPC:
+                    raise OSError(err, 'inotify watch limit reached (fs.inotify.max_user_watches)')
+                continue  # vanished or unreadable directory — nothing to watch
+            self._dirs[wd] = root_path
+            found.update(root_path / name for name in files)
+        return found
+
+    def _forget_tree(self, top: Path) -> None:
+        """Drop the watches of a directory moved out from under us."""
+        for wd, path in list(self._dirs.items()):
+            if path == top or top in path.parents:
+                self._lib.inotify_rm_watch(self._fd, wd)
+                self._dirs.pop(wd, None)
+
+    def _poll(self, timeout: Optional[float]) -> Set[Path]:
+        ready, _, _ = select.select([self._fd], [], [], timeout)
+        changed: Set[Path] = set()
+        if not ready:
+            return changed
+        while True:
+            try:
+                data = os.read(self._fd, _READ_SIZE)
+            except BlockingIOError:
+                break
+            if not data:
+                break
+            self._parse(data, changed)
+        return changed
+
+    def _parse(self, data: bytes, changed: Set[Path]) -> None:
+        offset = 0
+        while offset + _EVENT.size <= len(data):
+            wd, mask, _cookie, length = _EVENT.unpack_from(data, offset)
+            name = data[offset + _EVENT.size:offset + _EVENT.size + length].rstrip(b'\0')
+            offset += _EVENT.size + length
+            if mask & _IN_Q_OVERFLOW:
+                # Events were dropped; only a full re-read is safe.
+                changed.add(self.directory)
+                continue
+            if mask & _IN_IGNORED:
+                self._dirs.pop(wd, None)
+                continue
+            parent = self._dirs.get(wd)
+            if parent is None:
+                continue
+            if not name:
+                changed.add(parent)  # the watched directory itself went away
+                continue
+            path = parent / os.fsdecode(name)
+            if mask & _IN_ISDIR:
+                if mask & (_IN_CREATE | _IN_MOVED_TO):
+                    if prune_dirs(parent, [path.name], self.directory, self.skip_patterns):
+                        changed |= self._add_tree(path)
+                    continue
+                if mask & _IN_MOVED_FROM:
+                    self._forget_tree(path)
+            changed.add(path)
+
+    def close(self) -> None:
+        if self._fd >= 0:
+            os.close(self._fd)
+            self._fd = -1
+
+
+def make_watcher(directory: Path, skip_patterns: List[str]) -> Watcher:
+    """inotify where available, polling otherwise (or with REVEAL_WATCH_POLL=1)."""
+    force_poll = os.environ.get('REVEAL_WATCH_POLL', '').strip().lower() in _TRUTHY
+    if sys.platform.startswith('linux') and not force_poll:
+        try:
+            return InotifyWatcher(directory, skip_patterns)
+        except (OSError, AttributeError) as e:
+            # AttributeError: a libc without the inotify symbols.
+            print(f"watch: inotify unavailable ({e}); polling every {_POLL_INTERVAL_S}s",
+                  file=sys.stderr)
+    return PollingWatcher(directory, skip_patterns)
+
+
+# ---------------------------------------------------------------------------
+# check --watch
+# ---------------------------------------------------------------------------
+
+@dataclass
+class CheckDelta:
+    """What one batch of changes did to the check results."""
+
+    changed: List[Path]
+    rechecked: int
+    cross_file_rules: List[str]
+    cross_file_files: int
+    added: List[tuple] = field(default_factory=list)     # (path, Detection)
+    resolved: List[tuple] = field(default_factory=list)  # (path, Detection)
+    total_issues: int = 0
+    files_with_issues: int = 0
+    elapsed: float = 0.0
+
+
+def _detection_key(path: Path, d) -> tuple:
+    return (path, d.rule_code, d.line, d.column, d.message)
+
+
+class CheckWatchSession:
+    """The latest detections per file, kept current one batch at a time."""
+
+    def __init__(
+        self,
+        directory: Path,
+        select: Optional[List[str]],
+        ignore: Optional[List[str]],
+        severity: Optional[str] = None,
+        exclude_patterns: Optional[List[str]] = None,
+        respect_gitignore: bool = True,
+    ) -> None:
+        self.directory = directory
+        self.select = select
+        self.ignore = ignore
+        self.severity = severity
+        self.exclude_patterns = list(exclude_patterns or [])
+        self.respect_gitignore = respect_gitignore
+        self.results: Dict[Path, list] = {}
+        self.gitignore_patterns: List[str] = []
+        self.patterns_changed = False
+        self._load_patterns()
+
+    @property
+    def skip_patterns(self) -> List[str]:
+        return self.gitignore_patterns + self.exclude_patterns
+
+    def _load_patterns(self) -> None:
+        self.gitignore_patterns = (
+            load_gitignore_patterns(self.directory) if self.respect_gitignore else [])
+
+    def _run(self, files: List[Path], select: Optional[List[str]]) -> Dict[Path, list]:
+        results = file_checker.check_files_collected(sorted(files), self.directory, select, self.ignore)
+        return {
+            file_path: file_checker._apply_severity_filter(detections, self.severity)
+            for file_path, _count, detections, _status in results
+        }
+
+    def full_check(self) -> CheckDelta:
+        """(Re-)collect and check the whole tree."""
+        start = time.perf_counter()
+        old = self.results
+        collection = file_checker.collect_files_to_check(
+            self.directory, self.gitignore_patterns, self.exclude_patterns)
+        self.results = self._run(collection.files, self.select)
+        return self._delta(old, [], len(self.results), [], 0, start)
+
+    def _checkable(self, path: Path) -> bool:
+        """Would collect_files_to_check pick *path* up?"""
+        from ..registry import get_analyzer
+        try:
+            relative = path.relative_to(self.directory)
+        except ValueError:
+            return False
+        parent = self.directory
+        for part in relative.parts[:-1]:
+            if not prune_dirs(parent, [part], self.directory, self.skip_patterns):
+                return False
+            parent = parent / part
+        if should_skip_file(relative, self.skip_patterns):
+            return False
+        return get_analyzer(str(path), allow_fallback=False) is not None
+
+    def _cross_file_codes(self, touched: List[Path]) -> List[str]:
+        """Cross-file rules in scope that apply to any of the *touched* files."""
+        from ..rules import RuleRegistry
+        return sorted(
+            rule.code for rule in RuleRegistry.get_rules(select=self.select, ignore=self.ignore)
+            if getattr(rule, 'cross_file', False)
+            and any(rule.matches_target(str(p)) for p in touched)
+        )
+
+    def apply(self, changed: Set[Path]) -> Optional[CheckDelta]:
+        """Fold one batch of changed paths into the results.
+
+        Returns None when nothing checkable was touched (a README edit under
+        ``check --select B``, a file in an ignored directory).
+        """
+        self.patterns_changed = any(
+            p.name == '.gitignore' and p.parent == self.directory for p in changed)
+        if self.directory in changed or self.patterns_changed:
+            self._load_patterns()
+            delta = self.full_check()
+            delta.changed = sorted(changed)
+            return delta
+
+        start = time.perf_counter()
+        to_check: List[Path] = []
+        removed: List[Path] = []
+        for path in sorted(changed):
+            if path.is_file():
+                if self._checkable(path):
+                    to_check.append(path)
+                elif path in self.results:
+                    removed.append(path)
+            else:
+                removed.extend(f for f in self.results if f == path or path in f.parents)
+        if not to_check and not removed:
+            return None
+
+        old = dict(self.results)
+        for path in removed:
+            self.results.pop(path, None)
+        self.results.update(self._run(to_check, self.select))
+
+        cross = self._cross_file_codes(to_check + removed)
+        rechecked = set(to_check)
+        others = [f for f in self.results if f not in rechecked]
+        if cross and others:
+            rerun = self._run(others, cross)
+            cross_set = set(cross)
+            for path in others:
+                kept = [d for d in self.results[path] if d.rule_code not in cross_set]
+                self.results[path] = kept + rerun.get(path, [])
+        return self._delta(old, sorted(changed), len(to_check), cross,
+                           len(others) if cross else 0, start)
+
+    def _delta(self, old: Dict[Path, list], changed: List[Path], rechecked: int,
+               cross: List[str], cross_files: int, start: float) -> CheckDelta:
+        before = {_detection_key(p, d): (p, d) for p, ds in old.items() for d in ds}
+        after = {_detection_key(p, d): (p, d) for p, ds in self.results.items() for d in ds}
+
+        def ordered(keys, source):
+            # file, line, column, rule — the order the one-shot report uses
+            return [source[k] for k in sorted(keys, key=lambda k: (str(k[0]), k[2], k[3], k[1]))]
+
+        return CheckDelta(
+            changed=changed,
+            rechecked=rechecked,
+            cross_file_rules=cross,
+            cross_file_files=cross_files,
+            added=ordered(after.keys() - before.keys(), after),
+            resolved=ordered(before.keys() - after.keys(), before),
+            total_issues=len(after),
+            files_with_issues=sum(1 for ds in self.results.values() if ds),
+            elapsed=time.perf_counter() - start,
+        )
+
+
+def _display_path(path: Path, directory: Path) -> str:
+    """CWD-relative like the one-shot check output, else relative to *directory*."""
+    try:
+        return to_posix(path.relative_to(Path.cwd()))
+    except ValueError:
+        try:
+            return to_posix(path.relative_to(directory))
+        except ValueError:
+            return to_posix(path)
+
+
+def _print_delta_text(delta: CheckDelta, directory: Path, initial: bool = False) -> None:
+    stamp = datetime.now().strftime('%H:%M:%S')
+    if initial:
+        header = f"checked {delta.rechecked} file(s)"
+    else:
+        header = f"{len(delta.changed)} changed → re-checked {delta.rechecked} file(s)"
+        if delta.cross_file_rules and delta.cross_file_files:
+            header += (f", {','.join(delta.cross_file_rules)} on "
+                       f"{delta.cross_file_files} more")
+    print(f"\n[{stamp}] {header} in {delta.elapsed:.2f}s")
+    for marker, pairs in (('+', delta.added), ('-', delta.resolved)):
+        for path, d in pairs:
+            print(f"  {marker} {_display_path(path, directory)}:{d.line}:{d.column} "
+                  f"{d.rule_code} {d.message}")
+    print(f"  {delta.total_issues} issue(s) in {delta.files_with_issues} file(s) "
+          f"(+{len(delta.added)} -{len(delta.resolved)})")
+
+
+def _delta_json(delta: CheckDelta, directory: Path, initial: bool = False) -> str:
+    def entries(pairs):
+        return [{
+            'file': _display_path(path, directory),
+            'line': d.line,
+            'column': d.column,
+            'rule_code': d.rule_code,
+            'message': d.message,
+            'severity': d.severity.value,
+        } for path, d in pairs]
+
+    return json.dumps({
+        'type': 'check_snapshot' if initial else 'check_delta',
+        'time': datetime.now().isoformat(timespec='seconds'),
+        'changed': [_display_path(p, directory) for p in delta.changed],
+        'rechecked': delta.rechecked,
+        'cross_file_rules': delta.cross_file_rules,
+        'cross_file_files': delta.cross_file_files,
+        'added': entries(delta.added),
+        'resolved': entries(delta.resolved),
+        'total_issues': delta.total_issues,
+        'files_with_issues': delta.files_with_issues,
+        'elapsed_s': round(delta.elapsed, 3),
+    })
+
+
+def _emit_delta(delta: CheckDelta, directory: Path, output_format: str, initial: bool = False) -> None:
+    if output_format == 'json':
+        print(_delta_json(delta, directory, initial=initial))
+    else:
+        _print_delta_text(delta, directory, initial=initial)
+    sys.stdout.flush()
+
+
+def run_check_watch(directory: Path, args: 'Namespace') -> None:
+    """``reveal check <dir> --watch``: check once, then report deltas until Ctrl-C.
+
+    Text output lists added (``+``) and resolved (``-``) issues per batch;
+    ``--format json`` prints one JSON object per line (a ``check_snapshot``
+    first, then one ``check_delta`` per batch). Exits 1 if issues remain.
+    """
+    directory = directory.resolve()
+    output_format = getattr(args, 'format', 'text')
+    if output_format not in ('text', 'json'):
+        print(f"Error: --watch supports --format text or json, not {output_format}", file=sys.stderr)
+        sys.exit(2)
+
+    session = CheckWatchSession(
+        directory,
+        select=args.select.split(',') if args.select else None,
+        ignore=args.ignore.split(',') if args.ignore else None,
+        severity=getattr(args, 'severity', None),
+        exclude_patterns=getattr(args, 'exclude', None) or [],
+        respect_gitignore=getattr(args, 'respect_gitignore', True),
+    )
+    _emit_delta(session.full_check(), directory, output_format, initial=True)
+
+    watcher = make_watcher(directory, session.skip_patterns)
+    print(f"Watching {directory} ({watcher.kind}) — Ctrl-C to stop", file=sys.stderr)
+    try:
+        while True:
+            changed = watcher.wait()
+            if not changed:
+                continue
+            delta = session.apply(changed)
+            if session.patterns_changed:
+                watcher.close()
+                watcher = make_watcher(directory, session.skip_patterns)
+            if delta is not None:
+                _emit_delta(delta, directory, output_format)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        watcher.close()
+    sys.exit(1 if any(session.results.values()) else 0)
+
+
+# ---------------------------------------------------------------------------
+# <dir> --watch
+# ---------------------------------------------------------------------------
+
+def watch_structure(directory: Path, args: 'Namespace', render: Callable[[], None]) -> None:
+    """``reveal <dir> --watch``: call *render* now and again after every batch."""
+    directory = directory.resolve()
+    exclude_patterns = getattr(args, 'exclude', None) or []
+    respect_gitignore = getattr(args, 'respect_gitignore', True)
+
+    def patterns() -> List[str]:
+        gitignore = load_gitignore_patterns(directory) if respect_gitignore else []
+        return list(gitignore) + list(exclude_patterns)
+
+    render()
+    sys.stdout.flush()
+    watcher = make_watcher(directory, patterns())
+    print(f"Watching {directory} ({watcher.kind}) — Ctrl-C to stop", file=sys.stderr)
+    try:
+        while True:
+            changed = watcher.wait()
+            if not changed:
+                continue
+            names = ', '.join(sorted(_display_path(p, directory) for p in changed)[:5])
+            more = f" +{len(changed) - 5} more" if len(changed) > 5 else ''
+            print(f"\n── {datetime.now().strftime('%H:%M:%S')} · {len(changed)} changed: {names}{more} ──")
+            render()
+            sys.stdout.flush()
+            if any(p.name == '.gitignore' and p.parent == directory for p in changed):
+                watcher.close()
+                watcher = make_watcher(directory, patterns())
+    except KeyboardInterrupt:
+        pass
+    finally:
+        watcher.close()
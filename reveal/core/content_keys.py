@@ -0,0 +1,71 @@
+"""Content keys for files whose bytes are known to equal a git blob.
+
+Reveal's per-file disk caches (the tree-sitter structure cache, the imports
+caches) key an entry on ``(path, mtime_ns, size)`` — right for a live
+checkout, useless for a ref materialized into a fresh ``TemporaryDirectory``
+(``diff/architecture_diff.materialize_ref``): every run writes new paths with
+new mtimes, so every blob of the ref is re-parsed every time, even though its
+git blob OID already names its content exactly.
+
+The materializer registers each file it writes together with that OID; the
+path-keyed caches ask ``lookup()`` first and, on a match, key their entry on
+the OID instead of the path. The entry is then shared across refs, branches
+and invocations (the disk cache already segregates entries by reveal
+version). A registration also records the file's ``(mtime_ns, size)`` at
+registration time and only applies while the stat still matches, so a file
+edited after materialization falls back to its ordinary path key.
+
+Registrations are process-local and live only for the ``registered()``
+block; with nothing registered ``lookup()`` is a single dict-emptiness check.
+"""
+
+import os
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, Optional, Tuple, Union
+
+_registry: Dict[str, Tuple[str, int, int]] = {}
+_lock = threading.Lock()
+
+
+def lookup(path_str: str, st: Optional[os.stat_result] = None) -> Optional[str]:
+    """Content key registered for absolute *path_str*, or None.
+
+    Pass *st* when the caller has already stat'ed the file.
+    """
+    if not _registry:
+        return None
+    entry = _registry.get(path_str)
+    if entry is None:
+        return None
+    if st is None:
+        try:
+            st = os.stat(path_str)
+        except OSError:
+            return None
+    key, mtime_ns, size = entry
+    if st.st_mtime_ns != mtime_ns or st.st_size != size:
+        return None
+    return key
+
+
+@contextmanager
+def registered(entries: Iterable[Tuple[Union[str, Path], str]]) -> Iterator[None]:
+    """Register ``(path, content_key)`` pairs for the duration of the block."""
+    added = []
+    with _lock:
+        for path, key in entries:
+            path_str = os.path.abspath(str(path))
+            try:
+                st = os.stat(path_str)
+            except OSError:
+                continue
+            _registry[path_str] = (key, st.st_mtime_ns, st.st_size)
+            added.append(path_str)
+    try:
+        yield
+    finally:
+        with _lock:
+            for path_str in added:
+                _registry.pop(path_str, None)
@@ -34,7 +34,7 @@ import os
 import pickle
 import tempfile
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Iterable, Optional, Tuple
 
 from ..version import __version__
 
@@ -51,6 +51,9 @@ _MAX_ENTRIES_PER_NAMESPACE = 64
 
 _DISABLED_VALUES = {"0", "false", "no", "off", ""}
 
+# Suffix for raw (non-pickle) entries — see get_file/put_bytes.
+_RAW_SUFFIX = ".bin"
+
 
 def is_enabled() -> bool:
     """True unless REVEAL_DISK_CACHE is explicitly set to a falsey value."""
@@ -77,10 +80,10 @@ def _namespace_dir(namespace: str) -> Path:
     )
 
 
-def _entry_path(namespace: str, key: str) -> Path:
+def _entry_path(namespace: str, key: str, suffix: str = ".pkl") -> Path:
     # key is expected to be a hex digest (filesystem-safe); guard anyway.
     safe_key = "".join(c for c in key if c.isalnum() or c in "-_")
-    return _namespace_dir(namespace) / f"{safe_key}.pkl"
+    return _namespace_dir(namespace) / f"{safe_key}{suffix}"
 
 
 def get(namespace: str, key: str) -> Optional[Any]:
@@ -114,15 +117,47 @@ def put(namespace: str, key: str, value: Any, max_entries: Optional[int] = None)
     try:
         ns_dir = _namespace_dir(namespace)
         ns_dir.mkdir(parents=True, exist_ok=True)
-        target = _entry_path(namespace, key)
-        # Atomic write: temp file in the same dir + os.replace.
+        _write_entry(ns_dir, namespace, key, value)
+        _prune(ns_dir, max_entries if max_entries is not None else _MAX_ENTRIES_PER_NAMESPACE)
+    except Exception:
+        # Read-only home, disk full, race — degrade silently to no caching.
+        return
+
+
+def get_file(namespace: str, key: str) -> Optional[Path]:
+    """Path of a raw binary entry written by ``put_bytes``, or None on miss.
+
+    For artifacts read in place (e.g. memory-mapped indexes) rather than
+    unpickled. The caller validates the content it maps; a file that fails
+    validation must be treated as a miss.
+    """
+    if not is_enabled():
+        return None
+    try:
+        path = _entry_path(namespace, key, _RAW_SUFFIX)
+        return path if path.is_file() else None
+    except Exception:
+        return None
+
+
+def put_bytes(namespace: str, key: str, data: bytes, max_entries: Optional[int] = None) -> None:
+    """Persist raw *data* as a binary entry (see ``get_file``). Best-effort, never raises.
+
+    Same atomic temp-file + ``os.replace`` write as ``put``, so a reader that
+    maps the file never sees it half-written.
+    """
+    if not is_enabled():
+        return
+    try:
+        ns_dir = _namespace_dir(namespace)
+        ns_dir.mkdir(parents=True, exist_ok=True)
+        target = _entry_path(namespace, key, _RAW_SUFFIX)
         fd, tmp_name = tempfile.mkstemp(dir=str(ns_dir), suffix=".tmp")
         try:
             with os.fdopen(fd, "wb") as fh:
-                pickle.dump(value, fh, protocol=pickle.HIGHEST_PROTOCOL)
+                fh.write(data)
             os.replace(tmp_name, str(target))
         except Exception:
-            # Clean up the temp file on any failure mid-write.
             try:
                 os.unlink(tmp_name)
             except OSError:
@@ -130,15 +165,54 @@ def put(namespace: str, key: str, value: Any, max_entries: Optional[int] = None)
             raise
         _prune(ns_dir, max_entries if max_entries is not None else _MAX_ENTRIES_PER_NAMESPACE)
     except Exception:
-        # Read-only home, disk full, race — degrade silently to no caching.
         return
 
 
+def put_many(namespace: str, items: Iterable[Tuple[str, Any]], max_entries: Optional[int] = None) -> None:
+    """Persist several (key, value) pairs, pruning the namespace once at the end.
+
+    Same contract as ``put`` (atomic per entry, best-effort, never raises),
+    but ``put`` prunes after every write — a directory listing + stat of
+    every entry — so writing N per-file entries one by one is O(N²) on a
+    cold tree. Per-file caches that fill in bulk should use this instead.
+    """
+    if not is_enabled():
+        return
+    try:
+        ns_dir = _namespace_dir(namespace)
+        ns_dir.mkdir(parents=True, exist_ok=True)
+        wrote = False
+        for key, value in items:
+            _write_entry(ns_dir, namespace, key, value)
+            wrote = True
+        if wrote:
+            _prune(ns_dir, max_entries if max_entries is not None else _MAX_ENTRIES_PER_NAMESPACE)
+    except Exception:
+        return
+
+
+def _write_entry(ns_dir: Path, namespace: str, key: str, value: Any) -> None:
+    """Atomically write one entry: temp file in the same dir + os.replace."""
+    target = _entry_path(namespace, key)
+    fd, tmp_name = tempfile.mkstemp(dir=str(ns_dir), suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as fh:
+            pickle.dump(value, fh, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_name, str(target))
+    except Exception:
+        # Clean up the temp file on any failure mid-write.
+        try:
+            os.unlink(tmp_name)
+        except OSError:
+            pass
+        raise
+
+
 def _prune(ns_dir: Path, max_entries: int) -> None:
     """Best-effort LRU-ish cap: keep the newest ``max_entries``."""
     try:
         entries = sorted(
-            (p for p in ns_dir.glob("*.pkl")),
+            (p for p in ns_dir.iterdir() if p.suffix in (".pkl", _RAW_SUFFIX)),
             key=lambda p: p.stat().st_mtime,
             reverse=True,
         )
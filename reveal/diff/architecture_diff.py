@@ -26,17 +26,17 @@ module's own docstrings below):
 
 * **OID memoization** (design doc "performance nuance" section) asks to
   memoize per-file parse/structure extraction by blob OID so a file whose
-  content is unchanged between the two refs isn't re-parsed. That saving can
-  only be realized by hooking into ``ImportsAdapter``/``AstAdapter``'s own
-  per-file walk — which the design doc itself rules out ("Zero changes to
-  ImportsAdapter / AstAdapter"). ``StructureCache`` below implements the
-  memoization contract correctly and is unit-tested in isolation, but it is
-  *not* wired into the hot path of the reused adapters, so it does not
-  actually save a repeat parse in the default `--against` flow today. It is
-  used for the one legitimate saving available without touching those
-  adapters: dedup within a single tree walk when the same blob OID recurs at
-  multiple paths (e.g. duplicate boilerplate files). Full cross-ref reuse
-  needs BACK-486's virtual file-map (already scoped as separate, later work).
+  content is unchanged between the two refs isn't re-parsed. The design doc
+  rules out changing ``ImportsAdapter``/``AstAdapter``, so the memoization
+  happens one level down, in the per-file caches those adapters already go
+  through: ``materialize_ref`` registers every file it writes with its blob
+  OID (``reveal.core.content_keys``), and the tree-sitter structure cache and
+  the imports caches key such files on (blob OID, language) instead of
+  (temp path, mtime, size). Entries live in the version-keyed disk cache, so
+  they are shared across refs, branches and invocations — a rerun only
+  parses blobs no earlier run has seen. ``StructureCache`` keeps the
+  in-process dedup and, when ``persistent``, stores its own results on disk
+  under the same (blob OID, language) key.
 * **Fast-exit on unchanged subtree OID** is only attempted for the common
   "working tree exactly matches HEAD, and HEAD's subtree OID for the target
   path equals the base ref's" case (via ``repo.status()`` — cheap and
@@ -48,12 +48,14 @@ module's own docstrings below):
 
 from __future__ import annotations
 
+import hashlib
 import logging
 import tempfile
 from contextlib import contextmanager
 from pathlib import Path
 from typing import Any, Dict, Iterator, List, Optional, Set, Tuple
 
+from ..core import content_keys, disk_cache
 from ..defaults import SKIP_DIRECTORIES, AMBIGUOUS_SKIP_DIRECTORIES
 
 logger = logging.getLogger(__name__)
@@ -87,6 +89,26 @@ _DEFAULT_COMPLEXITY_TOP_N = 20
 
 # ── OID-memoized structure extraction ───────────────────────────────────────
 
+# Blob structures are per-file entries, like the tree-sitter structure cache,
+# so the default 64-entry prune cap would thrash on any real tree.
+_BLOB_STRUCTURE_NAMESPACE = "blob_structure"
+_BLOB_STRUCTURE_MAX_ENTRIES = 100_000
+
+
+def _analyzer_language(path: Path) -> Optional[str]:
+    """Language tag the blob-structure key is bound to, or None if unanalyzable."""
+    from reveal.registry import get_analyzer
+
+    analyzer_class = get_analyzer(str(path), allow_fallback=False)
+    if not analyzer_class:
+        return None
+    return getattr(analyzer_class, 'language', None) or analyzer_class.__name__
+
+
+def _blob_structure_key(oid: str, language: str) -> str:
+    return hashlib.sha256(f"{oid}\x00{language}".encode("utf-8", "replace")).hexdigest()
+
+
 def _extract_structure(path: Path) -> Dict[str, Any]:
     """Parse one file's structure via the registered analyzer. Pure function
     of file content — safe to memoize by blob OID (see StructureCache)."""
@@ -106,15 +128,19 @@ class StructureCache:
     """Memoizes per-file structure extraction, keyed by git blob OID.
 
     Parsing is a pure function of content, so two paths sharing a blob OID
-    never need to be parsed twice. Never used as a cache for *derived* graph
-    metrics (fan-in/out, SCC, cohesion, complexity) — those depend on the
-    whole-tree edge set, not just a file's own content, and must always be
-    recomputed fresh per snapshot (see module docstring's performance-nuance
-    note and the design doc section it references).
+    never need to be parsed twice. With ``persistent=True`` results are also
+    kept in the disk cache under (blob OID, language) — the reveal version is
+    part of the disk cache's own layout — so later runs and other refs reuse
+    them. Never used as a cache for *derived* graph metrics (fan-in/out, SCC,
+    cohesion, complexity) — those depend on the whole-tree edge set, not just
+    a file's own content, and must always be recomputed fresh per snapshot
+    (see module docstring's performance-nuance note and the design doc
+    section it references).
     """
 
-    def __init__(self) -> None:
+    def __init__(self, persistent: bool = False) -> None:
         self._cache: Dict[str, Dict[str, Any]] = {}
+        self.persistent = persistent
         self.hits = 0
         self.misses = 0
 
@@ -123,9 +149,22 @@ class StructureCache:
         if cached is not None:
             self.hits += 1
             return cached
+        disk_key = None
+        if self.persistent:
+            language = _analyzer_language(path)
+            if language is not None:
+                disk_key = _blob_structure_key(oid, language)
+                cached = disk_cache.get(_BLOB_STRUCTURE_NAMESPACE, disk_key)
+                if cached is not None:
+                    self.hits += 1
+                    self._cache[oid] = cached
+                    return cached
         self.misses += 1
         structure = _extract_structure(path)
         self._cache[oid] = structure
+        if disk_key is not None and structure:
+            disk_cache.put(_BLOB_STRUCTURE_NAMESPACE, disk_key, structure,
+                           max_entries=_BLOB_STRUCTURE_MAX_ENTRIES)
         return structure
 
 
@@ -221,19 +260,27 @@ def materialize_ref(repo, ref: str, subpath: str, cache: Optional[StructureCache
 
     with tempfile.TemporaryDirectory(prefix='reveal-archdiff-') as tmp:
         tmp_root = Path(tmp)
-        seen_oids: Set[str] = set()
+        written: List[Tuple[Path, str]] = []
         for relpath, blob in _iter_analyzable_blobs(repo, scoped_tree):
             dest = tmp_root / relpath
             dest.parent.mkdir(parents=True, exist_ok=True)
             dest.write_bytes(blob.data)
-            oid = str(blob.id)
-            if cache is not None and oid not in seen_oids:
-                seen_oids.add(oid)
-                # Dedup within this single materialization pass: if the same
-                # blob OID recurs at another path (duplicate content), its
-                # structure is parsed once and reused — see StructureCache.
-                cache.get_structure(dest, oid)
-        yield tmp_root
+            written.append((dest, str(blob.id)))
+        # While registered, the per-file structure/imports caches key these
+        # files on their blob OID, so the snapshot run against tmp_root
+        # reuses whatever any earlier run or ref already parsed.
+        with content_keys.registered(written):
+            if cache is not None:
+                seen_oids: Set[str] = set()
+                for dest, oid in written:
+                    if oid not in seen_oids:
+                        seen_oids.add(oid)
+                        # Dedup within this single materialization pass: if the
+                        # same blob OID recurs at another path (duplicate
+                        # content), its structure is parsed once and reused —
+                        # see StructureCache.
+                        cache.get_structure(dest, oid)
+            yield tmp_root
 
 
 def _fast_exit_possible(repo, base_commit, subpath: str) -> bool:
@@ -513,7 +560,7 @@ def run_architecture_diff(
     if _fast_exit_possible(repo, base_commit, subpath):
         deltas = _empty_deltas(top_n)
     else:
-        cache = StructureCache()
+        cache = StructureCache(persistent=True)
         with materialize_ref(repo, base_ref, subpath, cache=cache) as base_root:
             base_raw = _snapshot(base_root, top_n)
             base_snapshot = _normalize_snapshot(base_raw, top_n)
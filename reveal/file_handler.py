@@ -365,7 +365,8 @@ def _dispatch_special_flags(analyzer, path: str, output_format: str, args, confi
         return True
 
     if getattr(args, 'diagnose', False):
-        _handle_diagnose(analyzer, log_path=getattr(args, 'log_path', None))
+        _handle_diagnose(analyzer, log_path=getattr(args, 'log_path', None),
+                         since=getattr(args, 'since', None))
         return True
 
     if getattr(args, 'validate_schema', None):
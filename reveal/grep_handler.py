@@ -6,14 +6,24 @@ Groups matching lines by their enclosing structural element:
   - Flat files → bare line numbers
 """
 
+import heapq
 import os
 import re
 import sys
+from bisect import bisect_left, bisect_right
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from argparse import Namespace
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+try:  # Python 3.11+
+    from re import _parser as _sre_parse
+except ImportError:  # pragma: no cover — Python 3.10
+    import sre_parse as _sre_parse  # type: ignore[no-redef]
 
 from .utils import safe_json_dumps
+from .utils.json_utils import ndjson_enabled, print_ndjson_record
+from .utils.parallel import grep_files
 from .utils.path_utils import is_skippable_dir
 
 _BINARY_EXTENSIONS = frozenset({
@@ -25,6 +35,29 @@ _BINARY_SNIFF_SIZE = 8192
 
 _BRE_ALTERNATION_RE = re.compile(r'\\\|')
 
+# Directory grep: candidate files are byte-prefiltered on a literal the regex
+# requires (utils.parallel.grep_files), then searched and structurally grouped
+# in worker processes. Below _PARALLEL_MIN_FILES candidates the pool's startup
+# cost outweighs the win and the scan runs serially.
+_PARALLEL_MIN_FILES = 16
+_PARALLEL_MAX_WORKERS = 16
+
+# Shortest required literal worth a prefilter pass.
+_MIN_PREFILTER_LITERAL = 3
+
+# Under re.IGNORECASE these ASCII letters also match non-ASCII characters
+# (İ/ı, the Kelvin sign, long s), which an ASCII byte prefilter can't see.
+_CASEFOLD_UNSAFE = frozenset('iksIKS')
+
+# Patterns whose meaning depends on what lies beyond the line (string anchors,
+# lookaround, atomic groups / possessive quantifiers that could swallow the
+# newline) are searched line by line rather than over the whole buffer.
+_PER_LINE_ONLY_RE = re.compile(r'\\[AZz]|\(\?<?[=!>]|[*+?}]\+')
+
+# str.splitlines() also breaks on these; line numbers derived from '\n'
+# offsets would drift, so such files take the per-line path.
+_EXTRA_LINE_BREAKS_RE = re.compile('[\x0b\x0c\x1c\x1d\x1e\x85\u2028\u2029]')
+
 
 def _looks_like_bre_alternation_mistake(pattern: str) -> bool:
     """Detect the common '\\|' (BRE-style alternation) mistake.
@@ -69,8 +102,7 @@ def handle_grep(path: str, pattern: str, args: Namespace) -> None:
         print(f"Error: invalid pattern '{pattern}': {e}", file=sys.stderr)
         sys.exit(1)
 
-    lines = content.splitlines()
-    hit_lines = [i for i, line in enumerate(lines, 1) if compiled.search(line)]
+    hit_lines = _find_hit_lines(content, compiled)
 
     elements = _get_structural_elements(path)
     groups = _group_by_element(hit_lines, elements)
@@ -81,6 +113,128 @@ def handle_grep(path: str, pattern: str, args: Namespace) -> None:
         _render_text(path, pattern, hit_lines, groups)
 
 
+# ── search engine ───────────────────────────────────────────────────────────
+
+def _required_literal(compiled: 're.Pattern[str]') -> Optional[str]:
+    """Longest literal run every match of ``compiled`` must contain, or None.
+
+    Walks the parsed pattern's top-level sequence (inlining groups made only
+    of literals); alternation, classes, repeats and anchors break a run. Only
+    ASCII runs are returned — the byte prefilter lowercases ASCII only — and
+    under IGNORECASE letters with non-ASCII case partners also break a run.
+    """
+    try:
+        parsed = _sre_parse.parse(compiled.pattern, compiled.flags)
+    except Exception:  # noqa: BLE001 — no literal is always a safe answer
+        return None
+    ignore_case = bool(compiled.flags & re.IGNORECASE)
+    literal_op = _sre_parse.LITERAL
+    subpattern_op = _sre_parse.SUBPATTERN
+
+    runs: List[str] = []
+    current: List[str] = []
+
+    def flush() -> None:
+        if current:
+            runs.append(''.join(current))
+            current.clear()
+
+    def walk(items) -> None:
+        for op, arg in items:
+            if op is literal_op:
+                ch = chr(arg)
+                if not ch.isascii() or (ignore_case and ch in _CASEFOLD_UNSAFE):
+                    flush()
+                else:
+                    current.append(ch)
+            elif op is subpattern_op and all(o is literal_op for o, _ in arg[-1]):
+                walk(arg[-1])
+            else:
+                flush()
+
+    walk(parsed)
+    flush()
+    best = max(runs, key=len, default='')
+    return best if len(best) >= _MIN_PREFILTER_LITERAL else None
+
+
+def _find_hit_lines(content: str, compiled: 're.Pattern[str]') -> List[int]:
+    """1-based numbers of lines (``str.splitlines`` numbering) with a match.
+
+    Runs the regex over the whole buffer (re.MULTILINE, so ^/$ still bind to
+    lines) and maps each match offset to its line by bisecting a table of
+    newline offsets; after a hit the search resumes at the next line start.
+    A match that runs past its line's end is re-checked against that line
+    alone, so hits are exactly what a per-line ``compiled.search`` finds.
+    CRLF text is normalised to LF first (same lines, same numbering).
+    Patterns with string anchors or lookaround, and text with lone CRs or
+    other exotic line breaks, fall back to the per-line loop.
+    """
+    if '\r' in content:
+        content = content.replace('\r\n', '\n')
+    if (_PER_LINE_ONLY_RE.search(compiled.pattern) or '\r' in content
+            or _EXTRA_LINE_BREAKS_RE.search(content)):
+        return [i for i, line in enumerate(content.splitlines(), 1) if compiled.search(line)]
+
+    buffer_re = re.compile(compiled.pattern, compiled.flags | re.MULTILINE)
+    match = buffer_re.search(content)
+    if match is None:
+        return []
+
+    newlines = [m.start() for m in re.finditer('\n', content)]
+    n_lines = len(newlines) + (0 if not content or content.endswith('\n') else 1)
+    hits: List[int] = []
+    while match is not None:
+        line_idx = bisect_left(newlines, match.start())
+        if line_idx >= n_lines:
+            break  # empty match after the final newline — no such line
+        line_start = newlines[line_idx - 1] + 1 if line_idx else 0
+        line_end = newlines[line_idx] if line_idx < len(newlines) else len(content)
+        if match.end() <= line_end or compiled.search(content[line_start:line_end]):
+            hits.append(line_idx + 1)
+        if line_end >= len(content):
+            break
+        match = buffer_re.search(content, line_end + 1)
+    return hits
+
+
+def _grep_worker_count(n_files: int) -> int:
+    """Workers for scanning `n_files` candidates. 1 = run serially (no pool).
+
+    `REVEAL_MAX_WORKERS` overrides everything (set to 1 to force the serial
+    path); otherwise parallelize only above `_PARALLEL_MIN_FILES`, capped at
+    `_PARALLEL_MAX_WORKERS` and the CPU count.
+    """
+    override = os.environ.get('REVEAL_MAX_WORKERS')
+    if override:
+        try:
+            return max(1, int(override))
+        except ValueError:
+            pass
+    if n_files < _PARALLEL_MIN_FILES:
+        return 1
+    return max(1, min(os.cpu_count() or 1, _PARALLEL_MAX_WORKERS))
+
+
+def _grep_one_file(
+    args: Tuple[str, 're.Pattern[str]'],
+) -> Optional[Tuple[str, List[int], List[Dict[str, Any]]]]:
+    """Search one file; return (path, hit_lines, elements) or None if no hit.
+
+    Module-level so ProcessPoolExecutor can pickle it. Structural elements
+    (served from the structure cache when warm) are only built for hit files.
+    """
+    fpath, compiled = args
+    try:
+        content = Path(fpath).read_text(errors='replace')
+    except (OSError, UnicodeDecodeError):
+        return None
+    hit_lines = _find_hit_lines(content, compiled)
+    if not hit_lines:
+        return None
+    return fpath, hit_lines, _get_structural_elements(fpath)
+
+
 # ── structural context ──────────────────────────────────────────────────────
 
 def _get_structural_elements(path: str) -> List[Dict[str, Any]]:
@@ -138,31 +292,47 @@ def _group_by_element(
     hit_lines: List[int],
     elements: List[Dict[str, Any]],
 ) -> List[Dict[str, Any]]:
-    """Map each hit line to its nearest enclosing element; return grouped list."""
+    """Map each hit line to its nearest enclosing element; return grouped list.
+
+    ``elements`` is sorted by start line (``_get_structural_elements``).
+    Hits are swept in ascending order against a heap of open intervals keyed
+    by (-start, index): after discarding intervals that ended before the hit
+    (dead for every later hit too), the top is the tightest container — the
+    largest start line that still covers the hit, earliest element on ties.
+    Hits no interval covers fall back to the nearest preceding element by
+    bisecting the start lines. O((hits + elements) log elements).
+    """
     if not hit_lines:
         return []
 
+    starts = [elem['line'] for elem in elements]
+    open_heap: List[Tuple[int, int]] = []
+    next_elem = 0
+    best_for: Dict[int, Optional[Dict[str, Any]]] = {}
+
+    for hit in sorted(set(hit_lines)):
+        while next_elem < len(elements) and starts[next_elem] <= hit:
+            heapq.heappush(open_heap, (-starts[next_elem], next_elem))
+            next_elem += 1
+        while open_heap:
+            elem = elements[open_heap[0][1]]
+            end = elem['line_end'] if elem['line_end'] is not None else elem['line']
+            if end >= hit:
+                break
+            heapq.heappop(open_heap)
+        if open_heap:
+            best_for[hit] = elements[open_heap[0][1]]
+        else:
+            # Markdown fallback: nearest preceding heading even if no line_end match
+            idx = bisect_right(starts, hit) - 1
+            best_for[hit] = elements[idx] if idx >= 0 else None
+
     # Key: (name, kind) to preserve insertion order per element
     seen: Dict[tuple, Dict[str, Any]] = {}
     ungrouped: List[int] = []
 
     for hit in hit_lines:
-        best: Optional[Dict[str, Any]] = None
-
-        # Prefer tightest containing range (largest start-line that still covers hit)
-        for elem in elements:
-            end = elem['line_end'] if elem['line_end'] is not None else elem['line']
-            if elem['line'] <= hit <= end:
-                if best is None or elem['line'] > best['line']:
-                    best = elem
-
-        # Markdown fallback: nearest preceding heading even if no line_end match
-        if best is None:
-            for elem in reversed(elements):
-                if elem['line'] <= hit:
-                    best = elem
-                    break
-
+        best = best_for[hit]
         if best is None:
             ungrouped.append(hit)
         else:
@@ -275,6 +445,9 @@ def handle_grep_directory(path: str, pattern: str, args: Namespace) -> None:
         sys.exit(1)
 
     dir_path = Path(path)
+    if output_format == 'json' and ndjson_enabled():
+        _render_dir_ndjson(dir_path, compiled, respect_gitignore, path, pattern)
+        return
     file_results, total_hits = _collect_dir_results(dir_path, compiled, respect_gitignore)
 
     if output_format == 'json':
@@ -289,11 +462,28 @@ def _collect_dir_results(
     respect_gitignore: bool = True,
 ) -> 'tuple[List[Dict[str, Any]], int]':
     """Walk dir_path and return (file_results, total_hits)."""
+    file_results = list(_iter_dir_results(dir_path, compiled, respect_gitignore))
+    return file_results, sum(len(r['hits']) for r in file_results)
+
+
+def _iter_dir_results(
+    dir_path: Path,
+    compiled: 're.Pattern[str]',
+    respect_gitignore: bool = True,
+) -> Iterator[Dict[str, Any]]:
+    """Yield one result per file of dir_path with hits, as each is searched.
+
+    Three stages: walk (serial, deterministic order) → byte prefilter on the
+    pattern's required literal, if it has one → whole-buffer search plus
+    structural grouping per candidate, in worker processes for large
+    candidate sets. Results keep walk order either way; the pool's map is
+    consumed lazily, so the first result is available as soon as its file
+    (and the ones before it) have been searched.
+    """
     from .cli.file_checker import load_gitignore_patterns, should_skip_file  # noqa: I006  # deferred: cli cycle
     gitignore_patterns = load_gitignore_patterns(dir_path) if respect_gitignore else []
 
-    file_results: List[Dict[str, Any]] = []
-    total_hits = 0
+    candidates: List[Path] = []
     for root, dirs, files in os.walk(str(dir_path)):
         dirs[:] = sorted(
             d for d in dirs
@@ -311,19 +501,28 @@ def _collect_dir_results(
                         continue
                 except ValueError:
                     pass
-            try:
-                content = fpath.read_text(errors='replace')
-            except (OSError, UnicodeDecodeError):
-                continue
-            lines = content.splitlines()
-            hit_lines = [i for i, line in enumerate(lines, 1) if compiled.search(line)]
-            if not hit_lines:
-                continue
-            total_hits += len(hit_lines)
-            elements = _get_structural_elements(str(fpath))
-            groups = _group_by_element(hit_lines, elements)
-            file_results.append({'path': str(fpath), 'hits': hit_lines, 'groups': groups})
-    return file_results, total_hits
+            candidates.append(fpath)
+
+    literal = _required_literal(compiled)
+    if literal and candidates:
+        candidates = grep_files(candidates, literal, workers=_grep_worker_count(len(candidates)))
+
+    tasks = [(str(fpath), compiled) for fpath in candidates]
+    workers = _grep_worker_count(len(tasks))
+    if workers > 1:
+        with ProcessPoolExecutor(max_workers=min(workers, len(tasks))) as pool:
+            yield from _grouped_results(pool.map(_grep_one_file, tasks, chunksize=4))
+    else:
+        yield from _grouped_results(_grep_one_file(task) for task in tasks)
+
+
+def _grouped_results(scanned) -> Iterator[Dict[str, Any]]:
+    for item in scanned:
+        if item is None:
+            continue
+        fpath_str, hit_lines, elements = item
+        groups = _group_by_element(hit_lines, elements)
+        yield {'path': fpath_str, 'hits': hit_lines, 'groups': groups}
 
 
 def _render_dir_text(
@@ -391,6 +590,37 @@ def _render_dir_json(
     }))
 
 
+def _render_dir_ndjson(
+    dir_path: Path,
+    compiled: 're.Pattern[str]',
+    respect_gitignore: bool,
+    path: str,
+    pattern: str,
+) -> None:
+    """--format ndjson: a ``file`` record per matching file as it is searched
+    (the shape of one ``files[]`` entry of the JSON output), then a summary."""
+    total_hits = 0
+    total_files = 0
+    for r in _iter_dir_results(dir_path, compiled, respect_gitignore):
+        total_hits += len(r['hits'])
+        total_files += 1
+        print_ndjson_record('file', {
+            'path': r['path'],
+            'hits': len(r['hits']),
+            'groups': [
+                {'name': g['name'], 'kind': g['kind'], 'lines': g['lines']}
+                for g in r['groups']
+            ],
+        })
+    print_ndjson_record('summary', {
+        'type': 'grep_results',
+        'path': path,
+        'pattern': pattern,
+        'total_hits': total_hits,
+        'records': {'kind': 'file', 'count': total_files},
+    })
+
+
 def _format_lines(lines: List[int]) -> str:
     if len(lines) == 1:
         return f"line {lines[0]}"
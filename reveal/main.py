@@ -18,7 +18,7 @@ from collections.abc import Callable
 
 from .registry import get_all_analyzers, TREESITTER_EXTENSION_MAP
 from . import __version__
-from .utils import copy_to_clipboard, check_for_updates, set_provenance_enabled
+from .utils import copy_to_clipboard, check_for_updates, set_provenance_enabled, set_ndjson_enabled
 from .config import disable_breadcrumbs_permanently
 
 
@@ -167,11 +167,27 @@ def _dispatch_subcommand() -> bool:
     # overview/check/pack ...) never set the flag, so --provenance always
     # silently no-op'd for them regardless of downstream attach_provenance
     # calls. Set it here too, from the subcommand's own parsed args.
-    set_provenance_enabled(getattr(args, 'provenance', False))
+    _apply_output_toggles(args)
     getattr(mod, runner_fn)(args)
     return True
 
 
+def _apply_output_toggles(args: Any) -> None:
+    """Set the process-wide JSON output toggles from parsed args.
+
+    --format ndjson is JSON with different framing: args.format becomes
+    'json' so every JSON code path runs as-is, and json_utils' ndjson toggle
+    turns the printed results into one record per line (streamed where the
+    producer supports it). Reset on every call, like --provenance, so
+    in-process callers (tests, the MCP server) never inherit a stale mode.
+    """
+    set_provenance_enabled(getattr(args, 'provenance', False))
+    ndjson = getattr(args, 'format', None) == 'ndjson'
+    set_ndjson_enabled(ndjson)
+    if ndjson:
+        args.format = 'json'
+
+
 def _setup_windows_console() -> None:
     """Configure Windows console for UTF-8/emoji support."""
     if sys.platform != 'win32':
@@ -424,7 +440,7 @@ def _main_impl() -> None:
     parser = create_argument_parser(__version__)
     args = parser.parse_args()
     validate_navigation_args(args)
-    set_provenance_enabled(getattr(args, 'provenance', False))
+    _apply_output_toggles(args)
 
     # Check for updates (once per day, non-blocking, opt-out available)
     check_for_updates()
@@ -595,6 +595,40 @@ class RuleRegistry:
             if hasattr(rule, key):
                 setattr(rule, key, value)
 
+    @staticmethod
+    def _dispatch_visitor_rules(instances, file_path, structure, content, profile, on_failure,
+                                analysis=None):
+        """Run every NodeVisitorMixin rule in *instances* through one walk per language.
+
+        Returns {rule: detections}, with None for a rule that raised (already
+        reported through *on_failure*). Rules that don't visit this file are
+        absent and run their ``check()`` as usual.
+        """
+        from .base_mixins import NodeVisitorMixin, dispatch_nodes
+
+        by_language: Dict[str, List[Any]] = {}
+        for rule in instances:
+            if isinstance(rule, NodeVisitorMixin):
+                language = rule.visit_language(file_path)
+                if language is not None:
+                    by_language.setdefault(language, []).append(rule)
+
+        visited: Dict[Any, Optional[List[Detection]]] = {}
+        for language, group in by_language.items():
+            failed = set()
+
+            def _on_error(rule, e, failed=failed):
+                failed.add(id(rule))
+                on_failure(rule.code, e)
+
+            results = dispatch_nodes(
+                group, language, file_path, structure, content,
+                profile=profile, on_error=_on_error, analysis=analysis,
+            )
+            for rule, rule_detections in zip(group, results):
+                visited[rule] = None if id(rule) in failed else rule_detections
+        return visited
+
     @classmethod
     def check_file(cls,
                    file_path: str,
@@ -603,7 +637,8 @@ class RuleRegistry:
                    select: Optional[List[str]] = None,
                    ignore: Optional[List[str]] = None,
                    profile: Optional[Dict[str, float]] = None,
-                   errors: Optional[List[Dict[str, str]]] = None) -> List[Detection]:
+                   errors: Optional[List[Dict[str, str]]] = None,
+                   analyzer: Any = None) -> List[Detection]:
         """
         Run all applicable rules against a file.
 
@@ -624,6 +659,10 @@ class RuleRegistry:
                 visible only in the stderr log (BACK-1083) — callers that want
                 the failure surfaced in the check output contract pass a list;
                 omitting it preserves the prior log-only behavior.
+            analyzer: The analyzer that produced *structure*/*content*, if the
+                caller has one. Its tree-sitter tree and node-kind index are
+                handed to rules through the per-file ``FileAnalysis``
+                (``rule.analysis``), so rules don't reparse the file.
 
         Returns:
             List of all detections from all rules
@@ -641,6 +680,20 @@ class RuleRegistry:
         rules = cls.get_rules(select=select, ignore=ignore)
         detections: List[Detection] = []
 
+        def _record_failure(code: str, e: Exception) -> None:
+            logger.error(
+                f"Rule {code} failed on {file_path}: {e}",
+                exc_info=True
+            )
+            if errors is not None:
+                errors.append({"rule": code, "error": f"{type(e).__name__}: {e}"})
+
+        # One parse per language for the whole run, shared by every rule.
+        from .file_analysis import FileAnalysis
+        analysis = FileAnalysis(file_path, content, analyzer=analyzer)
+
+        # Pass 1: pick and configure the rule instances that run on this file.
+        instances = []
         for rule_class in rules:
             # Check if rule applies to this file (classmethod — no instantiation)
             if not rule_class.matches_target(file_path):
@@ -654,7 +707,6 @@ class RuleRegistry:
                 continue
 
             try:
-                # Instantiate rule and run check
                 rule = rule_class()
 
                 # Pass config values to rule if it needs them
@@ -662,25 +714,39 @@ class RuleRegistry:
                 rule_config = rules_config.get(rule_class.code, {})
                 if rule_config and isinstance(rule_config, dict):
                     cls._apply_rule_config(rule, rule_config)
-
-                if profile is not None:
-                    start = time.perf_counter()
-                    rule_detections = rule.check(file_path, structure, content)
-                    profile[rule_class.code] = profile.get(rule_class.code, 0.0) + (time.perf_counter() - start)
-                else:
-                    rule_detections = rule.check(file_path, structure, content)
-                detections.extend(rule_detections)
-                num_issues = len(rule_detections)
-                logger.debug(
-                    f"Rule {rule_class.code} found {num_issues} issues in {file_path}"
-                )
             except Exception as e:
-                logger.error(
-                    f"Rule {rule_class.code} failed on {file_path}: {e}",
-                    exc_info=True
-                )
-                if errors is not None:
-                    errors.append({"rule": rule_class.code, "error": f"{type(e).__name__}: {e}"})
+                _record_failure(rule_class.code, e)
+                continue
+            rule.analysis = analysis
+            instances.append(rule)
+
+        # Pass 2: node-visitor rules share one parse and one walk per language
+        # instead of each walking the whole tree (see NodeVisitorMixin).
+        visited = cls._dispatch_visitor_rules(
+            instances, file_path, structure, content, profile, _record_failure, analysis)
+
+        # Pass 3: collect results in rule order; everything else runs check().
+        for rule in instances:
+            code = rule.code
+            if rule in visited:
+                rule_detections = visited[rule]
+                if rule_detections is None:
+                    continue  # failed during dispatch, already recorded
+            else:
+                try:
+                    if profile is not None:
+                        start = time.perf_counter()
+                        rule_detections = rule.check(file_path, structure, content)
+                        profile[code] = profile.get(code, 0.0) + (time.perf_counter() - start)
+                    else:
+                        rule_detections = rule.check(file_path, structure, content)
+                except Exception as e:
+                    _record_failure(code, e)
+                    continue
+            detections.extend(rule_detections)
+            logger.debug(
+                f"Rule {code} found {len(rule_detections)} issues in {file_path}"
+            )
 
         return detections
 
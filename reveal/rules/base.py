@@ -255,6 +255,14 @@ class BaseRule(ABC):
     thresholds: Dict[str, Any] = {}
     # Optional: brief compliant code example shown via --explain
     compliant_example: str = ""
+    # True for rules whose verdict on one file depends on *other* files (import
+    # cycles, orphans, unresolvable imports, cross-file duplicates). `check
+    # --watch` re-runs these on every file when a matching file changes, and
+    # everything else only on the files that changed.
+    cross_file: bool = False
+    # Per-file parse artifacts (FileAnalysis), attached by RuleRegistry.check_file
+    # before check() runs. None when a rule is called directly.
+    analysis: Optional[Any] = None
 
     def __init__(self) -> None:
         self._config: Optional[Any] = None  # Lazy-loaded per-instance
@@ -282,6 +290,16 @@ class BaseRule(ABC):
                 self._config = MockConfig()
         return self._config
 
+    def source_lines(self, content: str) -> List[str]:
+        """``content.splitlines()``, shared with other rules via ``self.analysis``.
+
+        The returned list may be shared — don't mutate it.
+        """
+        analysis = self.analysis
+        if analysis is not None and analysis.content is content:
+            return analysis.lines
+        return content.splitlines()
+
     def get_threshold(self, key: str, default: Any) -> Any:
         """Get a configuration threshold for this rule.
 
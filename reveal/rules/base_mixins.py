@@ -6,23 +6,18 @@ to reduce boilerplate and ensure consistent behavior.
 
 import ast
 import functools
+from abc import ABC, abstractmethod
 import logging
-from typing import Optional
+import time
+from typing import Any, Callable, Dict, FrozenSet, List, Optional, Sequence, Tuple
 
 from ..core import _zero_arg
 
 logger = logging.getLogger(__name__)
 
 
-@functools.lru_cache(maxsize=4)
-def _cached_treesitter_parse(content: str, file_path: str, language: str):
-    """Parse non-Python content into a tree-sitter root node, LRU-cached.
-
-    Keyed by (content, file_path, language) — same rationale as
-    ``_cached_ast_parse``. Returns None on any parse failure (unknown
-    language, grammar not installed, etc.) rather than raising, so callers
-    can use the same "skip" pattern as the Python AST mixin.
-    """
+def _parse_treesitter_root(content: str, file_path: str, language: str):
+    """Parse *content* into a tree-sitter root node, or None on any failure."""
     try:
         from tree_sitter_language_pack import get_parser
 
@@ -40,13 +35,22 @@ def _cached_treesitter_parse(content: str, file_path: str, language: str):
 
 
 @functools.lru_cache(maxsize=4)
-def _cached_ast_parse(content: str, file_path: str) -> Optional[ast.AST]:
-    """Parse Python content into AST with LRU cache.
+def _cached_treesitter_parse(content: str, file_path: str, language: str):
+    """Parse non-Python content into a tree-sitter root node, LRU-cached.
 
-    Keyed by (content, file_path) so the same file processed by multiple
-    rules in one check_file() call hits the cache instead of re-parsing.
-    maxsize=4 keeps memory bounded while covering all rules on one file.
+    Keyed by (content, file_path, language) — same rationale as
+    ``_cached_ast_parse``. Returns None on any parse failure (unknown
+    language, grammar not installed, etc.) rather than raising, so callers
+    can use the same "skip" pattern as the Python AST mixin.
+
+    Fallback for rules run outside ``RuleRegistry.check_file``; inside it,
+    the per-file ``FileAnalysis`` supplies the tree without hashing content.
     """
+    return _parse_treesitter_root(content, file_path, language)
+
+
+def _parse_python_ast(content: str, file_path: str) -> Optional[ast.AST]:
+    """Parse Python *content* into an AST, or None (logged) on failure."""
     try:
         return ast.parse(content, filename=file_path)
     except SyntaxError as e:
@@ -57,6 +61,33 @@ def _cached_ast_parse(content: str, file_path: str) -> Optional[ast.AST]:
         return None
 
 
+@functools.lru_cache(maxsize=4)
+def _cached_ast_parse(content: str, file_path: str) -> Optional[ast.AST]:
+    """Parse Python content into AST with LRU cache.
+
+    Keyed by (content, file_path) so the same file processed by multiple
+    rules in one check_file() call hits the cache instead of re-parsing.
+    maxsize=4 keeps memory bounded while covering all rules on one file.
+    Inside ``RuleRegistry.check_file`` rules get the tree from the per-file
+    ``FileAnalysis`` instead (see ``ASTParsingMixin._parse_python``).
+    """
+    return _parse_python_ast(content, file_path)
+
+
+def _cached_ast_nodes(tree: ast.AST) -> list:
+    """Flattened ``ast.walk`` of *tree*, built once and cached on the tree object.
+
+    Shared by ``ASTParsingMixin._ast_walk`` and ``dispatch_nodes``; callers
+    must not mutate the returned list.
+    """
+    try:
+        return tree._cached_walk  # type: ignore[attr-defined]
+    except AttributeError:
+        nodes = list(ast.walk(tree))
+        tree._cached_walk = nodes  # type: ignore[attr-defined]
+        return nodes
+
+
 class ASTParsingMixin:
     """Mixin for rules that need to parse Python AST.
 
@@ -85,6 +116,9 @@ class ASTParsingMixin:
         Returns:
             AST tree if parsing succeeds, None on SyntaxError
         """
+        analysis = getattr(self, 'analysis', None)
+        if analysis is not None and analysis.covers(file_path, content):
+            return analysis.python_ast()
         return _cached_ast_parse(content, file_path)
 
     def _ast_walk(self, tree: ast.AST) -> list:
@@ -97,12 +131,7 @@ class ASTParsingMixin:
 
         Use instead of ``ast.walk(tree)`` in rule check() methods.
         """
-        try:
-            return list(tree._cached_walk)  # type: ignore[attr-defined]
-        except AttributeError:
-            nodes = list(ast.walk(tree))
-            tree._cached_walk = nodes  # type: ignore[attr-defined]
-            return nodes
+        return list(_cached_ast_nodes(tree))
 
     def _parse_python_or_skip(self, content: str, file_path: str = "<unknown>") -> tuple[Optional[ast.AST], list]:
         """Parse Python or return empty detections list.
@@ -154,7 +183,14 @@ class TreeSitterParsingMixin:
     """
 
     def _parse_treesitter(self, content: str, file_path: str, language: str):
-        """Parse content with tree-sitter, returning the root node or None."""
+        """Parse content with tree-sitter, returning the root node or None.
+
+        Reuses the analyzer's tree via the rule's ``FileAnalysis`` when the
+        language matches (see ``ASTParsingMixin._parse_python``).
+        """
+        analysis = getattr(self, 'analysis', None)
+        if analysis is not None and analysis.covers(file_path, content):
+            return analysis.ts_root(language)
         return _cached_treesitter_parse(content, file_path, language)
 
     def _parse_treesitter_or_skip(self, content: str, file_path: str, language: str) -> tuple:
@@ -186,3 +222,235 @@ class TreeSitterParsingMixin:
         start = _zero_arg(node, 'start_byte')
         end = _zero_arg(node, 'end_byte')
         return content_bytes[start:end].decode('utf-8', errors='replace')
+
+
+PYTHON_AST = 'python-ast'
+
+
+class NodeVisitorMixin(ABC):
+    """Mixin for rules that only need to see nodes of certain types.
+
+    Instead of walking the tree itself, a visitor rule declares which nodes it
+    cares about and handles them one at a time. ``RuleRegistry.check_file``
+    then parses each file once, walks it once, and hands every node only to
+    the rules that asked for its type (``dispatch_nodes``) — so N visitor
+    rules on a file cost one traversal, not N, and adding a rule adds only
+    its handler calls.
+
+    Declare interest with:
+
+    * ``AST_NODE_TYPES`` — Python ``ast`` classes, matched with ``isinstance``
+      semantics (a base class such as ``ast.stmt`` receives every subclass);
+    * ``TS_NODE_KINDS`` — tree-sitter language → node ``kind`` strings.
+
+    ``visit_language`` picks which of the two applies to a file (or None to
+    fall back to the rule's own ``check`` path for its non-visitor branches,
+    e.g. S001's YAML/TOML scanning).
+    Per-file state lives on the instance: ``begin_visit`` resets it,
+    ``visit_node`` accumulates into ``self._detections``, ``end_visit``
+    returns the result. Rule instances are created per file, so no state
+    leaks between files. A Python rule that has to look upward from a node
+    (enclosing Try, function or class) asks ``_ast_parents`` for a lazily
+    built parent map rather than walking the tree again itself.
+
+    ``check`` stays usable on its own (tests, direct callers) through
+    ``_check_by_visiting``, which runs the same dispatch for this rule alone.
+
+    Example:
+        class T005(BaseRule, ASTParsingMixin, NodeVisitorMixin):
+            AST_NODE_TYPES = (ast.FunctionDef, ast.AsyncFunctionDef)
+
+            def check(self, file_path, structure, content):
+                return self._check_by_visiting(file_path, structure, content)
+
+            def visit_node(self, node):
+                ...  # append to self._detections
+    """
+
+    AST_NODE_TYPES: Tuple[type, ...] = ()
+    TS_NODE_KINDS: Dict[str, FrozenSet[str]] = {}
+
+    def visit_language(self, file_path: str) -> Optional[str]:
+        """``PYTHON_AST``, a tree-sitter language, or None if this file isn't visited.
+
+        The default suits Python-only rules, whose ``file_patterns`` already
+        restrict them to Python files: visit with ``ast`` whenever
+        ``AST_NODE_TYPES`` is declared. Multi-language rules override this.
+        """
+        return PYTHON_AST if self.AST_NODE_TYPES else None
+
+    def begin_visit(self, file_path: str, structure: Optional[Dict[str, Any]],
+                    content: str, root: Any) -> bool:
+        """Reset per-file state before the walk. Return False to skip this file."""
+        self._file_path = file_path
+        self._content = content
+        self._root = root
+        self._parents: Optional[Dict[Any, Any]] = None
+        self._detections: List[Any] = []
+        return True
+
+    @abstractmethod
+    def visit_node(self, node: Any) -> None:
+        """Handle one node of a declared type."""
+
+    def _ast_parents(self) -> Dict[ast.AST, ast.AST]:
+        """Child → parent map of the Python tree being visited, built on first use.
+
+        Costs a second walk, so call it only once a node has already passed
+        every check that doesn't need to look upward.
+        """
+        if self._parents is None:
+            self._parents = {
+                child: parent
+                for parent in _cached_ast_nodes(self._root)
+                for child in ast.iter_child_nodes(parent)
+            }
+        return self._parents
+
+    def end_visit(self) -> List[Any]:
+        """Detections collected for the file."""
+        return self._detections
+
+    def _check_by_visiting(self, file_path: str, structure: Optional[Dict[str, Any]],
+                           content: str) -> List[Any]:
+        language = self.visit_language(file_path)
+        if language is None:
+            return []
+        return dispatch_nodes([self], language, file_path, structure, content)[0]
+
+
+def _parse_for_language(language: str, content: str, file_path: str, analysis=None):
+    if analysis is not None and analysis.covers(file_path, content):
+        return analysis.python_ast() if language == PYTHON_AST else analysis.ts_root(language)
+    if language == PYTHON_AST:
+        return _cached_ast_parse(content, file_path)
+    return _cached_treesitter_parse(content, file_path, language)
+
+
+def _iter_nodes(language: str, root):
+    if language == PYTHON_AST:
+        return _cached_ast_nodes(root)
+    from ..core import iter_tree
+    return iter_tree(root)
+
+
+def _iter_bucketed_nodes(buckets: Dict[str, list], kinds: FrozenSet[str]) -> list:
+    """Nodes of *kinds* from a kind → nodes index, in document order.
+
+    Each bucket is already in pre-order, so a single kind needs no sort;
+    several kinds are merged by position (outer node first on a shared start).
+    """
+    from ..core import _zero_arg as _node_attr
+    present = [buckets[k] for k in kinds if k in buckets]
+    if len(present) == 1:
+        return present[0]
+    merged = [node for bucket in present for node in bucket]
+    merged.sort(key=lambda n: (_node_attr(n, 'start_byte'), -_node_attr(n, 'end_byte')))
+    return merged
+
+
+def dispatch_nodes(
+    rules: Sequence[NodeVisitorMixin],
+    language: str,
+    file_path: str,
+    structure: Optional[Dict[str, Any]],
+    content: str,
+    profile: Optional[Dict[str, float]] = None,
+    on_error: Optional[Callable[[NodeVisitorMixin, Exception], None]] = None,
+    analysis: Any = None,
+) -> List[List[Any]]:
+    """Parse *content* once, walk it once, and feed each node to the rules that want it.
+
+    Returns one detection list per rule, in *rules* order. A parse failure
+    yields empty lists (the same "skip" every rule's own parse path takes).
+    A rule that raises in any hook is reported through *on_error* (or
+    re-raised when there is no handler), dropped from the rest of the walk,
+    and gets an empty result — one broken rule can't starve the others of
+    nodes. *profile*, when given, accumulates each rule's hook time under
+    its ``code``, as ``RuleRegistry.check_file`` does for ``check()``.
+
+    With a ``FileAnalysis`` (*analysis*) the tree comes from it, and a
+    tree-sitter walk is replaced by reading just the wanted kinds out of its
+    node-kind index — usually the analyzer's own, built during
+    ``get_structure``.
+    """
+    results: List[List[Any]] = [[] for _ in rules]
+    root = _parse_for_language(language, content, file_path, analysis)
+    if root is None:
+        return results
+
+    failed = set()
+
+    def _fail(i: int, exc: Exception) -> None:
+        failed.add(i)
+        if on_error is None:
+            raise exc
+        on_error(rules[i], exc)
+
+    def _call(i: int, fn: Callable, *args):
+        if profile is None:
+            return fn(*args)
+        code = getattr(rules[i], 'code', type(rules[i]).__name__)
+        start = time.perf_counter()
+        try:
+            return fn(*args)
+        finally:
+            profile[code] = profile.get(code, 0.0) + (time.perf_counter() - start)
+
+    active = []
+    for i, rule in enumerate(rules):
+        try:
+            if _call(i, rule.begin_visit, file_path, structure, content, root):
+                active.append(i)
+        except Exception as e:
+            _fail(i, e)
+
+    if language == PYTHON_AST:
+        wanted = {i: rules[i].AST_NODE_TYPES for i in active}
+
+        def _key(node):
+            return type(node)
+
+        def _interested(node_type) -> List[int]:
+            return [i for i in active if issubclass(node_type, wanted[i])]
+    else:
+        wanted = {i: rules[i].TS_NODE_KINDS.get(language, frozenset()) for i in active}
+        from ..core import _zero_arg as _node_attr
+
+        def _key(node):
+            return _node_attr(node, 'kind')
+
+        def _interested(kind) -> List[int]:
+            return [i for i in active if kind in wanted[i]]
+
+    nodes = None
+    if language != PYTHON_AST and analysis is not None and analysis.covers(file_path, content):
+        buckets = analysis.nodes_by_kind(language)
+        if buckets is not None:
+            nodes = _iter_bucketed_nodes(buckets, frozenset().union(*wanted.values()))
+    if nodes is None:
+        nodes = _iter_nodes(language, root)
+
+    # Node key → interested rule indexes, resolved on first sight of each key.
+    table: Dict[Any, List[int]] = {}
+    for node in nodes:
+        key = _key(node)
+        targets = table.get(key)
+        if targets is None:
+            targets = table[key] = _interested(key)
+        for i in targets:
+            if i in failed:
+                continue
+            try:
+                _call(i, rules[i].visit_node, node)
+            except Exception as e:
+                _fail(i, e)
+
+    for i in active:
+        if i in failed:
+            continue
+        try:
+            results[i] = _call(i, rules[i].end_visit)
+        except Exception as e:
+            _fail(i, e)
+    return results
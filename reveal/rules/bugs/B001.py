@@ -16,11 +16,11 @@ import ast
 from typing import List, Dict, Any, Optional
 
 from ..base import BaseRule, Detection, RulePrefix, Severity
-from ..base_mixins import ASTParsingMixin, TreeSitterParsingMixin
+from ..base_mixins import PYTHON_AST, ASTParsingMixin, NodeVisitorMixin, TreeSitterParsingMixin
 from ...core import node_children, _zero_arg
 
 
-class B001(BaseRule, ASTParsingMixin, TreeSitterParsingMixin):
+class B001(BaseRule, ASTParsingMixin, TreeSitterParsingMixin, NodeVisitorMixin):
     """Detect bare/untyped except-all catch clauses."""
 
     code = "B001"
@@ -32,6 +32,13 @@ class B001(BaseRule, ASTParsingMixin, TreeSitterParsingMixin):
 
     _CS_LANGUAGE = 'csharp'
     _CPP_LANGUAGE = 'cpp'
+    _CPP_EXTENSIONS = ('.cpp', '.cc', '.cxx', '.hpp', '.hh', '.h++')
+
+    AST_NODE_TYPES = (ast.ExceptHandler,)
+    TS_NODE_KINDS = {
+        _CS_LANGUAGE: frozenset({'catch_clause'}),
+        _CPP_LANGUAGE: frozenset({'catch_clause'}),
+    }
 
     @staticmethod
     def _get_except_context(content: str, node) -> Optional[str]:
@@ -57,86 +64,77 @@ class B001(BaseRule, ASTParsingMixin, TreeSitterParsingMixin):
         Returns:
             List of detections
         """
+        return self._check_by_visiting(file_path, structure, content)
+
+    def visit_language(self, file_path: str) -> Optional[str]:
         if file_path.endswith('.cs'):
-            return self._check_csharp(file_path, content)
-        if file_path.endswith(('.cpp', '.cc', '.cxx', '.hpp', '.hh', '.h++')):
-            return self._check_cpp(file_path, content)
-
-        tree, detections = self._parse_python_or_skip(content, file_path)
-        if tree is None:
-            return detections
-
-        # Walk the AST looking for bare except handlers
-        for node in self._ast_walk(tree):
-            if isinstance(node, ast.ExceptHandler) and node.type is None:
-                context = self._get_except_context(content, node)
-                detections.append(self.create_detection(
-                        file_path=file_path,
-                        line=node.lineno,
-                        column=node.col_offset + 1,  # AST is 0-indexed, display is 1-indexed
-                        suggestion="Use 'except Exception:' or specific exception types (ValueError, IOError, etc.)",
-                        context=context
-                    ))
-
-        return detections
+            return self._CS_LANGUAGE
+        if file_path.endswith(self._CPP_EXTENSIONS):
+            return self._CPP_LANGUAGE
+        return PYTHON_AST
+
+    def begin_visit(self, file_path, structure, content, root) -> bool:
+        super().begin_visit(file_path, structure, content, root)
+        self._content_bytes = content.encode('utf-8')
+        return True
+
+    def visit_node(self, node) -> None:
+        if isinstance(node, ast.ExceptHandler):
+            self._visit_except_handler(node)
+        elif self._file_path.endswith('.cs'):
+            self._visit_csharp_catch(node)
+        else:
+            self._visit_cpp_catch(node)
+
+    def _visit_except_handler(self, node: ast.ExceptHandler) -> None:
+        """Python: flag ``except:`` with no exception type."""
+        if node.type is not None:
+            return
+        context = self._get_except_context(self._content, node)
+        self._detections.append(self.create_detection(
+                file_path=self._file_path,
+                line=node.lineno,
+                column=node.col_offset + 1,  # AST is 0-indexed, display is 1-indexed
+                suggestion="Use 'except Exception:' or specific exception types (ValueError, IOError, etc.)",
+                context=context
+            ))
 
     # ── C# (BACK-1011) ───────────────────────────────────────────────────────
 
-    def _check_csharp(self, file_path: str, content: str) -> List[Detection]:
-        """Check C# source for a bare `catch { }` — no `catch_declaration` at
-        all, so no exception type is named anywhere in the clause."""
-        root, detections = self._parse_treesitter_or_skip(content, file_path, self._CS_LANGUAGE)
-        if root is None:
-            return detections
-
-        content_bytes = content.encode('utf-8')
-        for node in self._ts_walk(root):
-            if _zero_arg(node, 'kind') != 'catch_clause':
-                continue
-            if any(_zero_arg(c, 'kind') == 'catch_declaration' for c in node_children(node)):
-                continue
-
-            detections.append(self.create_detection(
-                file_path=file_path,
-                line=node.start_position().row + 1,
-                column=node.start_position().column + 1,
-                message="Bare 'catch { }' names no exception type, catching everything",
-                suggestion="Catch a specific exception type instead of a bare 'catch { }'.",
-                context=self._ts_node_text(node, content_bytes).split('\n')[0],
-            ))
-
-        return detections
+    def _visit_csharp_catch(self, node) -> None:
+        """C#: a bare `catch { }` — no `catch_declaration` at all, so no
+        exception type is named anywhere in the clause."""
+        if any(_zero_arg(c, 'kind') == 'catch_declaration' for c in node_children(node)):
+            return
+
+        self._detections.append(self.create_detection(
+            file_path=self._file_path,
+            line=node.start_position().row + 1,
+            column=node.start_position().column + 1,
+            message="Bare 'catch { }' names no exception type, catching everything",
+            suggestion="Catch a specific exception type instead of a bare 'catch { }'.",
+            context=self._ts_node_text(node, self._content_bytes).split('\n')[0],
+        ))
 
     # ── C++ (BACK-1011) ──────────────────────────────────────────────────────
 
-    def _check_cpp(self, file_path: str, content: str) -> List[Detection]:
-        """Check C++ source for `catch (...)` — the ellipsis handler, which
-        catches literally anything thrown (including non-exception-derived
-        values `.what()` can't be called on), not just `std::exception` and
-        its subtypes."""
-        root, detections = self._parse_treesitter_or_skip(content, file_path, self._CPP_LANGUAGE)
-        if root is None:
-            return detections
-
-        content_bytes = content.encode('utf-8')
-        for node in self._ts_walk(root):
-            if _zero_arg(node, 'kind') != 'catch_clause':
-                continue
-            param_list = next(
-                (c for c in node_children(node) if _zero_arg(c, 'kind') == 'parameter_list'), None
-            )
-            if param_list is None:
-                continue
-            if not any(_zero_arg(c, 'kind') == '...' for c in node_children(param_list)):
-                continue
-
-            detections.append(self.create_detection(
-                file_path=file_path,
-                line=node.start_position().row + 1,
-                column=node.start_position().column + 1,
-                message="'catch (...)' catches everything, including non-exception thrown values",
-                suggestion="Catch std::exception (or a specific type) instead of 'catch (...)'.",
-                context=self._ts_node_text(node, content_bytes).split('\n')[0],
-            ))
-
-        return detections
+    def _visit_cpp_catch(self, node) -> None:
+        """C++: `catch (...)` — the ellipsis handler, which catches literally
+        anything thrown (including non-exception-derived values `.what()`
+        can't be called on), not just `std::exception` and its subtypes."""
+        param_list = next(
+            (c for c in node_children(node) if _zero_arg(c, 'kind') == 'parameter_list'), None
+        )
+        if param_list is None:
+            return
+        if not any(_zero_arg(c, 'kind') == '...' for c in node_children(param_list)):
+            return
+
+        self._detections.append(self.create_detection(
+            file_path=self._file_path,
+            line=node.start_position().row + 1,
+            column=node.start_position().column + 1,
+            message="'catch (...)' catches everything, including non-exception thrown values",
+            suggestion="Catch std::exception (or a specific type) instead of 'catch (...)'.",
+            context=self._ts_node_text(node, self._content_bytes).split('\n')[0],
+        ))
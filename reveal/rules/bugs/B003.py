@@ -37,13 +37,13 @@ import logging
 from typing import List, Dict, Any, Optional
 
 from ..base import BaseRule, Detection, RulePrefix, Severity
-from ..base_mixins import TreeSitterParsingMixin
+from ..base_mixins import NodeVisitorMixin, TreeSitterParsingMixin
 from ...core import node_children, _zero_arg
 
 logger = logging.getLogger(__name__)
 
 
-class B003(BaseRule, TreeSitterParsingMixin):
+class B003(BaseRule, TreeSitterParsingMixin, NodeVisitorMixin):
     """Detect @property methods with overly complex bodies."""
 
     code = "B003"
@@ -60,6 +60,12 @@ class B003(BaseRule, TreeSitterParsingMixin):
     _KOTLIN_LANGUAGE = 'kotlin'
     _SWIFT_LANGUAGE = 'swift'
 
+    TS_NODE_KINDS = {
+        _CS_LANGUAGE: frozenset({'property_declaration'}),
+        _KOTLIN_LANGUAGE: frozenset({'getter'}),
+        _SWIFT_LANGUAGE: frozenset({'property_declaration'}),
+    }
+
     thresholds = {"max_lines": MAX_PROPERTY_LINES}
     compliant_example = """\
 @property
@@ -72,100 +78,102 @@ def compute_status(self) -> str:
         return "error"
     return self._status"""
 
+    def visit_language(self, file_path: str) -> Optional[str]:
+        # Python is measured from the analyzer's structure, not a tree walk.
+        if file_path.endswith('.cs'):
+            return self._CS_LANGUAGE
+        if file_path.endswith(('.kt', '.kts')):
+            return self._KOTLIN_LANGUAGE
+        if file_path.endswith('.swift'):
+            return self._SWIFT_LANGUAGE
+        return None
+
+    def begin_visit(self, file_path, structure, content, root) -> bool:
+        super().begin_visit(file_path, structure, content, root)
+        self._language = self.visit_language(file_path)
+        self._content_bytes = content.encode('utf-8')
+        return True
+
+    def visit_node(self, node) -> None:
+        if self._language == self._CS_LANGUAGE:
+            self._visit_csharp_property(node)
+        elif self._language == self._KOTLIN_LANGUAGE:
+            self._visit_kotlin_getter(node)
+        else:
+            self._visit_swift_property(node)
+
     # ── C# (BACK-1011) ───────────────────────────────────────────────────────
 
-    def _check_csharp(self, file_path: str, content: str) -> List[Detection]:
+    def _visit_csharp_property(self, node) -> None:
         """Check C# `get` accessor blocks for line count, mirroring the
         Python @property check. Auto-properties (`{ get; set; }`, no block)
         and expression-bodied properties (`=> expr`, always one line) have
         nothing to measure and are skipped."""
-        root, detections = self._parse_treesitter_or_skip(content, file_path, self._CS_LANGUAGE)
-        if root is None:
-            return detections
-
-        for node in self._ts_walk(root):
-            if _zero_arg(node, 'kind') != 'property_declaration':
-                continue
-
-            accessor_list = next(
-                (c for c in node_children(node) if _zero_arg(c, 'kind') == 'accessor_list'), None
-            )
-            if accessor_list is None:
-                continue  # expression-bodied property, e.g. `public string X => _x;`
-
-            name = next(
-                (self._ts_node_text(c, content.encode('utf-8'))
-                 for c in node_children(node) if _zero_arg(c, 'kind') == 'identifier'),
-                '?'
-            )
-
-            for accessor in node_children(accessor_list):
-                if _zero_arg(accessor, 'kind') != 'accessor_declaration':
-                    continue
-                keyword, block = None, None
-                for c in node_children(accessor):
-                    k = _zero_arg(c, 'kind')
-                    if k in ('get', 'set'):
-                        keyword = k
-                    elif k == 'block':
-                        block = c
-                if keyword != 'get' or block is None:
-                    continue  # auto-property accessor (`get;`) or a `set`
-
-                line = block.start_position().row + 1
-                end_line = block.end_position().row + 1
-                line_count = end_line - line + 1
-                if line_count > self.MAX_PROPERTY_LINES:
-                    detections.append(self.create_detection(
-                        file_path=file_path,
-                        line=line,
-                        message=f"@property '{name}' is {line_count} lines (max {self.MAX_PROPERTY_LINES})",
-                        suggestion=f"Consider converting to a regular method: string Get{name}()",
-                        context=f"get accessor with {line_count} lines - properties should be simple getters"
-                    ))
-
-        return detections
-
-    # ── Kotlin (BACK-1011) ───────────────────────────────────────────────────
-
-    def _check_kotlin(self, file_path: str, content: str) -> List[Detection]:
-        """Check Kotlin `getter` blocks for line count. Handles both the
-        sibling-of-property_declaration and nested-in-property_declaration
-        grammar shapes — see module docstring."""
-        root, detections = self._parse_treesitter_or_skip(content, file_path, self._KOTLIN_LANGUAGE)
-        if root is None:
-            return detections
-
-        content_bytes = content.encode('utf-8')
+        accessor_list = next(
+            (c for c in node_children(node) if _zero_arg(c, 'kind') == 'accessor_list'), None
+        )
+        if accessor_list is None:
+            return  # expression-bodied property, e.g. `public string X => _x;`
 
-        for node in self._ts_walk(root):
-            if _zero_arg(node, 'kind') != 'getter':
-                continue
+        name = next(
+            (self._ts_node_text(c, self._content_bytes)
+             for c in node_children(node) if _zero_arg(c, 'kind') == 'identifier'),
+            '?'
+        )
 
-            function_body = next(
-                (c for c in node_children(node) if _zero_arg(c, 'kind') == 'function_body'), None
-            )
-            if function_body is None:
+        for accessor in node_children(accessor_list):
+            if _zero_arg(accessor, 'kind') != 'accessor_declaration':
                 continue
-
-            body_children = node_children(function_body)
-            if not body_children or _zero_arg(body_children[0], 'kind') != '{':
-                continue  # expression-bodied `get() = expr` — nothing to measure
-
-            name = self._kotlin_property_name(node, content_bytes)
-            line = function_body.start_position().row + 1
-            end_line = function_body.end_position().row + 1
+            keyword, block = None, None
+            for c in node_children(accessor):
+                k = _zero_arg(c, 'kind')
+                if k in ('get', 'set'):
+                    keyword = k
+                elif k == 'block':
+                    block = c
+            if keyword != 'get' or block is None:
+                continue  # auto-property accessor (`get;`) or a `set`
+
+            line = block.start_position().row + 1
+            end_line = block.end_position().row + 1
             line_count = end_line - line + 1
             if line_count > self.MAX_PROPERTY_LINES:
-                detections.append(self.create_detection(
-                    file_path=file_path,
+                self._detections.append(self.create_detection(
+                    file_path=self._file_path,
                     line=line,
                     message=f"@property '{name}' is {line_count} lines (max {self.MAX_PROPERTY_LINES})",
-                    suggestion=f"Consider converting to a regular method: fun get{name[:1].upper()}{name[1:]}()",
-                    context=f"getter with {line_count} lines - properties should be simple getters"
+                    suggestion=f"Consider converting to a regular method: string Get{name}()",
+                    context=f"get accessor with {line_count} lines - properties should be simple getters"
                 ))
 
-        return detections
+    # ── Kotlin (BACK-1011) ───────────────────────────────────────────────────
+
+    def _visit_kotlin_getter(self, node) -> None:
+        """Check Kotlin `getter` blocks for line count. Handles both the
+        sibling-of-property_declaration and nested-in-property_declaration
+        grammar shapes — see module docstring."""
+        function_body = next(
+            (c for c in node_children(node) if _zero_arg(c, 'kind') == 'function_body'), None
+        )
+        if function_body is None:
+            return
+
+        body_children = node_children(function_body)
+        if not body_children or _zero_arg(body_children[0], 'kind') != '{':
+            return  # expression-bodied `get() = expr` — nothing to measure
+
+        name = self._kotlin_property_name(node, self._content_bytes)
+        line = function_body.start_position().row + 1
+        end_line = function_body.end_position().row + 1
+        line_count = end_line - line + 1
+        if line_count > self.MAX_PROPERTY_LINES:
+            self._detections.append(self.create_detection(
+                file_path=self._file_path,
+                line=line,
+                message=f"@property '{name}' is {line_count} lines (max {self.MAX_PROPERTY_LINES})",
+                suggestion=f"Consider converting to a regular method: fun get{name[:1].upper()}{name[1:]}()",
+                context=f"getter with {line_count} lines - properties should be simple getters"
+            ))
 
     def _kotlin_property_name(self, getter_node, content_bytes: bytes) -> str:
         """Resolve a `getter` node's owning property name, handling both the
@@ -201,55 +209,43 @@ def compute_status(self) -> str:
 
     # ── Swift (BACK-1011) ────────────────────────────────────────────────────
 
-    def _check_swift(self, file_path: str, content: str) -> List[Detection]:
+    def _visit_swift_property(self, node) -> None:
         """Check Swift computed-property getters for line count. Measures an
         explicit `get { }` block or, for the implicit-getter shorthand
         (`var x: T { <body> }`, no `get`/`set` keyword), the whole
         `computed_property` body. `willSet`/`didSet` observers (a different
         node kind entirely) and set-only properties are never matched."""
-        root, detections = self._parse_treesitter_or_skip(content, file_path, self._SWIFT_LANGUAGE)
-        if root is None:
-            return detections
-
-        content_bytes = content.encode('utf-8')
-
-        for node in self._ts_walk(root):
-            if _zero_arg(node, 'kind') != 'property_declaration':
-                continue
-
-            computed_property = next(
-                (c for c in node_children(node) if _zero_arg(c, 'kind') == 'computed_property'), None
-            )
-            if computed_property is None:
-                continue  # stored property, or a willSet/didSet observer block
-
-            cp_children = node_children(computed_property)
-            computed_getter = next(
-                (c for c in cp_children if _zero_arg(c, 'kind') == 'computed_getter'), None
-            )
-            has_setter = any(_zero_arg(c, 'kind') == 'computed_setter' for c in cp_children)
-
-            if computed_getter is not None:
-                target = computed_getter
-            elif not has_setter:
-                target = computed_property  # implicit-getter shorthand
-            else:
-                continue  # set-only, no getter to measure (invalid Swift, but be defensive)
-
-            name = self._swift_property_name(node, content_bytes)
-            line = target.start_position().row + 1
-            end_line = target.end_position().row + 1
-            line_count = end_line - line + 1
-            if line_count > self.MAX_PROPERTY_LINES:
-                detections.append(self.create_detection(
-                    file_path=file_path,
-                    line=line,
-                    message=f"@property '{name}' is {line_count} lines (max {self.MAX_PROPERTY_LINES})",
-                    suggestion=f"Consider converting to a regular method: func get{name[:1].upper()}{name[1:]}()",
-                    context=f"computed property getter with {line_count} lines - properties should be simple getters"
-                ))
+        computed_property = next(
+            (c for c in node_children(node) if _zero_arg(c, 'kind') == 'computed_property'), None
+        )
+        if computed_property is None:
+            return  # stored property, or a willSet/didSet observer block
 
-        return detections
+        cp_children = node_children(computed_property)
+        computed_getter = next(
+            (c for c in cp_children if _zero_arg(c, 'kind') == 'computed_getter'), None
+        )
+        has_setter = any(_zero_arg(c, 'kind') == 'computed_setter' for c in cp_children)
+
+        if computed_getter is not None:
+            target = computed_getter
+        elif not has_setter:
+            target = computed_property  # implicit-getter shorthand
+        else:
+            return  # set-only, no getter to measure (invalid Swift, but be defensive)
+
+        name = self._swift_property_name(node, self._content_bytes)
+        line = target.start_position().row + 1
+        end_line = target.end_position().row + 1
+        line_count = end_line - line + 1
+        if line_count > self.MAX_PROPERTY_LINES:
+            self._detections.append(self.create_detection(
+                file_path=self._file_path,
+                line=line,
+                message=f"@property '{name}' is {line_count} lines (max {self.MAX_PROPERTY_LINES})",
+                suggestion=f"Consider converting to a regular method: func get{name[:1].upper()}{name[1:]}()",
+                context=f"computed property getter with {line_count} lines - properties should be simple getters"
+            ))
 
     def _swift_property_name(self, property_decl_node, content_bytes: bytes) -> str:
         for c in node_children(property_decl_node):
@@ -277,12 +273,8 @@ def compute_status(self) -> str:
         Returns:
             List of detections
         """
-        if file_path.endswith('.cs'):
-            return self._check_csharp(file_path, content)
-        if file_path.endswith(('.kt', '.kts')):
-            return self._check_kotlin(file_path, content)
-        if file_path.endswith('.swift'):
-            return self._check_swift(file_path, content)
+        if self.visit_language(file_path) is not None:
+            return self._check_by_visiting(file_path, structure, content)
 
         detections: List[Detection] = []
 
@@ -30,12 +30,12 @@ from typing import List, Dict, Any, Optional
 from importlib.util import find_spec
 
 from ..base import BaseRule, Detection, RulePrefix, Severity
-from ..base_mixins import ASTParsingMixin
+from ..base_mixins import PYTHON_AST, ASTParsingMixin, NodeVisitorMixin
 from ..imports import STDLIB_MODULES
 from ...analyzers.imports.javascript import JavaScriptExtractor
 
 
-class B005(BaseRule, ASTParsingMixin):
+class B005(BaseRule, ASTParsingMixin, NodeVisitorMixin):
     """Detect imports referencing non-existent modules."""
 
     code = "B005"
@@ -43,8 +43,11 @@ class B005(BaseRule, ASTParsingMixin):
     category = RulePrefix.B
     severity = Severity.HIGH
     file_patterns = ['.py', '.js', '.jsx', '.ts', '.tsx', '.mjs', '.cjs']
+    cross_file = True
     version = "1.1.0"
 
+    AST_NODE_TYPES = (ast.Try, ast.Import, ast.ImportFrom)
+
     def _check_import_statement(self,
                                 node: ast.Import,
                                 file_path: str,
@@ -122,34 +125,19 @@ class B005(BaseRule, ASTParsingMixin):
 
         return detections
 
-    def _find_optional_import_lines(self, tree: ast.AST) -> set:
-        """Return line numbers of imports inside try/except ImportError blocks.
-
-        The try/except ImportError pattern is canonical Python for optional
-        dependencies. Imports in these blocks should not be flagged as broken.
-        """
-        optional_lines: set = set()
-
-        def _handler_catches_import_error(handler: ast.ExceptHandler) -> bool:
-            if handler.type is None:
-                return True  # bare except — assume it covers ImportError
-            if isinstance(handler.type, ast.Name):
-                return handler.type.id in ('ImportError', 'ModuleNotFoundError')
-            if isinstance(handler.type, ast.Tuple):
-                return any(
-                    isinstance(el, ast.Name) and el.id in ('ImportError', 'ModuleNotFoundError')
-                    for el in handler.type.elts
-                )
-            return False
-
-        for node in ast.walk(tree):
-            if isinstance(node, ast.Try):
-                if any(_handler_catches_import_error(h) for h in node.handlers):
-                    for child in ast.walk(ast.Module(body=node.body, type_ignores=[])):
-                        if isinstance(child, (ast.Import, ast.ImportFrom)):
-                            optional_lines.add(child.lineno)
-
-        return optional_lines
+    @staticmethod
+    def _catches_import_error(handler: ast.ExceptHandler) -> bool:
+        """True if *handler* would catch an ImportError."""
+        if handler.type is None:
+            return True  # bare except — assume it covers ImportError
+        if isinstance(handler.type, ast.Name):
+            return handler.type.id in ('ImportError', 'ModuleNotFoundError')
+        if isinstance(handler.type, ast.Tuple):
+            return any(
+                isinstance(el, ast.Name) and el.id in ('ImportError', 'ModuleNotFoundError')
+                for el in handler.type.elts
+            )
+        return False
 
     def check(self,
               file_path: str,
@@ -166,27 +154,45 @@ class B005(BaseRule, ASTParsingMixin):
         Returns:
             List of detections for dead imports
         """
-        if file_path.endswith(('.js', '.jsx', '.ts', '.tsx', '.mjs', '.cjs')):
+        if self.visit_language(file_path) is None:
             return self._check_js_like(file_path)
+        return self._check_by_visiting(file_path, structure, content)
 
-        tree, detections = self._parse_python_or_skip(content, file_path)
-        if tree is None:
-            return detections
+    def visit_language(self, file_path: str) -> Optional[str]:
+        if file_path.endswith(('.js', '.jsx', '.ts', '.tsx', '.mjs', '.cjs')):
+            return None
+        return PYTHON_AST
+
+    def begin_visit(self, file_path, structure, content, root) -> bool:
+        super().begin_visit(file_path, structure, content, root)
+        self._file_dir = Path(file_path).parent
+        self._project_root = self._find_project_root(self._file_dir)
+        self._imports: List[ast.stmt] = []
+        self._optional_spans: List[tuple] = []
+        return True
 
-        optional_lines = self._find_optional_import_lines(tree)
-        file_dir = Path(file_path).parent
-        project_root = self._find_project_root(file_dir)
-        for node in self._ast_walk(tree):
-            if getattr(node, 'lineno', None) in optional_lines:
+    def visit_node(self, node) -> None:
+        if isinstance(node, ast.Try):
+            # The try/except ImportError pattern is canonical Python for
+            # optional dependencies; imports in the try body are not broken.
+            # The walk is breadth-first, so the Try arrives before its
+            # imports — record its body's line span and filter in end_visit.
+            if node.body and any(self._catches_import_error(h) for h in node.handlers):
+                self._optional_spans.append((node.body[0].lineno, node.body[-1].end_lineno))
+        else:
+            self._imports.append(node)
+
+    def end_visit(self) -> List[Detection]:
+        for node in self._imports:
+            if any(start <= node.lineno <= end for start, end in self._optional_spans):
                 continue
             if isinstance(node, ast.Import):
-                detections.extend(self._check_import_statement(
-                    node, file_path, file_dir, project_root))
-            elif isinstance(node, ast.ImportFrom):
-                detections.extend(self._check_from_import_statement(
-                    node, file_path, file_dir, project_root))
-
-        return detections
+                self._detections.extend(self._check_import_statement(
+                    node, self._file_path, self._file_dir, self._project_root))
+            else:
+                self._detections.extend(self._check_from_import_statement(
+                    node, self._file_path, self._file_dir, self._project_root))
+        return self._detections
 
     def _find_project_root(self, file_dir: Path) -> Path:
         """Return the project root: the parent of the topmost package directory.
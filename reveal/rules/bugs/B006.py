@@ -45,11 +45,11 @@ import re
 from typing import List, Dict, Any, Optional
 
 from ..base import BaseRule, Detection, RulePrefix, Severity
-from ..base_mixins import ASTParsingMixin, TreeSitterParsingMixin
+from ..base_mixins import PYTHON_AST, ASTParsingMixin, NodeVisitorMixin, TreeSitterParsingMixin
 from ...core import node_children, _zero_arg
 
 
-class B006(BaseRule, ASTParsingMixin, TreeSitterParsingMixin):
+class B006(BaseRule, ASTParsingMixin, TreeSitterParsingMixin, NodeVisitorMixin):
     """Detect silent broad exception handlers that swallow errors."""
 
     code = "B006"
@@ -169,6 +169,21 @@ class B006(BaseRule, ASTParsingMixin, TreeSitterParsingMixin):
     # Pattern to detect explanatory comments near pass statement
     COMMENT_PATTERN = re.compile(r'#\s*\w+')
 
+    _JS_EXTENSIONS = ('.js', '.jsx', '.mjs', '.cjs')
+    _CPP_EXTENSIONS = ('.cpp', '.cc', '.cxx', '.hpp', '.hh', '.h++')
+
+    AST_NODE_TYPES = (ast.ExceptHandler,)
+    TS_NODE_KINDS = {
+        _CS_LANGUAGE: frozenset({'catch_clause'}),
+        _JAVA_LANGUAGE: frozenset({'catch_clause'}),
+        _JS_LANGUAGE: frozenset({'catch_clause'}),
+        _TS_LANGUAGE: frozenset({'catch_clause'}),
+        _PHP_LANGUAGE: frozenset({'catch_clause'}),
+        _KOTLIN_LANGUAGE: frozenset({'catch_block'}),
+        _SWIFT_LANGUAGE: frozenset({'catch_block'}),
+        _CPP_LANGUAGE: frozenset({'catch_clause'}),
+    }
+
     def check(self,
              file_path: str,
              structure: Optional[Dict[str, Any]],
@@ -177,51 +192,61 @@ class B006(BaseRule, ASTParsingMixin, TreeSitterParsingMixin):
         Check for broad exception handlers with silent pass.
 
         Args:
-            file_path: Path to Python file
-            structure: Parsed structure (not used, we parse AST ourselves)
+            file_path: Path to source file
+            structure: Parsed structure (not used, we parse ourselves)
             content: File content
 
         Returns:
             List of detections
         """
+        return self._check_by_visiting(file_path, structure, content)
+
+    def visit_language(self, file_path: str) -> Optional[str]:
         if file_path.endswith('.cs'):
-            return self._check_csharp(file_path, content)
+            return self._CS_LANGUAGE
         if file_path.endswith('.java'):
-            return self._check_java(file_path, content)
-        if file_path.endswith(('.js', '.jsx', '.mjs', '.cjs')):
-            return self._check_js_like(file_path, content, self._JS_LANGUAGE)
+            return self._JAVA_LANGUAGE
+        if file_path.endswith(self._JS_EXTENSIONS):
+            return self._JS_LANGUAGE
         if file_path.endswith('.ts'):
-            return self._check_js_like(file_path, content, self._TS_LANGUAGE)
+            return self._TS_LANGUAGE
         if file_path.endswith('.php'):
-            return self._check_php(file_path, content)
+            return self._PHP_LANGUAGE
         if file_path.endswith(('.kt', '.kts')):
-            return self._check_kotlin(file_path, content)
+            return self._KOTLIN_LANGUAGE
         if file_path.endswith('.swift'):
-            return self._check_swift(file_path, content)
-        if file_path.endswith(('.cpp', '.cc', '.cxx', '.hpp', '.hh', '.h++')):
-            return self._check_cpp(file_path, content)
-
-        tree, detections = self._parse_python_or_skip(content, file_path)
-        if tree is None:
-            return detections
-
+            return self._SWIFT_LANGUAGE
+        if file_path.endswith(self._CPP_EXTENSIONS):
+            return self._CPP_LANGUAGE
+        return PYTHON_AST
+
+    def begin_visit(self, file_path, structure, content, root) -> bool:
+        super().begin_visit(file_path, structure, content, root)
+        self._language = self.visit_language(file_path)
+        self._content_bytes = content.encode('utf-8')
         # Split content into lines for comment checking
-        lines = content.split('\n')
-
-        # Build parent map so handlers can walk up to the enclosing function
-        parent_map: Dict[ast.AST, ast.AST] = {}
-        for parent in ast.walk(tree):
-            for child in ast.iter_child_nodes(parent):
-                parent_map[child] = parent
-
-        # Walk the AST looking for problematic exception handlers
-        for node in self._ast_walk(tree):
-            if isinstance(node, ast.ExceptHandler):
-                detection = self._check_handler(node, file_path, content, lines, parent_map)
-                if detection:
-                    detections.append(detection)
+        self._lines = content.split('\n')
+        return True
 
-        return detections
+    def visit_node(self, node) -> None:
+        if isinstance(node, ast.ExceptHandler):
+            detection = self._check_handler(node, self._file_path, self._content, self._lines)
+            if detection:
+                self._detections.append(detection)
+        elif self._language == self._CS_LANGUAGE:
+            self._visit_csharp_catch(node)
+        elif self._language == self._JAVA_LANGUAGE:
+            self._visit_java_catch(node)
+        elif self._language in (self._JS_LANGUAGE, self._TS_LANGUAGE):
+            self._visit_js_catch(node)
+        elif self._language == self._PHP_LANGUAGE:
+            self._visit_php_catch(node)
+        elif self._language == self._KOTLIN_LANGUAGE:
+            self._visit_kotlin_catch(node)
+        elif self._language == self._SWIFT_LANGUAGE:
+            self._visit_swift_catch(node)
+        else:
+            self._visit_cpp_catch(node)
 
     def _check_handler(
         self,
@@ -229,7 +254,6 @@ class B006(BaseRule, ASTParsingMixin, TreeSitterParsingMixin):
         file_path: str,
         content: str,
         lines: List[str],
-        parent_map: Optional[Dict[ast.AST, ast.AST]] = None,
     ) -> Optional[Detection]:
         """Check a single exception handler for silent broad exception swallowing."""
         if not self._is_broad_exception(node):
@@ -238,9 +262,12 @@ class B006(BaseRule, ASTParsingMixin, TreeSitterParsingMixin):
             return None
         if self._has_explanatory_comment(node, lines):
             return None
-        if parent_map and self._is_intentional_fallback(node, parent_map):
+        # Both remaining exemptions look up from the handler to its Try and
+        # enclosing function — the only part of this rule that needs parents.
+        parent_map = self._ast_parents()
+        if self._is_intentional_fallback(node, parent_map):
             return None
-        if parent_map and self._has_deferred_visible_signal(node, parent_map):
+        if self._has_deferred_visible_signal(node, parent_map):
             return None
 
         context = None
@@ -534,46 +561,29 @@ class B006(BaseRule, ASTParsingMixin, TreeSitterParsingMixin):
 
     # ── C# (BACK-1011) ──────────────────────────────────────────────────────
 
-    def _check_csharp(self, file_path: str, content: str) -> List[Detection]:
-        """Check C# source for silent broad `catch` clauses.
-
-        Args:
-            file_path: Path to C# file
-            content: File content
-
-        Returns:
-            List of detections
-        """
-        root, detections = self._parse_treesitter_or_skip(content, file_path, self._CS_LANGUAGE)
-        if root is None:
-            return detections
-
-        content_bytes = content.encode('utf-8')
-        for node in self._ts_walk(root):
-            if _zero_arg(node, 'kind') != 'catch_clause':
-                continue
-            if not self._cs_is_broad_catch(node, content_bytes):
-                continue
-            if self._cs_has_visible_signal(node, content_bytes):
-                continue
-            if self._cs_has_explanatory_comment(node):
-                continue
-
-            detections.append(self.create_detection(
-                file_path=file_path,
-                line=node.start_position().row + 1,
-                column=node.start_position().column + 1,
-                suggestion=(
-                    "Consider:\n"
-                    "  1. Catch specific exception types instead of Exception\n"
-                    "  2. Add visible logging: _logger.LogWarning(ex, \"...\") —\n"
-                    "     LogTrace/LogDebug alone are invisible by default and do not count\n"
-                    "  3. Re-throw if you can't handle it: throw;"
-                ),
-                context=self._ts_node_text(node, content_bytes).split('\n')[0],
-            ))
-
-        return detections
+    def _visit_csharp_catch(self, node) -> None:
+        """C#: flag a broad `catch` clause with no visible failure signal."""
+        content_bytes = self._content_bytes
+        if not self._cs_is_broad_catch(node, content_bytes):
+            return
+        if self._cs_has_visible_signal(node, content_bytes):
+            return
+        if self._cs_has_explanatory_comment(node):
+            return
+
+        self._detections.append(self.create_detection(
+            file_path=self._file_path,
+            line=node.start_position().row + 1,
+            column=node.start_position().column + 1,
+            suggestion=(
+                "Consider:\n"
+                "  1. Catch specific exception types instead of Exception\n"
+                "  2. Add visible logging: _logger.LogWarning(ex, \"...\") —\n"
+                "     LogTrace/LogDebug alone are invisible by default and do not count\n"
+                "  3. Re-throw if you can't handle it: throw;"
+            ),
+            context=self._ts_node_text(node, content_bytes).split('\n')[0],
+        ))
 
     def _cs_is_broad_catch(self, node, content_bytes: bytes) -> bool:
         """True for a bare `catch { }` or a `catch (Exception e) { }`.
@@ -626,38 +636,29 @@ class B006(BaseRule, ASTParsingMixin, TreeSitterParsingMixin):
 
     # ── Java (BACK-1011) ─────────────────────────────────────────────────────
 
-    def _check_java(self, file_path: str, content: str) -> List[Detection]:
-        """Check Java source for silent broad `catch` clauses."""
-        root, detections = self._parse_treesitter_or_skip(content, file_path, self._JAVA_LANGUAGE)
-        if root is None:
-            return detections
-
-        content_bytes = content.encode('utf-8')
-        for node in self._ts_walk(root):
-            if _zero_arg(node, 'kind') != 'catch_clause':
-                continue
-            if not self._java_is_broad_catch(node, content_bytes):
-                continue
-            if self._java_has_visible_signal(node, content_bytes):
-                continue
-            if any(_zero_arg(d, 'kind') == 'comment' for d in self._ts_walk(node)):
-                continue
-
-            detections.append(self.create_detection(
-                file_path=file_path,
-                line=node.start_position().row + 1,
-                column=node.start_position().column + 1,
-                suggestion=(
-                    "Consider:\n"
-                    "  1. Catch specific exception types instead of Exception/Throwable\n"
-                    "  2. Add visible logging: log.error(\"...\", e) —\n"
-                    "     debug/trace-level logging alone is invisible by default and does not count\n"
-                    "  3. Re-throw if you can't handle it: throw e; / throw new ...(e);"
-                ),
-                context=self._ts_node_text(node, content_bytes).split('\n')[0],
-            ))
-
-        return detections
+    def _visit_java_catch(self, node) -> None:
+        """Java: flag a broad `catch` clause with no visible failure signal."""
+        content_bytes = self._content_bytes
+        if not self._java_is_broad_catch(node, content_bytes):
+            return
+        if self._java_has_visible_signal(node, content_bytes):
+            return
+        if any(_zero_arg(d, 'kind') == 'comment' for d in self._ts_walk(node)):
+            return
+
+        self._detections.append(self.create_detection(
+            file_path=self._file_path,
+            line=node.start_position().row + 1,
+            column=node.start_position().column + 1,
+            suggestion=(
+                "Consider:\n"
+                "  1. Catch specific exception types instead of Exception/Throwable\n"
+                "  2. Add visible logging: log.error(\"...\", e) —\n"
+                "     debug/trace-level logging alone is invisible by default and does not count\n"
+                "  3. Re-throw if you can't handle it: throw e; / throw new ...(e);"
+            ),
+            context=self._ts_node_text(node, content_bytes).split('\n')[0],
+        ))
 
     def _java_is_broad_catch(self, node, content_bytes: bytes) -> bool:
         """True if any type in a (possibly multi-catch `A | B`) clause is broad.
@@ -710,40 +711,31 @@ class B006(BaseRule, ASTParsingMixin, TreeSitterParsingMixin):
 
     # ── JavaScript / TypeScript (BACK-1011) ─────────────────────────────────
 
-    def _check_js_like(self, file_path: str, content: str, language: str) -> List[Detection]:
-        """Check JS/TS source for silent `catch` clauses.
+    def _visit_js_catch(self, node) -> None:
+        """JS/TS: flag a `catch` clause with no visible failure signal.
 
         Neither language has catch-type syntax — every `catch` is
         unconditionally broad, so only the silence check discriminates
         (unlike the typed-language ports above).
         """
-        root, detections = self._parse_treesitter_or_skip(content, file_path, language)
-        if root is None:
-            return detections
-
-        content_bytes = content.encode('utf-8')
-        for node in self._ts_walk(root):
-            if _zero_arg(node, 'kind') != 'catch_clause':
-                continue
-            if self._js_has_visible_signal(node, content_bytes):
-                continue
-            if any(_zero_arg(d, 'kind') == 'comment' for d in self._ts_walk(node)):
-                continue
-
-            detections.append(self.create_detection(
-                file_path=file_path,
-                line=node.start_position().row + 1,
-                column=node.start_position().column + 1,
-                suggestion=(
-                    "Consider:\n"
-                    "  1. Add visible logging: console.error(err) — any console.* call counts\n"
-                    "  2. Re-throw if you can't handle it: throw err;\n"
-                    "  3. Add a comment explaining why silence is intentional"
-                ),
-                context=self._ts_node_text(node, content_bytes).split('\n')[0],
-            ))
-
-        return detections
+        content_bytes = self._content_bytes
+        if self._js_has_visible_signal(node, content_bytes):
+            return
+        if any(_zero_arg(d, 'kind') == 'comment' for d in self._ts_walk(node)):
+            return
+
+        self._detections.append(self.create_detection(
+            file_path=self._file_path,
+            line=node.start_position().row + 1,
+            column=node.start_position().column + 1,
+            suggestion=(
+                "Consider:\n"
+                "  1. Add visible logging: console.error(err) — any console.* call counts\n"
+                "  2. Re-throw if you can't handle it: throw err;\n"
+                "  3. Add a comment explaining why silence is intentional"
+            ),
+            context=self._ts_node_text(node, content_bytes).split('\n')[0],
+        ))
 
     def _js_has_visible_signal(self, node, content_bytes: bytes) -> bool:
         """True if the catch body re-throws or calls a visible logging method."""
@@ -777,38 +769,29 @@ class B006(BaseRule, ASTParsingMixin, TreeSitterParsingMixin):
 
     # ── PHP (BACK-1011) ──────────────────────────────────────────────────────
 
-    def _check_php(self, file_path: str, content: str) -> List[Detection]:
-        """Check PHP source for silent broad `catch` clauses."""
-        root, detections = self._parse_treesitter_or_skip(content, file_path, self._PHP_LANGUAGE)
-        if root is None:
-            return detections
-
-        content_bytes = content.encode('utf-8')
-        for node in self._ts_walk(root):
-            if _zero_arg(node, 'kind') != 'catch_clause':
-                continue
-            if not self._php_is_broad_catch(node, content_bytes):
-                continue
-            if self._php_has_visible_signal(node, content_bytes):
-                continue
-            if any(_zero_arg(d, 'kind') == 'comment' for d in self._ts_walk(node)):
-                continue
-
-            detections.append(self.create_detection(
-                file_path=file_path,
-                line=node.start_position().row + 1,
-                column=node.start_position().column + 1,
-                suggestion=(
-                    "Consider:\n"
-                    "  1. Catch specific exception types instead of Exception/Throwable\n"
-                    "  2. Add visible logging: error_log(...) or $logger->error(...) —\n"
-                    "     debug/info-level logging alone is invisible by default and does not count\n"
-                    "  3. Re-throw if you can't handle it: throw $e;"
-                ),
-                context=self._ts_node_text(node, content_bytes).split('\n')[0],
-            ))
-
-        return detections
+    def _visit_php_catch(self, node) -> None:
+        """PHP: flag a broad `catch` clause with no visible failure signal."""
+        content_bytes = self._content_bytes
+        if not self._php_is_broad_catch(node, content_bytes):
+            return
+        if self._php_has_visible_signal(node, content_bytes):
+            return
+        if any(_zero_arg(d, 'kind') == 'comment' for d in self._ts_walk(node)):
+            return
+
+        self._detections.append(self.create_detection(
+            file_path=self._file_path,
+            line=node.start_position().row + 1,
+            column=node.start_position().column + 1,
+            suggestion=(
+                "Consider:\n"
+                "  1. Catch specific exception types instead of Exception/Throwable\n"
+                "  2. Add visible logging: error_log(...) or $logger->error(...) —\n"
+                "     debug/info-level logging alone is invisible by default and does not count\n"
+                "  3. Re-throw if you can't handle it: throw $e;"
+            ),
+            context=self._ts_node_text(node, content_bytes).split('\n')[0],
+        ))
 
     def _php_is_broad_catch(self, node, content_bytes: bytes) -> bool:
         """True if any type in a (possibly multi-catch `A | B`) clause is broad."""
@@ -853,8 +836,8 @@ class B006(BaseRule, ASTParsingMixin, TreeSitterParsingMixin):
 
     # ── Kotlin (BACK-1011) ───────────────────────────────────────────────────
 
-    def _check_kotlin(self, file_path: str, content: str) -> List[Detection]:
-        """Check Kotlin source for silent broad `catch` clauses.
+    def _visit_kotlin_catch(self, node) -> None:
+        """Kotlin: flag a broad `catch` block with no visible failure signal.
 
         Kotlin's `catch_block` is a different tree-sitter node kind from the
         `catch_clause` shared by C#/Java/JS/TS/PHP, but Kotlin always
@@ -862,36 +845,27 @@ class B006(BaseRule, ASTParsingMixin, TreeSitterParsingMixin):
         the broad-type check mirrors Java's rather than needing a
         no-declaration fallback.
         """
-        root, detections = self._parse_treesitter_or_skip(content, file_path, self._KOTLIN_LANGUAGE)
-        if root is None:
-            return detections
-
-        content_bytes = content.encode('utf-8')
-        for node in self._ts_walk(root):
-            if _zero_arg(node, 'kind') != 'catch_block':
-                continue
-            if not self._kotlin_is_broad_catch(node, content_bytes):
-                continue
-            if self._kotlin_has_visible_signal(node, content_bytes):
-                continue
-            if any('comment' in _zero_arg(d, 'kind') for d in self._ts_walk(node)):
-                continue
-
-            detections.append(self.create_detection(
-                file_path=file_path,
-                line=node.start_position().row + 1,
-                column=node.start_position().column + 1,
-                suggestion=(
-                    "Consider:\n"
-                    "  1. Catch specific exception types instead of Exception/Throwable\n"
-                    "  2. Add visible logging: logger.e(e) { \"...\" } / Log.w(TAG, ...) —\n"
-                    "     debug/verbose-level logging alone is invisible by default and does not count\n"
-                    "  3. Re-throw if you can't handle it: throw e"
-                ),
-                context=self._ts_node_text(node, content_bytes).split('\n')[0],
-            ))
-
-        return detections
+        content_bytes = self._content_bytes
+        if not self._kotlin_is_broad_catch(node, content_bytes):
+            return
+        if self._kotlin_has_visible_signal(node, content_bytes):
+            return
+        if any('comment' in _zero_arg(d, 'kind') for d in self._ts_walk(node)):
+            return
+
+        self._detections.append(self.create_detection(
+            file_path=self._file_path,
+            line=node.start_position().row + 1,
+            column=node.start_position().column + 1,
+            suggestion=(
+                "Consider:\n"
+                "  1. Catch specific exception types instead of Exception/Throwable\n"
+                "  2. Add visible logging: logger.e(e) { \"...\" } / Log.w(TAG, ...) —\n"
+                "     debug/verbose-level logging alone is invisible by default and does not count\n"
+                "  3. Re-throw if you can't handle it: throw e"
+            ),
+            context=self._ts_node_text(node, content_bytes).split('\n')[0],
+        ))
 
     def _kotlin_is_broad_catch(self, node, content_bytes: bytes) -> bool:
         """True if the catch parameter's type is Exception/Throwable/RuntimeException."""
@@ -936,8 +910,8 @@ class B006(BaseRule, ASTParsingMixin, TreeSitterParsingMixin):
 
     # ── Swift (BACK-1011) ────────────────────────────────────────────────────
 
-    def _check_swift(self, file_path: str, content: str) -> List[Detection]:
-        """Check Swift source for silent broad `catch` clauses.
+    def _visit_swift_catch(self, node) -> None:
+        """Swift: flag a broad `catch` block with no visible failure signal.
 
         Swift's `catch_block` (same node kind name as Kotlin's, unrelated
         grammar) narrows only when a `pattern` child actually types the
@@ -947,35 +921,26 @@ class B006(BaseRule, ASTParsingMixin, TreeSitterParsingMixin):
         `pattern` with no type at all) and stays broad, same as an
         unqualified `catch` in the other languages.
         """
-        root, detections = self._parse_treesitter_or_skip(content, file_path, self._SWIFT_LANGUAGE)
-        if root is None:
-            return detections
-
-        content_bytes = content.encode('utf-8')
-        for node in self._ts_walk(root):
-            if _zero_arg(node, 'kind') != 'catch_block':
-                continue
-            if not self._swift_is_broad_catch(node, content_bytes):
-                continue
-            if self._swift_has_visible_signal(node, content_bytes):
-                continue
-            if any(_zero_arg(d, 'kind') == 'comment' for d in self._ts_walk(node)):
-                continue
-
-            detections.append(self.create_detection(
-                file_path=file_path,
-                line=node.start_position().row + 1,
-                column=node.start_position().column + 1,
-                suggestion=(
-                    "Consider:\n"
-                    "  1. Catch a specific error type: catch let e as SomeError\n"
-                    "  2. Add visible logging: print(error) / logger.error(\"...\")\n"
-                    "  3. Re-throw if you can't handle it: throw error"
-                ),
-                context=self._ts_node_text(node, content_bytes).split('\n')[0],
-            ))
-
-        return detections
+        content_bytes = self._content_bytes
+        if not self._swift_is_broad_catch(node, content_bytes):
+            return
+        if self._swift_has_visible_signal(node, content_bytes):
+            return
+        if any(_zero_arg(d, 'kind') == 'comment' for d in self._ts_walk(node)):
+            return
+
+        self._detections.append(self.create_detection(
+            file_path=self._file_path,
+            line=node.start_position().row + 1,
+            column=node.start_position().column + 1,
+            suggestion=(
+                "Consider:\n"
+                "  1. Catch a specific error type: catch let e as SomeError\n"
+                "  2. Add visible logging: print(error) / logger.error(\"...\")\n"
+                "  3. Re-throw if you can't handle it: throw error"
+            ),
+            context=self._ts_node_text(node, content_bytes).split('\n')[0],
+        ))
 
     def _swift_is_broad_catch(self, node, content_bytes: bytes) -> bool:
         """True unless a `pattern` child types the catch to a non-broad type.
@@ -1026,37 +991,28 @@ class B006(BaseRule, ASTParsingMixin, TreeSitterParsingMixin):
                     return True
         return False
 
-    def _check_cpp(self, file_path: str, content: str) -> List[Detection]:
-        """Check C++ source for silent broad `catch` clauses."""
-        root, detections = self._parse_treesitter_or_skip(content, file_path, self._CPP_LANGUAGE)
-        if root is None:
-            return detections
-
-        content_bytes = content.encode('utf-8')
-        for node in self._ts_walk(root):
-            if _zero_arg(node, 'kind') != 'catch_clause':
-                continue
-            if not self._cpp_is_broad_catch(node, content_bytes):
-                continue
-            if self._cpp_has_visible_signal(node, content_bytes):
-                continue
-            if any(_zero_arg(d, 'kind') == 'comment' for d in self._ts_walk(node)):
-                continue
-
-            detections.append(self.create_detection(
-                file_path=file_path,
-                line=node.start_position().row + 1,
-                column=node.start_position().column + 1,
-                suggestion=(
-                    "Consider:\n"
-                    "  1. Catch specific exception types instead of std::exception/(...)\n"
-                    "  2. Add visible output: std::cerr << \"...\" << e.what();\n"
-                    "  3. Re-throw if you can't handle it: throw;"
-                ),
-                context=self._ts_node_text(node, content_bytes).split('\n')[0],
-            ))
-
-        return detections
+    def _visit_cpp_catch(self, node) -> None:
+        """C++: flag a broad `catch` clause with no visible failure signal."""
+        content_bytes = self._content_bytes
+        if not self._cpp_is_broad_catch(node, content_bytes):
+            return
+        if self._cpp_has_visible_signal(node, content_bytes):
+            return
+        if any(_zero_arg(d, 'kind') == 'comment' for d in self._ts_walk(node)):
+            return
+
+        self._detections.append(self.create_detection(
+            file_path=self._file_path,
+            line=node.start_position().row + 1,
+            column=node.start_position().column + 1,
+            suggestion=(
+                "Consider:\n"
+                "  1. Catch specific exception types instead of std::exception/(...)\n"
+                "  2. Add visible output: std::cerr << \"...\" << e.what();\n"
+                "  3. Re-throw if you can't handle it: throw;"
+            ),
+            context=self._ts_node_text(node, content_bytes).split('\n')[0],
+        ))
 
     def _cpp_is_broad_catch(self, node, content_bytes: bytes) -> bool:
         """True for `catch (...)` (ellipsis, catches everything including
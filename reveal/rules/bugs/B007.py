@@ -39,10 +39,10 @@ import ast
 from typing import List, Dict, Any, Optional
 
 from ..base import BaseRule, Detection, RulePrefix, Severity
-from ..base_mixins import ASTParsingMixin
+from ..base_mixins import PYTHON_AST, ASTParsingMixin, NodeVisitorMixin
 
 
-class B007(BaseRule, ASTParsingMixin):
+class B007(BaseRule, ASTParsingMixin, NodeVisitorMixin):
     """Detect adapter exception handlers that log but don't record_composed_error()."""
 
     code = "B007"
@@ -62,41 +62,30 @@ class B007(BaseRule, ASTParsingMixin):
     # because they are NOT interchangeable inside adapter code.
     _ENVELOPE_CALLS = frozenset({'record_composed_error', 'create_error', 'create_error_result'})
 
+    AST_NODE_TYPES = (ast.ExceptHandler,)
+
     def check(self,
               file_path: str,
               structure: Optional[Dict[str, Any]],
               content: str) -> List[Detection]:
         if not file_path.endswith('.py'):
             return []
-
-        tree, detections = self._parse_python_or_skip(content, file_path)
-        if tree is None:
-            return detections
-
-        parent_map: Dict[ast.AST, ast.AST] = {}
-        for parent in ast.walk(tree):
-            for child in ast.iter_child_nodes(parent):
-                parent_map[child] = parent
-
-        for node in ast.walk(tree):
-            if not isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
-                continue
-            if self._adapter_param_name(node, parent_map) is None:
-                continue
-            for sub in ast.walk(node):
-                if not isinstance(sub, ast.ExceptHandler):
-                    continue
-                # Only handlers whose nearest enclosing function is this one —
-                # a nested function's own handlers are checked against the
-                # nested function's own adapter-param status separately, not
-                # inherited from the outer scope.
-                if self._nearest_enclosing_function(sub, parent_map) is not node:
-                    continue
-                detection = self._check_handler(sub, file_path, content)
-                if detection:
-                    detections.append(detection)
-
-        return detections
+        return self._check_by_visiting(file_path, structure, content)
+
+    def visit_language(self, file_path: str) -> Optional[str]:
+        return PYTHON_AST if file_path.endswith('.py') else None
+
+    def visit_node(self, node: ast.ExceptHandler) -> None:
+        detection = self._check_handler(node, self._file_path, self._content)
+        if detection is None:
+            return
+        # Only handlers whose nearest enclosing function takes an adapter —
+        # a nested function's own handlers are judged by the nested
+        # function's adapter-param status, not inherited from the outer scope.
+        parent_map = self._ast_parents()
+        func = self._nearest_enclosing_function(node, parent_map)
+        if func is not None and self._adapter_param_name(func, parent_map) is not None:
+            self._detections.append(detection)
 
     def _check_handler(self, node: ast.ExceptHandler, file_path: str, content: str) -> Optional[Detection]:
         """Flag a handler that logs visibly but never calls the envelope helper."""
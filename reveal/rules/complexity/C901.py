@@ -5,18 +5,19 @@ Uses McCabe algorithm for Python (matching Ruff/flake8), with heuristic
 fallback for other languages.
 """
 
+import ast
 import logging
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
 
 from mccabe import PathGraphingAstVisitor
 
 from ..base import BaseRule, Detection, RulePrefix, Severity
-from ..base_mixins import ASTParsingMixin
+from ..base_mixins import PYTHON_AST, ASTParsingMixin, NodeVisitorMixin
 
 logger = logging.getLogger(__name__)
 
 
-class C901(BaseRule, ASTParsingMixin):
+class C901(BaseRule, ASTParsingMixin, NodeVisitorMixin):
     """Detect overly complex functions (cyclomatic complexity).
 
     Uses the McCabe algorithm for Python files, matching Ruff's C901 rule.
@@ -37,6 +38,8 @@ class C901(BaseRule, ASTParsingMixin):
     #       threshold: 15
     DEFAULT_THRESHOLD = 10
 
+    AST_NODE_TYPES = (ast.FunctionDef, ast.AsyncFunctionDef)
+
     def check(self,
              file_path: str,
              structure: Optional[Dict[str, Any]],
@@ -52,6 +55,45 @@ class C901(BaseRule, ASTParsingMixin):
         Returns:
             List of detections
         """
+        if self.visit_language(file_path) is not None:
+            return self._check_by_visiting(file_path, structure, content)
+        return self._check_functions(file_path, structure, content, {})
+
+    def visit_language(self, file_path: str) -> Optional[str]:
+        # For Python files, use McCabe on each function for accuracy
+        return PYTHON_AST if file_path.endswith('.py') else None
+
+    def begin_visit(self, file_path, structure, content, root) -> bool:
+        super().begin_visit(file_path, structure, content, root)
+        # Need structure to work
+        if not structure:
+            return False
+        self._structure = structure
+        self._graphed: List[ast.AST] = []
+        self._complexities: List[Tuple[int, int, Dict[str, int]]] = []
+        return True
+
+    def visit_node(self, node) -> None:
+        # McCabe folds a nested function into its enclosing function's graph.
+        # The walk is breadth-first, so the outer function always arrives first.
+        if any(outer.lineno <= node.lineno <= outer.end_lineno for outer in self._graphed):
+            return
+        self._graphed.append(node)
+        self._complexities.append((node.lineno, node.col_offset, self._mccabe_complexity(node)))
+
+    def end_visit(self) -> List[Detection]:
+        # Source order, so a repeated name resolves as a whole-module pass would.
+        mccabe_results: Dict[str, int] = {}
+        for _, _, results in sorted(self._complexities, key=lambda c: c[:2]):
+            mccabe_results.update(results)
+        return self._check_functions(self._file_path, self._structure, self._content, mccabe_results)
+
+    def _check_functions(self,
+                         file_path: str,
+                         structure: Optional[Dict[str, Any]],
+                         content: str,
+                         mccabe_results: Dict[str, int]) -> List[Detection]:
+        """Flag every function in *structure* over the complexity threshold."""
         detections: List[Detection] = []
 
         # Need structure to work
@@ -61,12 +103,6 @@ class C901(BaseRule, ASTParsingMixin):
         # Get threshold from config (allows per-project customization)
         threshold = self.get_threshold('threshold', self.DEFAULT_THRESHOLD)
 
-        # For Python files, use McCabe on the whole file for accuracy
-        is_python = file_path.endswith('.py')
-        mccabe_results = {}
-        if is_python and content:
-            mccabe_results = self._get_mccabe_complexity(content, file_path)
-
         # Get functions from structure
         functions = structure.get('functions', [])
 
@@ -95,27 +131,23 @@ class C901(BaseRule, ASTParsingMixin):
 
         return detections
 
-    def _get_mccabe_complexity(self, content: str, file_path: str = "<unknown>") -> Dict[str, int]:
+    def _mccabe_complexity(self, node: ast.AST) -> Dict[str, int]:
         """
-        Calculate McCabe cyclomatic complexity for all functions in Python code.
+        Calculate McCabe cyclomatic complexity for an outermost function.
 
         Uses the same algorithm as Ruff and flake8-mccabe for consistent results.
-        Shares the cached AST tree with other rules via ASTParsingMixin.
+        Graphs the function straight from the shared AST node (no re-parse).
 
         Args:
-            content: Python source code
-            file_path: Path for error messages and cache key
+            node: FunctionDef/AsyncFunctionDef not nested in another function
 
         Returns:
             Dict mapping function names to complexity scores
         """
         results: Dict[str, int] = {}
         try:
-            tree = self._parse_python(content, file_path)
-            if tree is None:
-                return results
             visitor = PathGraphingAstVisitor()
-            visitor.preorder(tree, visitor)
+            visitor.preorder(node, visitor)
 
             for graph in visitor.graphs.values():
                 # Graph entity is the function/method name
@@ -153,7 +185,7 @@ class C901(BaseRule, ASTParsingMixin):
             return max(1, line_count // 10)
 
         # Extract function content
-        lines = content.splitlines()
+        lines = self.source_lines(content)
         if start_line > len(lines) or end_line > len(lines):
             return 1
 
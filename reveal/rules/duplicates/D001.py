@@ -123,7 +123,7 @@ class D001(BaseRule):
         if start == 0 or end == 0:
             return ""
 
-        lines = content.splitlines()
+        lines = self.source_lines(content)
         if start > len(lines) or end > len(lines):
             return ""
 
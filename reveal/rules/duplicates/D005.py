@@ -18,18 +18,23 @@ Example fix:
     from defaults import SKIP_DIRECTORIES
 
 Uses the same scan-all-files-once-per-project cache strategy as I002 so that
-every file in a cluster is reported, not just the N-th one seen.
+every file in a cluster is reported, not just the N-th one seen. Across
+processes the index is incremental: each file's extracted literals are a
+disk-cached fragment keyed by (path, mtime_ns, size), so a new `reveal check`
+re-parses only the files that changed and assembles the rest from cache.
 """
 
 import ast
 import hashlib
 import logging
 import os
+import stat as stat_module
 from pathlib import Path
 from typing import Dict, List, Any, Optional, Tuple
 
 from ..base import BaseRule, Detection, RulePrefix, Severity
 from ..base_mixins import ASTParsingMixin
+from ...core import disk_cache
 from ...utils.path_utils import is_skippable_dir, resolve_project_root
 
 logger = logging.getLogger(__name__)
@@ -47,15 +52,27 @@ _STABLE_NAME_PATTERNS = {
     'example', 'sample',
 }
 
-# Safety ceiling: cross-file detection scans every .py under the project root
-# on first check, so a huge tree is skipped (with a logged warning) rather than
-# stalling an interactive --check. Override with REVEAL_D005_MAX_FILES for large
-# monorepos that genuinely want the scan. Mirrors I002's REVEAL_I002_MAX_FILES.
-_DEFAULT_MAX_PROJECT_FILES = 5000
+# Optional ceiling on the cross-file scan. Off by default: with per-file
+# fragments on disk (below) only changed files are re-parsed, so a large tree
+# pays the full parse once rather than on every `check`, and the rule no
+# longer bails on monorepos. Set REVEAL_D005_MAX_FILES to reinstate a cap
+# (e.g. to guard against a mis-detected, marker-less parent root).
+_DEFAULT_MAX_PROJECT_FILES = 0
+
+# Disk-cache namespaces (see reveal/core/disk_cache.py). Fragments are one
+# entry per source file — the literal clusters it contributes, keyed by the
+# file's fingerprint — and are assembled into the project index. The
+# assembled index is cached too, keyed on the digest of every fragment key,
+# so an unchanged tree costs one stat walk and a single read.
+_FRAGMENT_NAMESPACE = "d005_literals_v1"
+_INDEX_NAMESPACE = "d005_index_v1"
+# Fragment namespace prune floor; raised to 2x the project's file count so a
+# big tree's own fragments are never evicted while it is being assembled.
+_FRAGMENT_CACHE_MIN_ENTRIES = 20000
 
 
 def _max_project_files() -> int:
-    """Read the scan ceiling, honoring REVEAL_D005_MAX_FILES."""
+    """Read the scan ceiling, honoring REVEAL_D005_MAX_FILES (0 = no ceiling)."""
     raw = os.environ.get('REVEAL_D005_MAX_FILES')
     if raw:
         try:
@@ -139,10 +156,23 @@ def _is_stable_name(name: str) -> bool:
 
 
 def _clear_index() -> None:
-    """Clear the project index cache (for tests)."""
+    """Clear the project index cache (for tests; disk fragments are untouched)."""
     _project_index.clear()
 
 
+def _fragment_key(path_str: str, st: os.stat_result, min_size: int) -> str:
+    """Disk-cache key for one file's literal fragment.
+
+    ``min_size`` is part of the key because it changes what a file yields;
+    the reveal version (and so the extraction logic) is already part of the
+    cache path.
+    """
+    hasher = hashlib.sha256()
+    hasher.update(path_str.encode('utf-8', 'replace'))
+    hasher.update(f"\x00{st.st_mtime_ns}\x00{st.st_size}\x00{min_size}".encode('ascii'))
+    return hasher.hexdigest()
+
+
 # ── Rule ──────────────────────────────────────────────────────────────────────
 
 class D005(BaseRule, ASTParsingMixin):
@@ -157,6 +187,7 @@ class D005(BaseRule, ASTParsingMixin):
     category = RulePrefix.D
     severity = Severity.MEDIUM
     file_patterns = ['.py']
+    cross_file = True
 
     # Minimum items in the literal to be considered (small lists are often deliberate)
     MIN_LITERAL_SIZE = 5
@@ -249,35 +280,68 @@ class D005(BaseRule, ASTParsingMixin):
 def _build_index(
     project_root: Path, rule: D005
 ) -> Dict[str, List[Tuple[str, int, str]]]:
-    """Scan all .py files under project_root and build the cross-file literal index.
+    """Build the cross-file literal index for every .py file under project_root.
 
-    Collects paths lazily and aborts as soon as the file count crosses the
-    ceiling — a huge tree (e.g. a marker-less parent that aggregates many
-    projects) is skipped without materializing the full list or parsing a
-    single file, so an interactive --check never stalls.
+    Incremental across processes: one stat walk fingerprints each file, a
+    digest of all fingerprints looks up a previously assembled index, and on
+    a miss each file's fragment is read from the disk cache — only files
+    whose fragment is missing (new or changed since the last run) are read
+    and parsed. Newly extracted fragments are written back in one batch.
+
+    If REVEAL_D005_MAX_FILES is set, the walk aborts as soon as the file
+    count crosses it and returns an empty index without parsing anything.
     """
     ceiling = _max_project_files()
-    py_files: List[Path] = []
+    min_size = rule.MIN_LITERAL_SIZE
+    files: List[Tuple[str, str]] = []  # (path, fragment key), walk order
     for p in project_root.rglob('*.py'):
         if _should_skip_path(p):
             continue
-        py_files.append(p)
-        if len(py_files) > ceiling:
+        try:
+            st = p.stat()
+        except OSError:
+            continue
+        if not stat_module.S_ISREG(st.st_mode):
+            continue
+        path_str = str(p)
+        files.append((path_str, _fragment_key(path_str, st, min_size)))
+        if ceiling and len(files) > ceiling:
             logger.warning(
                 "D005: project root %s exceeds %d .py files; skipping cross-file "
-                "scan (set REVEAL_D005_MAX_FILES to raise the ceiling)",
+                "scan (REVEAL_D005_MAX_FILES)",
                 project_root, ceiling,
             )
             return {}
 
-    index: Dict[str, List[Tuple[str, int, str]]] = {}
-
-    for py_file in py_files:
-        try:
-            content = py_file.read_text(encoding='utf-8', errors='ignore')
-        except OSError:
-            continue
-        for key, line, var_name, _ in rule.extract_file_literals(str(py_file), content):
-            index.setdefault(key, []).append((str(py_file), line, var_name))
+    tree_hasher = hashlib.sha256()
+    for _, fragment_key in sorted(files):
+        tree_hasher.update(fragment_key.encode('ascii'))
+    tree_key = tree_hasher.hexdigest()
+    cached_index = disk_cache.get(_INDEX_NAMESPACE, tree_key)
+    if cached_index is not None:
+        return cached_index
 
+    index: Dict[str, List[Tuple[str, int, str]]] = {}
+    fresh: List[Tuple[str, List[Tuple[str, int, str]]]] = []
+    for path_str, fragment_key in files:
+        fragment = disk_cache.get(_FRAGMENT_NAMESPACE, fragment_key)
+        if fragment is None:
+            try:
+                content = Path(path_str).read_text(encoding='utf-8', errors='ignore')
+            except OSError:
+                continue
+            fragment = [
+                (key, line, var_name)
+                for key, line, var_name, _ in rule.extract_file_literals(path_str, content)
+            ]
+            fresh.append((fragment_key, fragment))
+        for key, line, var_name in fragment:
+            index.setdefault(key, []).append((path_str, line, var_name))
+
+    if fresh:
+        disk_cache.put_many(
+            _FRAGMENT_NAMESPACE, fresh,
+            max_entries=max(_FRAGMENT_CACHE_MIN_ENTRIES, 2 * len(files)),
+        )
+    disk_cache.put(_INDEX_NAMESPACE, tree_key, index)
     return index
@@ -61,7 +61,7 @@ class E501(BaseRule):
             List of detections
         """
         detections: List[Detection] = []
-        lines = content.splitlines()
+        lines = self.source_lines(content)
 
         # Get configuration
         max_length = self.get_threshold('max_length', self.DEFAULT_MAX_LENGTH)
@@ -0,0 +1,107 @@
+"""Per-file analysis context shared by every rule in one check_file() call.
+
+``reveal check`` already builds an analyzer per file — and with it a
+tree-sitter tree and (after ``get_structure``) a node-kind index. Rules used
+to ignore all of that and reparse from ``content`` through the mixins'
+``lru_cache``d parsers, whose keys hash the whole file on every call.
+
+``FileAnalysis`` carries those artifacts to the rules instead:
+
+* ``ts_root(language)`` — the analyzer's tree when its language matches,
+  otherwise one parse per language, memoized;
+* ``nodes_by_kind(language)`` — kind → nodes in document order, reusing the
+  analyzer's ``_find_nodes_by_type`` cache when available;
+* ``python_ast()`` — a lazily built ``ast`` tree (Python rules use the stdlib
+  ``ast``, which the tree-sitter analyzer doesn't provide);
+* ``lines`` — the line split.
+
+So each file is parsed at most once per language for the whole rule run.
+``RuleRegistry.check_file`` attaches the context to every rule instance as
+``rule.analysis``; ``ASTParsingMixin``/``TreeSitterParsingMixin`` and
+``dispatch_nodes`` consult it before falling back to the cached parsers.
+Everything it hands out is shared — rules must treat it as read-only.
+"""
+
+from typing import Any, Dict, List, Optional
+
+from .base_mixins import _parse_python_ast, _parse_treesitter_root
+
+_UNSET = object()
+
+
+class FileAnalysis:
+    """Parse artifacts for one file, each built at most once."""
+
+    def __init__(self, file_path: str, content: str, analyzer: Any = None) -> None:
+        self.file_path = file_path
+        self.content = content
+        self.analyzer = analyzer
+        self._python_ast: Any = _UNSET
+        self._ts_roots: Dict[str, Any] = {}
+        self._node_index: Dict[str, Optional[Dict[str, list]]] = {}
+        self._lines: Optional[List[str]] = None
+
+    def covers(self, file_path: str, content: str) -> bool:
+        """True if this context describes exactly (*file_path*, *content*).
+
+        Identity, not equality, on the content: check_file hands every rule
+        the same string object, and comparing would cost the hash we avoid.
+        """
+        return content is self.content and file_path == self.file_path
+
+    # -- trees --------------------------------------------------------------
+
+    def python_ast(self):
+        """Stdlib ``ast`` tree for the file, or None if it doesn't parse."""
+        if self._python_ast is _UNSET:
+            self._python_ast = _parse_python_ast(self.content, self.file_path)
+        return self._python_ast
+
+    def _analyzer_for(self, language: str):
+        analyzer = self.analyzer
+        if (analyzer is not None
+                and getattr(analyzer, 'language', None) == language
+                and getattr(analyzer, 'content', None) is self.content):
+            return analyzer
+        return None
+
+    def ts_root(self, language: str):
+        """Tree-sitter root node for *language*, or None if it can't be parsed."""
+        if language not in self._ts_roots:
+            analyzer = self._analyzer_for(language)
+            if analyzer is not None:
+                from ..core import tree_root
+                tree = analyzer.tree
+                root = tree_root(tree) if tree is not None else None
+            else:
+                root = _parse_treesitter_root(self.content, self.file_path, language)
+            self._ts_roots[language] = root
+        return self._ts_roots[language]
+
+    def nodes_by_kind(self, language: str) -> Optional[Dict[str, list]]:
+        """Node kind → nodes (document order) for *language*; None if unparsed."""
+        if language in self._node_index:
+            return self._node_index[language]
+        index: Optional[Dict[str, list]] = None
+        analyzer = self._analyzer_for(language)
+        if analyzer is not None and hasattr(analyzer, '_find_nodes_by_type'):
+            analyzer._find_nodes_by_type('')  # builds the analyzer's single-pass index
+            index = analyzer._node_cache
+        if index is None:
+            root = self.ts_root(language)
+            if root is not None:
+                from ..core import _zero_arg, iter_tree
+                index = {}
+                for node in iter_tree(root):
+                    index.setdefault(_zero_arg(node, 'kind'), []).append(node)
+        self._node_index[language] = index
+        return index
+
+    # -- lines --------------------------------------------------------------
+
+    @property
+    def lines(self) -> List[str]:
+        """``content.splitlines()``, computed once."""
+        if self._lines is None:
+            self._lines = self.content.splitlines()
+        return self._lines
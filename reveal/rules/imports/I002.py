@@ -247,6 +247,7 @@ class I002(BaseRule):
     category = RulePrefix.I
     severity = Severity.HIGH
     file_patterns = _initialize_file_patterns()  # Populated at module load time
+    cross_file = True
     version = "2.0.0"
 
     def check(self,
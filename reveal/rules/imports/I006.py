@@ -177,7 +177,7 @@ class I006(BaseRule):
             return detections
 
         # Index raw source lines for noqa detection (analyzers strip comments from 'content')
-        source_lines = content.splitlines() if content else []
+        source_lines = self.source_lines(content) if content else []
 
         for imp in imports:
             import_line: int = imp.get('line', 0)
@@ -147,6 +147,7 @@ class M102(BaseRule):
     category = RulePrefix.M
     severity = Severity.MEDIUM
     file_patterns = ['.py']
+    cross_file = True
     version = "1.0.0"
 
     # Files that are typically entry points, not imported
@@ -32,12 +32,12 @@ from typing import List, Dict, Any, Optional
 from tree_sitter_language_pack import get_parser
 
 from ..base import BaseRule, Detection, RulePrefix, Severity
-from ..base_mixins import ASTParsingMixin
+from ..base_mixins import PYTHON_AST, ASTParsingMixin, NodeVisitorMixin
 from ...core.treesitter_compat import tree_root, ts_parse
 from ._m104_treesitter import extract_collections
 
 
-class M104(BaseRule, ASTParsingMixin):
+class M104(BaseRule, ASTParsingMixin, NodeVisitorMixin):
     """Detect hardcoded lists that may become stale."""
 
     code = "M104"
@@ -56,6 +56,8 @@ class M104(BaseRule, ASTParsingMixin):
         '.java': 'java',
     }
 
+    AST_NODE_TYPES = (ast.Assign, ast.Dict)
+
     # Minimum list size to flag (smaller lists are often intentional)
     MIN_LIST_SIZE = 5
     # Lower threshold for dict values (these are often lookup tables)
@@ -190,37 +192,40 @@ class M104(BaseRule, ASTParsingMixin):
         """Check for hardcoded lists/arrays across Python, JS/TS, Go, Rust, Java."""
         ext = Path(file_path).suffix.lower()
         if ext == '.py':
-            return self._check_python(file_path, content)
+            return self._check_by_visiting(file_path, structure, content)
 
         language = self._TS_LANGUAGE_BY_EXT.get(ext)
         if language is None:
             return []
         return self._check_treesitter(file_path, content, language)
 
-    def _check_python(self, file_path: str, content: str) -> List[Detection]:
-        """Check for hardcoded lists in Python files (ast-based)."""
-        tree, detections = self._parse_python_or_skip(content, file_path)
-        if tree is None:
-            return detections
-
-        for node in self._ast_walk(tree):
-            if isinstance(node, ast.Assign):
-                detections.extend(self._check_assign_node(node, file_path))
-            if isinstance(node, ast.Dict):
-                detection = self._check_dict_with_list_values(node, file_path)
-                if detection:
-                    detections.append(detection)
+    def visit_language(self, file_path: str) -> Optional[str]:
+        # Only the Python branch is visitor-driven; the tree-sitter branch
+        # delegates to extract_collections, which owns its own traversal.
+        return PYTHON_AST if Path(file_path).suffix.lower() == '.py' else None
 
-        return detections
+    def visit_node(self, node: ast.Assign | ast.Dict) -> None:
+        """Check for hardcoded lists in Python files (ast-based)."""
+        if isinstance(node, ast.Assign):
+            self._detections.extend(self._check_assign_node(node, self._file_path))
+        else:
+            detection = self._check_dict_with_list_values(node, self._file_path)
+            if detection:
+                self._detections.append(detection)
 
     def _check_treesitter(self, file_path: str, content: str, language: str) -> List[Detection]:
         """Check for hardcoded collection literals via tree-sitter (JS/TS/Go/Rust/Java)."""
-        try:
-            parser = get_parser(language)
-        except Exception:
-            return []
-        tree = ts_parse(parser, content)
-        root = tree_root(tree)
+        analysis = self.analysis
+        if analysis is not None and analysis.covers(file_path, content):
+            # Under check_file: the analyzer's own tree for this language.
+            root = analysis.ts_root(language)
+        else:
+            try:
+                parser = get_parser(language)
+            except Exception:
+                return []
+            tree = ts_parse(parser, content)
+            root = tree_root(tree)
         if root is None:
             return []
 
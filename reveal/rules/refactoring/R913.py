@@ -7,10 +7,10 @@ import ast
 from typing import List, Dict, Any, Optional
 
 from ..base import BaseRule, Detection, RulePrefix, Severity
-from ..base_mixins import ASTParsingMixin
+from ..base_mixins import ASTParsingMixin, NodeVisitorMixin
 
 
-class R913(BaseRule, ASTParsingMixin):
+class R913(BaseRule, ASTParsingMixin, NodeVisitorMixin):
     """Detect functions with too many arguments (>5 is a code smell)."""
 
     code = "R913"
@@ -23,6 +23,8 @@ class R913(BaseRule, ASTParsingMixin):
     # Threshold for "too many" (configurable in future)
     MAX_ARGS = 5
 
+    AST_NODE_TYPES = (ast.FunctionDef, ast.AsyncFunctionDef)
+
     @staticmethod
     def _get_def_line(content: str, node) -> str:
         """Extract the def line from source, falling back to a placeholder."""
@@ -47,43 +49,36 @@ class R913(BaseRule, ASTParsingMixin):
         Returns:
             List of detections
         """
-        tree, detections = self._parse_python_or_skip(content, file_path)
-        if tree is None:
-            return detections
-
-        # Walk the AST looking for function definitions
-        for node in self._ast_walk(tree):
-            if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
-                # Count arguments (exclude self, cls, *args, **kwargs)
-                args = node.args
-
-                # Count positional and keyword-only args
-                total_args = len(args.args) + len(args.kwonlyargs)
-
-                # Exclude 'self' or 'cls' for methods
-                if args.args and args.args[0].arg in ('self', 'cls'):
-                    total_args -= 1
-
-                # Don't count *args or **kwargs as violations
-                # (they're often used to reduce argument lists)
-
-                if total_args > self.MAX_ARGS:
-                    arg_names = [a.arg for a in args.args] + [a.arg for a in args.kwonlyargs]
-                    context = self._get_def_line(content, node)
-                    suggestion = (
-                        f"Reduce to {self.MAX_ARGS} or fewer arguments. "
-                        f"Consider: 1) Using a config object/dataclass, "
-                        f"2) Breaking function into smaller pieces, "
-                        f"3) Using **kwargs for optional params"
-                    )
-
-                    detections.append(self.create_detection(
-                        file_path=file_path,
-                        line=node.lineno,
-                        message=f"{self.message} ({total_args} > {self.MAX_ARGS}): {node.name}()",
-                        column=node.col_offset + 1,
-                        suggestion=suggestion,
-                        context=context
-                    ))
-
-        return detections
+        return self._check_by_visiting(file_path, structure, content)
+
+    def visit_node(self, node: ast.FunctionDef | ast.AsyncFunctionDef) -> None:
+        # Count arguments (exclude self, cls, *args, **kwargs)
+        args = node.args
+
+        # Count positional and keyword-only args
+        total_args = len(args.args) + len(args.kwonlyargs)
+
+        # Exclude 'self' or 'cls' for methods
+        if args.args and args.args[0].arg in ('self', 'cls'):
+            total_args -= 1
+
+        # Don't count *args or **kwargs as violations
+        # (they're often used to reduce argument lists)
+
+        if total_args > self.MAX_ARGS:
+            context = self._get_def_line(self._content, node)
+            suggestion = (
+                f"Reduce to {self.MAX_ARGS} or fewer arguments. "
+                f"Consider: 1) Using a config object/dataclass, "
+                f"2) Breaking function into smaller pieces, "
+                f"3) Using **kwargs for optional params"
+            )
+
+            self._detections.append(self.create_detection(
+                file_path=self._file_path,
+                line=node.lineno,
+                message=f"{self.message} ({total_args} > {self.MAX_ARGS}): {node.name}()",
+                column=node.col_offset + 1,
+                suggestion=suggestion,
+                context=context
+            ))
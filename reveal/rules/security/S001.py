@@ -10,7 +10,7 @@ import logging
 from typing import List, Dict, Any, Optional
 
 from ..base import BaseRule, Detection, RulePrefix, Severity
-from ..base_mixins import ASTParsingMixin
+from ..base_mixins import PYTHON_AST, ASTParsingMixin, NodeVisitorMixin
 
 logger = logging.getLogger(__name__)
 
@@ -76,7 +76,7 @@ _SAFE_VALUE_WORDS = frozenset({
 _MIN_VALUE_LENGTH = 6
 
 
-class S001(BaseRule, ASTParsingMixin):
+class S001(BaseRule, ASTParsingMixin, NodeVisitorMixin):
     """Detect hardcoded secrets in source files."""
 
     code = "S001"
@@ -90,13 +90,15 @@ class S001(BaseRule, ASTParsingMixin):
     file_patterns = ['.py', '.env', '.env.*', '.yaml', '.yml', '.toml']
     version = "1.0.0"
 
+    AST_NODE_TYPES = (ast.Assign, ast.AnnAssign)
+
     def check(self,
               file_path: str,
               structure: Optional[Dict[str, Any]],
               content: str) -> List[Detection]:
         ext = self._ext(file_path)
         if ext == '.py':
-            return self._check_python(file_path, content)
+            return self._check_by_visiting(file_path, structure, content)
         if ext in ('.yaml', '.yml'):
             return self._check_yaml(file_path, content)
         if ext == '.toml':
@@ -109,31 +111,27 @@ class S001(BaseRule, ASTParsingMixin):
     # Python: AST-based assignment detection
     # ------------------------------------------------------------------
 
-    def _check_python(self, file_path: str, content: str) -> List[Detection]:
-        tree, detections = self._parse_python_or_skip(content, file_path)
-        if tree is None:
-            return detections
+    def visit_language(self, file_path: str) -> Optional[str]:
+        return PYTHON_AST if self._ext(file_path) == '.py' else None
 
-        for node in self._ast_walk(tree):
-            if isinstance(node, ast.Assign):
-                for target in node.targets:
-                    if isinstance(target, ast.Name):
-                        det = self._check_name_value(
-                            file_path, target.id, node.value,
-                            node.lineno, node.col_offset + 1,
-                        )
-                        if det:
-                            detections.append(det)
-            elif isinstance(node, ast.AnnAssign):
-                if isinstance(node.target, ast.Name) and node.value is not None:
+    def visit_node(self, node: ast.Assign | ast.AnnAssign) -> None:
+        file_path, detections = self._file_path, self._detections
+        if isinstance(node, ast.Assign):
+            for target in node.targets:
+                if isinstance(target, ast.Name):
                     det = self._check_name_value(
-                        file_path, node.target.id, node.value,
+                        file_path, target.id, node.value,
                         node.lineno, node.col_offset + 1,
                     )
                     if det:
                         detections.append(det)
-
-        return detections
+        elif isinstance(node.target, ast.Name) and node.value is not None:
+            det = self._check_name_value(
+                file_path, node.target.id, node.value,
+                node.lineno, node.col_offset + 1,
+            )
+            if det:
+                detections.append(det)
 
     def _check_name_value(
         self,
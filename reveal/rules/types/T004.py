@@ -17,10 +17,10 @@ import ast
 from typing import List, Dict, Any, Optional
 
 from ..base import BaseRule, Detection, RulePrefix, Severity
-from ..base_mixins import ASTParsingMixin
+from ..base_mixins import ASTParsingMixin, NodeVisitorMixin
 
 
-class T004(BaseRule, ASTParsingMixin):
+class T004(BaseRule, ASTParsingMixin, NodeVisitorMixin):
     """Detect implicit Optional parameters (PEP 484 violation)."""
 
     code = "T004"
@@ -30,6 +30,8 @@ class T004(BaseRule, ASTParsingMixin):
     file_patterns = ['.py']
     version = "1.0.0"
 
+    AST_NODE_TYPES = (ast.FunctionDef, ast.AsyncFunctionDef)
+
     def check(self,
              file_path: str,
              structure: Optional[Dict[str, Any]],
@@ -45,16 +47,10 @@ class T004(BaseRule, ASTParsingMixin):
         Returns:
             List of detections
         """
-        tree, detections = self._parse_python_or_skip(content, file_path)
-        if tree is None:
-            return detections
-
-        # Walk the AST looking for function definitions
-        for node in self._ast_walk(tree):
-            if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
-                self._check_function_params(node, file_path, content, detections)
+        return self._check_by_visiting(file_path, structure, content)
 
-        return detections
+    def visit_node(self, node: ast.FunctionDef | ast.AsyncFunctionDef) -> None:
+        self._check_function_params(node, self._file_path, self._content, self._detections)
 
     def _check_function_params(self, func_node: ast.FunctionDef | ast.AsyncFunctionDef, file_path: str,
                                content: str, detections: List[Detection]) -> None:
@@ -14,10 +14,10 @@ import ast
 from typing import List, Dict, Any, Optional
 
 from ..base import BaseRule, Detection, RulePrefix, Severity
-from ..base_mixins import ASTParsingMixin
+from ..base_mixins import ASTParsingMixin, NodeVisitorMixin
 
 
-class T005(BaseRule, ASTParsingMixin):
+class T005(BaseRule, ASTParsingMixin, NodeVisitorMixin):
     """Report functions with partial type annotations."""
 
     code = "T005"
@@ -27,19 +27,16 @@ class T005(BaseRule, ASTParsingMixin):
     file_patterns = ['.py']
     version = "1.0.0"
 
+    AST_NODE_TYPES = (ast.FunctionDef, ast.AsyncFunctionDef)
+
     def check(self,
               file_path: str,
               structure: Optional[Dict[str, Any]],
               content: str) -> List[Detection]:
-        tree, detections = self._parse_python_or_skip(content, file_path)
-        if tree is None:
-            return detections
-
-        for node in self._ast_walk(tree):
-            if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
-                self._check_function(node, file_path, content, detections)
+        return self._check_by_visiting(file_path, structure, content)
 
-        return detections
+    def visit_node(self, node: ast.FunctionDef | ast.AsyncFunctionDef) -> None:
+        self._check_function(node, self._file_path, self._content, self._detections)
 
     def _check_function(self,
                         func_node: ast.FunctionDef | ast.AsyncFunctionDef,
@@ -14,13 +14,13 @@ import ast
 from typing import Dict, List, Optional, Set, Any
 
 from ..base import BaseRule, Detection, RulePrefix, Severity
-from ..base_mixins import ASTParsingMixin
+from ..base_mixins import ASTParsingMixin, NodeVisitorMixin
 
 _BARE_DICT_NAMES = frozenset({'dict', 'Dict'})
 _MIN_KEY_MATCH = 3
 
 
-class T006(BaseRule, ASTParsingMixin):
+class T006(BaseRule, ASTParsingMixin, NodeVisitorMixin):
     """Suggest TypedDict when bare dict annotation + matching TypedDict exists."""
 
     code = "T006"
@@ -30,25 +30,23 @@ class T006(BaseRule, ASTParsingMixin):
     file_patterns = ['.py']
     version = "1.0.0"
 
+    AST_NODE_TYPES = (ast.FunctionDef, ast.AsyncFunctionDef)
+
     def check(
         self,
         file_path: str,
         structure: Optional[Dict[str, Any]],
         content: str,
     ) -> List[Detection]:
-        tree, detections = self._parse_python_or_skip(content, file_path)
-        if tree is None:
-            return detections
-
-        typeddicts = _collect_typeddicts(tree)
-        if not typeddicts:
-            return detections
+        return self._check_by_visiting(file_path, structure, content)
 
-        for node in self._ast_walk(tree):
-            if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
-                _check_function(node, typeddicts, file_path, detections, self)
+    def begin_visit(self, file_path, structure, content, root) -> bool:
+        super().begin_visit(file_path, structure, content, root)
+        self._typeddicts = _collect_typeddicts(root)
+        return bool(self._typeddicts)
 
-        return detections
+    def visit_node(self, node: ast.FunctionDef | ast.AsyncFunctionDef) -> None:
+        _check_function(node, self._typeddicts, self._file_path, self._detections, self)
 
 
 # ─────────────────────────── TypedDict collection ────────────────────────────
@@ -1,16 +1,177 @@
 """Directory tree view for reveal."""
 
+import codecs
 import datetime
 import heapq
 import os
+import re
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Generator, List, Optional, Tuple
-from .registry import get_analyzer
+from typing import Any, Callable, Dict, Generator, List, Optional, Tuple
+from .base import FileAnalyzer
+from .registry import discover_plugins, get_analyzer
 from .display.filtering import PathFilter
 from .utils import format_size
 
 
+# ── File info (lines + type) without instantiating analyzers ────────────────
+#
+# The tree shows "N lines, Type" per file. Building an analyzer for that reads,
+# decodes and splits every file (and some analyzers parse on construction), so
+# for analyzers that inherit FileAnalyzer's reader and get_metadata() the line
+# count comes from a raw-bytes newline count instead, and the type from the
+# registered class's `type_name`. Results are memoized by (path, mtime_ns,
+# size) and each directory's visible files are prefetched on a thread pool.
+_LINE_COUNT_CHUNK = 1 << 20
+# Bytes that str.splitlines() treats as line breaks besides \n / \r\n once
+# the file is decoded as UTF-8. Any hit (or a lone \r) sends the file to the
+# analyzer path for an exact count. A bare 0x85 byte is a break only when
+# FileAnalyzer falls back to latin-1, i.e. the file isn't valid UTF-8.
+_EXOTIC_LINE_BREAKS_RE = re.compile(rb'[\x0b\x0c\x1c-\x1e]|\xc2\x85|\xe2\x80[\xa8\xa9]')
+_TREE_INFO_MAX_WORKERS = 8
+_MAX_FILE_INFO_CACHE = 4096
+_file_info_cache: "OrderedDict[Tuple[str, int, int], Optional[Tuple[int, str]]]" = OrderedDict()
+_file_info_lock = threading.Lock()
+
+
+def _count_lines(path: Path) -> Optional[int]:
+    """Line count equal to ``len(text.splitlines())``, from raw bytes.
+
+    Returns None when bytes alone can't decide (lone CRs, form feeds,
+    U+2028 and friends, or 0x85 in a non-UTF-8 file) — the caller then
+    counts via the analyzer. Reads in chunks; a CRLF or multi-byte break
+    straddling a chunk boundary is caught by carrying the previous chunk's
+    last two bytes.
+    """
+    newlines = crs = crlfs = 0
+    saw_nel_byte = False
+    tail = b''
+    with open(path, 'rb') as fh:
+        while True:
+            chunk = fh.read(_LINE_COUNT_CHUNK)
+            if not chunk:
+                break
+            window = tail + chunk
+            if _EXOTIC_LINE_BREAKS_RE.search(window):
+                return None
+            newlines += chunk.count(b'\n')
+            crs += chunk.count(b'\r')
+            crlfs += chunk.count(b'\r\n') + (1 if tail.endswith(b'\r') and chunk.startswith(b'\n') else 0)
+            saw_nel_byte = saw_nel_byte or b'\x85' in chunk
+            tail = window[-2:]
+    if crs != crlfs:
+        return None
+    if saw_nel_byte and not _is_utf8(path):
+        return None
+    return newlines + (1 if tail and not tail.endswith(b'\n') else 0)
+
+
+def _is_utf8(path: Path) -> bool:
+    """True if the whole file decodes as UTF-8 (streamed, constant memory)."""
+    decoder = codecs.getincrementaldecoder('utf-8')()
+    try:
+        with open(path, 'rb') as fh:
+            while True:
+                chunk = fh.read(_LINE_COUNT_CHUNK)
+                if not chunk:
+                    break
+                decoder.decode(chunk)
+        decoder.decode(b'', final=True)
+    except UnicodeDecodeError:
+        return False
+    return True
+
+
+def _reads_like_base_analyzer(analyzer_class: type) -> bool:
+    """True if the analyzer's 'lines' metadata is FileAnalyzer's text.splitlines()."""
+    return (
+        isinstance(analyzer_class, type)
+        and issubclass(analyzer_class, FileAnalyzer)
+        and analyzer_class.get_metadata is FileAnalyzer.get_metadata
+        and analyzer_class._read_file is FileAnalyzer._read_file
+    )
+
+
+def _file_line_info(path: Path, stat: os.stat_result) -> Optional[Tuple[int, str]]:
+    """(line count, type name) for a file reveal can analyze, else None.
+
+    Memoized by (path, mtime_ns, size). Raises if the file can't be read or
+    analyzed; callers fall back to the bare name.
+    """
+    key = (str(path), stat.st_mtime_ns, stat.st_size)
+    with _file_info_lock:
+        if key in _file_info_cache:
+            _file_info_cache.move_to_end(key)
+            return _file_info_cache[key]
+
+    info: Optional[Tuple[int, str]] = None
+    analyzer_class = get_analyzer(str(path))
+    if analyzer_class:
+        type_name = getattr(analyzer_class, 'type_name', None)
+        lines = None
+        if (type_name and _reads_like_base_analyzer(analyzer_class)
+                and stat.st_size <= analyzer_class.MAX_INPUT_SIZE):
+            lines = _count_lines(path)
+        if lines is None:
+            analyzer = analyzer_class(str(path))
+            lines = analyzer.get_metadata()['lines']
+            type_name = analyzer.type_name
+        info = (lines, type_name)
+
+    with _file_info_lock:
+        _file_info_cache[key] = info
+        if len(_file_info_cache) > _MAX_FILE_INFO_CACHE:
+            _file_info_cache.popitem(last=False)
+    return info
+
+
+def _tree_info_workers() -> int:
+    """Threads for prefetching file info; REVEAL_MAX_WORKERS overrides."""
+    override = os.environ.get('REVEAL_MAX_WORKERS')
+    if override:
+        try:
+            return max(1, int(override))
+        except ValueError:
+            pass
+    return max(1, min((os.cpu_count() or 1) + 4, _TREE_INFO_MAX_WORKERS))
+
+
+def _info_pool(fast: bool) -> Optional[ThreadPoolExecutor]:
+    """Thread pool for file-info prefetch, or None when it wouldn't help."""
+    if fast:
+        return None  # --fast is one stat() per file; nothing worth overlapping
+    workers = _tree_info_workers()
+    if workers <= 1:
+        return None
+    discover_plugins()  # register analyzers once, before worker threads look them up
+    return ThreadPoolExecutor(max_workers=workers)
+
+
+def _prefetch_file_infos(entries: List[Path], start: int, dir_entry_count: int, context: dict,
+                         build: Callable[[Path], Any]) -> Dict[Path, Any]:
+    """Build per-file output for the files this directory will show, in parallel.
+
+    Called at the first file entry (after any directories have been walked,
+    so the global count is current): from `start`, only as many entries as
+    the per-directory and global limits can still display are considered.
+    """
+    pool = context.get('info_pool')
+    if pool is None:
+        return {}
+    stop = len(entries)
+    if context.get('dir_limit', 0) > 0:
+        stop = min(stop, start + max(0, context['dir_limit'] - dir_entry_count))
+    if context.get('max_entries', 0) > 0:
+        stop = min(stop, start + max(0, context['max_entries'] - context['count']))
+    files = [e for e in entries[start:stop] if e.is_file()]
+    if len(files) < 2:
+        return {}
+    return dict(zip(files, pool.map(build, files)))
+
+
 @dataclass
 class TreeViewOptions:
     """Options controlling directory tree rendering."""
@@ -257,8 +418,14 @@ def show_directory_tree(path: str, options: Optional[TreeViewOptions] = None, **
         'sort_desc': options.sort_desc, 'include_extensions': options.include_extensions,
         'max_entries_hit': False, 'dir_limit_hit': False,
     }
-    _walk_directory(root_path, lines, depth=options.depth, show_hidden=options.show_hidden,
-                   fast=options.fast, context=context, path_filter=path_filter)
+    pool = _info_pool(options.fast)
+    context['info_pool'] = pool
+    try:
+        _walk_directory(root_path, lines, depth=options.depth, show_hidden=options.show_hidden,
+                       fast=options.fast, context=context, path_filter=path_filter)
+    finally:
+        if pool is not None:
+            pool.shutdown()
 
     # Show truncation message if we hit the limit — name whichever flag(s) actually fired,
     # since --max-entries 0 alone won't expand a directory still capped by --dir-limit (BACK-864).
@@ -383,13 +550,14 @@ def _get_tree_connectors(is_last: bool) -> tuple:
 
 
 def _process_file_entry(entry: Path, lines: List[str], prefix: str, connector: str,
-                       context: dict, fast: bool) -> int:
+                       context: dict, fast: bool, file_info: Optional[str] = None) -> int:
     """Process file entry and add to output.
 
     Returns:
         Number of entries added (always 1 for files)
     """
-    file_info = _get_file_info(entry, fast=fast)
+    if file_info is None:
+        file_info = _get_file_info(entry, fast=fast)
     lines.append(f"{prefix}{connector}{file_info}")
     context['count'] += 1
     return 1
@@ -442,6 +610,7 @@ def _walk_directory(path: Path, lines: List[str], prefix: str = '', depth: int =
 
     dir_limit = context.get('dir_limit', 0)
     dir_entry_count = 0
+    infos: Optional[Dict[Path, Any]] = None
 
     for i, entry in enumerate(entries):
         if _check_global_limit(context, entries, i):
@@ -454,7 +623,11 @@ def _walk_directory(path: Path, lines: List[str], prefix: str = '', depth: int =
         connector, extension = _get_tree_connectors(is_last)
 
         if entry.is_file():
-            dir_entry_count += _process_file_entry(entry, lines, prefix, connector, context, fast)
+            if infos is None:
+                infos = _prefetch_file_infos(
+                    entries, i, dir_entry_count, context, lambda p: _get_file_info(p, fast=fast))
+            dir_entry_count += _process_file_entry(entry, lines, prefix, connector, context, fast,
+                                                   file_info=infos.get(entry))
         elif entry.is_dir():
             dir_entry_count += _process_dir_entry(entry, lines, prefix, connector, extension,
                                                   context, depth, show_hidden, fast, path_filter)
@@ -496,8 +669,14 @@ def show_directory_tree_json(path: str, options: Optional[TreeViewOptions] = Non
         'sort_desc': options.sort_desc, 'include_extensions': options.include_extensions,
         'max_entries_hit': False, 'dir_limit_hit': False,
     }
-    entries = _walk_directory_json(root_path, depth=options.depth, show_hidden=options.show_hidden,
-                                   fast=options.fast, context=context, path_filter=path_filter)
+    pool = _info_pool(options.fast)
+    context['info_pool'] = pool
+    try:
+        entries = _walk_directory_json(root_path, depth=options.depth, show_hidden=options.show_hidden,
+                                       fast=options.fast, context=context, path_filter=path_filter)
+    finally:
+        if pool is not None:
+            pool.shutdown()
 
     result: dict = {'path': str(root_path), 'name': root_path.name or str(root_path), 'entries': entries}
     if context['truncated'] > 0:
@@ -520,17 +699,15 @@ def _file_entry_json(path: Path, fast: bool) -> dict:
     """Structured counterpart to _get_file_info."""
     entry: dict = {'name': path.name, 'type': 'file'}
     try:
+        stat = os.stat(path)
         if fast:
-            entry['size'] = os.stat(path).st_size
+            entry['size'] = stat.st_size
             return entry
-        analyzer_class = get_analyzer(str(path))
-        if analyzer_class:
-            analyzer = analyzer_class(str(path))
-            meta = analyzer.get_metadata()
-            entry['lines'] = meta['lines']
-            entry['language'] = analyzer.type_name
+        info = _file_line_info(path, stat)
+        if info:
+            entry['lines'], entry['language'] = info
         else:
-            entry['size'] = os.stat(path).st_size
+            entry['size'] = stat.st_size
     except Exception:
         pass
     return entry
@@ -559,6 +736,7 @@ def _walk_directory_json(path: Path, depth: int = 3, show_hidden: bool = False,
     dir_limit = context.get('dir_limit', 0)
     dir_entry_count = 0
     result: List[dict] = []
+    infos: Optional[Dict[Path, Any]] = None
 
     for i, entry in enumerate(entries):
         if _check_global_limit(context, entries, i):
@@ -568,7 +746,10 @@ def _walk_directory_json(path: Path, depth: int = 3, show_hidden: bool = False,
             return result
 
         if entry.is_file():
-            result.append(_file_entry_json(entry, fast))
+            if infos is None:
+                infos = _prefetch_file_infos(
+                    entries, i, dir_entry_count, context, lambda p: _file_entry_json(p, fast))
+            result.append(infos.get(entry) or _file_entry_json(entry, fast))
             context['count'] += 1
             dir_entry_count += 1
         elif entry.is_dir():
@@ -591,27 +772,18 @@ def _get_file_info(path: Path, fast: bool = False) -> str:
         Formatted string like "app.py (247 lines, Python)" or "app.py (12.5 KB)"
     """
     try:
+        stat = os.stat(path)
         if fast:
             # Fast mode: just show file size, no analyzer
-            stat = os.stat(path)
-            size = format_size(stat.st_size)
-            return f"{path.name} ({size})"
-
-        # Normal mode: Try to get analyzer for this file
-        analyzer_class = get_analyzer(str(path))
-
-        if analyzer_class:
-            # Use analyzer to get info
-            analyzer = analyzer_class(str(path))
-            meta = analyzer.get_metadata()
-            file_type = analyzer.type_name
-
-            return f"{path.name} ({meta['lines']} lines, {file_type})"
-        else:
-            # No analyzer - just show basic info
-            stat = os.stat(path)
-            size = format_size(stat.st_size)
-            return f"{path.name} ({size})"
+            return f"{path.name} ({format_size(stat.st_size)})"
+
+        # Normal mode: lines + type for files reveal can analyze
+        info = _file_line_info(path, stat)
+        if info:
+            line_count, file_type = info
+            return f"{path.name} ({line_count} lines, {file_type})"
+        # No analyzer - just show basic info
+        return f"{path.name} ({format_size(stat.st_size)})"
 
     except Exception:
         # If anything fails, just show filename
@@ -13,7 +13,7 @@ from .complexity import (
     _NESTING_TYPES,
     _KEYWORD_PAIRS,
 )
-from .core import disk_cache
+from .core import content_keys, disk_cache
 from .core import suppress_treesitter_warnings
 from .core import node_children as _children
 from .core import node_next_sibling as _next_sibling
@@ -580,6 +580,10 @@ class TreeSitterAnalyzer(FileAnalyzer):
         path were ever analyzed under a different grammar. Returns None (skip
         cache) on any stat error, so a vanished/unreadable file falls through
         to the uncached (correct) path rather than caching a wrong key.
+
+        A file materialized from a git ref (see core.content_keys) is keyed
+        on (blob OID, language) instead, so its entry is shared by every ref
+        and every run that materializes the same blob.
         """
         try:
             path_str = os.path.abspath(str(self.path))
@@ -587,6 +591,13 @@ class TreeSitterAnalyzer(FileAnalyzer):
         except OSError:
             return None
         hasher = hashlib.sha256()
+        content_key = content_keys.lookup(path_str, st)
+        if content_key is not None:
+            hasher.update(b"blob\x00")
+            hasher.update(content_key.encode("utf-8", "replace"))
+            hasher.update(b"\x00")
+            hasher.update(str(self.language).encode("utf-8", "replace"))
+            return hasher.hexdigest()
         hasher.update(path_str.encode("utf-8", "replace"))
         hasher.update(b"\x00")
         hasher.update(str(st.st_mtime_ns).encode("ascii"))
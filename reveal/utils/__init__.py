@@ -2,7 +2,9 @@
 
 from .clipboard import copy_to_clipboard
 from .formatting import format_size
-from .json_utils import DateTimeEncoder, safe_json_dumps, print_json_result, set_provenance_enabled
+from .json_utils import (
+    DateTimeEncoder, safe_json_dumps, print_json_result, set_provenance_enabled, set_ndjson_enabled,
+)
 from .breadcrumbs import (
     get_element_placeholder,
     get_file_type_from_analyzer,
@@ -25,6 +27,7 @@ from .query import (
     QueryFilter,
     apply_filter,
     apply_filters,
+    compile_filters,
 )
 
 __all__ = [
@@ -34,6 +37,7 @@ __all__ = [
     'safe_json_dumps',
     'print_json_result',
     'set_provenance_enabled',
+    'set_ndjson_enabled',
     'get_element_placeholder',
     'get_file_type_from_analyzer',
     'print_breadcrumbs',
@@ -52,4 +56,5 @@ __all__ = [
     'QueryFilter',
     'apply_filter',
     'apply_filters',
+    'compile_filters',
 ]
@@ -14,13 +14,23 @@ class DateTimeEncoder(json.JSONEncoder):
 
 
 def safe_json_dumps(obj, **kwargs):
-    """Safely dump JSON with support for datetime/date objects."""
+    """Safely dump JSON with support for datetime/date objects.
+
+    Compact (one line) under --format ndjson, so a document printed through
+    here is still a valid NDJSON stream of one record.
+    """
     kwargs.setdefault('cls', DateTimeEncoder)
-    kwargs.setdefault('indent', 2)
+    kwargs.setdefault('indent', None if _ndjson_enabled else 2)
     return json.dumps(obj, **kwargs)
 
 
 _provenance_enabled = False
+_ndjson_enabled = False
+
+# Top-level list fields probed, in order, when splitting a result into NDJSON
+# records (routing/uri.py's budget-constraint probe order, plus calls://'s
+# 'entries').
+NDJSON_LIST_FIELDS = ('items', 'results', 'checks', 'commits', 'files', 'entries')
 
 
 def set_provenance_enabled(enabled: bool) -> None:
@@ -57,6 +67,73 @@ def print_json_result(result, file=None) -> None:
     those should keep using plain json.dumps/safe_json_dumps directly.
 
     When provenance is enabled (see set_provenance_enabled), attaches an
-    'execution' block to dict results that don't already carry one.
+    'execution' block to dict results that don't already carry one. Under
+    --format ndjson the result is split into records (print_ndjson_result).
     """
+    if _ndjson_enabled:
+        print_ndjson_result(attach_provenance(result), file=file)
+        return
     print(safe_json_dumps(attach_provenance(result)), file=file or sys.stdout)
+
+
+def set_ndjson_enabled(enabled: bool) -> None:
+    """Toggle --format ndjson output. Set once from CLI arg parsing, which
+    also rewrites args.format to 'json' so every JSON code path runs
+    unchanged; print_json_result then splits each result into records, and
+    the scan paths that can produce records incrementally (check, --grep on
+    a directory, adapters whose get_structure accepts ``on_record``) stream
+    them as they are produced. Module-level for the same reason as
+    set_provenance_enabled.
+    """
+    global _ndjson_enabled
+    _ndjson_enabled = enabled
+
+
+def ndjson_enabled() -> bool:
+    """True while --format ndjson is active."""
+    return _ndjson_enabled
+
+
+def record_kind(list_field: str) -> str:
+    """Record name for one item of *list_field*: 'files' -> 'file'."""
+    return list_field[:-1] if list_field.endswith('s') else list_field
+
+
+def print_ndjson_record(kind: str, payload: dict, file=None) -> None:
+    """Print one NDJSON record — ``{"record": kind, ...payload}`` on one line —
+    and flush, so a consumer (``jq``, a pipeline) sees it immediately."""
+    out = file or sys.stdout
+    line = {'record': kind, **payload}
+    line['record'] = kind  # a payload's own 'record' key can't relabel it; stays first
+    out.write(json.dumps(line, cls=DateTimeEncoder, separators=(',', ':')) + '\n')
+    out.flush()
+
+
+def print_ndjson_result(result, list_field=None, streamed: int = 0, file=None) -> None:
+    """Print *result* as NDJSON: one record per item of its list field, then
+    a closing ``summary`` record carrying everything else (the meta/trust
+    envelope, contract fields, totals).
+
+    Args:
+        result: Result dict (non-dicts are printed as a single record).
+        list_field: Field holding the per-item list; probed from
+            NDJSON_LIST_FIELDS when None.
+        streamed: Items of *list_field* already emitted by the producer
+            (via print_ndjson_record) — added to the summary's count.
+    """
+    if not isinstance(result, dict):
+        print_ndjson_record('value', {'value': result}, file=file)
+        return
+    if list_field is None:
+        list_field = next((f for f in NDJSON_LIST_FIELDS if isinstance(result.get(f), list)), None)
+    items = result.get(list_field) if list_field else None
+    if not isinstance(items, list):
+        print_ndjson_record('summary', result, file=file)
+        return
+    kind = record_kind(list_field)
+    for item in items:
+        print_ndjson_record(kind, item if isinstance(item, dict) else {'value': item}, file=file)
+    summary = {k: v for k, v in result.items() if k != list_field}
+    summary['records'] = {'kind': kind, 'count': streamed + len(items)}
+    print_ndjson_record('summary', summary, file=file)
+
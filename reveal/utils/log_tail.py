@@ -0,0 +1,99 @@
+"""Bounded-memory reading from the end of large append-only logs.
+
+``fh.readlines()[-n:]`` reads and holds the whole file to keep its last n
+lines; on a busy server the nginx error log is several GB. The readers here
+walk the file backwards a block at a time and stop as soon as they have
+enough, so memory is bounded by the kept lines plus one block.
+"""
+
+import os
+from typing import Callable, Iterator, List, NamedTuple, Optional
+
+_BLOCK_SIZE = 64 * 1024
+
+
+class Tail(NamedTuple):
+    """Lines read from the end of a byte range of a log, oldest first."""
+    lines: List[str]
+    complete_end: int   # offset just past the last newline in the range
+
+
+def iter_lines_reverse(path: str, start: int = 0, end: Optional[int] = None,
+                       block_size: int = _BLOCK_SIZE) -> Iterator[bytes]:
+    """Yield the lines of bytes ``[start, end)`` of *path*, last line first.
+
+    Lines are yielded without their newline. A final line with no trailing
+    newline is yielded like any other, as readlines() would return it.
+
+    Raises:
+        OSError: if *path* can't be opened.
+    """
+    with open(path, 'rb') as fh:
+        if end is None:
+            end = fh.seek(0, os.SEEK_END)
+        pos = end
+        pending = b''
+        at_end = True   # the next split part is the one after the range's last newline
+        while pos > start:
+            size = min(block_size, pos - start)
+            pos -= size
+            fh.seek(pos)
+            parts = (fh.read(size) + pending).split(b'\n')
+            pending = parts[0]
+            for part in reversed(parts[1:]):
+                if at_end:
+                    at_end = False
+                    if not part:
+                        continue
+                yield part
+        if pending or not at_end:
+            yield pending
+
+
+def _decode(raw: bytes) -> str:
+    return raw.decode('utf-8', errors='replace').rstrip('\r')
+
+
+def read_tail(path: str, max_lines: Optional[int] = None, start: int = 0,
+              end: Optional[int] = None,
+              stop: Optional[Callable[[str], bool]] = None) -> Tail:
+    """The last *max_lines* lines of bytes ``[start, end)`` of *path*.
+
+    Args:
+        path: Log file.
+        max_lines: Keep at most this many (positive) lines; None keeps all.
+        start: Don't read before this byte offset (e.g. a checkpoint).
+        end: Read up to this byte offset (None: current end of file).
+        stop: Called on each line, newest first; the first line it returns
+            True for is dropped and reading stops there. Used for time
+            windows: ``stop=lambda line: line[:19] < cutoff``.
+
+    Returns:
+        Tail with the kept lines (decoded as UTF-8 with replacement) and the
+        offset just past the last newline, so a caller checkpointing the
+        range can re-read a line that was still being written.
+
+    Raises:
+        OSError: if *path* can't be opened.
+    """
+    with open(path, 'rb') as fh:
+        if end is None:
+            end = fh.seek(0, os.SEEK_END)
+        complete_end = end
+        if end > start:
+            fh.seek(end - 1)
+            if fh.read(1) != b'\n':
+                complete_end = None
+
+    lines: List[str] = []
+    for raw in iter_lines_reverse(path, start, end):
+        if complete_end is None:
+            complete_end = end - len(raw)
+        line = _decode(raw)
+        if stop is not None and stop(line):
+            break
+        lines.append(line)
+        if max_lines is not None and len(lines) >= max_lines:
+            break
+    lines.reverse()
+    return Tail(lines, start if complete_end is None else complete_end)
@@ -0,0 +1,99 @@
+"""Compact worker→parent result transport for process-pool fan-outs.
+
+The parallel scan paths (``imports://``/``architecture`` extraction,
+``stats://``, directory ``check``) used to return full nested dict/list
+structures from each worker. ``ProcessPoolExecutor`` pickles those back to the
+parent, where its single result-handler thread unpickles every nested object
+before the reduce step sees any of it — for large repos that IPC is a large
+share of the fan-out cost and spikes parent RSS with data the reduce step often
+throws away (files rejected by a filter, structures nobody asked for).
+
+A :class:`PackedRecord` is one flat ``bytes`` payload instead:
+
+* a **struct-packed scalar header** (``float64`` values) holding the handful of
+  numbers the parent filters on, readable without decoding anything else;
+* any number of **independently pickled segments**, each decoded only on first
+  access (and memoized).
+
+Crossing the process boundary it pickles as a single ``bytes`` object — a
+memcpy for the parent's result thread, not an object-graph rebuild — and the
+parent pays for exactly the segments its reduce step consumes.
+
+Layout (little-endian)::
+
+    u16 n_scalars | u16 n_segments | f64 * n_scalars | u32 * n_segments (lengths)
+    | segment bytes...
+"""
+
+from __future__ import annotations
+
+import pickle
+import struct
+from typing import Any, List, Sequence, Tuple
+
+_COUNTS = struct.Struct('<HH')
+
+# Sentinel distinguishing "not decoded yet" from a segment that decoded to None.
+_UNDECODED = object()
+
+
+def pack_record(scalars: Sequence[float] = (), segments: Sequence[Any] = ()) -> bytes:
+    """Encode ``scalars`` + ``segments`` into one compact ``bytes`` payload.
+
+    Called in the worker process. Scalars must be numbers (bools/ints are stored
+    as ``float64`` — exact for any int below 2**53); segments may be anything
+    picklable and are pickled separately so the parent can decode them one at a
+    time.
+    """
+    blobs = [pickle.dumps(seg, protocol=pickle.HIGHEST_PROTOCOL) for seg in segments]
+    header = _COUNTS.pack(len(scalars), len(blobs))
+    header += struct.pack(f'<{len(scalars)}d', *(float(s) for s in scalars))
+    header += struct.pack(f'<{len(blobs)}I', *(len(b) for b in blobs))
+    return b''.join([header, *blobs])
+
+
+class PackedRecord:
+    """Parent-side lazy view over a :func:`pack_record` payload.
+
+    ``scalars`` is decoded eagerly (a single ``struct.unpack_from``);
+    ``segment(i)`` unpickles segment ``i`` on first access only.
+    """
+
+    __slots__ = ('_data', '_scalars', '_spans', '_decoded')
+
+    def __init__(self, data: bytes):
+        n_scalars, n_segments = _COUNTS.unpack_from(data, 0)
+        offset = _COUNTS.size
+        self._scalars: Tuple[float, ...] = struct.unpack_from(f'<{n_scalars}d', data, offset)
+        offset += 8 * n_scalars
+        lengths = struct.unpack_from(f'<{n_segments}I', data, offset)
+        offset += 4 * n_segments
+        spans: List[Tuple[int, int]] = []
+        for length in lengths:
+            spans.append((offset, offset + length))
+            offset += length
+        self._data = data
+        self._spans = spans
+        self._decoded: List[Any] = [_UNDECODED] * n_segments
+
+    @property
+    def scalars(self) -> Tuple[float, ...]:
+        """The struct-packed header values, in the order they were packed."""
+        return self._scalars
+
+    def segment(self, index: int) -> Any:
+        """Decode (once) and return segment ``index``."""
+        value = self._decoded[index]
+        if value is _UNDECODED:
+            start, end = self._spans[index]
+            value = pickle.loads(memoryview(self._data)[start:end])
+            self._decoded[index] = value
+        return value
+
+    def __len__(self) -> int:
+        return len(self._spans)
+
+    def __reduce__(self):
+        # Re-pickles as the raw payload, so a record can itself be shipped on.
+        return (PackedRecord, (self._data,))
+
@@ -73,7 +73,8 @@ def grep_files(
             internally.
         terms: One term (``str``) or multiple terms (iterable of ``str``).
             All terms must be present for a file to match (AND logic).
-        workers: Maximum number of parallel worker processes.  Defaults to 8.
+        workers: Maximum number of parallel worker processes.  Defaults to 8;
+            ``1`` scans sequentially in-process.
 
     Returns:
         Subset of *paths* where all terms were found, in input order.
@@ -96,8 +97,8 @@ def grep_files(
     if not needles:
         return paths_list  # no constraints → everything matches
 
-    # Sequential fast path for small inputs.
-    if len(paths_list) < _PARALLEL_THRESHOLD:
+    # Sequential fast path for small inputs (or when the caller asked for one worker).
+    if len(paths_list) < _PARALLEL_THRESHOLD or workers <= 1:
         return [p for p in paths_list if _scan_one((p, needles)) is not None]
 
     # Parallel scan — ProcessPoolExecutor preserves result order via .map().
@@ -2,7 +2,7 @@
 
 Split into focused modules (BACK-184):
   query_parser.py  — coerce_value, parse_query_params, QueryFilter, parse_query_filters
-  query_eval.py    — compare_values, apply_filter, apply_filters
+  query_eval.py    — compare_values, compile_comparison, compile_filters, apply_filter, apply_filters
   query_control.py — ResultControl, parse_result_control, apply_result_control, apply_budget_limits
 """
 
@@ -29,6 +29,9 @@ from .query_eval import (  # noqa: F401
     _handle_none_comparison,
     _dispatch_comparison,
     compare_values,
+    compile_comparison,
+    compile_filter,
+    compile_filters,
     apply_filter,
     apply_filters,
 )
@@ -41,6 +44,7 @@ from .query_control import (  # noqa: F401
     _detect_value_types,
     _create_sort_key,
     _apply_sorting,
+    _select_sorted,
     _apply_offset_and_limit,
     apply_result_control,
     apply_budget_limits,
@@ -1,5 +1,6 @@
 """Result control: sorting, pagination, budget limits — ResultControl dataclass."""
 
+import heapq
 from dataclasses import dataclass
 from typing import Any, Dict, List, Optional, Tuple
 
@@ -122,6 +123,21 @@ def _apply_sorting(items: List[Dict[str, Any]], field: str, descending: bool) ->
     return items
 
 
+def _select_sorted(items: List[Dict[str, Any]], field: str, descending: bool, n: int) -> List[Dict[str, Any]]:
+    """The first *n* items of _apply_sorting's order, via heapq instead of a
+    full sort. nsmallest/nlargest order ties exactly as the stable sort does."""
+    has_numbers, has_strings = _detect_value_types(items, field)
+    has_mixed = has_numbers and has_strings
+
+    sort_key = _create_sort_key(field, has_mixed, descending)
+    select = heapq.nlargest if descending else heapq.nsmallest
+
+    try:
+        return select(n, items, key=sort_key)
+    except TypeError:
+        return select(n, items, key=lambda item: str(item.get(field) or ''))
+
+
 def _apply_offset_and_limit(items: List[Dict[str, Any]], offset: int, limit: Optional[int]) -> List[Dict[str, Any]]:
     """Apply offset and limit to items list."""
     if offset > 0:
@@ -132,11 +148,18 @@ def _apply_offset_and_limit(items: List[Dict[str, Any]], offset: int, limit: Opt
 
 
 def apply_result_control(items: List[Dict[str, Any]], control: ResultControl) -> List[Dict[str, Any]]:
-    """Apply result control to a list of items."""
-    result = items[:]
+    """Apply result control to a list of items.
 
-    if control.sort_field:
-        result = _apply_sorting(result, control.sort_field, control.sort_descending)
+    With a limit, a sorted query only ever returns the first offset + limit
+    items, so those are selected with a heap rather than sorting everything.
+    """
+    if control.sort_field and control.limit is not None and control.limit >= 0:
+        wanted = max(control.offset, 0) + control.limit
+        result = _select_sorted(items, control.sort_field, control.sort_descending, wanted)
+    elif control.sort_field:
+        result = _apply_sorting(items[:], control.sort_field, control.sort_descending)
+    else:
+        result = items[:]
 
     result = _apply_offset_and_limit(result, control.offset, control.limit)
 
@@ -0,0 +1,137 @@
+"""Tests for reveal.adapters.ast.summary — the per-file element summary index
+that ast:// evaluates scalar filters, sort and limit against.
+
+analyze_file is replaced by a fake that derives elements from each file's
+text, so the tests run without tree-sitter grammars and can count which
+files are analyzed for the summary and for the returned detail.
+"""
+
+import random
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from reveal.adapters.ast import adapter as ast_adapter
+from reveal.adapters.ast import summary
+from reveal.utils.query import ResultControl, apply_result_control
+
+
+def _element(path, i, complexity):
+    return {
+        'file': path, 'category': 'functions', 'name': f'fn_{Path(path).stem}_{i}',
+        'line': i * 10 + 1, 'line_count': complexity * 3, 'signature': '(x)',
+        'decorators': ['@cache'] if i % 2 else [], 'bases': [],
+        'complexity': complexity, 'depth': 0, 'calls': ['len', 'helper'], 'called_by': [],
+    }
+
+
+class _FakeAnalyzer:
+    """analyze_file stand-in: one function per integer on the file's first
+    line (its complexity), plus one class; records every analyzed path."""
+
+    def __init__(self):
+        self.calls = []
+
+    def __call__(self, file_path):
+        self.calls.append(Path(file_path).name)
+        numbers = [int(n) for n in Path(file_path).read_text().split()]
+        elements = [_element(file_path, i, c) for i, c in enumerate(numbers)]
+        elements.append({'file': file_path, 'category': 'classes', 'name': f'C_{Path(file_path).stem}',
+                         'line': 1, 'line_count': 50, 'signature': '', 'decorators': [], 'bases': []})
+        return {'file': file_path, 'elements': elements}
+
+
+@pytest.fixture
+def tree(tmp_path, monkeypatch):
+    monkeypatch.setenv('REVEAL_CACHE_DIR', str(tmp_path / 'cache'))
+    monkeypatch.delenv('REVEAL_DISK_CACHE', raising=False)
+    src = tmp_path / 'src'
+    src.mkdir()
+    (src / 'a.py').write_text('3 12 7\n')
+    (src / 'b.py').write_text('15 1\n')
+    (src / 'c.py').write_text('9 20 2 11\n')
+    return src
+
+
+@pytest.fixture
+def analyzer(monkeypatch):
+    fake = _FakeAnalyzer()
+    monkeypatch.setattr(summary, 'analyze_file', fake)
+    return fake
+
+
+def _collected(tree, query, analyzer):
+    from reveal.adapters.ast.analysis import iter_code_files
+    structures = [analyzer(p) for p in iter_code_files(str(tree))]
+    analyzer.calls.clear()
+    return ast_adapter.AstAdapter(str(tree), query).get_structure(structures=structures)
+
+
+@pytest.mark.parametrize('query', [
+    'complexity>10&sort=-complexity',
+    'complexity>5&sort=-complexity&limit=2&offset=1',
+    'type=function&sort=name&limit=3',
+    'decorator=cache&sort=-line_count',
+    'type=class',
+    'lines>10&limit=2',
+    None,
+])
+def test_pushdown_matches_collected_path(tree, analyzer, query):
+    expected = _collected(tree, query, analyzer)
+    result = ast_adapter.AstAdapter(str(tree), query).get_structure()
+    assert [(e['file'], e['name']) for e in result['results']] == \
+        [(e['file'], e['name']) for e in expected['results']]
+    for key in ('total_files', 'total_results', 'displayed_results'):
+        assert result[key] == expected[key]
+    assert result['meta']['warnings'] == expected['meta']['warnings']
+
+
+def test_detail_is_loaded_only_for_returned_rows(tree, analyzer):
+    ast_adapter.AstAdapter(str(tree), 'complexity>0&sort=-complexity&limit=1').get_structure()
+    analyzer.calls.clear()
+
+    result = ast_adapter.AstAdapter(str(tree), 'complexity>0&sort=-complexity&limit=1').get_structure()
+
+    assert [e['name'] for e in result['results']] == ['fn_c_1']
+    assert result['results'][0]['calls'] == ['helper']  # full element, builtins filtered
+    assert analyzer.calls == ['c.py']
+
+
+def test_only_changed_files_are_resummarized(tree, analyzer):
+    summary.load_table(str(tree))
+    analyzer.calls.clear()
+    (tree / 'b.py').write_text('15 1 40\n')
+    (tree / 'a.py').unlink()
+
+    table = summary.load_table(str(tree))
+
+    assert analyzer.calls == ['b.py']
+    assert sorted(Path(p).name for p in table.paths) == ['b.py', 'c.py']
+    assert all(row.file_id == i for i, rows in enumerate(table.rows) for row in rows)
+    analyzer.calls.clear()
+    summary.load_table(str(tree))
+    assert analyzer.calls == []
+
+
+def test_detail_filters_keep_collected_path(tree):
+    control = ResultControl(sort_field='complexity')
+    assert summary.can_push_down({'complexity': {'op': '>', 'value': 3}}, control)
+    assert not summary.can_push_down({'calls': {'op': '==', 'value': 'x'}}, control)
+    assert not summary.can_push_down({}, ResultControl(sort_field='signature'))
+    with patch.object(ast_adapter, 'collect_structures', return_value=[]) as collect, \
+            patch.object(ast_adapter, 'query_summary') as pushed:
+        ast_adapter.AstAdapter(str(tree), 'calls=helper').get_structure()
+    assert collect.called and not pushed.called
+
+
+@pytest.mark.parametrize('descending', [False, True])
+@pytest.mark.parametrize('offset,limit', [(0, 5), (3, 4), (0, None), (7, None), (2, 0)])
+def test_select_window_matches_full_sort(descending, offset, limit):
+    rng = random.Random(7)
+    items = [{'id': i, 'score': rng.choice([None, 1, 2, 3, 5])} for i in range(60)]
+    control = ResultControl(sort_field='score', sort_descending=descending, limit=limit, offset=offset)
+    expected = apply_result_control(items, control)
+    if limit is None:
+        expected = expected[:10]
+    assert summary.select_window(items, control, cap=10) == expected
@@ -392,6 +392,156 @@ class TestBareCalleeName(unittest.TestCase):
         self.assertEqual(_bare_callee_name('a.b::c'), 'c')
 
 
+class TestCallersIndexEdgeTable(unittest.TestCase):
+    """CallersIndex keeps edges as interned integer columns but reads like a dict."""
+
+    def _index(self):
+        from reveal.adapters.calls.index import CallersIndex, _index_callee
+        index = CallersIndex()
+        app, worker = index.intern('app.py'), index.intern('worker.py')
+        process, run_job = index.intern('process'), index.intern('run_job')
+        for file_id, caller_id, line, callee in (
+            (app, process, 9, 'validate_item'),
+            (app, process, 10, 'self.validate_item'),
+            (worker, run_job, 4, 'h'),
+        ):
+            edge = index.add_edge(file_id, caller_id, line, index.intern(callee))
+            _index_callee(index, callee, edge, {'h': 'validate_item'})
+        return index
+
+    def test_strings_are_interned_once(self):
+        index = self._index()
+        self.assertEqual(index.intern('app.py'), index.intern('app.py'))
+        self.assertEqual(index.edge_count, 3)
+
+    def test_mapping_protocol_materializes_records(self):
+        index = self._index()
+        self.assertIn('validate_item', index)
+        self.assertNotIn('missing', index)
+        self.assertEqual(index.get('missing', []), [])
+        self.assertEqual(index['self.validate_item'], [
+            {'file': 'app.py', 'caller': 'process', 'line': 10, 'call_expr': 'self.validate_item'},
+        ])
+        self.assertEqual(
+            [r['call_expr'] for r in index['validate_item']],
+            ['validate_item', 'self.validate_item', 'h'],
+        )
+        self.assertEqual(set(index.keys()), {'validate_item', 'self.validate_item', 'h'})
+
+    def test_bfs_level_dedupes_on_integer_caller_keys(self):
+        from reveal.adapters.calls.index import _bfs_level
+        index = self._index()
+        visited = set()
+        records, next_targets = _bfs_level(index, {'validate_item'}, visited)
+        self.assertEqual([(r['file'], r['caller']) for r in records],
+                         [('app.py', 'process'), ('worker.py', 'run_job')])
+        self.assertEqual(next_targets, {'process', 'run_job'})
+        self.assertTrue(all(isinstance(a, int) and isinstance(b, int) for a, b in visited))
+
+
+
+class TestMappedCallersIndex(unittest.TestCase):
+    """The on-disk mmap index answers exactly like the in-memory CallersIndex."""
+
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        import shutil
+        from reveal.adapters.calls import index as index_module
+        index_module._INDEX_CACHE.clear()
+        shutil.rmtree(self.tmpdir, ignore_errors=True)
+
+    def _pair(self):
+        from reveal.adapters.calls.mapped_index import MappedCallersIndex, serialize_callers_index
+        index = TestCallersIndexEdgeTable._index(self)
+        edge = index.add_edge(index.intern('ünïcode.py'), index.intern('процесс'), 7, index.intern('h'))
+        index.post('h', edge)
+        target = os.path.join(self.tmpdir, 'index.bin')
+        with open(target, 'wb') as fh:
+            fh.write(serialize_callers_index(index))
+        return index, MappedCallersIndex.open(target)
+
+    def test_round_trip_matches_in_memory_index(self):
+        index, mapped = self._pair()
+        self.assertIsNotNone(mapped)
+        self.assertEqual(list(mapped), list(index))
+        self.assertEqual(len(mapped), len(index))
+        for key in index:
+            self.assertIn(key, mapped)
+            self.assertEqual(mapped[key], index[key])
+        self.assertNotIn('missing', mapped)
+        self.assertNotIn(3, mapped)
+        self.assertEqual(mapped.get('missing', []), [])
+        self.assertEqual(len(mapped.edge_ids('missing')), 0)
+
+    def test_bfs_level_runs_unchanged_on_mapped_index(self):
+        from reveal.adapters.calls.index import _bfs_level
+        index, mapped = self._pair()
+        expected = _bfs_level(index, {'validate_item', 'h'}, set())
+        self.assertEqual(_bfs_level(mapped, {'validate_item', 'h'}, set()), expected)
+
+    def test_corrupt_or_truncated_file_is_rejected(self):
+        from reveal.adapters.calls.mapped_index import MappedCallersIndex
+        _, mapped = self._pair()
+        target = os.path.join(self.tmpdir, 'index.bin')
+        with open(target, 'rb') as fh:
+            data = fh.read()
+        with open(target, 'wb') as fh:
+            fh.write(data[:-8])
+        self.assertIsNone(MappedCallersIndex.open(target))
+        with open(target, 'wb') as fh:
+            fh.write(b'garbage')
+        self.assertIsNone(MappedCallersIndex.open(target))
+
+    def test_string_offset_past_blob_is_rejected_and_unmapped(self):
+        import mmap
+        import struct
+        from unittest.mock import patch
+        from reveal.adapters.calls import mapped_index
+        self._pair()
+        target = os.path.join(self.tmpdir, 'index.bin')
+        with open(target, 'rb') as fh:
+            data = bytearray(fh.read())
+        header = mapped_index._HEADER.unpack_from(data, 0)
+        n_strings, str_off_at = header[2], header[5]
+        struct.pack_into('=Q', data, str_off_at + 8 * n_strings, len(data))
+        with open(target, 'wb') as fh:
+            fh.write(data)
+
+        opened = []
+        real_mmap = mmap.mmap
+
+        def tracking_mmap(*args, **kwargs):
+            opened.append(real_mmap(*args, **kwargs))
+            return opened[-1]
+
+        with patch.object(mapped_index.mmap, 'mmap', tracking_mmap):
+            self.assertIsNone(mapped_index.MappedCallersIndex.open(target))
+        self.assertEqual(len(opened), 1)
+        self.assertTrue(opened[0].closed)
+
+    def test_fresh_process_maps_index_from_disk(self):
+        from unittest.mock import patch
+        from reveal.adapters.calls import index as index_module
+        from reveal.adapters.calls.mapped_index import MappedCallersIndex
+        _write(self.tmpdir, 'app.py', 'def a():\n    b()\n')
+        cache_dir = os.path.join(self.tmpdir, 'cache')
+        structure = {'file': os.path.join(self.tmpdir, 'app.py'), 'elements': [
+            {'category': 'functions', 'name': 'a', 'line': 1, 'calls': ['b']},
+        ]}
+        with patch.dict(os.environ, {'REVEAL_CACHE_DIR': cache_dir}), \
+                patch.object(index_module, 'analyze_file', return_value=structure) as analyze, \
+                patch.object(index_module, 'iter_code_files', wraps=index_module.iter_code_files) as walk, \
+                patch.object(index_module, 'build_alias_map', return_value={}):
+            built = build_callers_index(self.tmpdir)
+            index_module._INDEX_CACHE.clear()  # simulate a new process
+            loaded = build_callers_index(self.tmpdir)
+        self.assertEqual(analyze.call_count, 1)
+        self.assertEqual(walk.call_count, 2)  # one walk per call: fingerprint and build share it
+        self.assertIsInstance(loaded, MappedCallersIndex)
+        self.assertEqual(loaded['b'], built['b'])
+
 class TestCppScopeResolutionCallers(unittest.TestCase):
     """BACK-414: `ClassName::method()` — Godot's `Engine::get_singleton()`
     idiom — must be indexed under the bare method name, not just the fully
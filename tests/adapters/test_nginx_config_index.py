@@ -0,0 +1,153 @@
+"""Tests for reveal.adapters.nginx.config_index — the parse-once nginx config
+model behind nginx://, letsencrypt:// orphan detection and the fleet audit."""
+
+import os
+from unittest.mock import patch
+
+import pytest
+
+from reveal.adapters.nginx import config_index
+from reveal.adapters.nginx.adapter import NginxUriAdapter, _find_config_for_domain
+from reveal.adapters.letsencrypt.adapter import _collect_nginx_cert_paths
+from reveal.analyzers.nginx import NginxAnalyzer
+
+
+def _vhost(name, cert=None, extra=''):
+    ssl = f'    ssl_certificate {cert};\n' if cert else ''
+    return (
+        'server {\n'
+        '    listen 443 ssl;\n'
+        f'    server_name {name} www.{name};\n'
+        f'{ssl}{extra}'
+        '    location / { proxy_pass http://127.0.0.1:8000; }\n'
+        '}\n'
+    )
+
+
+@pytest.fixture
+def nginx(tmp_path, monkeypatch):
+    monkeypatch.setenv('REVEAL_CACHE_DIR', str(tmp_path / 'cache'))
+    monkeypatch.delenv('REVEAL_DISK_CACHE', raising=False)
+    root = tmp_path / 'nginx'
+    (root / 'sites-enabled').mkdir(parents=True)
+    (root / 'conf.d' / 'users').mkdir(parents=True)
+    (root / 'snippets').mkdir()
+    (root / 'sites-enabled' / 'a.com').write_text(_vhost('a.com', '/le/a.com/fullchain.pem'))
+    (root / 'sites-enabled' / 'b.com').write_text(
+        _vhost('b.com', extra='    include snippets/ssl-b.conf;\n'))
+    (root / 'sites-enabled' / 'b.com.bak').write_text(_vhost('b.com', '/le/stale/fullchain.pem'))
+    (root / 'snippets' / 'ssl-b.conf').write_text(
+        'ssl_certificate "/le/b.com/fullchain.pem";\ninclude snippets/ssl-b.conf;\n')
+    (root / 'conf.d' / 'users' / 'bob.conf').write_text(_vhost('a.com') + _vhost('c.com'))
+    return root
+
+
+def _dirs(root):
+    return [str(root / 'sites-enabled'), str(root / 'conf.d')]
+
+
+def test_domain_and_server_block_lookups(nginx):
+    index = config_index.load_index(_dirs(nginx))
+
+    assert [os.path.basename(s.path) for s in index.sites] == ['a.com', 'b.com', 'bob.conf']
+    # first match in search order wins, like the old per-file scan
+    assert index.site_for_domain('www.a.com').path.endswith('sites-enabled/a.com')
+    assert index.site_for_domain('c.com').path.endswith('bob.conf')
+    assert index.site_for_domain('missing.com') is None
+    blocks = index.server_blocks('a.com')
+    assert [(os.path.basename(s.path), b.line) for s, b in blocks] == [('a.com', 1), ('bob.conf', 1)]
+    assert blocks[0][1].cert_paths == ('/le/a.com/fullchain.pem',)
+    assert index.file(str(nginx / 'sites-enabled' / 'a.com')).domains == ('a.com', 'www.a.com')
+
+
+def test_includes_feed_cert_paths(nginx):
+    index = config_index.load_index(_dirs(nginx))
+
+    b_site = str(nginx / 'sites-enabled' / 'b.com')
+    snippet = str(nginx / 'snippets' / 'ssl-b.conf')
+    assert index.include_graph[b_site] == (snippet,)
+    assert index.include_graph[snippet] == (snippet,)  # self-include doesn't loop
+    assert sorted(index.cert_paths()) == ['/le/a.com/fullchain.pem', '/le/b.com/fullchain.pem']
+    # the .bak copy is skipped, as nginx skips it
+    assert '/le/stale/fullchain.pem' not in _collect_nginx_cert_paths(_dirs(nginx))
+
+
+def test_only_changed_files_are_reparsed(nginx):
+    config_index.load_index(_dirs(nginx))
+    parsed = []
+    real_parse = config_index.parse_config_file
+
+    def counting(path, stat, content):
+        parsed.append(os.path.basename(path))
+        return real_parse(path, stat, content)
+
+    with patch.object(config_index, 'parse_config_file', counting):
+        config_index.load_index(_dirs(nginx))
+        assert parsed == []
+
+        (nginx / 'sites-enabled' / 'a.com').write_text(_vhost('moved.com'))
+        index = config_index.load_index(_dirs(nginx))
+
+    assert parsed == ['a.com']
+    assert index.site_for_domain('a.com').path.endswith('bob.conf')
+    assert index.site_for_domain('moved.com').path.endswith('sites-enabled/a.com')
+
+
+def test_disabled_disk_cache_still_indexes(nginx, monkeypatch):
+    monkeypatch.setenv('REVEAL_DISK_CACHE', '0')
+    assert config_index.load_index(_dirs(nginx)).site_for_domain('c.com') is not None
+
+
+def test_uri_adapter_reads_only_the_matching_file(nginx):
+    dirs = _dirs(nginx)
+    with patch('reveal.adapters.nginx.adapter._NGINX_SEARCH_DIRS', dirs):
+        assert _find_config_for_domain('c.com').endswith('bob.conf')
+        config_index.load_index(dirs)
+        with patch.object(config_index, 'parse_config_file') as parse:
+            result = NginxUriAdapter('nginx://c.com').get_structure()
+    assert not parse.called
+    assert result['type'] == 'nginx_vhost_summary'
+    assert result['config_file'].endswith('bob.conf')
+    assert result['also_serves'] == ['a.com', 'www.a.com']
+
+
+def test_server_name_outside_a_server_block(tmp_path, monkeypatch):
+    monkeypatch.setenv('REVEAL_CACHE_DIR', str(tmp_path / 'cache'))
+    (tmp_path / 'odd.conf').write_text('server_name odd.example.com;\n')
+    with patch('reveal.adapters.nginx.adapter._NGINX_SEARCH_DIRS', [str(tmp_path)]):
+        result = NginxUriAdapter('nginx://odd.example.com').get_structure()
+    assert result['type'] == 'nginx_vhost_not_found'
+    assert result['config_file'].endswith('odd.conf')
+
+
+def test_analyzer_location_lookup_matches_linear_scan(tmp_path):
+    conf = tmp_path / 'many.conf'
+    conf.write_text(''.join(
+        _vhost(f's{i}.com', extra='    location /.well-known/acme-challenge/ {\n'
+                                  f'        root /var/www/s{i};\n    }}\n')
+        for i in range(6)
+    ))
+    analyzer = NginxAnalyzer(str(conf))
+
+    def linear(location_line):
+        best = (0, {})
+        for i, line in enumerate(analyzer.lines, 1):
+            if i > location_line:
+                break
+            if analyzer._is_server_block_start(line.strip()):
+                best = (i, analyzer._parse_server_block(i))
+        return best
+
+    for line_no in range(1, len(analyzer.lines) + 1):
+        assert analyzer._find_server_start_for_location(line_no) == linear(line_no)
+    assert [r['domain'] for r in analyzer.extract_acme_roots()] == [f's{i}.com' for i in range(6)]
+
+
+def test_fleet_records_come_from_the_index(nginx):
+    from reveal.adapters.nginx.adapter import _collect_site_records
+    records = _collect_site_records(_dirs(nginx))
+    assert [r['domains'] for r in records] == [
+        ['a.com', 'www.a.com'], ['b.com', 'www.b.com'], ['a.com', 'www.a.com', 'c.com', 'www.c.com']]
+    assert records[1]['includes'] == ['snippets/ssl-b.conf']
+    assert set(records[0]['checks']) == {d[0] for d in config_index._FLEET_CHECK_DEFS}
+
@@ -265,6 +265,15 @@ class TestD005Ceiling(unittest.TestCase):
         with mock.patch.dict(os.environ, {'REVEAL_D005_MAX_FILES': 'not-a-number'}):
             self.assertEqual(_max_project_files(), _DEFAULT_MAX_PROJECT_FILES)
 
+    def test_no_ceiling_by_default(self):
+        code = "EXTS = ['.py', '.js', '.ts', '.rs', '.go']\n"
+        for i in range(6):
+            _write(self._tmpdir, f'mod{i}.py', code)
+        with mock.patch.dict(os.environ, {}, clear=False):
+            os.environ.pop('REVEAL_D005_MAX_FILES', None)
+            index = _build_index(Path(self._tmpdir), self.rule)
+        self.assertEqual(len(next(iter(index.values()))), 6)
+
     def test_build_index_bails_over_ceiling(self):
         """A tree exceeding the ceiling returns an empty index without parsing."""
         # 6 files, ceiling forced to 3 → bail, empty index.
@@ -290,3 +299,53 @@ class TestD005Ceiling(unittest.TestCase):
 
 if __name__ == '__main__':
     unittest.main()
+
+
+class TestD005IncrementalIndex(unittest.TestCase):
+    """Per-file literal fragments persist across processes; only changed files re-parse."""
+
+    CODE = "EXTS = ['.py', '.js', '.ts', '.rs', '.go']\n"
+
+    def setUp(self):
+        _clear_index()
+        self.rule = D005()
+        self._tmpdir = tempfile.mkdtemp()
+        cache_dir = tempfile.mkdtemp()
+        env = mock.patch.dict(os.environ, {'REVEAL_CACHE_DIR': cache_dir})
+        env.start()
+        self.addCleanup(env.stop)
+        Path(self._tmpdir, 'pyproject.toml').write_text('[project]\nname="t"')
+        self.paths = [_write(self._tmpdir, f'mod{i}.py', self.CODE) for i in range(4)]
+
+    def tearDown(self):
+        _clear_index()
+
+    def _build(self):
+        """Build as a fresh process would: no in-process index, disk cache warm."""
+        _clear_index()
+        with mock.patch.object(D005, 'extract_file_literals', autospec=True,
+                               side_effect=D005.extract_file_literals) as extract:
+            index = _build_index(Path(self._tmpdir), self.rule)
+        return index, sorted(call.args[1] for call in extract.call_args_list)
+
+    def test_unchanged_tree_parses_nothing(self):
+        first, parsed_cold = self._build()
+        second, parsed_warm = self._build()
+        self.assertEqual(parsed_cold, sorted(self.paths))
+        self.assertEqual(parsed_warm, [])
+        self.assertEqual(first, second)
+
+    def test_only_changed_file_is_reparsed(self):
+        self._build()
+        os.utime(self.paths[2], ns=(1, 1))
+        index, parsed = self._build()
+        self.assertEqual(parsed, [self.paths[2]])
+        self.assertEqual(len({fp for fp, _, _ in next(iter(index.values()))}), 4)
+
+    def test_edit_is_reflected_in_index(self):
+        self._build()
+        Path(self.paths[0]).write_text("OTHER = 1\n")
+        os.utime(self.paths[0], ns=(2, 2))
+        index, parsed = self._build()
+        self.assertEqual(parsed, [self.paths[0]])
+        self.assertEqual({fp for fp, _, _ in next(iter(index.values()))}, set(self.paths[1:]))
@@ -8,6 +8,8 @@ tests/test_cli_architecture.py alongside the rest of the `architecture`
 command's tests.
 """
 
+import os
+import tempfile
 import unittest
 from pathlib import Path
 from unittest.mock import patch
@@ -226,5 +228,44 @@ class TestStructureCache(unittest.TestCase):
         self.assertEqual(mock_extract.call_count, 1)
 
 
+class TestPersistentStructureCache(unittest.TestCase):
+    """persistent=True shares blob structures across cache instances (runs)
+    through the disk cache, keyed on (blob OID, language)."""
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        env = patch.dict(os.environ, {'REVEAL_CACHE_DIR': self._tmp.name})
+        env.start()
+        os.environ.pop('REVEAL_DISK_CACHE', None)
+        self.addCleanup(env.stop)
+        self.addCleanup(self._tmp.cleanup)
+
+    @patch('reveal.diff.architecture_diff._extract_structure')
+    def test_second_run_reads_disk(self, mock_extract):
+        mock_extract.return_value = {'functions': [{'name': 'f'}]}
+        StructureCache(persistent=True).get_structure(Path('/tmp/base/a.py'), 'oid-1')
+
+        later = StructureCache(persistent=True)
+        result = later.get_structure(Path('/elsewhere/b.py'), 'oid-1')
+
+        self.assertEqual(result, {'functions': [{'name': 'f'}]})
+        self.assertEqual(mock_extract.call_count, 1)
+        self.assertEqual((later.hits, later.misses), (1, 0))
+
+    @patch('reveal.diff.architecture_diff._extract_structure')
+    def test_key_includes_language(self, mock_extract):
+        mock_extract.return_value = {'functions': []}
+        StructureCache(persistent=True).get_structure(Path('/tmp/a.py'), 'oid-1')
+        StructureCache(persistent=True).get_structure(Path('/tmp/a.js'), 'oid-1')
+        self.assertEqual(mock_extract.call_count, 2)
+
+    @patch('reveal.diff.architecture_diff._extract_structure')
+    def test_in_process_cache_stays_off_disk(self, mock_extract):
+        mock_extract.return_value = {'functions': []}
+        StructureCache().get_structure(Path('/tmp/a.py'), 'oid-1')
+        StructureCache().get_structure(Path('/tmp/a.py'), 'oid-1')
+        self.assertEqual(mock_extract.call_count, 2)
+
+
 if __name__ == '__main__':
     unittest.main()
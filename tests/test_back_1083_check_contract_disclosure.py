@@ -84,8 +84,10 @@ class TestRuleCrashSurfacedInContract:
 
         f = _write_py(tmp_path, "target.py", "x = 1\n")
         rule_cls = next(rc for rc in RuleRegistry._rules if rc.code == "B001")
+        # B001 is a node-visitor rule: check_file drives it through the shared
+        # walk (begin_visit/visit_node/end_visit), not check().
         monkeypatch.setattr(
-            rule_cls, "check",
+            rule_cls, "begin_visit",
             lambda self, *a, **kw: (_ for _ in ()).throw(RuntimeError("INJECTED FAULT")),
         )
 
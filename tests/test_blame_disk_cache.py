@@ -0,0 +1,262 @@
+"""Tests for the git:// blame cache and ?type=ownership&basis=lines.
+
+Blame is the slowest git:// operation on long-lived files. Results are cached
+per (path, commit, blob oid); when HEAD advances, the cached blame is brought
+forward with an oldest_commit-bounded blame whose boundary hunks are resolved
+against the cached attribution. Most tests drive the helpers with a
+scripted fake repository, so they run without pygit2; TestRealRepository
+checks the merge against libgit2's own boundary hunks.
+"""
+
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+
+from reveal.adapters.git import files
+from reveal.core import disk_cache
+
+
+@pytest.fixture(autouse=True)
+def _isolate_cache(tmp_path, monkeypatch):
+    monkeypatch.setenv("REVEAL_CACHE_DIR", str(tmp_path / "cache"))
+    monkeypatch.delenv("REVEAL_DISK_CACHE", raising=False)
+
+
+def _sig(name, t=1_700_000_000):
+    return SimpleNamespace(name=name, email=f"{name.lower()}@example.com", time=t)
+
+
+def _hunk(commit_id, start, count, who, orig_start=None, boundary=False, orig_path="a.py"):
+    return SimpleNamespace(
+        final_commit_id=commit_id,
+        final_start_line_number=start,
+        lines_in_hunk=count,
+        final_committer=_sig(who),
+        orig_start_line_number=orig_start if orig_start is not None else start,
+        orig_path=orig_path,
+        boundary=boundary,
+    )
+
+
+class _FakeRepo:
+    """Enough of pygit2.Repository for blame: commits, trees, ancestry, blame."""
+
+    def __init__(self, workdir):
+        self.workdir = workdir
+        self.path = workdir + "/.git"
+        self.objects = {}
+        self.ancestors = {}     # commit id -> set of ancestor ids
+        self.blames = {}        # (newest, oldest) -> hunk list
+        self.blame_calls = []
+
+    def add_commit(self, cid, blobs, message="msg", parents=()):
+        tree = {path: SimpleNamespace(id=oid) for path, oid in blobs.items()}
+        self.objects[cid] = SimpleNamespace(id=cid, tree=tree, message=message)
+        self.ancestors[cid] = set(parents).union(*(self.ancestors[p] for p in parents))
+        return self.objects[cid]
+
+    def __getitem__(self, oid):
+        return self.objects[oid]
+
+    def descendant_of(self, oid, ancestor):
+        return ancestor in self.ancestors[oid]
+
+    def blame(self, path, newest_commit=None, oldest_commit=None):
+        self.blame_calls.append((path, newest_commit, oldest_commit))
+        return self.blames[(newest_commit, oldest_commit)]
+
+
+@pytest.fixture
+def repo():
+    r = _FakeRepo("/work/proj")
+    r.add_commit("c1" * 20, {"a.py": "b1"}, message="first")
+    r.add_commit("c2" * 20, {"a.py": "b2"}, message="second", parents=["c1" * 20])
+    r.add_commit("c3" * 20, {"a.py": "b3"}, message="third", parents=["c2" * 20])
+    return r
+
+
+C1, C2, C3 = "c1" * 20, "c2" * 20, "c3" * 20
+
+
+def _owners(hunks):
+    """Flatten hunks to the per-line author list."""
+    out = {}
+    for h in hunks:
+        for line in range(h['lines']['start'], h['lines']['start'] + h['lines']['count']):
+            out[line] = h['commit']['author']
+    return [out[k] for k in sorted(out)]
+
+
+class TestBlameCache:
+    def test_repeat_blame_is_served_from_cache(self, repo):
+        repo.blames[(C1, None)] = [_hunk(C1, 1, 3, "Alice")]
+        first = files._blame_file_hunks(repo, repo[C1], "a.py")
+        second = files._blame_file_hunks(repo, repo[C1], "a.py")
+        assert second == first
+        assert len(repo.blame_calls) == 1
+
+    def test_disabled_cache_always_blames(self, repo, monkeypatch):
+        monkeypatch.setenv("REVEAL_DISK_CACHE", "0")
+        repo.blames[(C1, None)] = [_hunk(C1, 1, 3, "Alice")]
+        files._blame_file_hunks(repo, repo[C1], "a.py")
+        files._blame_file_hunks(repo, repo[C1], "a.py")
+        assert len(repo.blame_calls) == 2
+
+    def test_head_advance_blames_incrementally(self, repo):
+        # c1: Alice wrote lines 1-4.  c2: Bob inserts a line after line 2.
+        repo.blames[(C1, None)] = [_hunk(C1, 1, 4, "Alice")]
+        files._blame_file_hunks(repo, repo[C1], "a.py")
+
+        repo.blames[(C2, C1)] = [
+            _hunk(C1, 1, 2, "Alice", orig_start=1, boundary=True),
+            _hunk(C2, 3, 1, "Bob"),
+            _hunk(C1, 4, 2, "Alice", orig_start=3, boundary=True),
+        ]
+        hunks = files._blame_file_hunks(repo, repo[C2], "a.py")
+
+        assert repo.blame_calls[-1] == ("a.py", C2, C1)
+        assert _owners(hunks) == ["Alice", "Alice", "Bob", "Alice", "Alice"]
+        assert [h['lines'] for h in hunks] == [
+            {'start': 1, 'count': 2}, {'start': 3, 'count': 1}, {'start': 4, 'count': 2}]
+
+    def test_boundary_lines_keep_original_authors(self, repo):
+        # The base blame already splits Alice/Carol; a boundary hunk spanning
+        # both must resolve line-by-line, not to the boundary commit.
+        repo.blames[(C1, None)] = [_hunk(C1, 1, 2, "Alice"), _hunk("c0" * 20, 3, 2, "Carol")]
+        repo.objects["c0" * 20] = SimpleNamespace(message="older")
+        files._blame_file_hunks(repo, repo[C1], "a.py")
+
+        repo.blames[(C2, C1)] = [
+            _hunk(C2, 1, 1, "Bob"),
+            _hunk(C1, 2, 3, "Alice", orig_start=2, boundary=True),
+        ]
+        hunks = files._blame_file_hunks(repo, repo[C2], "a.py")
+        assert _owners(hunks) == ["Bob", "Alice", "Carol", "Carol"]
+
+    def test_pointer_only_moves_forward(self, repo):
+        repo.blames[(C2, None)] = [_hunk(C2, 1, 2, "Bob")]
+        repo.blames[(C1, None)] = [_hunk(C1, 1, 2, "Alice")]
+        files._blame_file_hunks(repo, repo[C2], "a.py")
+        files._blame_file_hunks(repo, repo[C1], "a.py")   # older ref: full blame
+
+        repo.blames[(C3, C2)] = [_hunk(C2, 1, 2, "Bob", orig_start=1, boundary=True)]
+        hunks = files._blame_file_hunks(repo, repo[C3], "a.py")
+        assert repo.blame_calls[-1] == ("a.py", C3, C2)
+        assert _owners(hunks) == ["Bob", "Bob"]
+
+    def test_rename_across_range_falls_back_to_full_blame(self, repo):
+        repo.blames[(C1, None)] = [_hunk(C1, 1, 2, "Alice")]
+        files._blame_file_hunks(repo, repo[C1], "a.py")
+        repo.blames[(C2, C1)] = [_hunk(C1, 1, 2, "Alice", boundary=True, orig_path="old.py")]
+        repo.blames[(C2, None)] = [_hunk(C1, 1, 2, "Alice")]
+        files._blame_file_hunks(repo, repo[C2], "a.py")
+        assert repo.blame_calls[-1] == ("a.py", C2, None)
+
+    def test_cache_key_includes_blob(self, repo):
+        repo.blames[(C1, None)] = [_hunk(C1, 1, 1, "Alice")]
+        files._blame_file_hunks(repo, repo[C1], "a.py")
+        repo_id = files._repo_cache_identity(repo)
+        assert disk_cache.get(files._BLAME_CACHE_NAMESPACE,
+                              files._blame_cache_key(repo_id, "a.py", C1, "b1")) is not None
+        assert disk_cache.get(files._BLAME_CACHE_NAMESPACE,
+                              files._blame_cache_key(repo_id, "a.py", C1, "other")) is None
+
+
+class TestLineOwnership:
+    def test_aggregate_line_owners(self):
+        def h(who, count, date):
+            return {'lines': {'start': 1, 'count': count},
+                    'commit': {'author': who, 'email': f"{who}@x", 'date': date}}
+
+        authors, total = files._aggregate_line_owners(
+            ["a.py", "b.py"],
+            [[h("alice", 6, "2026-01-02 10:00:00"), h("bob", 2, "2026-03-01 09:00:00")],
+             [h("alice", 2, "2026-02-01 08:00:00")]],
+        )
+        assert total == 10
+        assert [(a['name'], a['lines'], a['files'], a['share'], a['last_touch']) for a in authors] == [
+            ("alice", 8, 2, 0.8, "2026-02-01"),
+            ("bob", 2, 1, 0.2, "2026-03-01"),
+        ]
+
+    def test_parallel_blame_uses_per_thread_repos(self, repo, monkeypatch):
+        monkeypatch.setenv("REVEAL_MAX_WORKERS", "3")
+        paths = [f"f{i}.py" for i in range(6)]
+        repo.add_commit("d1" * 20, {p: f"blob{i}" for i, p in enumerate(paths)})
+        repo.blames[("d1" * 20, None)] = [_hunk("d1" * 20, 1, 1, "Alice")]
+        repo.objects["d1" * 20].message = "m"
+        opened = []
+
+        def open_repo():
+            opened.append(1)
+            return repo
+
+        results = files._blame_files(repo, repo["d1" * 20], paths, open_repo=open_repo)
+        assert len(results) == len(paths)
+        assert all(_owners(r) == ["Alice"] for r in results)
+        assert 1 <= len(opened) <= 3
+
+    def test_cold_scope_prunes_each_namespace_once(self, repo, monkeypatch):
+        paths = [f"f{i}.py" for i in range(5)]
+        repo.add_commit("d1" * 20, {p: f"blob{i}" for i, p in enumerate(paths)})
+        repo.blames[("d1" * 20, None)] = [_hunk("d1" * 20, 1, 1, "Alice")]
+        prunes = []
+        real_prune = disk_cache._prune
+        monkeypatch.setattr(disk_cache, "_prune",
+                            lambda ns_dir, n: prunes.append(ns_dir.name) or real_prune(ns_dir, n))
+
+        files._blame_files(repo, repo["d1" * 20], paths)
+        assert sorted(prunes) == sorted([files._BLAME_CACHE_NAMESPACE, files._BLAME_HEAD_NAMESPACE])
+        repo.blame_calls.clear()
+        files._blame_files(repo, repo["d1" * 20], paths)
+        assert repo.blame_calls == []
+
+    def test_worker_count_serial_for_small_scopes(self, monkeypatch):
+        monkeypatch.delenv("REVEAL_MAX_WORKERS", raising=False)
+        assert files._ownership_worker_count(1) == 1
+        monkeypatch.setenv("REVEAL_MAX_WORKERS", "1")
+        assert files._ownership_worker_count(500) == 1
+
+
+class TestRealRepository:
+    """Incremental blame against real pygit2 boundary hunks."""
+
+    @staticmethod
+    def _commit(pygit2, repo, workdir, lines, who, parents):
+        (workdir / "a.py").write_text("".join(f"{line}\n" for line in lines))
+        repo.index.add("a.py")
+        repo.index.write()
+        sig = pygit2.Signature(who, f"{who.lower()}@example.com", 1_700_000_000 + len(parents))
+        return repo.create_commit("refs/heads/master", sig, sig, f"edit by {who}",
+                                  repo.index.write_tree(), parents)
+
+    def test_incremental_blame_matches_full_blame(self, tmp_path):
+        pygit2 = pytest.importorskip("pygit2")
+        workdir = tmp_path / "proj"
+        repo = pygit2.init_repository(str(workdir))
+        lines = [f"line {i}" for i in range(1, 11)]
+        c1 = self._commit(pygit2, repo, workdir, lines, "Alice", [])
+        lines[4:6] = ["bob 5", "bob 6", "bob 6b"]
+        c2 = self._commit(pygit2, repo, workdir, lines, "Bob", [c1])
+        lines[0] = "carol 1"
+        lines[8] = "carol 9"
+        c3 = self._commit(pygit2, repo, workdir, lines, "Carol", [c2])
+
+        files._blame_file_hunks(repo, repo[c1], "a.py")
+        merged = []
+        real_incremental = files._incremental_blame
+        with patch.object(files, "_incremental_blame",
+                          lambda *a: merged.append(real_incremental(*a)) or merged[-1]):
+            incremental = files._blame_file_hunks(repo, repo[c3], "a.py")
+        assert merged and merged[0] is not None   # not the full-blame fallback
+        full = files._format_blame_hunks(repo, repo.blame("a.py", newest_commit=c3))
+
+        def per_line(hunks):
+            return [h['commit']['author'] for h in hunks for _ in range(h['lines']['count'])]
+
+        assert per_line(incremental) == per_line(full)
+        assert per_line(incremental) == (
+            ["Carol"] + ["Alice"] * 3 + ["Bob"] * 3 + ["Alice"] + ["Carol"] + ["Alice"] * 2)
+        assert [h['lines'] for h in incremental] == [h['lines'] for h in full]
+        assert [h['commit'] for h in incremental] == [h['commit'] for h in full]
@@ -165,6 +165,25 @@ from typing import List, Dict
         # Should detect because .nonexistent doesn't exist
         self.assertGreaterEqual(len(detections), 1)
 
+    def test_optional_import_in_try_import_error_not_flagged(self):
+        """Imports guarded by try/except ImportError are optional, not dead."""
+        pkg_dir = self.create_package("pkg")
+        content = (
+            "try:\n"
+            "    from .optional_missing import fast\n"
+            "    if fast:\n"
+            "        from .also_missing import faster\n"
+            "except ImportError:\n"
+            "    fast = None\n"
+            "from .required_missing import thing\n"
+        )
+        path = os.path.join(pkg_dir, "test.py")
+        with open(path, 'w') as f:
+            f.write(content)
+
+        detections = self.rule.check(path, None, content)
+        self.assertEqual([d.line for d in detections], [7])
+
     def test_relative_import_existing_sibling(self):
         """Test relative import of existing sibling module."""
         # Create package structure
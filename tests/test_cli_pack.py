@@ -464,6 +464,98 @@ class TestComputeGraphRelevance(unittest.TestCase):
             self.assertLessEqual(score, 1.0)
 
 
+class TestGraphRelevanceCsr(unittest.TestCase):
+    """CSR-cached, batched personalized PageRank behind --focus."""
+
+    def setUp(self):
+        import os
+        from unittest import mock
+        cache_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(cache_dir.cleanup)
+        env = mock.patch.dict(os.environ, {'REVEAL_CACHE_DIR': cache_dir.name})
+        env.start()
+        self.addCleanup(env.stop)
+
+    @staticmethod
+    def _graph(edges, isolated=()):
+        from types import SimpleNamespace
+        deps, rdeps = {}, {}
+        for src, dst in edges:
+            deps.setdefault(Path(src), set()).add(Path(dst))
+            rdeps.setdefault(Path(dst), set()).add(Path(src))
+        files = {Path(f): None for f in deps}
+        return SimpleNamespace(files=files, dependencies=deps, reverse_deps=rdeps), {Path(f) for f in isolated}
+
+    @staticmethod
+    def _dict_pagerank(graph, scanned, seeds):
+        """The pre-CSR dict implementation, kept as a reference."""
+        all_files = scanned | set(graph.files) | set(graph.reverse_deps)
+        adjacency = {f: set(graph.dependencies.get(f, set())) | set(graph.reverse_deps.get(f, set()))
+                     for f in all_files}
+        personalization = {f: (1.0 / len(seeds) if f in seeds else 0.0) for f in all_files}
+        scores = dict(personalization)
+        for _ in range(30):
+            new = {f: 0.15 * personalization[f] for f in all_files}
+            for f in all_files:
+                if adjacency[f]:
+                    share = 0.85 * scores[f] / len(adjacency[f])
+                    for nb in adjacency[f]:
+                        new[nb] += share
+            scores = new
+        top = max(scores.values())
+        return {str(f): v / top for f, v in scores.items()}
+
+    def _patched(self, graph, scanned):
+        from unittest import mock
+        return mock.patch('reveal.adapters.pack._build_pack_import_graph', return_value=(graph, scanned))
+
+    def test_matches_dict_implementation(self):
+        from reveal.adapters.pack import _compute_graph_relevance
+        edges = [('/r/auth.py', '/r/db.py'), ('/r/api.py', '/r/auth.py'), ('/r/db.py', '/r/util.py'),
+                 ('/r/cli.py', '/r/api.py'), ('/r/cli.py', '/r/util.py'), ('/r/auth_jwt.py', '/r/auth.py')]
+        graph, scanned = self._graph(edges, isolated=['/r/lonely.py'])
+        with tempfile.TemporaryDirectory() as d, self._patched(graph, scanned):
+            result = _compute_graph_relevance(Path(d), 'auth')
+        expected = self._dict_pagerank(graph, scanned, {Path('/r/auth.py'), Path('/r/auth_jwt.py')})
+        self.assertEqual(set(result), set(expected))
+        for f, v in expected.items():
+            self.assertAlmostEqual(result[f], v, places=6)
+        self.assertEqual(result['/r/lonely.py'], 0.0)
+
+    def test_python_fallback_matches_numpy(self):
+        import builtins
+        from unittest import mock
+        from reveal.adapters.pack import _compute_graph_relevance
+        graph, scanned = self._graph([('/r/a.py', '/r/b.py'), ('/r/b.py', '/r/c.py'),
+                                      ('/r/d.py', '/r/b.py')], isolated=['/r/e.py'])
+        real_import = builtins.__import__
+
+        def no_numpy(name, *args, **kwargs):
+            if name == 'numpy':
+                raise ImportError(name)
+            return real_import(name, *args, **kwargs)
+
+        with tempfile.TemporaryDirectory() as d, self._patched(graph, scanned):
+            default = _compute_graph_relevance(Path(d), 'c.py')
+            with mock.patch('builtins.__import__', no_numpy):
+                fallback = _compute_graph_relevance(Path(d), 'c.py')
+        self.assertEqual(set(default), set(fallback))
+        for f, v in default.items():
+            self.assertAlmostEqual(fallback[f], v, places=12)
+        self.assertEqual(_compute_graph_relevance(Path('/nonexistent'), ''), {})
+
+    def test_warm_call_reads_cached_csr(self):
+        from reveal.adapters.pack import _compute_graph_relevance
+        graph, scanned = self._graph([('/r/auth.py', '/r/db.py')])
+        with tempfile.TemporaryDirectory() as d:
+            (Path(d) / 'auth.py').write_text('X = 1\n')
+            with self._patched(graph, scanned) as build:
+                first = _compute_graph_relevance(Path(d), 'auth')
+                second = _compute_graph_relevance(Path(d), 'auth')
+        self.assertEqual(first, second)
+        self.assertEqual(build.call_count, 1)
+
+
 # ---------------------------------------------------------------------------
 # _apply_budget
 # ---------------------------------------------------------------------------
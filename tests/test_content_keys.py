@@ -0,0 +1,94 @@
+"""Tests for reveal.core.content_keys — blob-OID keys for materialized files.
+
+Files that ``materialize_ref`` writes from a git ref are registered with
+their blob OID; the per-file structure and imports caches then key them on
+that OID instead of (temp path, mtime, size), so entries survive into later
+runs that materialize the same blob at a different temp path.
+"""
+
+import os
+
+import pytest
+
+from reveal.core import content_keys
+
+
+@pytest.fixture
+def blob_file(tmp_path):
+    path = tmp_path / "mod.py"
+    path.write_text("import os\n")
+    return path
+
+
+class TestRegistry:
+    def test_lookup_only_inside_block(self, blob_file):
+        path_str = os.path.abspath(str(blob_file))
+        assert content_keys.lookup(path_str) is None
+        with content_keys.registered([(blob_file, "oid-1")]):
+            assert content_keys.lookup(path_str) == "oid-1"
+        assert content_keys.lookup(path_str) is None
+
+    def test_edit_after_registration_drops_the_key(self, blob_file):
+        path_str = os.path.abspath(str(blob_file))
+        with content_keys.registered([(blob_file, "oid-1")]):
+            blob_file.write_text("import os, sys\n")
+            assert content_keys.lookup(path_str) is None
+
+    def test_missing_files_are_skipped(self, tmp_path):
+        with content_keys.registered([(tmp_path / "gone.py", "oid-1")]):
+            assert content_keys.lookup(str(tmp_path / "gone.py")) is None
+
+
+class TestFingerprints:
+    def test_imports_fingerprint_follows_blob_not_path(self, tmp_path):
+        from reveal.analyzers.imports.python import _imports_fingerprint
+
+        first = tmp_path / "run1" / "mod.py"
+        second = tmp_path / "run2" / "mod.py"
+        for path in (first, second):
+            path.parent.mkdir()
+            path.write_text("import os\n")
+
+        def fp(path):
+            path_str = os.path.abspath(str(path))
+            return _imports_fingerprint(path_str, os.stat(path_str).st_mtime_ns)
+
+        assert fp(first) != fp(second)
+        with content_keys.registered([(first, "oid-1")]):
+            shared = fp(first)
+        with content_keys.registered([(second, "oid-1")]):
+            assert fp(second) == shared
+        with content_keys.registered([(second, "oid-2")]):
+            assert fp(second) != shared
+
+    def test_structure_fingerprint_binds_language(self, blob_file):
+        from reveal.treesitter import TreeSitterAnalyzer
+
+        def fp(language):
+            analyzer = TreeSitterAnalyzer.__new__(TreeSitterAnalyzer)
+            analyzer.path = blob_file
+            analyzer.language = language
+            return analyzer._structure_fingerprint()
+
+        with content_keys.registered([(blob_file, "oid-1")]):
+            python_key, js_key = fp("python"), fp("javascript")
+        assert python_key != js_key
+        assert fp("python") != python_key
+
+    def test_shared_imports_namespace_binds_extension(self, tmp_path):
+        from reveal.analyzers.imports.base import ImportsDiskCache
+
+        cache = ImportsDiskCache("generic_imports")
+        paths = [tmp_path / "lib.c", tmp_path / "lib.rb", tmp_path / "other" / "lib.c"]
+        for path in paths:
+            path.parent.mkdir(exist_ok=True)
+            path.write_text("#include <stdio.h>\n")
+
+        def fp(path):
+            path_str = os.path.abspath(str(path))
+            return cache.fingerprint(path_str, os.stat(path_str).st_mtime_ns)
+
+        with content_keys.registered([(path, "oid-1") for path in paths]):
+            c_key, ruby_key, moved_c_key = (fp(path) for path in paths)
+        assert c_key != ruby_key
+        assert c_key == moved_c_key
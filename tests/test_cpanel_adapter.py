@@ -1654,5 +1654,158 @@ class TestCpanelSchema:
         assert 'check-live' in qp
 
 
+# ---------------------------------------------------------------------------
+# Concurrent fan-out, shared probes, disk cert cache
+# ---------------------------------------------------------------------------
+
+class TestCpanelAuditFanout:
+    """ssl/full-audit fan-out: bounded pool, per-op timeouts, shared probes, cert parse cache."""
+
+    @pytest.fixture
+    def ssl_dir(self, tmp_path, monkeypatch):
+        from reveal.adapters.cpanel import adapter as cpanel_mod
+        monkeypatch.setenv('REVEAL_CACHE_DIR', str(tmp_path / 'cache'))
+        monkeypatch.delenv('REVEAL_DISK_CACHE', raising=False)
+        monkeypatch.setattr(cpanel_mod, 'CPANEL_SSL_DIR', str(tmp_path / 'apache_tls'))
+        monkeypatch.setattr(cpanel_mod, '_disk_certs', None)
+        for domain in ('a.com', 'b.com'):
+            (tmp_path / 'apache_tls' / domain).mkdir(parents=True)
+            (tmp_path / 'apache_tls' / domain / 'combined').write_text('PEM ' + domain)
+        return tmp_path / 'apache_tls'
+
+    def test_disk_certs_reparsed_only_when_changed(self, ssl_dir, monkeypatch):
+        from reveal.adapters.cpanel import adapter as cpanel_mod
+        parsed = []
+
+        def load(path):
+            parsed.append(os.path.basename(os.path.dirname(path)))
+            return _make_cert(days=60 if 'a.com' in path else 10), []
+
+        with patch('reveal.adapters.ssl.certificate.load_certificate_from_file', side_effect=load):
+            assert _get_disk_cert_status('a.com')['status'] == 'ok'
+            assert _get_disk_cert_status('b.com')['status'] == 'expiring'
+            cpanel_mod._disk_cert_cache().save()
+            monkeypatch.setattr(cpanel_mod, '_disk_certs', None)  # as a new process would
+            assert _get_disk_cert_status('a.com')['days_until_expiry'] >= 59
+            assert parsed == ['a.com', 'b.com']
+
+            (ssl_dir / 'b.com' / 'combined').write_text('PEM renewed b.com')
+            assert _get_disk_cert_status('b.com')['status'] == 'expiring'
+        assert parsed == ['a.com', 'b.com', 'b.com']
+
+    def test_fanout_times_out_slow_calls_only(self):
+        import time
+        from reveal.adapters.cpanel.adapter import _run_fanout
+
+        calls = {i: (lambda i=i: time.sleep(2) if i == 3 else i * 10) for i in range(6)}
+        start = time.monotonic()
+        results = _run_fanout(calls, 0.2, lambda key: 'timeout')
+        assert time.monotonic() - start < 1.5
+        assert results == {0: 0, 1: 10, 2: 20, 3: 'timeout', 4: 40, 5: 50}
+
+    def test_fanout_replaces_workers_lost_to_timeouts(self, monkeypatch):
+        import threading
+        import time
+        from reveal.adapters.cpanel.adapter import _run_fanout
+
+        monkeypatch.setenv('REVEAL_MAX_WORKERS', '2')
+        release = threading.Event()
+        calls = {i: (lambda: release.wait(10)) for i in range(3)}
+        calls[3] = lambda: 'fast'
+        start = time.monotonic()
+        try:
+            results = _run_fanout(calls, 0.3, lambda key: 'timeout')
+        finally:
+            release.set()
+        assert time.monotonic() - start < 3
+        assert results == {0: 'timeout', 1: 'timeout', 2: 'timeout', 3: 'fast'}
+
+    def test_fanout_timeout_bounds_process_exit(self):
+        import subprocess
+        import sys
+        import time
+
+        script = ("import time\n"
+                  "from reveal.adapters.cpanel.adapter import _run_fanout\n"
+                  "r = _run_fanout({0: lambda: time.sleep(5), 1: lambda: 1}, 0.3, lambda k: 'timeout')\n"
+                  "assert r == {0: 'timeout', 1: 1}, r\n")
+        start = time.monotonic()
+        subprocess.run([sys.executable, '-c', script], check=True, timeout=30)
+        assert time.monotonic() - start < 4
+
+    def test_fanout_serial_with_one_worker(self, monkeypatch):
+        import threading
+        from reveal.adapters.cpanel.adapter import _run_fanout
+
+        monkeypatch.setenv('REVEAL_MAX_WORKERS', '1')
+        threads = set()
+        calls = {i: (lambda: threads.add(threading.get_ident())) for i in range(4)}
+        _run_fanout(calls, 1.0, lambda key: None)
+        assert threads == {threading.get_ident()}
+
+    def test_host_probes_probe_each_host_once(self):
+        import threading
+        import time
+        from reveal.adapters.cpanel.adapter import _HostProbes
+
+        probed = []
+
+        def slow_probe(host):
+            probed.append(host)
+            time.sleep(0.05)
+            return {'status': 'healthy', 'host': host}
+
+        probes = _HostProbes()
+        with patch('reveal.adapters.cpanel.adapter._probe_tls', side_effect=slow_probe):
+            threads = [threading.Thread(target=probes.tls, args=(host,))
+                       for host in ['a.com', 'A.com', 'a.com.', 'b.com'] * 3]
+            for t in threads:
+                t.start()
+            for t in threads:
+                t.join()
+        assert sorted(h.lower().rstrip('.') for h in probed) == ['a.com', 'b.com']
+
+    def test_ssl_live_and_dns_timeouts_are_reported(self, monkeypatch):
+        import time
+        from reveal.adapters.cpanel import adapter as cpanel_mod
+
+        monkeypatch.setattr(cpanel_mod, '_DNS_TIMEOUT', 0.2)
+        monkeypatch.setattr(cpanel_mod, '_TLS_TIMEOUT', 0.2)
+        domains = [{'domain': d, 'docroot': '', 'serveralias': '', 'type': 'addon'}
+                   for d in ('fast.com', 'slow.com', 'ok.com')]
+
+        def status(domain):
+            return {'status': 'ok' if domain == 'ok.com' else 'expired', 'days_until_expiry': -1}
+
+        def resolve(domain):
+            if domain == 'slow.com':
+                time.sleep(1)
+            return ['1.2.3.4']
+
+        def tls(domain):
+            if domain == 'slow.com':
+                time.sleep(1)
+            return {'certificate': {'days_until_expiry': 80, 'not_after': '2027-01-01T00:00:00',
+                                    'serial_number': 'FF'}}
+
+        with patch.object(cpanel_mod, '_list_user_domains', return_value=domains), \
+                patch.object(cpanel_mod, '_get_disk_cert_status', side_effect=status), \
+                patch.object(cpanel_mod, '_dns_resolve_ips', side_effect=resolve), \
+                patch.object(cpanel_mod, '_get_local_ips', return_value={'1.2.3.4'}), \
+                patch.object(cpanel_mod, '_probe_tls', side_effect=tls) as probe:
+            result = CpanelAdapter('cpanel://myuser/ssl').get_structure(dns_verified=True, check_live=True)
+
+        certs = {c['domain']: c for c in result['certs']}
+        assert certs['fast.com']['dns_points_here'] is True
+        assert certs['fast.com']['live_status'] == 'ok'
+        assert certs['slow.com']['dns_resolves'] is False
+        assert 'timed out' in certs['slow.com']['dns_error']
+        assert certs['slow.com']['live_status'] == 'error'
+        assert 'timed out' in certs['slow.com']['live_error']
+        assert 'live_status' not in certs['ok.com']  # --check-live only probes non-ok certs
+        assert sorted(c.args[0] for c in probe.call_args_list) == ['fast.com', 'slow.com']
+        assert result['dns_excluded'] == {'expired': 1}
+
+
 if __name__ == '__main__':
     pytest.main([__file__, '-v'])
@@ -2191,5 +2191,109 @@ class TestGemLoadPathRoots:
         assert 'b.py' in importers
 
 
+class _CountingExtractor:
+    """Minimal non-spec extractor: ``import X`` lines resolve to a sibling
+    ``X.py``. Counts parses and resolutions so snapshot reuse is visible."""
+
+    def __init__(self):
+        self.parsed = []
+        self.resolved = []
+
+    def extract_imports(self, file_path):
+        from reveal.analyzers.imports import ImportStatement
+        self.parsed.append(file_path.name)
+        out = []
+        for n, line in enumerate(file_path.read_text().splitlines(), 1):
+            if line.startswith('import '):
+                out.append(ImportStatement(file_path, n, line.split()[1], [], False, 'import'))
+        return out
+
+    def resolve_import_targets(self, stmt, base_path, search_paths=None):
+        self.resolved.append(stmt.file_path.name)
+        target = base_path / f'{stmt.module_name}.py'
+        return [target] if target.exists() else []
+
+    def is_intra_project_import(self, stmt, base_path, search_paths=None, project_namespaces=None):
+        return True
+
+
+class TestDependsScanSnapshot:
+    """Each build is saved per scan scope; the next build re-parses and
+    re-resolves only what changed."""
+
+    @pytest.fixture
+    def tree(self, tmp_path, monkeypatch):
+        from reveal.adapters import depends
+        monkeypatch.setenv('REVEAL_CACHE_DIR', str(tmp_path / 'cache'))
+        monkeypatch.delenv('REVEAL_DISK_CACHE', raising=False)
+        extractor = _CountingExtractor()
+        monkeypatch.setattr(depends, 'get_extractor',
+                            lambda p: extractor if Path(p).suffix == '.py' else None)
+        root = tmp_path / 'proj'
+        _write(root / 'utils.py', 'X = 1\n')
+        _write(root / 'models.py', 'import utils\n')
+        _write(root / 'api.py', 'import utils\nimport models\nimport missing\n')
+        return root, extractor
+
+    @staticmethod
+    def _build(root):
+        from reveal.adapters.depends import DependsAdapter
+        adapter = DependsAdapter(str(root))
+        adapter._build_graph(root, scan_extensions=frozenset({'.py'}))
+        return adapter
+
+    @staticmethod
+    def _importers(adapter, name):
+        return sorted(p.name for p in adapter._graph.reverse_deps[adapter._scan_root / name])
+
+    def test_unchanged_tree_parses_and_resolves_nothing(self, tree):
+        root, extractor = tree
+        first = self._build(root)
+        assert sorted(extractor.parsed) == ['api.py', 'models.py', 'utils.py']
+        extractor.parsed.clear()
+        extractor.resolved.clear()
+
+        second = self._build(root)
+        assert extractor.parsed == [] and extractor.resolved == []
+        assert self._importers(second, 'utils.py') == ['api.py', 'models.py']
+        assert second._graph.files.keys() == first._graph.files.keys()
+        assert second._unresolved_intra == first._unresolved_intra == 1
+        assert set(second._edge_stmts) == set(first._edge_stmts)
+
+    def test_edit_reparses_and_reresolves_only_that_file(self, tree):
+        root, extractor = tree
+        self._build(root)
+        extractor.parsed.clear()
+        extractor.resolved.clear()
+
+        _write(root / 'api.py', 'import models\n')
+        adapter = self._build(root)
+        assert extractor.parsed == ['api.py']
+        assert extractor.resolved == ['api.py']
+        assert self._importers(adapter, 'utils.py') == ['models.py']
+        assert self._importers(adapter, 'models.py') == ['api.py']
+        assert adapter._unresolved_intra == 0
+
+    def test_new_file_reresolves_everything_without_reparsing(self, tree):
+        root, extractor = tree
+        self._build(root)
+        extractor.parsed.clear()
+        extractor.resolved.clear()
+
+        _write(root / 'missing.py', 'Y = 2\n')
+        adapter = self._build(root)
+        assert extractor.parsed == ['missing.py']
+        assert sorted(extractor.resolved) == ['api.py', 'api.py', 'api.py', 'models.py']
+        assert self._importers(adapter, 'missing.py') == ['api.py']
+        assert adapter._unresolved_intra == 0
+
+    def test_disabled_disk_cache_always_parses(self, tree, monkeypatch):
+        root, extractor = tree
+        monkeypatch.setenv('REVEAL_DISK_CACHE', '0')
+        self._build(root)
+        self._build(root)
+        assert len(extractor.parsed) == 6
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -16,6 +16,7 @@ import sys
 import pytest
 from unittest.mock import patch, MagicMock
 
+from reveal.adapters.diff import git as diff_git
 from reveal.adapters.diff.git import (
     resolve_git_adapter,
     resolve_git_file,
@@ -24,6 +25,8 @@ from reveal.adapters.diff.git import (
     _ls_tree_files,
     _tag_items_with_file,
     resolve_git_ref,
+    resolve_git_directory_pair,
+    _changed_blobs,
 )
 
 
@@ -281,3 +284,100 @@ class TestResolveGitDirectory:
         result = resolve_git_directory('HEAD', 'sub')
         assert result['file_count'] == 1
         assert any(f['name'] == 'bar' for f in result['functions'])
+
+
+
+# ─── resolve_git_directory_pair (tree-OID short-circuit) ────────────────────
+
+class _Entry:
+    def __init__(self, name, type_str, oid):
+        self.name, self.type_str, self.id = name, type_str, oid
+
+
+class _Tree(list):
+    def __init__(self, oid, entries):
+        super().__init__(entries)
+        self.id = oid
+
+
+class _Repo(dict):
+    """oid -> object map that records every lookup."""
+
+    def __init__(self, *args):
+        super().__init__(*args)
+        self.lookups = []
+
+    def __getitem__(self, oid):
+        self.lookups.append(oid)
+        return super().__getitem__(oid)
+
+
+class TestChangedBlobs:
+    def _trees(self):
+        shared = _Tree('t-shared', [_Entry('a.py', 'blob', 'b-a')])
+        left = _Tree('t-left', [
+            _Entry('lib', 'tree', 't-shared'),
+            _Entry('m.py', 'blob', 'b-m1'),
+            _Entry('same.py', 'blob', 'b-same'),
+            _Entry('gone.py', 'blob', 'b-gone'),
+        ])
+        right = _Tree('t-right', [
+            _Entry('lib', 'tree', 't-shared'),
+            _Entry('m.py', 'blob', 'b-m2'),
+            _Entry('same.py', 'blob', 'b-same'),
+            _Entry('new.py', 'blob', 'b-new'),
+        ])
+        return _Repo({'t-shared': shared}), left, right
+
+    def test_identical_subtrees_are_not_descended(self):
+        repo, left, right = self._trees()
+        changed, unchanged = [], []
+        _changed_blobs(repo, left, right, '', changed, unchanged)
+        assert changed == [('m.py', 'b-m1'), ('gone.py', 'b-gone')]
+        assert unchanged == [('lib/', 't-shared', True), ('same.py', 'b-same', False)]
+        assert repo.lookups == []
+
+    def test_right_side_collects_additions(self):
+        repo, left, right = self._trees()
+        changed = []
+        _changed_blobs(repo, right, left, '', changed)
+        assert changed == [('m.py', 'b-m2'), ('new.py', 'b-new')]
+
+
+class TestResolveGitDirectoryPair:
+    def test_not_a_directory_defers_to_per_side_resolution(self, git_repo):
+        assert resolve_git_directory_pair(('HEAD', 'file.py'), ('HEAD', 'file.py')) is None
+
+    def test_missing_path_defers_to_per_side_resolution(self, git_repo):
+        assert resolve_git_directory_pair(('HEAD', 'nope'), ('HEAD', 'sub')) is None
+
+    def test_matches_full_resolution_and_skips_unchanged_files(self, git_repo, monkeypatch):
+        import pygit2
+        from reveal.diff import compute_structure_diff
+
+        monkeypatch.setenv('REVEAL_MAX_WORKERS', '1')
+        repo = pygit2.Repository(str(git_repo))
+        (git_repo / "sub" / "mod.py").write_text("import os\n\ndef bar():\n    return 1\n")
+        (git_repo / "sub" / "keep.py").write_text("import os\n\ndef keep():\n    pass\n")
+        index = repo.index
+        index.add_all()
+        index.write()
+        author = pygit2.Signature("Test", "test@example.com")
+        repo.create_commit("HEAD", author, author, "second", index.write_tree(), [repo.head.target])
+        (git_repo / "sub" / "mod.py").write_text("def bar():\n    return 2\n")
+        index.add_all()
+        index.write()
+        repo.create_commit("HEAD", author, author, "third", index.write_tree(), [repo.head.target])
+
+        full = compute_structure_diff(resolve_git_directory('HEAD~1', 'sub'),
+                                      resolve_git_directory('HEAD', 'sub'))
+        with patch('reveal.adapters.diff.git._analyze_blob_text',
+                   wraps=diff_git._analyze_blob_text) as analyze:
+            left, right = resolve_git_directory_pair(('HEAD~1', 'sub'), ('HEAD', 'sub'))
+        paired = compute_structure_diff(left, right)
+
+        assert paired['summary'] == full['summary']
+        # 'import os' left mod.py, but keep.py (unchanged) still has it.
+        assert paired['summary']['imports'] == {'added': 0, 'removed': 0}
+        analyzed = [call.args[0][0] for call in analyze.call_args_list]
+        assert sorted(analyzed) == ['keep.py', 'mod.py', 'mod.py']
@@ -1454,3 +1454,36 @@ class TestProfileRules:
             run_check(args)
         mock_profile.assert_called_once()
         mock_recursive.assert_not_called()
+
+
+class TestParallelWorkerTransport:
+    """_parallel_worker ships detections column-wise in one packed payload."""
+
+    def test_worker_result_round_trips_detections(self, tmp_path):
+        from reveal.cli.file_checker import (
+            _parallel_worker, _unpack_worker_result, check_and_collect_file,
+        )
+
+        f = tmp_path / "bad.py"
+        f.write_text("try:\n    pass\nexcept:\n    pass\n")
+        raw = _parallel_worker((f, tmp_path, ["B001"], None))
+        assert isinstance(raw[1], bytes)
+
+        file_path, issue_count, detections, status = _unpack_worker_result(raw)
+        expected = check_and_collect_file(f, tmp_path, ["B001"], None)
+        assert file_path == f
+        assert issue_count == expected[0] > 0
+        assert [d.to_dict() for d in detections] == [d.to_dict() for d in expected[1]]
+        assert status == expected[2]
+
+    def test_clean_file_decodes_empty_detections(self, tmp_path):
+        from reveal.cli.file_checker import _parallel_worker, _unpack_worker_result
+
+        f = tmp_path / "ok.py"
+        f.write_text("x = 1\n")
+        _, issue_count, detections, status = _unpack_worker_result(
+            _parallel_worker((f, tmp_path, ["B001"], None))
+        )
+        assert issue_count == 0
+        assert detections == []
+        assert status["status"] == "ok"
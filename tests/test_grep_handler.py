@@ -255,3 +255,62 @@ class TestGrepBreAlternationMistake(unittest.TestCase):
         self.assertIn('No matches found', r.stdout)
         self.assertIn("uses Python regex", r.stdout)
         self.assertIn("SOC-SEC-33|SOC-101", r.stdout)
+
+
+class TestGrepSearchEngine(unittest.TestCase):
+    """Whole-buffer search, literal prefilter and parallel directory scan."""
+
+    def test_required_literal(self):
+        import re
+        from reveal.grep_handler import _required_literal
+        self.assertEqual(_required_literal(re.compile(r'def\s+handle_\w+')), 'handle_')
+        self.assertEqual(_required_literal(re.compile(r'(?:TODO)-item')), 'TODO-item')
+        self.assertIsNone(_required_literal(re.compile(r'foo|barbaz')))
+        self.assertIsNone(_required_literal(re.compile(r'\d+')))
+        # 'i' and 'k' have non-ASCII case partners under IGNORECASE, so they break a run.
+        self.assertEqual(_required_literal(re.compile('linkage', re.I)), 'age')
+
+    def test_whole_buffer_search_matches_per_line_search(self):
+        for content in ['alpha\nbeta gamma\n\nfoo bar\nbar\r\nlast foo', 'a\rb\nfoo a\n']:
+            self._assert_parity(content)
+
+    def _assert_parity(self, content):
+        import re
+        from reveal.grep_handler import _find_hit_lines
+        for pattern in ['foo', '^bar', 'a$', r'a\s+g', r'\s', '^$', 'x*', r'(?<=fo)o', r'\Abeta']:
+            compiled = re.compile(pattern)
+            expected = [i for i, line in enumerate(content.splitlines(), 1) if compiled.search(line)]
+            self.assertEqual(_find_hit_lines(content, compiled), expected, pattern)
+
+    def test_group_by_element_nested_and_uncovered(self):
+        from reveal.grep_handler import _group_by_element
+        elements = [
+            {'name': 'Outer', 'line': 1, 'line_end': 20, 'kind': 'class'},
+            {'name': 'inner', 'line': 5, 'line_end': 8, 'kind': 'function'},
+        ]
+        groups = _group_by_element([2, 6, 7, 25], elements)
+        by_name = {g['name']: g['lines'] for g in groups}
+        self.assertEqual(by_name['Outer'], [2])
+        # Line 25 is outside every element: it falls back to the nearest preceding one.
+        self.assertEqual(by_name['inner'], [6, 7, 25])
+
+    def test_directory_results_identical_serial_and_parallel(self):
+        import re
+        import shutil
+        from unittest import mock
+        from reveal.grep_handler import _collect_dir_results
+        d = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, d, ignore_errors=True)
+        for i in range(24):
+            body = f'line one\nneedle_{i} here\n' if i % 3 == 0 else 'nothing to see\n'
+            with open(os.path.join(d, f'f{i:02d}.txt'), 'w') as fh:
+                fh.write(body)
+        compiled = re.compile(r'needle_\d+')
+        with mock.patch.dict(os.environ, {'REVEAL_MAX_WORKERS': '1'}):
+            serial = _collect_dir_results(Path(d), compiled)
+        with mock.patch.dict(os.environ, {'REVEAL_MAX_WORKERS': '2'}):
+            parallel = _collect_dir_results(Path(d), compiled)
+        self.assertEqual(serial, parallel)
+        self.assertEqual(serial[1], 8)
+        self.assertEqual([Path(r['path']).name for r in serial[0]],
+                         [f'f{i:02d}.txt' for i in range(0, 24, 3)])
@@ -86,6 +86,16 @@ def test_max_entries_override_avoids_thrashing():
         assert disk_cache.get("prune_override_ns", f"k{i}") == i
 
 
+def test_put_many_writes_all_and_prunes_once(monkeypatch):
+    prunes = []
+    real_prune = disk_cache._prune
+    monkeypatch.setattr(disk_cache, "_prune", lambda d, n: (prunes.append(n), real_prune(d, n)))
+    disk_cache.put_many("bulk_ns", ((f"k{i}", i) for i in range(70)), max_entries=1000)
+    assert prunes == [1000]
+    for i in range(70):
+        assert disk_cache.get("bulk_ns", f"k{i}") == i
+
+
 def test_version_keyed_path_isolates_reveal_versions(monkeypatch):
     disk_cache.put("ns", "k", "old")
     monkeypatch.setattr(disk_cache, "__version__", "999.999.999")
@@ -546,5 +546,105 @@ class TestLetsEncryptGetHelp:
         assert '--check-duplicates' in flags
 
 
+# ---------------------------------------------------------------------------
+# Cert inventory cache, parallel parsing, san_hash duplicates
+# ---------------------------------------------------------------------------
+
+def _write_pem(path: Path, san: list, days: int = 90):
+    """Write a real self-signed PEM cert covering *san* to *path*."""
+    from datetime import datetime, timedelta, timezone
+    from cryptography import x509
+    from cryptography.hazmat.primitives import hashes, serialization
+    from cryptography.hazmat.primitives.asymmetric import ec
+    from cryptography.x509.oid import NameOID
+
+    key = ec.generate_private_key(ec.SECP256R1())
+    name = x509.Name([x509.NameAttribute(NameOID.COMMON_NAME, san[0])])
+    now = datetime.now(timezone.utc)
+    cert = (
+        x509.CertificateBuilder()
+        .subject_name(name).issuer_name(name).public_key(key.public_key())
+        .serial_number(x509.random_serial_number())
+        .not_valid_before(now - timedelta(days=1)).not_valid_after(now + timedelta(days=days))
+        .add_extension(x509.SubjectAlternativeName([x509.DNSName(d) for d in san]), critical=False)
+        .sign(key, hashes.SHA256())
+    )
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(cert.public_bytes(serialization.Encoding.PEM))
+
+
+class TestCertInventoryCache(unittest.TestCase):
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self._tmp.name)
+        self.live = self.root / 'live'
+        env = patch.dict(os.environ, {'REVEAL_CACHE_DIR': str(self.root / 'cache'),
+                                      'REVEAL_DISK_CACHE': '1'})
+        env.start()
+        self.addCleanup(env.stop)
+        self.addCleanup(self._tmp.cleanup)
+        _write_pem(self.live / 'a.com' / 'cert.pem', ['a.com', 'www.a.com'], days=60)
+        _write_pem(self.live / 'b.com' / 'cert.pem', ['b.com'], days=20)
+        _write_pem(self.live / 'a.com-0001' / 'cert.pem', ['www.a.com', 'a.com'], days=80)
+
+    def _parsed(self):
+        from reveal.adapters.letsencrypt import adapter as le_mod
+        return patch.object(le_mod, '_parse_cert_file', wraps=le_mod._parse_cert_file)
+
+    def test_repeat_walk_parses_only_changed_certs(self):
+        first = _walk_live_dir(str(self.live))
+        self.assertEqual([c['name'] for c in first], ['a.com', 'a.com-0001', 'b.com'])
+        self.assertEqual(first[0]['san'], ['a.com', 'www.a.com'])
+        self.assertIn(first[2]['days_until_expiry'], (19, 20))
+
+        with self._parsed() as parse:
+            self.assertEqual(_walk_live_dir(str(self.live)), first)
+        self.assertFalse(parse.called)
+
+        # certbot renewal: write the new archive file and repoint the symlink
+        _write_pem(self.root / 'archive' / 'b.com' / 'cert2.pem', ['b.com'], days=90)
+        (self.live / 'b.com' / 'cert.pem').unlink()
+        (self.live / 'b.com' / 'cert.pem').symlink_to(self.root / 'archive' / 'b.com' / 'cert2.pem')
+        with self._parsed() as parse:
+            renewed = _walk_live_dir(str(self.live))
+        self.assertEqual([c.args[0] for c in parse.call_args_list], [str(self.live / 'b.com' / 'cert.pem')])
+        self.assertGreaterEqual(renewed[2]['days_until_expiry'], 89)
+
+    def test_unreadable_cert_is_not_cached(self):
+        with patch('reveal.adapters.ssl.certificate.load_certificate_from_file',
+                   side_effect=PermissionError('denied')):
+            self.assertTrue(all('error' in c for c in _walk_live_dir(str(self.live))))
+        self.assertFalse(any('error' in c for c in _walk_live_dir(str(self.live))))
+
+    def test_process_pool_matches_serial(self):
+        for i in range(5):
+            _write_pem(self.live / f'extra{i}.com' / 'cert.pem', [f'extra{i}.com'])
+        with patch.dict(os.environ, {'REVEAL_DISK_CACHE': '0', 'REVEAL_MAX_WORKERS': '1'}):
+            serial = _walk_live_dir(str(self.live))
+        with patch.dict(os.environ, {'REVEAL_DISK_CACHE': '0', 'REVEAL_MAX_WORKERS': '3'}):
+            pooled = _walk_live_dir(str(self.live))
+        self.assertEqual(pooled, serial)
+
+    def test_duplicates_grouped_by_san_hash(self):
+        certs = _walk_live_dir(str(self.live))
+        self.assertEqual(certs[0]['san_hash'], certs[1]['san_hash'])
+        groups = _find_duplicates(certs)
+        self.assertEqual([sorted(c['name'] for c in g) for g in groups], [['a.com', 'a.com-0001']])
+
+    def test_orphan_lookup_matches_prefix_scan(self):
+        certs = [_fake_cert(n, [n]) for n in ('a.com', 'b.com', 'c.com', 'a.co')]
+        paths = ['/etc/letsencrypt/live/a.com/fullchain.pem', '/etc/letsencrypt/live/c.com',
+                 '/etc/letsencrypt/live/a.cox/cert.pem', '/etc/letsencrypt/live/b.com/cert.pem.bak']
+
+        def prefix_scan(certs, refs):
+            return [c for c in certs if not any(
+                p == c['cert_path'] or p.startswith(c['cert_path'].rsplit('/', 1)[0] + '/')
+                for p in refs)]
+
+        for n in range(len(paths) + 1):
+            self.assertEqual(_find_orphans(certs, paths[:n]), prefix_scan(certs, paths[:n]))
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,273 @@
+"""Tests for the shared mysql:// server snapshot and ?sample= interval mode.
+
+Runs the real MySQLConnection against a stand-in for the server: pymysql.connect
+is patched to return a fake connection that answers the handful of SHOW/SELECT
+statements the adapter issues and records every query it receives.
+"""
+
+import io
+import unittest
+from collections import Counter
+from contextlib import redirect_stdout
+from unittest.mock import patch
+
+from reveal.adapters.mysql import MySQLAdapter
+from reveal.adapters.mysql.renderer import MySQLRenderer
+from reveal.adapters.mysql.snapshot import (
+    ServerSnapshot, parse_sample_interval, sample_rates,
+)
+
+
+class _FakeServer:
+    """Answers the adapter's server-wide queries from in-memory state."""
+
+    def __init__(self):
+        self.clock = 1_700_000_000.0
+        self.status = {
+            'Uptime': '864000', 'Questions': '1000000', 'Slow_queries': '10',
+            'Com_select': '600000', 'Com_insert': '100000',
+            'Innodb_rows_read': '5000000', 'Innodb_rows_inserted': '100000',
+            'Innodb_buffer_pool_read_requests': '10000000', 'Innodb_buffer_pool_reads': '1000',
+            'Threads_connected': '10', 'Threads_running': '2', 'Max_used_connections': '40',
+            'Open_files': '100', 'Select_scan': '200', 'Select_range': '800',
+            'Threads_created': '5', 'Connections': '1000',
+            'Created_tmp_disk_tables': '10', 'Created_tmp_tables': '100',
+        }
+        self.variables = {
+            'version': '8.0.36', 'max_connections': '200', 'open_files_limit': '10000',
+            'innodb_buffer_pool_size': '134217728', 'tmp_table_size': '16777216',
+            'max_heap_table_size': '16777216', 'sql_mode': 'STRICT_TRANS_TABLES',
+        }
+        self.processlist = [
+            {'Id': 1, 'User': 'app', 'db': 'shop', 'Time': 30, 'State': 'Sending data',
+             'Info': 'SELECT * FROM orders'},
+            {'Id': 2, 'User': 'app', 'db': 'shop', 'Time': 0, 'State': None, 'Info': None},
+        ]
+        self.queries = Counter()
+
+    def advance(self, seconds, **increments):
+        """Let *seconds* pass on the server, bumping status counters."""
+        self.clock += seconds
+        self.status['Uptime'] = str(int(self.status['Uptime']) + int(seconds))
+        for name, inc in increments.items():
+            self.status[name] = str(int(self.status[name]) + inc)
+
+    def rows(self, query):
+        query = ' '.join(query.split())
+        self.queries[query] += 1
+        if query == 'SHOW GLOBAL STATUS':
+            return [{'Variable_name': k, 'Value': v} for k, v in self.status.items()]
+        if query == 'SHOW GLOBAL VARIABLES':
+            return [{'Variable_name': k, 'Value': v} for k, v in self.variables.items()]
+        if query == 'SHOW FULL PROCESSLIST':
+            return list(self.processlist)
+        if query == 'SELECT UNIX_TIMESTAMP() as timestamp':
+            return [{'timestamp': int(self.clock)}]
+        if query in ('SHOW SLAVE STATUS', 'SHOW SLAVE HOSTS') or 'information_schema.tables' in query:
+            return []
+        raise AssertionError(f"unexpected query: {query}")
+
+    def connect(self, **kwargs):
+        return _FakeConnection(self)
+
+
+class _FakeConnection:
+    host = 'localhost'
+    port = 3306
+
+    def __init__(self, server):
+        self.server = server
+
+    def cursor(self, cursor_class=None):
+        return _FakeCursor(self.server)
+
+    def close(self):
+        pass
+
+
+class _FakeCursor:
+    def __init__(self, server):
+        self.server = server
+        self._rows = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def execute(self, query, params=None):
+        self._rows = self.server.rows(query)
+
+    def fetchall(self):
+        return self._rows
+
+
+class _ServerTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.server = _FakeServer()
+        connect = patch('reveal.adapters.mysql.connection.pymysql.connect', self.server.connect)
+        connect.start()
+        self.addCleanup(connect.stop)
+
+    def count(self, query):
+        return self.server.queries[query]
+
+
+class TestSharedSnapshot(_ServerTestCase):
+
+    def test_overview_reads_each_result_set_once(self):
+        result = MySQLAdapter('mysql://u:p@localhost').get_structure()
+
+        self.assertEqual(result['version'], '8.0.36')
+        self.assertEqual(result['connection_health']['max'], 200)
+        self.assertEqual(result['resource_limits']['open_files']['limit'], 10000)
+        self.assertEqual(result['performance']['qps'], '1.2')  # 1M questions / 10 days
+        self.assertNotIn('sample', result)
+        self.assertEqual(self.count('SHOW GLOBAL STATUS'), 1)
+        self.assertEqual(self.count('SHOW GLOBAL VARIABLES'), 1)
+        self.assertEqual(self.count('SELECT UNIX_TIMESTAMP() as timestamp'), 1)
+
+    def test_check_and_elements_share_one_snapshot(self):
+        adapter = MySQLAdapter('mysql://u:p@localhost')
+        checks = {c['name']: c for c in adapter.check()['checks']}
+        connections = adapter.get_element('connections')
+        variables = adapter.get_element('variables')
+        errors = adapter.get_element('errors')
+
+        # Select_scan 200 / 1000 selects: table scan ratio now reaches check()
+        self.assertEqual(checks['Table Scan Ratio']['value'], '20.00%')
+        self.assertEqual(checks['Table Scan Ratio']['status'], 'warning')
+        self.assertEqual(connections['total_connections'], 2)
+        self.assertEqual([q['id'] for q in connections['long_running_queries']], [1])
+        self.assertEqual(list(variables['variables']), [
+            'innodb_buffer_pool_size', 'max_connections', 'max_heap_table_size', 'tmp_table_size'])
+        self.assertEqual(errors['snapshot_time'], connections['snapshot_time'])
+        self.assertEqual(self.count('SHOW GLOBAL STATUS'), 1)
+        self.assertEqual(self.count('SHOW GLOBAL VARIABLES'), 1)
+        self.assertEqual(self.count('SHOW FULL PROCESSLIST'), 1)
+
+
+class TestCheckTuningRatios(_ServerTestCase):
+    """check()'s scan, thread cache and temp-disk checks read /performance's tuning_ratios."""
+
+    def _checks(self):
+        result = MySQLAdapter('mysql://u:p@localhost').check()
+        return result, {c['name']: (c['value'], c['status']) for c in result['checks']}
+
+    def test_ratios_come_from_the_snapshot(self):
+        result, checks = self._checks()
+        self.assertEqual(checks['Table Scan Ratio'], ('20.00%', 'warning'))      # 200 / (200 + 800)
+        self.assertEqual(checks['Thread Cache Miss Rate'], ('0.50%', 'pass'))   # 5 / 1000
+        self.assertEqual(checks['Temp Disk Ratio'], ('10.00%', 'pass'))         # 10 / 100
+        self.assertEqual((result['status'], result['exit_code']), ('warning', 1))
+        self.assertEqual(self.count('SHOW GLOBAL STATUS'), 1)
+
+    def test_ratios_can_fail_the_check(self):
+        self.server.status.update(Select_scan='900', Select_range='100', Threads_created='400',
+                                  Created_tmp_disk_tables='60')
+        result, checks = self._checks()
+        self.assertEqual(checks['Table Scan Ratio'], ('90.00%', 'failure'))
+        self.assertEqual(checks['Thread Cache Miss Rate'], ('40.00%', 'failure'))
+        self.assertEqual(checks['Temp Disk Ratio'], ('60.00%', 'failure'))
+        self.assertEqual((result['status'], result['exit_code']), ('failure', 2))
+
+
+class TestSampleMode(_ServerTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.now = 100.0
+
+        def sleep(seconds):
+            self.now += seconds
+            self.server.advance(seconds, Questions=2500, Com_select=2000, Innodb_rows_read=50_000,
+                                Innodb_buffer_pool_read_requests=10_000,
+                                Innodb_buffer_pool_reads=50)
+
+        for target, fake in (('time.monotonic', lambda: self.now), ('time.sleep', sleep)):
+            p = patch(target, fake)
+            p.start()
+            self.addCleanup(p.stop)
+
+    def test_overview_reports_interval_rates(self):
+        adapter = MySQLAdapter('u:p@localhost', 'sample=5s')
+        result = adapter.get_structure()
+
+        sample = result['sample']
+        self.assertEqual(sample['interval_seconds'], 5.0)
+        self.assertEqual(sample['per_second']['queries'], 500.0)
+        self.assertEqual(sample['per_second']['selects'], 400.0)
+        self.assertEqual(sample['per_second']['rows_read'], 10_000.0)
+        self.assertEqual(sample['per_second']['buffer_pool_reads'], 10.0)
+        self.assertEqual(sample['per_second']['inserts'], 0.0)
+        self.assertEqual(sample['buffer_pool_hit_rate'], '99.50%')
+        self.assertEqual(result['performance']['qps'], '500.0')
+        # the rest of the overview describes the end of the interval
+        self.assertEqual(result['uptime'], '10d 0h 0m')
+        self.assertEqual(self.count('SHOW GLOBAL STATUS'), 2)
+        self.assertEqual(self.count('SHOW GLOBAL VARIABLES'), 1)
+
+    def test_elements_reuse_the_same_sample(self):
+        adapter = MySQLAdapter('mysql://u:p@localhost?sample=5s')
+        performance = adapter.get_element('performance')
+        innodb = adapter.get_element('innodb')
+
+        self.assertEqual(performance['queries_per_second'], 500.0)
+        self.assertIs(innodb['sample'], performance['sample'])
+        self.assertEqual(self.count('SHOW GLOBAL STATUS'), 2)
+
+        out = io.StringIO()
+        with redirect_stdout(out):
+            MySQLRenderer._render_performance(performance)
+        self.assertIn('Sampled over 5.0s (per second):', out.getvalue())
+        self.assertIn('Queries: 500.0', out.getvalue())
+
+    def test_invalid_interval_is_rejected(self):
+        for value in ('forever', '0s', '10m', '-1'):
+            with self.assertRaises(ValueError, msg=value):
+                MySQLAdapter('localhost', f'sample={value}')
+
+
+class TestSampleRates(unittest.TestCase):
+
+    def _snapshot(self, at, **status):
+        snap = ServerSnapshot(lambda q: [{'Variable_name': k, 'Value': str(v)} for k, v in status.items()],
+                              lambda q: None)
+        with patch('time.monotonic', lambda: at):
+            snap.read_status()
+        return snap
+
+    def test_parse_sample_interval(self):
+        self.assertEqual(parse_sample_interval('5s'), 5.0)
+        self.assertEqual(parse_sample_interval('500ms'), 0.5)
+        self.assertEqual(parse_sample_interval('2M'), 120.0)
+        self.assertEqual(parse_sample_interval(3), 3.0)
+
+    def test_counter_reset_and_missing_counters(self):
+        before = self._snapshot(10.0, Questions=1000, Innodb_rows_read=50)
+        after = self._snapshot(12.0, Questions=10, Innodb_rows_read=250, Com_select=5)
+
+        rates = sample_rates(before, after)
+        self.assertEqual(rates['per_second'], {'queries': 0.0, 'rows_read': 100.0})
+        self.assertIsNone(rates['buffer_pool_hit_rate'])
+
+    def test_refreshed_snapshot_keeps_variables(self):
+        calls = []
+
+        def query(q):
+            calls.append(q)
+            return []
+
+        snap = ServerSnapshot(query, lambda q: None)
+        snap.variables
+        snap.status
+        fresh = snap.refreshed()
+        fresh.variables
+        fresh.status
+        self.assertEqual(calls, ['SHOW GLOBAL VARIABLES', 'SHOW GLOBAL STATUS', 'SHOW GLOBAL STATUS'])
+
+
+if __name__ == '__main__':
+    unittest.main()
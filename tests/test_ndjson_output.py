@@ -0,0 +1,205 @@
+"""Tests for --format ndjson: one JSON record per line, streamed where the
+producer can stream (check, --grep on a directory, ast://, stats://), then a
+closing summary record."""
+
+import json
+from argparse import Namespace
+from unittest.mock import patch
+
+import pytest
+
+from reveal.utils import json_utils
+from reveal.rules.base import Detection
+
+
+@pytest.fixture(autouse=True)
+def _ndjson_mode():
+    json_utils.set_ndjson_enabled(True)
+    yield
+    json_utils.set_ndjson_enabled(False)
+
+
+def _records(text):
+    return [json.loads(line) for line in text.splitlines() if line.strip()]
+
+
+class TestNdjsonPrinting:
+    def test_result_split_into_records_then_summary(self, capsys):
+        json_utils.print_json_result({
+            "type": "x", "meta": {"confidence": 1.0},
+            "results": [{"name": "a"}, {"name": "b"}],
+        })
+        recs = _records(capsys.readouterr().out)
+        assert [r["record"] for r in recs] == ["result", "result", "summary"]
+        assert recs[0]["name"] == "a"
+        assert "results" not in recs[-1]
+        assert recs[-1]["meta"] == {"confidence": 1.0}
+        assert recs[-1]["records"] == {"kind": "result", "count": 2}
+
+    def test_result_without_list_is_one_summary(self, capsys):
+        json_utils.print_json_result({"type": "x", "value": 3})
+        assert _records(capsys.readouterr().out) == [{"record": "summary", "type": "x", "value": 3}]
+
+    def test_streamed_count_is_added(self, capsys):
+        json_utils.print_ndjson_result({"files": []}, "files", streamed=5)
+        assert _records(capsys.readouterr().out)[-1]["records"] == {"kind": "file", "count": 5}
+
+    def test_payload_record_key_cannot_relabel_record(self, capsys):
+        json_utils.print_ndjson_result({"results": [{"record": "summary", "name": "a"}]})
+        out = capsys.readouterr().out
+        assert [r["record"] for r in _records(out)] == ["result", "summary"]
+        assert out.startswith('{"record":"result",')
+
+    def test_documents_are_compact_in_ndjson_mode(self):
+        assert "\n" not in json_utils.safe_json_dumps({"a": [1, 2], "b": {"c": 1}})
+        json_utils.set_ndjson_enabled(False)
+        assert "\n" in json_utils.safe_json_dumps({"a": [1, 2]})
+
+
+class TestOutputToggles:
+    def test_ndjson_becomes_json_plus_toggle(self):
+        from reveal.main import _apply_output_toggles
+        args = Namespace(format="ndjson", provenance=False)
+        _apply_output_toggles(args)
+        assert args.format == "json" and json_utils.ndjson_enabled()
+
+        args = Namespace(format="json", provenance=False)
+        _apply_output_toggles(args)
+        assert not json_utils.ndjson_enabled()
+
+    def test_parser_accepts_ndjson(self):
+        from reveal.cli.parser import create_argument_parser
+        assert create_argument_parser("0").parse_args(["x", "--format", "ndjson"]).format == "ndjson"
+
+
+def _check_args(**kw):
+    base = dict(format="json", select=None, ignore=None, respect_gitignore=True,
+                exclude=None, no_group=False, severity=None, limit=50)
+    base.update(kw)
+    return Namespace(**base)
+
+
+class TestCheckNdjson:
+    def test_file_records_stream_before_summary(self, tmp_path, capsys):
+        from reveal.cli import file_checker
+        (tmp_path / "a.py").write_text("x = 1\n")
+        (tmp_path / "b.py").write_text("y = 1\n")
+        printed_before_second_check = []
+
+        def fake_check(file_path, directory, select, ignore, profile=None):
+            if file_path.name == "b.py":
+                printed_before_second_check.append(capsys.readouterr().out)
+                return 0, [], {"status": "ok"}
+            d = Detection(file_path=str(file_path), line=1, rule_code="B001", message="m")
+            return 1, [d], {"status": "ok"}
+
+        with patch.object(file_checker, "check_and_collect_file", fake_check), \
+                pytest.raises(SystemExit) as exc:
+            file_checker.handle_recursive_check(tmp_path, _check_args())
+
+        assert exc.value.code == 1
+        first = _records(printed_before_second_check[0])
+        assert [r["record"] for r in first] == ["file"]
+        assert first[0]["detections"][0]["rule_code"] == "B001"
+        summary = _records(capsys.readouterr().out)[-1]
+        assert summary["record"] == "summary" and summary["type"] == "check"
+        assert summary["summary"]["files_checked"] == 2
+        assert summary["summary"]["total_issues"] == 1
+        assert summary["records"] == {"kind": "file", "count": 1}
+        assert "files" not in summary and "scope" in summary
+
+    def test_clean_tree_is_just_a_summary(self, tmp_path, capsys):
+        from reveal.cli import file_checker
+        (tmp_path / "a.py").write_text("x = 1\n")
+        with patch.object(file_checker, "check_and_collect_file", return_value=(0, [], {"status": "ok"})), \
+                pytest.raises(SystemExit) as exc:
+            file_checker.handle_recursive_check(tmp_path, _check_args())
+        assert exc.value.code == 0
+        recs = _records(capsys.readouterr().out)
+        assert [r["record"] for r in recs] == ["summary"]
+
+
+class TestGrepNdjson:
+    def test_directory_grep_streams_file_records(self, tmp_path, capsys):
+        from reveal.grep_handler import handle_grep_directory
+        (tmp_path / "a.txt").write_text("needle\nhay\nneedle\n")
+        (tmp_path / "b.txt").write_text("hay\n")
+        (tmp_path / "c.txt").write_text("needle\n")
+        handle_grep_directory(str(tmp_path), "needle", Namespace(format="json"))
+        recs = _records(capsys.readouterr().out)
+        assert [r["record"] for r in recs] == ["file", "file", "summary"]
+        assert sorted((r["path"].rsplit("/", 1)[-1], r["hits"]) for r in recs[:2]) == [("a.txt", 2), ("c.txt", 1)]
+        assert recs[-1]["total_hits"] == 3
+        assert recs[-1]["records"] == {"kind": "file", "count": 2}
+
+
+def _fake_structures(n_files, per_file):
+    return [
+        {"file": f"f{i}.go", "elements": [
+            {"name": f"fn{i}_{j}", "category": "functions", "file": f"f{i}.go", "line": j + 1}
+            for j in range(per_file)
+        ]}
+        for i in range(n_files)
+    ]
+
+
+class TestAstStreaming:
+    @pytest.mark.parametrize("query", [None, "limit=3", "offset=2&limit=4", "offset=5"])
+    def test_streamed_query_matches_collected_query(self, tmp_path, query):
+        from reveal.adapters.ast import adapter as ast_adapter
+        structures = _fake_structures(3, 4)
+        collected = ast_adapter.AstAdapter(str(tmp_path), query).get_structure(structures=structures)
+        streamed = []
+        with patch.object(ast_adapter, "iter_structures", return_value=iter(structures)):
+            summary = ast_adapter.AstAdapter(str(tmp_path), query).get_structure(on_record=streamed.append)
+        assert [e["name"] for e in streamed] == [e["name"] for e in collected["results"]]
+        assert summary["results"] == []
+        for key in ("total_files", "total_results", "displayed_results"):
+            assert summary[key] == collected[key]
+        assert summary["meta"]["warnings"] == collected["meta"]["warnings"]
+
+    def test_auto_cap_applies_while_streaming(self, tmp_path):
+        from reveal.adapters.ast import adapter as ast_adapter
+        structures = _fake_structures(3, ast_adapter.DEFAULT_RESULT_CAP)
+        streamed = []
+        with patch.object(ast_adapter, "iter_structures", return_value=iter(structures)):
+            summary = ast_adapter.AstAdapter(str(tmp_path)).get_structure(on_record=streamed.append)
+        assert len(streamed) == ast_adapter.DEFAULT_RESULT_CAP
+        assert summary["total_results"] == 3 * ast_adapter.DEFAULT_RESULT_CAP
+        assert [w["type"] for w in summary["meta"]["warnings"]] == ["auto_capped"]
+
+    def test_sorted_query_ignores_on_record(self, tmp_path):
+        from reveal.adapters.ast import adapter as ast_adapter
+        streamed = []
+        with patch.object(ast_adapter, "query_summary", return_value=(2, 4, [{}] * 4, 0)):
+            result = ast_adapter.AstAdapter(str(tmp_path), "sort=-line").get_structure(on_record=streamed.append)
+        assert streamed == [] and len(result["results"]) == 4
+
+
+class TestStatsStreaming:
+    def test_totals_match_aggregate(self):
+        from pathlib import Path
+        from reveal.adapters.stats.aggregation import StatsTotals, aggregate_stats
+        stats = [
+            {"lines": {"total": t, "code": t - 1}, "elements": {"functions": f, "classes": 1},
+             "complexity": {"average": c}, "quality": {"score": q}}
+            for t, f, c, q in [(10, 2, 3.5, 90.0), (40, 0, 0, 70.0), (7, 5, 1.25, 99.5)]
+        ]
+        totals = StatsTotals()
+        for s in stats:
+            totals.add(s)
+        assert totals.result(Path("."), [])["summary"] == aggregate_stats(stats, Path("."))["summary"]
+
+
+class TestUriStreamSelection:
+    def test_streaming_only_for_opted_in_adapters(self, tmp_path):
+        from reveal.adapters.ast.adapter import AstAdapter
+        from reveal.cli.routing.uri import _ndjson_stream
+        adapter = AstAdapter(str(tmp_path))
+        assert _ndjson_stream(adapter, Namespace()).kind == "result"
+        assert _ndjson_stream(adapter, Namespace(fields="name")) is None
+        assert _ndjson_stream(adapter, Namespace(max_items=5)) is None
+        with patch.object(AstAdapter, "post_process", lambda self, result, args: result, create=True):
+            assert _ndjson_stream(adapter, Namespace()) is None
+        json_utils.set_ndjson_enabled(False)
+        assert _ndjson_stream(adapter, Namespace()) is None
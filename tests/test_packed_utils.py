@@ -0,0 +1,39 @@
+"""Tests for reveal.utils.packed — compact worker→parent result transport."""
+
+import pickle
+
+from reveal.utils.packed import PackedRecord, pack_record
+
+
+class TestPackRecord:
+
+    def test_round_trip_scalars_and_segments(self):
+        payload = pack_record((3, 2.5, True), ({'a': [1, 2]}, None, 'x'))
+        record = PackedRecord(payload)
+        assert record.scalars == (3.0, 2.5, 1.0)
+        assert len(record) == 3
+        assert record.segment(0) == {'a': [1, 2]}
+        assert record.segment(1) is None
+        assert record.segment(2) == 'x'
+
+    def test_empty_record(self):
+        record = PackedRecord(pack_record())
+        assert record.scalars == ()
+        assert len(record) == 0
+
+    def test_payload_is_plain_bytes(self):
+        assert isinstance(pack_record((1,), ([1],)), bytes)
+
+    def test_segments_decode_lazily_and_memoize(self):
+        record = PackedRecord(pack_record((), ([1, 2, 3], {'k': 'v'})))
+        first = record.segment(0)
+        assert record.segment(0) is first
+        # Segment 1 was never touched, so it is still undecoded.
+        assert record._decoded[1] is not record._decoded[0]
+        assert record._decoded[1] != {'k': 'v'}
+
+    def test_record_pickles_as_raw_payload(self):
+        record = PackedRecord(pack_record((7,), ('seg',)))
+        clone = pickle.loads(pickle.dumps(record))
+        assert clone.scalars == (7.0,)
+        assert clone.segment(0) == 'seg'
@@ -7,9 +7,15 @@ indistinguishable from genuinely clean code. See the BACK-984/985 case
 study — same disease, different call site.
 """
 
+import ast
 import logging
+from unittest.mock import patch
 
-from reveal.rules.base_mixins import _cached_ast_parse, ASTParsingMixin
+import pytest
+
+from reveal.rules.base_mixins import (
+    _cached_ast_parse, ASTParsingMixin, NodeVisitorMixin, dispatch_nodes,
+)
 
 
 class TestCachedAstParse:
@@ -42,3 +48,130 @@ class TestASTParsingMixin:
         tree, detections = Rule()._parse_python_or_skip("def f(:\n", "mixin_skip.py")
         assert tree is None
         assert detections == []
+
+
+class _Recorder(NodeVisitorMixin):
+    """Visitor that records the node types it was handed."""
+
+    code = "X000"
+
+    def __init__(self, types=(), kinds=None):
+        self.AST_NODE_TYPES = types
+        self.TS_NODE_KINDS = kinds or {}
+        self.walks = 0
+
+    def begin_visit(self, file_path, structure, content, root):
+        super().begin_visit(file_path, structure, content, root)
+        self.walks += 1
+        return True
+
+    def visit_node(self, node):
+        self._detections.append(getattr(node, 'kind', type(node).__name__))
+
+
+class TestNodeVisitorDispatch:
+    SOURCE = "import os\n\ndef f(x):\n    return g(x)\n\nclass C:\n    def m(self):\n        pass\n"
+
+    def test_each_rule_sees_only_its_node_types(self):
+        funcs = _Recorder((ast.FunctionDef,))
+        calls = _Recorder((ast.Call, ast.Import))
+        results = dispatch_nodes([funcs, calls], 'python-ast', 'v.py', None, self.SOURCE)
+        assert sorted(results[0]) == ['FunctionDef', 'FunctionDef']
+        assert sorted(results[1]) == ['Call', 'Import']
+
+    def test_base_class_matches_subclasses(self):
+        stmts = _Recorder((ast.stmt,))
+        [seen] = dispatch_nodes([stmts], 'python-ast', 'v.py', None, self.SOURCE)
+        assert {'Import', 'FunctionDef', 'Return', 'ClassDef', 'Pass'} <= set(seen)
+
+    def test_results_match_standalone_visit(self):
+        rule = _Recorder((ast.Name,))
+        standalone = rule._check_by_visiting('v.py', None, self.SOURCE)
+        assert dispatch_nodes([_Recorder((ast.Name,))], 'python-ast', 'v.py', None, self.SOURCE)[0] == standalone
+
+    def test_parse_failure_yields_empty_results(self):
+        assert dispatch_nodes([_Recorder((ast.Name,))], 'python-ast', 'bad.py', None, "def f(:\n") == [[]]
+
+    def test_failing_rule_is_dropped_and_others_continue(self):
+        class Boom(_Recorder):
+            def visit_node(self, node):
+                raise RuntimeError("boom")
+
+        errors = []
+        good = _Recorder((ast.FunctionDef,))
+        results = dispatch_nodes(
+            [Boom((ast.FunctionDef,)), good], 'python-ast', 'v.py', None, self.SOURCE,
+            on_error=lambda rule, exc: errors.append(str(exc)),
+        )
+        assert errors == ["boom"]
+        assert results[0] == [] and len(results[1]) == 2
+
+    def test_begin_visit_false_skips_rule(self):
+        class Skip(_Recorder):
+            def begin_visit(self, *args):
+                return False
+
+        assert dispatch_nodes([Skip((ast.Name,))], 'python-ast', 'v.py', None, self.SOURCE) == [[]]
+
+    def test_tree_sitter_nodes_dispatched_by_kind(self):
+        class Node:
+            def __init__(self, kind):
+                self.kind = kind
+
+        nodes = [Node('program'), Node('catch_clause'), Node('call'), Node('catch_clause')]
+        rule = _Recorder(kinds={'csharp': frozenset({'catch_clause'})})
+        with patch('reveal.rules.base_mixins._cached_treesitter_parse', return_value=nodes[0]), \
+                patch('reveal.core.iter_tree', return_value=iter(nodes)):
+            [seen] = dispatch_nodes([rule], 'csharp', 'x.cs', None, 'ignored')
+        assert seen == ['catch_clause', 'catch_clause']
+
+    def test_visit_node_is_abstract(self):
+        class Incomplete(NodeVisitorMixin):
+            AST_NODE_TYPES = (ast.Name,)
+
+        with pytest.raises(TypeError):
+            Incomplete()
+
+    def test_ast_parents_built_once_on_demand(self):
+        class Parents(_Recorder):
+            def visit_node(self, node):
+                self._detections.append(type(self._ast_parents()[node]).__name__)
+
+        rule = Parents((ast.Return, ast.Pass))
+        with patch('reveal.rules.base_mixins._cached_ast_nodes',
+                   wraps=_cached_ast_nodes_spy) as walk:
+            [seen] = dispatch_nodes([rule], 'python-ast', 'v.py', None, self.SOURCE)
+        assert seen == ['FunctionDef', 'FunctionDef']
+        assert walk.call_count == 2  # the dispatch walk + one parent-map build
+
+
+def _cached_ast_nodes_spy(tree):
+    return list(ast.walk(tree))
+
+
+class TestCheckFileSingleWalk:
+    def test_visitor_rules_share_one_walk(self, tmp_path):
+        """check_file walks the AST once for all visitor rules and keeps rule order."""
+        from reveal.rules import RuleRegistry
+
+        target = tmp_path / "mod.py"
+        content = "def f(a, b, c, d, e, f, g):\n    try:\n        pass\n    except:\n        pass\n"
+        target.write_text(content)
+        with patch('reveal.rules.base_mixins._cached_ast_nodes', wraps=_cached_ast_nodes_spy) as walk:
+            detections = RuleRegistry.check_file(
+                str(target), None, content, select=['B001', 'R913', 'T005'])
+        assert walk.call_count == 1
+        assert [d.rule_code for d in detections] == ['B001', 'R913']
+
+    def test_bug_and_complexity_rules_join_the_shared_walk(self, tmp_path):
+        from reveal.rules import RuleRegistry
+
+        target = tmp_path / "mod.py"
+        content = "def f(a, b, c, d, e, f, g):\n    try:\n        pass\n    except:\n        pass\n"
+        target.write_text(content)
+        structure = {'functions': [{'name': 'f', 'line': 1, 'line_count': 5}]}
+        with patch('reveal.rules.base_mixins._cached_ast_nodes', wraps=_cached_ast_nodes_spy) as walk:
+            detections = RuleRegistry.check_file(
+                str(target), structure, content, select=['B001', 'B005', 'B006', 'B007', 'C901'])
+        assert walk.call_count == 1
+        assert [d.rule_code for d in detections] == ['B001']
@@ -0,0 +1,143 @@
+"""Tests for reveal.rules.file_analysis — the per-file context check_file hands to rules."""
+
+import ast
+from unittest.mock import patch
+
+from reveal.rules import RuleRegistry
+from reveal.rules.base_mixins import NodeVisitorMixin, dispatch_nodes
+from reveal.rules.file_analysis import FileAnalysis
+
+
+class _Node:
+    def __init__(self, kind, start=0, end=0):
+        self.kind = kind
+        self.start_byte = start
+        self.end_byte = end
+
+
+class _Tree:
+    def __init__(self, root):
+        self.root_node = root
+
+
+class _FakeAnalyzer:
+    """Stands in for a TreeSitterAnalyzer that already parsed the file."""
+
+    def __init__(self, language, content, root, node_cache=None):
+        self.language = language
+        self.content = content
+        self.tree = _Tree(root)
+        self._node_cache = node_cache
+        self.index_builds = 0
+
+    def _find_nodes_by_type(self, node_type):
+        self.index_builds += 1
+        return self._node_cache.get(node_type, [])
+
+
+class TestFileAnalysis:
+    def test_covers_requires_same_content_object(self):
+        content = "x = 1\n"
+        analysis = FileAnalysis("a.py", content)
+        assert analysis.covers("a.py", content)
+        assert not analysis.covers("b.py", content)
+        assert not analysis.covers("a.py", "".join(["x = 1", "\n"]))
+
+    def test_python_ast_parsed_once(self):
+        analysis = FileAnalysis("a.py", "def f():\n    pass\n")
+        with patch("reveal.rules.file_analysis._parse_python_ast",
+                   wraps=ast.parse) as parse:
+            first = analysis.python_ast()
+            assert analysis.python_ast() is first
+        assert parse.call_count == 1
+
+    def test_python_ast_none_on_syntax_error(self):
+        assert FileAnalysis("bad.py", "def f(:\n").python_ast() is None
+
+    def test_ts_root_reuses_analyzer_tree(self):
+        content = "class C {}"
+        root = _Node("compilation_unit")
+        analysis = FileAnalysis("a.cs", content, _FakeAnalyzer("csharp", content, root))
+        with patch("reveal.rules.file_analysis._parse_treesitter_root") as parse:
+            assert analysis.ts_root("csharp") is root
+        parse.assert_not_called()
+
+    def test_ts_root_parses_other_languages_once(self):
+        content = "class C {}"
+        analysis = FileAnalysis("a.cs", content, _FakeAnalyzer("csharp", content, _Node("x")))
+        other = _Node("program")
+        with patch("reveal.rules.file_analysis._parse_treesitter_root", return_value=other) as parse:
+            assert analysis.ts_root("javascript") is other
+            assert analysis.ts_root("javascript") is other
+        assert parse.call_count == 1
+
+    def test_nodes_by_kind_uses_analyzer_index(self):
+        content = "try {} catch {}"
+        buckets = {"catch_clause": [_Node("catch_clause")]}
+        analyzer = _FakeAnalyzer("csharp", content, _Node("compilation_unit"), buckets)
+        analysis = FileAnalysis("a.cs", content, analyzer)
+        assert analysis.nodes_by_kind("csharp") is buckets
+        assert analysis.nodes_by_kind("csharp") is buckets
+        assert analyzer.index_builds == 1
+
+    def test_lines(self):
+        analysis = FileAnalysis("a.py", "a\nbb\n\nccc")
+        assert analysis.lines == ["a", "bb", "", "ccc"]
+        assert analysis.lines is analysis.lines
+
+
+class _KindRecorder(NodeVisitorMixin):
+    code = "X001"
+    TS_NODE_KINDS = {"csharp": frozenset({"catch_clause", "throw_statement"})}
+
+    def visit_language(self, file_path):
+        return "csharp"
+
+    def visit_node(self, node):
+        self._detections.append((node.kind, node.start_byte))
+
+
+class TestDispatchWithAnalysis:
+    def test_tree_sitter_dispatch_reads_kind_buckets_in_document_order(self):
+        content = "..."
+        buckets = {
+            "catch_clause": [_Node("catch_clause", 10, 20), _Node("catch_clause", 40, 50)],
+            "throw_statement": [_Node("throw_statement", 25, 30)],
+            "identifier": [_Node("identifier", 11, 12)],
+        }
+        analyzer = _FakeAnalyzer("csharp", content, _Node("compilation_unit"), buckets)
+        analysis = FileAnalysis("a.cs", content, analyzer)
+        with patch("reveal.core.iter_tree") as walk:
+            [seen] = dispatch_nodes([_KindRecorder()], "csharp", "a.cs", None, content,
+                                    analysis=analysis)
+        walk.assert_not_called()
+        assert seen == [("catch_clause", 10), ("throw_statement", 25), ("catch_clause", 40)]
+
+
+class TestCheckFileSharesOneParse:
+    def test_python_rules_share_one_ast_parse(self, tmp_path):
+        target = tmp_path / "mod.py"
+        content = "def f(a, b, c, d, e, f, g):\n    try:\n        pass\n    except:\n        pass\n"
+        target.write_text(content)
+        with patch("reveal.rules.file_analysis._parse_python_ast",
+                   wraps=ast.parse) as parse, \
+                patch("reveal.rules.base_mixins._cached_ast_parse") as lru_parse:
+            detections = RuleRegistry.check_file(
+                str(target), None, content, select=["B001", "B005", "R913", "T005", "S001"])
+        assert parse.call_count == 1
+        lru_parse.assert_not_called()
+        assert {d.rule_code for d in detections} == {"B001", "R913"}
+
+    def test_rules_see_the_analysis(self, tmp_path):
+        seen = []
+        RuleRegistry.discover()
+        rule_cls = next(rc for rc in RuleRegistry._rules if rc.code == "E501")
+        original = rule_cls.check
+
+        def spy(self, file_path, structure, content):
+            seen.append(self.analysis)
+            return original(self, file_path, structure, content)
+
+        with patch.object(rule_cls, "check", spy):
+            RuleRegistry.check_file(str(tmp_path / "m.py"), None, "x = 1\n", select=["E501"])
+        assert len(seen) == 1 and isinstance(seen[0], FileAnalysis)
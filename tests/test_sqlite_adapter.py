@@ -223,6 +223,123 @@ class TestSQLiteAdapterStructure(unittest.TestCase):
         self.assertTrue(len(structure['next_steps']) > 0)
 
 
+class TestSQLiteAdapterRowCounts(unittest.TestCase):
+    """Test ?counts= / ?workers= overview row-count modes and the catalog query."""
+
+    def setUp(self):
+        self.temp_db = tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.db')
+        self.temp_db.close()
+        self.db_path = self.temp_db.name
+
+        conn = sqlite3.connect(self.db_path)
+        conn.execute("CREATE TABLE a (id INTEGER PRIMARY KEY, v TEXT)")
+        conn.execute("CREATE TABLE b (id INTEGER PRIMARY KEY, a_id INTEGER REFERENCES a(id))")
+        conn.execute("CREATE INDEX idx_b_a ON b(a_id)")
+        conn.execute("CREATE TABLE kv (k TEXT PRIMARY KEY, v TEXT) WITHOUT ROWID")
+        conn.executemany("INSERT INTO a (v) VALUES (?)", [(str(i),) for i in range(10)])
+        conn.executemany("INSERT INTO b (a_id) VALUES (?)", [(1,), (2,), (3,)])
+        conn.execute("INSERT INTO kv VALUES ('x', 'y')")
+        conn.commit()
+        conn.close()
+
+    def tearDown(self):
+        if os.path.exists(self.db_path):
+            safe_unlink(self.db_path)
+
+    def _tables(self, result):
+        return {t['name']: t for t in result['tables']}
+
+    def test_default_small_file_is_exact(self):
+        result = SQLiteAdapter(f"sqlite://{self.db_path}").get_structure()
+        tables = self._tables(result)
+        self.assertEqual(tables['a']['rows'], 10)
+        self.assertEqual(tables['kv']['rows'], 1)
+        self.assertNotIn('rows_estimated', tables['a'])
+        self.assertEqual(result['statistics']['row_counts'], 'exact')
+
+    def test_catalog_counts_match_per_table_path(self):
+        adapter = SQLiteAdapter(f"sqlite://{self.db_path}")
+        catalog = adapter._get_catalog()
+        tables = adapter._execute_query(
+            "SELECT name, type FROM sqlite_master "
+            "WHERE type IN ('table', 'view') AND name NOT LIKE 'sqlite_%' ORDER BY type, name"
+        )
+        self.assertEqual(catalog, adapter._get_table_stats(tables))
+        self.assertEqual(self._tables({'tables': catalog})['b']['indexes'], 1)
+        self.assertEqual(self._tables({'tables': catalog})['b']['foreign_keys'], 1)
+
+    def test_approx_uses_max_rowid(self):
+        adapter = SQLiteAdapter(f"sqlite://{self.db_path}", query='counts=approx')
+        result = adapter.get_structure()
+        tables = self._tables(result)
+        self.assertEqual(tables['a']['rows'], 10)
+        self.assertTrue(tables['a']['rows_estimated'])
+        self.assertIsNone(tables['kv']['rows'])  # WITHOUT ROWID, no stats
+        self.assertEqual(result['statistics']['row_counts'], 'estimated')
+        self.assertEqual(result['statistics']['total_rows'], 13)
+
+    def test_approx_prefers_sqlite_stat1(self):
+        conn = sqlite3.connect(self.db_path)
+        conn.execute("ANALYZE")
+        conn.commit()
+        conn.close()
+        result = SQLiteAdapter(f"sqlite://{self.db_path}?counts=approx").get_structure()
+        tables = self._tables(result)
+        self.assertEqual(tables['b']['rows'], 3)
+        self.assertEqual(tables['kv']['rows'], 1)
+
+    def test_approx_stat1_ignores_partial_index_counts(self):
+        conn = sqlite3.connect(self.db_path)
+        conn.execute("ANALYZE")
+        conn.execute("DELETE FROM sqlite_stat1")
+        conn.executemany("INSERT INTO sqlite_stat1 (tbl, idx, stat) VALUES (?, ?, ?)",
+                         [('a', 'a_partial', '2 1'), ('a', 'a_other', '7 1')])
+        conn.commit()
+
+        def rows():
+            result = SQLiteAdapter(f"sqlite://{self.db_path}?counts=approx").get_structure()
+            return self._tables(result)['a']['rows']
+
+        self.assertEqual(rows(), 7)
+        conn.execute("INSERT INTO sqlite_stat1 (tbl, idx, stat) VALUES ('a', NULL, '9')")
+        conn.commit()
+        conn.close()
+        self.assertEqual(rows(), 9)
+
+    def test_auto_switches_to_estimates_above_threshold(self):
+        from reveal.adapters.sqlite import adapter as sqlite_adapter
+        original = sqlite_adapter._EXACT_COUNT_MAX_BYTES
+        sqlite_adapter._EXACT_COUNT_MAX_BYTES = 0
+        try:
+            result = SQLiteAdapter(f"sqlite://{self.db_path}").get_structure()
+        finally:
+            sqlite_adapter._EXACT_COUNT_MAX_BYTES = original
+        self.assertEqual(result['statistics']['row_counts'], 'estimated')
+        self.assertTrue(any('counts=exact' in step for step in result['next_steps']))
+
+    def test_exact_parallel_workers(self):
+        adapter = SQLiteAdapter(f"sqlite://{self.db_path}", query='counts=exact&workers=4')
+        tables = self._tables(adapter.get_structure())
+        self.assertEqual((tables['a']['rows'], tables['b']['rows'], tables['kv']['rows']), (10, 3, 1))
+
+    def test_invalid_counts_mode(self):
+        adapter = SQLiteAdapter(f"sqlite://{self.db_path}", query='counts=sometimes')
+        with self.assertRaises(ValueError):
+            adapter.get_structure()
+
+    def test_renderer_marks_estimates(self):
+        from io import StringIO
+        from unittest.mock import patch
+        from reveal.adapters.sqlite.renderer import SqliteRenderer
+        result = SQLiteAdapter(f"sqlite://{self.db_path}?counts=approx").get_structure()
+        with patch('sys.stdout', new=StringIO()) as out:
+            SqliteRenderer.render_structure(result, format="text")
+        text = out.getvalue()
+        self.assertIn('~10 rows', text)
+        self.assertIn('? rows', text)
+        self.assertIn('(estimated)', text)
+
+
 class TestSQLiteAdapterElement(unittest.TestCase):
     """Test SQLite table inspection."""
 
@@ -391,6 +391,79 @@ class TestGetFileInfo(unittest.TestCase):
         self.assertTrue('B' in result or 'KB' in result)
 
 
+class TestFastFileInfo(unittest.TestCase):
+    """Line counts from raw bytes, type from the registry, memoized per (path, mtime, size)."""
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+
+    def _write(self, name, data):
+        path = Path(self.temp_dir) / name
+        path.write_bytes(data)
+        return path
+
+    def test_count_lines_matches_splitlines(self):
+        from reveal.tree_view import _count_lines
+        for data in [b'', b'a', b'a\n', b'a\nb', b'a\r\nb\r\n', b'\n\n\n', b'caf\xc3\xa9\n\xff\n']:
+            path = self._write('f.txt', data)
+            expected = len(data.decode('latin-1').splitlines())
+            self.assertEqual(_count_lines(path), expected, data)
+
+    def test_count_lines_defers_on_ambiguous_breaks(self):
+        from reveal.tree_view import _count_lines
+        for data in [b'a\rb', b'a\x0cb\n', b'a\xe2\x80\xa8b', b'latin-1 NEL \x85 here\n']:
+            self.assertIsNone(_count_lines(self._write('f.txt', data)), data)
+        # 0x85 inside a UTF-8 sequence (U+2705) is not a line break.
+        self.assertEqual(_count_lines(self._write('f.txt', b'done \xe2\x9c\x85\nnext\n')), 2)
+
+    def test_crlf_split_across_chunks(self):
+        from unittest import mock
+        from reveal.tree_view import _count_lines
+        path = self._write('f.txt', b'ab\r\ncd\r\nef')
+        with mock.patch('reveal.tree_view._LINE_COUNT_CHUNK', 3):
+            self.assertEqual(_count_lines(path), 3)
+
+    def test_no_analyzer_instantiated_for_plain_files(self):
+        from unittest import mock
+        from reveal.tree_view import _file_info_cache
+        _file_info_cache.clear()
+        path = self._write('app.py', b'import os\r\n\r\ndef f():\r\n    pass\r\n')
+        with mock.patch('reveal.base.FileAnalyzer.__init__', side_effect=AssertionError('instantiated')):
+            result = _get_file_info(path)
+        self.assertEqual(result, 'app.py (4 lines, Python)')
+
+    def test_info_cached_until_file_changes(self):
+        from unittest import mock
+        from reveal.tree_view import _file_info_cache, _count_lines
+        _file_info_cache.clear()
+        path = self._write('notes.py', b'one\ntwo\n')
+        with mock.patch('reveal.tree_view._count_lines', wraps=_count_lines) as count:
+            first = _get_file_info(path)
+            self.assertEqual(_get_file_info(path), first)
+            self.assertEqual(count.call_count, 1)
+            path.write_bytes(b'one\ntwo\nthree\n')
+            os.utime(path, ns=(1, 1))
+            self.assertIn('3 lines', _get_file_info(path))
+            self.assertEqual(count.call_count, 2)
+
+    def test_parallel_tree_matches_serial(self):
+        from unittest import mock
+        for i in range(12):
+            self._write(f'm{i:02d}.py', b'x = 1\n' * (i + 1))
+        with mock.patch.dict(os.environ, {'REVEAL_MAX_WORKERS': '1'}):
+            serial = show_directory_tree(self.temp_dir, dir_limit=8)
+            serial_json = show_directory_tree_json(self.temp_dir, dir_limit=8)
+        with mock.patch.dict(os.environ, {'REVEAL_MAX_WORKERS': '4'}):
+            parallel = show_directory_tree(self.temp_dir, dir_limit=8)
+            parallel_json = show_directory_tree_json(self.temp_dir, dir_limit=8)
+        self.assertEqual(serial, parallel)
+        self.assertEqual(serial_json, parallel_json)
+        self.assertIn('m07.py (8 lines, Python)', parallel)
+
+
 class TestWalkDirectory(unittest.TestCase):
     """Test directory walking helper."""
 
@@ -0,0 +1,170 @@
+"""Tests for reveal.utils.log_tail and the --diagnose scan built on it:
+reverse block reading, --since windows and the byte-offset checkpoint."""
+
+from unittest.mock import patch
+
+import pytest
+
+from reveal.analyzers import nginx as nginx_mod
+from reveal.analyzers.nginx import NginxAnalyzer
+from reveal.utils.log_tail import iter_lines_reverse, read_tail
+
+CONFIG = """
+server {
+    listen 443 ssl;
+    server_name alpha.example.com;
+    ssl_certificate /etc/ssl/alpha.crt;
+}
+"""
+
+
+def _denied(ts, domain='alpha.example.com'):
+    return (f'{ts} [error] 1#1: *1 open() "/home/u/.well-known/acme-challenge/T" '
+            f'failed (13: Permission denied), server: {domain}, request: "GET / HTTP/1.1"')
+
+
+def _ssl(ts):
+    return f'{ts} [crit] 1#1: *2 SSL_do_handshake() failed (SSL handshake error), server: alpha.example.com'
+
+
+def _noise(ts):
+    return f'{ts} [notice] 1#1: signal process started'
+
+
+@pytest.fixture
+def cache(tmp_path, monkeypatch):
+    monkeypatch.setenv('REVEAL_CACHE_DIR', str(tmp_path / 'cache'))
+    monkeypatch.delenv('REVEAL_DISK_CACHE', raising=False)
+
+
+@pytest.fixture
+def analyzer(tmp_path):
+    conf = tmp_path / 'site.conf'
+    conf.write_text(CONFIG)
+    return NginxAnalyzer(str(conf))
+
+
+def _readlines_scan(log, tail_lines):
+    """The pre-checkpoint implementation: readlines() and one regex per pattern."""
+    with open(log, encoding='utf-8', errors='replace') as fh:
+        lines = fh.readlines()[-tail_lines:]
+    hits = {}
+    for raw in lines:
+        line = raw.rstrip()
+        server = nginx_mod._LOG_SERVER_RE.search(line)
+        for key, regex in nginx_mod._ACME_LOG_PATTERNS:
+            if regex.search(line) and server and server.group(1) == 'alpha.example.com':
+                ts = nginx_mod._LOG_TIMESTAMP_RE.match(line)
+                NginxAnalyzer._record_hit(hits, 'alpha.example.com', key, ts.group(1) if ts else '', line)
+    return sorted(hits.values(), key=lambda r: (r['domain'], r['pattern']))
+
+
+@pytest.mark.parametrize('content', [
+    b'', b'\n', b'one', b'one\n', b'one\ntwo', b'one\n\ntwo\n', b'\n\nthree\n\n', b'a\r\nb\r\n',
+])
+@pytest.mark.parametrize('block_size', [1, 2, 3, 64])
+def test_reverse_lines_match_readlines(tmp_path, content, block_size):
+    log = tmp_path / 'log'
+    log.write_bytes(content)
+    expected = content.decode().splitlines()
+    assert [b.decode() for b in iter_lines_reverse(str(log), block_size=block_size)] == \
+        [line + ('\r' if content.startswith(b'a\r') else '') for line in reversed(expected)]
+    assert read_tail(str(log)).lines == expected
+    assert read_tail(str(log), max_lines=2).lines == expected[-2:]
+
+
+def test_read_tail_range_stop_and_partial_line(tmp_path):
+    log = tmp_path / 'log'
+    log.write_bytes(b'l1\nl2\nl3\nl4 still being writ')
+
+    tail = read_tail(str(log), start=3)
+    assert tail.lines == ['l2', 'l3', 'l4 still being writ']
+    assert tail.complete_end == 9
+    assert read_tail(str(log), end=9).complete_end == 9
+    assert read_tail(str(log), stop=lambda line: line == 'l2').lines == ['l3', 'l4 still being writ']
+
+
+def test_tail_reads_only_the_end_of_a_big_log(tmp_path, analyzer, cache):
+    log = tmp_path / 'error.log'
+    log.write_text(''.join(_noise('2026/01/01 00:00:00') + '\n' for _ in range(50_000))
+                   + _denied('2026/02/01 10:00:00') + '\n')
+    reads = []
+    real_open = open
+
+    def tracking_open(path, mode='r', *args, **kwargs):
+        fh = real_open(path, mode, *args, **kwargs)
+        if str(path) == str(log):
+            real_read = fh.read
+            fh.read = lambda n=-1: reads.append(n) or real_read(n)
+        return fh
+
+    with patch('builtins.open', tracking_open):
+        hits = analyzer.diagnose_acme_errors(str(log), tail_lines=10)
+    assert [(h['pattern'], h['count']) for h in hits] == [('permission_denied', 1)]
+    assert -1 not in reads and sum(reads) < 64 * 1024 + 200
+
+
+def test_checkpoint_scans_only_appended_lines(tmp_path, analyzer, cache):
+    log = tmp_path / 'error.log'
+    lines = [_denied('2026/02/01 10:00:00'), _noise('2026/02/01 10:00:01'), _ssl('2026/02/01 10:00:02')]
+    log.write_text('\n'.join(lines) + '\n')
+    first = analyzer.diagnose_acme_errors(str(log), tail_lines=4)
+    assert first == _readlines_scan(log, 4)
+
+    with open(log, 'a') as fh:
+        fh.write(_denied('2026/02/02 09:00:00') + '\n' + _noise('2026/02/02 09:00:01') + '\n')
+    with patch.object(nginx_mod, 'read_tail', wraps=nginx_mod.read_tail) as reader:
+        second = analyzer.diagnose_acme_errors(str(log), tail_lines=4)
+    assert reader.call_args.kwargs['start'] == len('\n'.join(lines)) + 1
+    # the first denied line has scrolled out of the 4-line window
+    assert second == _readlines_scan(log, 4)
+    assert [(h['pattern'], h['count'], h['last_seen']) for h in second] == [
+        ('permission_denied', 1, '2026/02/02 09:00:00'), ('ssl_error', 1, '2026/02/01 10:00:02')]
+
+    with patch.object(nginx_mod, 'read_tail') as reader:
+        assert analyzer.diagnose_acme_errors(str(log), tail_lines=4) == second
+    assert not reader.called
+
+
+def test_checkpoint_survives_partial_lines_and_rotation(tmp_path, analyzer, cache):
+    log = tmp_path / 'error.log'
+    log.write_text(_denied('2026/02/01 10:00:00') + '\n' + _denied('2026/02/01 10:00:01')[:40])
+    assert analyzer.diagnose_acme_errors(str(log))[0]['count'] == 1
+
+    with open(log, 'a') as fh:
+        fh.write(_denied('2026/02/01 10:00:01')[40:] + '\n')
+    assert analyzer.diagnose_acme_errors(str(log)) == _readlines_scan(log, 5000)
+    assert analyzer.diagnose_acme_errors(str(log))[0]['count'] == 2
+
+    # truncated in place and regrown past the old offset: same inode, new bytes
+    log.write_text('\n'.join(_ssl(f'2026/03/01 00:00:0{i}') for i in range(5)) + '\n')
+    assert analyzer.diagnose_acme_errors(str(log)) == _readlines_scan(log, 5000)
+
+
+def test_since_window_stops_at_older_lines(tmp_path, analyzer, cache):
+    log = tmp_path / 'error.log'
+    log.write_text('\n'.join([
+        _denied('2026/01/30 23:59:59'),
+        _denied('2026/02/01 00:00:00'),
+        '    continuation line with no timestamp',
+        _ssl('2026/02/03 12:00:00'),
+    ]) + '\n')
+
+    hits = analyzer.diagnose_acme_errors(str(log), since='2026-02-01')
+    assert [(h['pattern'], h['count']) for h in hits] == [('permission_denied', 1), ('ssl_error', 1)]
+    hits = analyzer.diagnose_acme_errors(str(log), since='2026-02-03 11:00')
+    assert [h['pattern'] for h in hits] == ['ssl_error']
+    with pytest.raises(ValueError):
+        analyzer.diagnose_acme_errors(str(log), since='last week')
+
+
+def test_handle_diagnose_reports_since_window(tmp_path, analyzer, cache, capsys):
+    from reveal.file_handler import _handle_diagnose
+
+    log = tmp_path / 'error.log'
+    log.write_text(_denied('2026/01/01 00:00:00') + '\n')
+    _handle_diagnose(analyzer, log_path=str(log), since='2026-02-01')
+    assert '(since 2026-02-01)' in capsys.readouterr().out
+    with pytest.raises(SystemExit) as exc_info:
+        _handle_diagnose(analyzer, log_path=str(log), since='yesterday')
+    assert exc_info.value.code == 1
@@ -14,7 +14,11 @@ from reveal.utils.query import (
     parse_result_control,
     apply_result_control,
     ResultControl,
+    compare_values,
+    compile_comparison,
+    compile_filters,
 )
+from reveal.utils.query_control import _apply_sorting
 
 
 class TestWarnUnknownQueryParams:
@@ -556,3 +560,79 @@ class TestResultControl:
         assert len(result) == 2
         assert result[0]['score'] == 80
         assert result[1]['score'] == 60
+
+
+_VALUES = [None, 0, 1, 5, 10, 10.5, -3, True, False, '', '5', '10', 'abc', 'ABC', 'null',
+           'func_main', '2024-01-15', [1, 'x'], ['abc', None], {'k': 1}]
+_TARGETS = [5, 10, 1.5, True, '5', 'abc', 'ABC', 'null', '1..10', '..5', 'a..m', '..',
+            '*ab*', 'func_*', '^f', '[', 'x' * 201, '2024-01-01']
+_OPERATORS = ['=', '==', '!=', '>', '<', '>=', '<=', '~=', '!~', '..', '*', '?', '!', 'bogus']
+_OPTIONS = [
+    None,
+    {'allow_list_any': False, 'case_sensitive': True, 'coerce_numeric': True,
+     'none_matches_not_equal': False},
+    {'case_sensitive': True, 'coerce_numeric': False},
+]
+
+
+class TestCompiledFilters:
+    """compile_comparison/compile_filters must answer exactly what
+    compare_values/apply_filter answer, for every operator and option set."""
+
+    @pytest.mark.parametrize('options', _OPTIONS)
+    @pytest.mark.parametrize('operator', _OPERATORS)
+    def test_compiled_comparison_matches_compare_values(self, operator, options):
+        for target in _TARGETS:
+            predicate = compile_comparison(operator, target, options)
+            for value in _VALUES:
+                assert predicate(value) == compare_values(value, operator, target, options), \
+                    (value, operator, target)
+
+    def test_compiled_filters_match_apply_filters(self):
+        filters = parse_query_filters('name~=^test&lines>10&!draft&type=func*&size=1..100')
+        items = [
+            {'name': 'test_a', 'lines': 20, 'type': 'function', 'size': 50},
+            {'name': 'test_b', 'lines': 5, 'type': 'function', 'size': 50},
+            {'name': 'test_c', 'lines': 20, 'type': 'function', 'size': 50, 'draft': True},
+            {'name': 'other', 'lines': 20, 'type': 'function', 'size': 500},
+            {'lines': 20},
+        ]
+        matches = compile_filters(filters)
+        assert [matches(i) for i in items] == [apply_filters(i, filters) for i in items]
+        assert [matches(i) for i in items] == [True, False, False, False, False]
+
+    def test_cheap_filters_run_first(self):
+        seen = []
+
+        def get_value(item, field):
+            seen.append(field)
+            return item.get(field)
+
+        filters = parse_query_filters('name~=^x&body=*needle*&lines>10')
+        compile_filters(filters, get_value=get_value)({'name': 'x', 'body': 'needle', 'lines': 1})
+        assert seen == ['lines']
+
+    def test_existence_ops_off_compares_raw(self):
+        [missing] = parse_query_filters('!draft')
+        assert compile_filters([missing])({}) is True
+        assert compile_filters([missing], existence_ops=False)({}) == compare_values(None, '!', '')
+
+
+class TestHeapResultControl:
+    """A sorted, limited query heap-selects offset + limit items; the result
+    must equal full sort + slice, ties and None placement included."""
+
+    @pytest.mark.parametrize('descending', [False, True])
+    @pytest.mark.parametrize('offset,limit', [(0, 1), (0, 7), (5, 10), (0, 0), (30, 5), (0, 100)])
+    def test_matches_full_sort(self, descending, offset, limit):
+        import random
+        rng = random.Random(11)
+        items = [{'id': i, 'v': rng.choice([None, 1, 2, 2, 3, 'x', 4.5])} for i in range(40)]
+        control = ResultControl(sort_field='v', sort_descending=descending, offset=offset, limit=limit)
+        expected = _apply_sorting(items[:], 'v', descending)[offset:offset + limit]
+        assert apply_result_control(items, control) == expected
+
+    def test_negative_limit_keeps_slice_semantics(self):
+        items = [{'v': v} for v in (3, 1, 2)]
+        control = ResultControl(sort_field='v', limit=-1)
+        assert apply_result_control(items, control) == [{'v': 1}, {'v': 2}]
@@ -0,0 +1,242 @@
+"""Tests for reveal.cli.watch — ``check --watch`` and ``<dir> --watch``.
+
+The watchers are exercised against a real temporary tree (the inotify tests
+skip where inotify is unavailable); CheckWatchSession is driven with a fake
+per-file checker so the tests assert *which* files and rules are re-run
+without depending on any analyzer.
+"""
+
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+from reveal.cli import file_checker, watch
+from reveal.rules.base import Detection
+
+
+def _touch(path: Path, text: str) -> None:
+    path.write_text(text)
+    # Bump mtime explicitly: coarse filesystem timestamps can otherwise make
+    # a rewrite within the same tick invisible to the polling watcher.
+    st = path.stat()
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 10_000_000))
+
+
+@pytest.fixture
+def tree(tmp_path):
+    (tmp_path / "pkg").mkdir()
+    (tmp_path / "pkg" / "a.py").write_text("a = 1\n")
+    (tmp_path / "pkg" / "b.py").write_text("b = 1\n")
+    (tmp_path / "node_modules").mkdir()
+    (tmp_path / "node_modules" / "dep.js").write_text("x\n")
+    return tmp_path
+
+
+def _inotify_watcher(tree, patterns=()):
+    if not sys.platform.startswith("linux"):
+        pytest.skip("inotify is Linux-only")
+    try:
+        return watch.InotifyWatcher(tree, list(patterns))
+    except (OSError, AttributeError) as e:
+        pytest.skip(f"inotify unavailable: {e}")
+
+
+class TestPollingWatcher:
+    def test_reports_modified_and_new_files(self, tree):
+        w = watch.PollingWatcher(tree, [], interval=0.01)
+        _touch(tree / "pkg" / "a.py", "a = 2\n")
+        (tree / "pkg" / "c.py").write_text("c = 1\n")
+        assert w.wait(timeout=1.0) == {tree / "pkg" / "a.py", tree / "pkg" / "c.py"}
+
+    def test_reports_deleted_files(self, tree):
+        w = watch.PollingWatcher(tree, [], interval=0.01)
+        (tree / "pkg" / "b.py").unlink()
+        assert w.wait(timeout=1.0) == {tree / "pkg" / "b.py"}
+
+    def test_ignores_pruned_and_gitignored_paths(self, tree):
+        w = watch.PollingWatcher(tree, ["*.log"], interval=0.01)
+        _touch(tree / "node_modules" / "dep.js", "y\n")
+        (tree / "pkg" / "debug.log").write_text("noise\n")
+        assert w.wait(timeout=0.1) == set()
+
+    def test_timeout_without_changes(self, tree):
+        w = watch.PollingWatcher(tree, [], interval=0.01)
+        assert w.wait(timeout=0.05) == set()
+
+
+class TestInotifyWatcher:
+    def test_reports_writes(self, tree):
+        w = _inotify_watcher(tree)
+        try:
+            (tree / "pkg" / "a.py").write_text("a = 2\n")
+            assert tree / "pkg" / "a.py" in w.wait(timeout=2.0)
+        finally:
+            w.close()
+
+    def test_new_directory_is_watched_and_its_files_reported(self, tree):
+        w = _inotify_watcher(tree)
+        try:
+            (tree / "pkg" / "sub").mkdir()
+            (tree / "pkg" / "sub" / "d.py").write_text("d = 1\n")
+            changed = w.wait(timeout=2.0)
+            (tree / "pkg" / "sub" / "d.py").write_text("d = 2\n")
+            changed |= w.wait(timeout=2.0)
+            assert tree / "pkg" / "sub" / "d.py" in changed
+        finally:
+            w.close()
+
+    def test_skipped_directories_are_not_watched(self, tree):
+        w = _inotify_watcher(tree)
+        try:
+            assert tree / "node_modules" not in set(w._dirs.values())
+            (tree / "node_modules" / "dep.js").write_text("y\n")
+            assert w.wait(timeout=0.3) == set()
+        finally:
+            w.close()
+
+
+class TestMakeWatcher:
+    def test_base_watcher_is_abstract(self, tree):
+        with pytest.raises(TypeError):
+            watch.Watcher(tree, [])
+
+    def test_env_forces_polling(self, tree, monkeypatch):
+        monkeypatch.setenv("REVEAL_WATCH_POLL", "1")
+        assert isinstance(watch.make_watcher(tree, []), watch.PollingWatcher)
+
+    def test_falls_back_when_inotify_fails(self, tree, monkeypatch, capsys):
+        monkeypatch.delenv("REVEAL_WATCH_POLL", raising=False)
+        monkeypatch.setattr(sys, "platform", "linux")
+
+        def boom(*_a, **_k):
+            raise OSError(28, "inotify watch limit reached")
+
+        monkeypatch.setattr(watch, "InotifyWatcher", boom)
+        assert isinstance(watch.make_watcher(tree, []), watch.PollingWatcher)
+        assert "polling" in capsys.readouterr().err
+
+
+class _FakeChecker:
+    """check_and_collect_file stand-in: one detection per selected rule code
+    listed in the file's ``# rules:`` header; records every call."""
+
+    def __init__(self):
+        self.calls = []
+
+    def __call__(self, file_path, directory, select, ignore, profile=None):
+        self.calls.append((file_path.name, tuple(select) if select else None))
+        first = file_path.read_text().splitlines()[0]
+        codes = first.split(":", 1)[1].split() if first.startswith("# rules:") else []
+        detections = [
+            Detection(file_path=str(file_path), line=1, rule_code=code, message=f"{code} hit")
+            for code in codes if select is None or code in select
+        ]
+        return len(detections), detections, {"status": "ok"}
+
+
+@pytest.fixture
+def session(tree, monkeypatch):
+    (tree / "pkg" / "a.py").write_text("# rules: B001 D005\n")
+    (tree / "pkg" / "b.py").write_text("# rules: D005\n")
+    checker = _FakeChecker()
+    monkeypatch.setattr(file_checker, "check_and_collect_file", checker)
+    monkeypatch.setattr(file_checker, "_PARALLEL_THRESHOLD", 10_000)
+    s = watch.CheckWatchSession(tree, select=None, ignore=None)
+    s.checker = checker
+    return s
+
+
+class TestCheckWatchSession:
+    def test_full_check_reports_everything_as_added(self, session, tree):
+        delta = session.full_check()
+        assert sorted((p.name, d.rule_code) for p, d in delta.added) == [
+            ("a.py", "B001"), ("a.py", "D005"), ("b.py", "D005")]
+        assert delta.total_issues == 3 and delta.files_with_issues == 2
+
+    def test_change_rechecks_file_and_cross_file_rules_only(self, session, tree):
+        session.full_check()
+        session.checker.calls.clear()
+        (tree / "pkg" / "a.py").write_text("# rules: D005\n")
+
+        delta = session.apply({tree / "pkg" / "a.py"})
+
+        full = [c for c in session.checker.calls if c[1] is None]
+        cross = [c for c in session.checker.calls if c[1] is not None]
+        assert full == [("a.py", None)]
+        assert cross and all(name != "a.py" for name, _ in cross)
+        assert all("B001" not in codes for _, codes in cross)
+        assert "D005" in delta.cross_file_rules
+        assert [(p.name, d.rule_code) for p, d in delta.resolved] == [("a.py", "B001")]
+        assert delta.added == []
+
+    def test_cross_file_rerun_replaces_only_those_codes(self, session, tree):
+        session.full_check()
+        (tree / "pkg" / "b.py").write_text("# rules: B001\n")
+        # b.py now only produces B001, but only D005 is re-run on it when
+        # a.py changes: its D005 result goes away and B001 is not reported
+        # until b.py itself changes.
+        session.apply({tree / "pkg" / "a.py"})
+        assert [d.rule_code for d in session.results[tree / "pkg" / "b.py"]] == []
+
+    def test_deleted_file_resolves_its_issues(self, session, tree):
+        session.full_check()
+        (tree / "pkg" / "b.py").unlink()
+        delta = session.apply({tree / "pkg" / "b.py"})
+        assert tree / "pkg" / "b.py" not in session.results
+        assert [(p.name, d.rule_code) for p, d in delta.resolved] == [("b.py", "D005")]
+
+    def test_removed_directory_drops_files_below_it(self, session, tree):
+        session.full_check()
+        for f in (tree / "pkg").iterdir():
+            f.unlink()
+        (tree / "pkg").rmdir()
+        delta = session.apply({tree / "pkg"})
+        assert session.results == {}
+        assert delta.total_issues == 0 and len(delta.resolved) == 3
+
+    def test_unsupported_or_excluded_changes_are_ignored(self, session, tree):
+        session.full_check()
+        session.checker.calls.clear()
+        (tree / "notes.unknownext").write_text("x\n")
+        _touch(tree / "node_modules" / "dep.js", "y\n")
+        assert session.apply({tree / "notes.unknownext", tree / "node_modules" / "dep.js"}) is None
+        assert session.checker.calls == []
+
+    def test_root_gitignore_change_triggers_full_check(self, session, tree):
+        session.full_check()
+        (tree / ".gitignore").write_text("pkg/b.py\n")
+        delta = session.apply({tree / ".gitignore"})
+        assert session.patterns_changed
+        assert tree / "pkg" / "b.py" not in session.results
+        assert [(p.name, d.rule_code) for p, d in delta.resolved] == [("b.py", "D005")]
+
+
+class TestDeltaOutput:
+    def test_text_lists_added_and_resolved(self, session, tree, capsys):
+        session.full_check()
+        (tree / "pkg" / "a.py").write_text("# rules: B001 D005 E501\n")
+        delta = session.apply({tree / "pkg" / "a.py"})
+        watch._emit_delta(delta, tree, "text")
+        out = capsys.readouterr().out
+        assert "1 changed → re-checked 1 file(s)" in out
+        assert "  + " in out and "E501 E501 hit" in out
+        assert "+1 -0" in out
+
+    def test_json_is_one_line_per_batch(self, session, tree, capsys):
+        import json
+        watch._emit_delta(session.full_check(), tree, "json", initial=True)
+        lines = capsys.readouterr().out.strip().splitlines()
+        assert len(lines) == 1
+        payload = json.loads(lines[0])
+        assert payload["type"] == "check_snapshot"
+        assert payload["total_issues"] == 3
+        assert {e["rule_code"] for e in payload["added"]} == {"B001", "D005"}
+
+
+def test_cross_file_rules_are_declared():
+    from reveal.rules import RuleRegistry
+    RuleRegistry.discover()
+    declared = {rc.code for rc in RuleRegistry._rules if getattr(rc, "cross_file", False)}
+    assert {"B005", "D005", "I002", "M102"} <= declared
@@ -588,6 +588,76 @@ class TestXlsxAdapterCrossSheetSearch:
         result = adapter.get_structure()
         assert result['pattern'] == 'Gadget'
 
+    def test_search_limit_stops_scheduling_sheets(self, multi_sheet_xlsx, monkeypatch):
+        """Once ?limit is met, later sheets are never opened."""
+        from reveal.analyzers.office.openxml import XlsxAnalyzer
+        monkeypatch.setenv('REVEAL_MAX_WORKERS', '1')
+        searched = []
+        original = XlsxAnalyzer._search_sheet
+
+        def spy(self, sheet_name, *args, **kwargs):
+            searched.append(sheet_name)
+            return original(self, sheet_name, *args, **kwargs)
+
+        monkeypatch.setattr(XlsxAnalyzer, '_search_sheet', spy)
+        result = XlsxAdapter(f"xlsx://{multi_sheet_xlsx}?search=Alice&limit=1").get_structure()
+        assert result['total_matches'] == 1
+        assert searched == ['Customers']
+
+    def test_parallel_search_matches_serial(self, multi_sheet_xlsx, monkeypatch):
+        """Worker-process search returns the serial results in sheet-then-row order."""
+        from reveal.analyzers.office.openxml import XlsxAnalyzer
+        monkeypatch.setenv('REVEAL_MAX_WORKERS', '1')
+        serial = XlsxAnalyzer(str(multi_sheet_xlsx)).search_all_sheets('widget')
+        monkeypatch.setenv('REVEAL_MAX_WORKERS', '3')
+        parallel = XlsxAnalyzer(str(multi_sheet_xlsx)).search_all_sheets('widget')
+        assert parallel == serial
+        assert [m['sheet_name'] for m in parallel] == ['Orders', 'Orders', 'Products', 'Products']
+        limited = XlsxAnalyzer(str(multi_sheet_xlsx)).search_all_sheets('widget', limit=3)
+        assert limited == serial[:3]
+
+    def test_parallel_search_stops_waiting_at_limit(self, multi_sheet_xlsx, monkeypatch):
+        """Hitting the limit shuts the pool down without waiting for running sheets."""
+        from concurrent.futures import ProcessPoolExecutor
+        from reveal.analyzers.office import openxml
+        shutdowns = []
+
+        class RecordingPool(ProcessPoolExecutor):
+            def shutdown(self, wait=True, *, cancel_futures=False):
+                shutdowns.append((wait, cancel_futures))
+                super().shutdown(wait=wait, cancel_futures=cancel_futures)
+
+        monkeypatch.setattr(openxml, 'ProcessPoolExecutor', RecordingPool)
+        monkeypatch.setenv('REVEAL_MAX_WORKERS', '3')
+        analyzer = openxml.XlsxAnalyzer(str(multi_sheet_xlsx))
+        assert len(analyzer.search_all_sheets('widget', limit=1)) == 1
+        assert len(analyzer.search_all_sheets('widget')) == 4
+        assert shutdowns == [(False, True), (True, True)]
+
+    def test_search_shared_string_prematch(self, tmp_path):
+        """Shared-string cells are matched via the pre-matched index set."""
+        from reveal.analyzers.office.openxml import XlsxAnalyzer
+        import zipfile
+        path = _make_minimal_xlsx(tmp_path, extra_files={
+            'xl/sharedStrings.xml': (
+                '<sst xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">'
+                '<si><t>Revenue</t></si><si><t>Cost</t></si></sst>'
+            ),
+        })
+        sheet = (
+            '<worksheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main"><sheetData>'
+            '<row r="1"><c r="A1" t="s"><v>1</v></c></row>'
+            '<row r="2"><c r="A2" t="s"><v>0</v></c><c r="B2"><v>42</v></c></row>'
+            '</sheetData></worksheet>'
+        )
+        out = tmp_path / "ss_search.xlsx"
+        with zipfile.ZipFile(path) as src, zipfile.ZipFile(out, 'w') as dst:
+            for item in src.infolist():
+                data = sheet.encode() if item.filename == 'xl/worksheets/sheet1.xml' else src.read(item.filename)
+                dst.writestr(item.filename, data)
+        matches = XlsxAnalyzer(str(out)).search_all_sheets('REVEN')
+        assert matches == [{'sheet_name': 'Sheet1', 'row_num': 2, 'cells': ['Revenue', '42']}]
+
 
 class TestXlsxSearchRenderer:
     """Tests for the search result renderer (BACK-003)."""
@@ -1397,9 +1467,9 @@ class TestXlsxRealWorldFixtures:
             pytest.skip("dynamic_arrays.xlsx fixture not present")
         return path
 
-    def test_too_large_sheet_shows_message_not_zeros(self, adventure_dw_parsed):
-        """Sheet XML > 50 MB should surface a human-readable message, not silent 0 rows/0 cols."""
-        import io, sys
+    def test_large_sheet_is_streamed_not_rejected(self, adventure_dw_parsed):
+        """Sheet XML > 50 MB is counted by the streaming reader, not skipped as too large."""
+        import io, re, sys
         buf = io.StringIO()
         old_stdout = sys.stdout
         sys.stdout = buf
@@ -1408,14 +1478,13 @@ class TestXlsxRealWorldFixtures:
         finally:
             sys.stdout = old_stdout
         output = buf.getvalue()
-        assert "too large to parse" in output
-        # Should NOT show "0 rows, 0 cols" for the oversized sheet
+        assert "too large to parse" not in output
         lines = [l for l in output.splitlines() if "FactInternetSales" in l]
         assert lines, "FactInternetSales sheet not found in output"
-        assert "0 rows" not in lines[0]
+        assert not re.search(r'\b0 rows', lines[0])
 
     def test_too_large_sheet_other_sheets_still_parsed(self, adventure_dw_parsed):
-        """Other sheets in the same workbook should parse normally despite one being too large."""
+        """Other sheets in the same workbook parse normally alongside the large one."""
         sheets = adventure_dw_parsed.get('sheets', [])
         dim_product = next((s for s in sheets if 'DimProduct' in s.get('name', '')), None)
         assert dim_product is not None
@@ -1845,5 +1914,103 @@ class TestHelpContentCoverage:
         assert len(help_doc['workflows']) >= 4  # added two new workflows
 
 
+
+# ---------------------------------------------------------------------------
+# Streaming sheet reader: range/limit pushdown, lazy shared strings
+# ---------------------------------------------------------------------------
+
+class TestXlsxStreamingReader:
+    """Sheets are streamed with iterparse; ?range/?limit stop parsing early."""
+
+    @pytest.fixture
+    def tall_xlsx(self, tmp_path):
+        openpyxl = pytest.importorskip("openpyxl", reason="openpyxl not installed (pip install reveal-cli[xlsx])")
+        wb = openpyxl.Workbook()
+        ws = wb.active
+        ws.title = "Data"
+        ws.append(["Name", "Skip", "Value"])
+        for i in range(1, 200):
+            ws.append([f"name{i}", None, i])
+        path = tmp_path / "tall.xlsx"
+        wb.save(path)
+        return path
+
+    def test_default_sheet_read_is_a_preview(self, tall_xlsx):
+        result = XlsxAdapter(f"xlsx://{tall_xlsx}?sheet=Data").get_structure()
+        assert len(result['rows']) == 20
+        assert result['rows_count'] == 200  # from the dimension ref, no full scan
+        assert result['cols_count'] == 3
+
+    def test_limit_is_not_capped_by_preview(self, tall_xlsx):
+        result = XlsxAdapter(f"xlsx://{tall_xlsx}?sheet=Data&limit=150").get_structure()
+        assert len(result['rows']) == 150
+
+    def test_csv_exports_whole_sheet(self, tall_xlsx):
+        result = XlsxAdapter(f"xlsx://{tall_xlsx}?sheet=Data&format=csv").get_structure()
+        assert len(result['rows']) == 200
+
+    def test_range_uses_cell_references(self, tall_xlsx):
+        result = XlsxAdapter(f"xlsx://{tall_xlsx}?sheet=Data&range=A5:C7").get_structure()
+        # Column B is absent from the XML; C still lands at index 2
+        assert result['rows'] == [['name4', '', '4'], ['name5', '', '5'], ['name6', '', '6']]
+
+    def test_range_column_subset(self, tall_xlsx):
+        result = XlsxAdapter(f"xlsx://{tall_xlsx}?sheet=Data&range=C2:C3").get_structure()
+        assert result['rows'] == [['1'], ['2']]
+
+    def test_range_stops_parsing_after_last_row(self, tall_xlsx):
+        from reveal.analyzers.office.openxml import XlsxAnalyzer
+        analyzer = XlsxAnalyzer(str(tall_xlsx))
+        sheet = analyzer.read_sheet_rows('xl/worksheets/sheet1.xml', cell_range='A1:C3')
+        assert len(sheet['rows']) == 3
+        assert sheet['rows_scanned'] == 4  # row 4 seen, then the stream is closed
+        assert sheet['exhausted'] is False
+
+    def test_full_read_reports_exact_count(self, tall_xlsx):
+        from reveal.analyzers.office.openxml import XlsxAnalyzer
+        analyzer = XlsxAnalyzer(str(tall_xlsx))
+        sheet = analyzer.read_sheet_rows('xl/worksheets/sheet1.xml')
+        assert sheet['exhausted'] is True
+        assert sheet['rows_scanned'] == 200
+
+    def test_shared_strings_resolve_lazily(self, tmp_path):
+        from reveal.analyzers.office.openxml import XlsxAnalyzer
+        rows = ''.join(
+            f'<row r="{i + 1}"><c r="A{i + 1}" t="s"><v>{i}</v></c></row>' for i in range(100)
+        )
+        strings = ''.join(f'<si><t>s{i}</t></si>' for i in range(100))
+        path = _make_minimal_xlsx(tmp_path, extra_files={
+            'xl/sharedStrings.xml': (
+                '<sst xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main" '
+                f'uniqueCount="100">{strings}</sst>'
+            ),
+        })
+        # Swap in a worksheet that references the shared strings
+        import zipfile
+        big = tmp_path / "ss.xlsx"
+        with zipfile.ZipFile(path) as src, zipfile.ZipFile(big, 'w') as dst:
+            for item in src.infolist():
+                data = src.read(item.filename)
+                if item.filename == 'xl/worksheets/sheet1.xml':
+                    data = (
+                        '<worksheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">'
+                        f'<sheetData>{rows}</sheetData></worksheet>'
+                    ).encode()
+                dst.writestr(item.filename, data)
+
+        analyzer = XlsxAnalyzer(str(big))
+        sheet = analyzer.read_sheet_rows('xl/worksheets/sheet1.xml', limit=2)
+        assert sheet['rows'] == [['s0'], ['s1']]
+        assert len(analyzer._ss_values) == 2  # only as far as index 1
+        assert len(analyzer.shared_strings) == 100  # full table still available
+
+    def test_large_sheet_counted_instead_of_rejected(self, tall_xlsx, monkeypatch):
+        from reveal.analyzers.office import base
+        monkeypatch.setattr(base, 'MAX_XML_PART_SIZE', 2048)  # below the sheet, above workbook.xml
+        result = XlsxAdapter(f"xlsx://{tall_xlsx}").get_structure()
+        data = next(s for s in result['sheets'] if s.get('name') == 'Data')
+        assert data['rows'] == 200
+        assert data['cols'] == 3
+
 if __name__ == '__main__':
     pytest.main([__file__, '-v'])